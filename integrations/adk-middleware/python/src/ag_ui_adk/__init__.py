@@ -15,7 +15,14 @@ from .adk_agent import ADKAgent
 from .event_translator import EventTranslator, adk_events_to_messages
 from .session_manager import SessionManager
 from .endpoint import add_adk_fastapi_endpoint, create_adk_app
-from .config import PredictStateMapping, normalize_predict_state
+from .config import (
+    PredictStateMapping,
+    ToolCallArgsConfig,
+    ToolResponseConfig,
+    normalize_predict_state,
+)
+from .tool_response import ToolResponseSerializer, ToolResponseBlobStore, LocalDiskBlobStore
+from .metrics import AgentMetrics, InMemoryMetricsRecorder, NoOpMetrics, OpenTelemetryMetrics
 
 __all__ = [
     'ADKAgent',
@@ -25,6 +32,15 @@ __all__ = [
     'SessionManager',
     'PredictStateMapping',
     'normalize_predict_state',
+    'ToolResponseConfig',
+    'ToolCallArgsConfig',
+    'ToolResponseSerializer',
+    'ToolResponseBlobStore',
+    'LocalDiskBlobStore',
+    'AgentMetrics',
+    'NoOpMetrics',
+    'InMemoryMetricsRecorder',
+    'OpenTelemetryMetrics',
     'adk_events_to_messages',
 ]
 
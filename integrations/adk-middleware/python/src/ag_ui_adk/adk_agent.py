@@ -2,7 +2,7 @@
 
 """Main ADKAgent implementation for bridging AG-UI Protocol with Google ADK."""
 
-from typing import Optional, Dict, Callable, Any, AsyncGenerator, List, Iterable, TYPE_CHECKING
+from typing import Optional, Dict, Callable, Any, AsyncGenerator, Awaitable, List, Iterable, Set, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from google.adk.apps import App
@@ -15,7 +15,7 @@ from datetime import datetime
 from ag_ui.core import (
     RunAgentInput, BaseEvent, EventType,
     RunStartedEvent, RunFinishedEvent, RunErrorEvent,
-    ToolCallEndEvent, SystemMessage, ToolCallResultEvent,
+    ToolCallStartEvent, ToolCallEndEvent, SystemMessage, ToolCallResultEvent,
     MessagesSnapshotEvent
 )
 
@@ -33,11 +33,15 @@ from .event_translator import EventTranslator, adk_events_to_messages
 from .session_manager import SessionManager
 from .execution_state import ExecutionState
 from .client_proxy_toolset import ClientProxyToolset
-from .config import PredictStateMapping
+from .config import PredictStateMapping, ToolCallArgsConfig, ToolResponseConfig
+from .metrics import AgentMetrics, NoOpMetrics
 
 import logging
 logger = logging.getLogger(__name__)
 
+# Upper bound on tool calls tracked for round-trip metrics
+_MAX_TRACKED_TOOL_CALLS = 10000
+
 class ADKAgent:
     """Middleware to bridge AG-UI Protocol with Google ADK agents.
     
@@ -73,6 +77,7 @@ class ADKAgent:
         execution_timeout_seconds: int = 600,  # 10 minutes
         tool_timeout_seconds: int = 300,  # 5 minutes
         max_concurrent_executions: int = 10,
+        client_disconnect_grace_seconds: Optional[float] = None,
 
         # Session cleanup configuration
         cleanup_interval_seconds: int = 300,  # 5 minutes default
@@ -82,6 +87,15 @@ class ADKAgent:
 
         # Message snapshot configuration
         emit_messages_snapshot: bool = False,
+
+        # Tool response serialization limits
+        tool_response_config: Optional[ToolResponseConfig] = None,
+
+        # Tool call argument streaming
+        tool_call_args_config: Optional[ToolCallArgsConfig] = None,
+
+        # Instrumentation
+        metrics: Optional[AgentMetrics] = None,
     ):
         """Initialize the ADKAgent.
 
@@ -100,6 +114,12 @@ class ADKAgent:
             execution_timeout_seconds: Timeout for entire execution
             tool_timeout_seconds: Timeout for individual tool calls
             max_concurrent_executions: Maximum concurrent background executions
+            client_disconnect_grace_seconds: Opt-in. How long a background
+                execution keeps running after its client disconnects before it
+                is cancelled. Executions waiting on client-side (HITL) tool
+                results are never cancelled. None (the default) lets abandoned
+                executions run to completion (bounded only by
+                execution_timeout_seconds).
             cleanup_interval_seconds: Interval for session cleanup
             predict_state: Configuration for predictive state updates. When provided,
                 the agent will emit PredictState CustomEvents for matching tool calls,
@@ -112,6 +132,17 @@ class ADKAgent:
                 full message history (e.g., for client-side persistence or AG-UI
                 protocol compliance). Note: Clients using CopilotKit can use the
                 /agents/state endpoint instead for on-demand history retrieval.
+            tool_response_config: Size limits for tool responses emitted as
+                TOOL_CALL_RESULT content (per-string and per-collection truncation,
+                overall cap, optional offloading to a blob store). Defaults to
+                no limits.
+            tool_call_args_config: Chunk size for TOOL_CALL_ARGS deltas and the
+                size threshold above which argument serialization is offloaded
+                to a worker pool. Defaults to single-event, inline serialization.
+            metrics: Metrics/tracing hooks receiving execution-level measurements
+                (time to first event, events per execution, queue wait, session
+                service latency, translator time, tool round-trip time). Defaults
+                to NoOpMetrics.
         """
         if app_name and app_name_extractor:
             raise ValueError("Cannot specify both 'app_name' and 'app_name_extractor'")
@@ -161,6 +192,12 @@ class ADKAgent:
         self._max_concurrent = max_concurrent_executions
         self._execution_lock = asyncio.Lock()
 
+        # Cancellation of executions abandoned by disconnected clients
+        self._disconnect_grace = client_disconnect_grace_seconds
+        self._disconnect_tasks: Set[asyncio.Task] = set()
+        self._cancelled_execution_count = 0
+        self._preserved_execution_count = 0
+
         # Session lookup cache for efficient session ID to metadata mapping
         # Maps session_id -> {"app_name": str, "user_id": str}
         self._session_lookup_cache: Dict[str, Dict[str, str]] = {}
@@ -171,6 +208,16 @@ class ADKAgent:
         # Message snapshot configuration
         self._emit_messages_snapshot = emit_messages_snapshot
 
+        # Tool response serialization configuration
+        self._tool_response_config = tool_response_config
+
+        # Tool call argument streaming configuration
+        self._tool_call_args_config = tool_call_args_config
+
+        # Instrumentation hooks and emission times of client-side tool calls
+        self._metrics: AgentMetrics = metrics or NoOpMetrics()
+        self._tool_call_emitted_at: Dict[str, float] = {}
+
         # App-based configuration (set by from_app() classmethod)
         self._app: Optional["App"] = None
         self._plugin_close_timeout: float = 5.0
@@ -200,12 +247,16 @@ class ADKAgent:
         execution_timeout_seconds: int = 600,
         tool_timeout_seconds: int = 300,
         max_concurrent_executions: int = 10,
+        client_disconnect_grace_seconds: Optional[float] = None,
         # Session management
         session_timeout_seconds: Optional[int] = 1200,
         cleanup_interval_seconds: int = 300,
         # AG-UI specific
         predict_state: Optional[Iterable[PredictStateMapping]] = None,
         emit_messages_snapshot: bool = False,
+        tool_response_config: Optional[ToolResponseConfig] = None,
+        tool_call_args_config: Optional[ToolCallArgsConfig] = None,
+        metrics: Optional[AgentMetrics] = None,
     ) -> "ADKAgent":
         """Create ADKAgent from an ADK App instance.
 
@@ -233,10 +284,16 @@ class ADKAgent:
             execution_timeout_seconds: Timeout for entire execution
             tool_timeout_seconds: Timeout for individual tool calls
             max_concurrent_executions: Maximum concurrent background executions
+            client_disconnect_grace_seconds: Grace period before cancelling the
+                execution of a disconnected client (None, the default, disables
+                cancellation)
             session_timeout_seconds: Session timeout in seconds
             cleanup_interval_seconds: Interval for session cleanup
             predict_state: Configuration for predictive state updates
             emit_messages_snapshot: Whether to emit MessagesSnapshotEvent at end of runs
+            tool_response_config: Size limits for serialized tool responses
+            tool_call_args_config: Chunking/offloading for tool call arguments
+            metrics: Metrics/tracing hooks (defaults to NoOpMetrics)
 
         Returns:
             ADKAgent instance configured to use the App
@@ -272,10 +329,14 @@ class ADKAgent:
             execution_timeout_seconds=execution_timeout_seconds,
             tool_timeout_seconds=tool_timeout_seconds,
             max_concurrent_executions=max_concurrent_executions,
+            client_disconnect_grace_seconds=client_disconnect_grace_seconds,
             session_timeout_seconds=session_timeout_seconds,
             cleanup_interval_seconds=cleanup_interval_seconds,
             predict_state=predict_state,
             emit_messages_snapshot=emit_messages_snapshot,
+            tool_response_config=tool_response_config,
+            tool_call_args_config=tool_call_args_config,
+            metrics=metrics,
         )
         # Store App for per-request App creation with modified agents
         instance._app = app
@@ -307,7 +368,7 @@ class ADKAgent:
                         self._session_lookup_cache[session_id] = metadata
                         return metadata
         except Exception as e:
-            logger.error(f"Error during session metadata lookup for {session_id}: {e}")
+            logger.error("Error during session metadata lookup for %s: %s", session_id, e)
 
         return None
     
@@ -326,7 +387,7 @@ class ADKAgent:
         try:
             return self._adk_agent.name
         except Exception as e:
-            logger.warning(f"Could not get agent name for app_name, using default: {e}")
+            logger.warning("Could not get agent name for app_name, using default: %s", e)
             return "AG-UI ADK Agent"
     
     def _get_user_id(self, input: RunAgentInput) -> str:
@@ -343,6 +404,29 @@ class ADKAgent:
         # Use thread_id as default (assumes thread per user)
         return f"thread_user_{input.thread_id}"
     
+    def _record_metric(self, hook: str, *args: Any, **kwargs: Any) -> Any:
+        """Call a metrics hook; a failing recorder is logged and never breaks the run."""
+        try:
+            return getattr(self._metrics, hook)(*args, **kwargs)
+        except Exception:
+            logger.warning("Metrics hook %s failed", hook, exc_info=True)
+            return None
+
+    async def _timed_session_call(self, operation: str, awaitable: Awaitable[Any]) -> Any:
+        """Await a session service call, reporting its latency to the metrics hooks."""
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self._record_metric("record_session_call", operation, time.perf_counter() - start)
+
+    def _mark_tool_call_emitted(self, tool_call_id: str) -> None:
+        """Remember when a client-side tool call was emitted to measure its round-trip time."""
+        self._tool_call_emitted_at[tool_call_id] = time.monotonic()
+        # Results for some calls never arrive; keep the bookkeeping bounded
+        if len(self._tool_call_emitted_at) > _MAX_TRACKED_TOOL_CALLS:
+            self._tool_call_emitted_at.pop(next(iter(self._tool_call_emitted_at)))
+
     async def _add_pending_tool_call_with_context(self, session_id: str, tool_call_id: str, app_name: str, user_id: str):
         """Add a tool call to the session's pending list for HITL tracking.
 
@@ -352,15 +436,18 @@ class ADKAgent:
             app_name: App name (for session lookup)
             user_id: User ID (for session lookup)
         """
-        logger.debug(f"Adding pending tool call {tool_call_id} for session {session_id}, app_name={app_name}, user_id={user_id}")
+        logger.debug("Adding pending tool call %s for session %s, app_name=%s, user_id=%s", tool_call_id, session_id, app_name, user_id)
         try:
             # Get current pending calls using SessionManager
-            pending_calls = await self._session_manager.get_state_value(
-                session_id=session_id,
-                app_name=app_name,
-                user_id=user_id,
-                key="pending_tool_calls",
-                default=[]
+            pending_calls = await self._timed_session_call(
+                "get_state_value",
+                self._session_manager.get_state_value(
+                    session_id=session_id,
+                    app_name=app_name,
+                    user_id=user_id,
+                    key="pending_tool_calls",
+                    default=[]
+                ),
             )
 
             # Add new tool call if not already present
@@ -368,18 +455,21 @@ class ADKAgent:
                 pending_calls.append(tool_call_id)
 
                 # Update the state using SessionManager
-                success = await self._session_manager.set_state_value(
-                    session_id=session_id,
-                    app_name=app_name,
-                    user_id=user_id,
-                    key="pending_tool_calls",
-                    value=pending_calls
+                success = await self._timed_session_call(
+                    "set_state_value",
+                    self._session_manager.set_state_value(
+                        session_id=session_id,
+                        app_name=app_name,
+                        user_id=user_id,
+                        key="pending_tool_calls",
+                        value=pending_calls
+                    ),
                 )
 
                 if success:
-                    logger.info(f"Added tool call {tool_call_id} to session {session_id} pending list")
+                    logger.info("Added tool call %s to session %s pending list", tool_call_id, session_id)
         except Exception as e:
-            logger.error(f"Failed to add pending tool call {tool_call_id} to session {session_id}: {e}")
+            logger.error("Failed to add pending tool call %s to session %s: %s", tool_call_id, session_id, e)
 
     async def _remove_pending_tool_call(self, session_id: str, tool_call_id: str):
         """Remove a tool call from the session's pending list.
@@ -390,6 +480,13 @@ class ADKAgent:
             session_id: The session ID (thread_id)
             tool_call_id: The tool call ID to remove
         """
+        emitted_at = self._tool_call_emitted_at.pop(tool_call_id, None)
+        if emitted_at is not None:
+            self._record_metric(
+                "record_tool_round_trip",
+                time.monotonic() - emitted_at, tool_call_id=tool_call_id
+            )
+
         try:
             # Use efficient session metadata lookup
             metadata = self._get_session_metadata(session_id)
@@ -399,12 +496,15 @@ class ADKAgent:
                 user_id = metadata["user_id"]
 
                 # Get current pending calls using SessionManager
-                pending_calls = await self._session_manager.get_state_value(
-                    session_id=session_id,
-                    app_name=app_name,
-                    user_id=user_id,
-                    key="pending_tool_calls",
-                    default=[]
+                pending_calls = await self._timed_session_call(
+                    "get_state_value",
+                    self._session_manager.get_state_value(
+                        session_id=session_id,
+                        app_name=app_name,
+                        user_id=user_id,
+                        key="pending_tool_calls",
+                        default=[]
+                    ),
                 )
 
                 # Remove tool call if present
@@ -412,18 +512,21 @@ class ADKAgent:
                     pending_calls.remove(tool_call_id)
 
                     # Update the state using SessionManager
-                    success = await self._session_manager.set_state_value(
-                        session_id=session_id,
-                        app_name=app_name,
-                        user_id=user_id,
-                        key="pending_tool_calls",
-                        value=pending_calls
+                    success = await self._timed_session_call(
+                        "set_state_value",
+                        self._session_manager.set_state_value(
+                            session_id=session_id,
+                            app_name=app_name,
+                            user_id=user_id,
+                            key="pending_tool_calls",
+                            value=pending_calls
+                        ),
                     )
 
                     if success:
-                        logger.info(f"Removed tool call {tool_call_id} from session {session_id} pending list")
+                        logger.info("Removed tool call %s from session %s pending list", tool_call_id, session_id)
         except Exception as e:
-            logger.error(f"Failed to remove pending tool call {tool_call_id} from session {session_id}: {e}")
+            logger.error("Failed to remove pending tool call %s from session %s: %s", tool_call_id, session_id, e)
     
     async def _get_pending_tool_call_ids(self, session_id: str) -> Optional[List[str]]:
         """Fetch the pending tool call identifiers tracked for a session."""
@@ -431,12 +534,15 @@ class ADKAgent:
             metadata = self._get_session_metadata(session_id)
 
             if metadata:
-                pending_calls = await self._session_manager.get_state_value(
-                    session_id=session_id,
-                    app_name=metadata["app_name"],
-                    user_id=metadata["user_id"],
-                    key="pending_tool_calls",
-                    default=[],
+                pending_calls = await self._timed_session_call(
+                    "get_state_value",
+                    self._session_manager.get_state_value(
+                        session_id=session_id,
+                        app_name=metadata["app_name"],
+                        user_id=metadata["user_id"],
+                        key="pending_tool_calls",
+                        default=[],
+                    ),
                 )
 
                 if pending_calls is None:
@@ -444,7 +550,7 @@ class ADKAgent:
 
                 return list(pending_calls)
         except Exception as e:
-            logger.error(f"Failed to fetch pending tool calls for session {session_id}: {e}")
+            logger.error("Failed to fetch pending tool calls for session %s: %s", session_id, e)
 
         return None
 
@@ -568,7 +674,7 @@ class ADKAgent:
                     index = i
                     break
 
-        logger.debug(f"[RUN_LOOP] Starting message loop for thread={input.thread_id}, total_unseen={total_unseen}, starting_index={index}")
+        logger.debug("[RUN_LOOP] Starting message loop for thread=%s, total_unseen=%s, starting_index=%s", input.thread_id, total_unseen, index)
 
         while index < total_unseen:
             current = unseen_messages[index]
@@ -708,13 +814,13 @@ class ADKAgent:
                 if upcoming_tool_batch_skipped:
                     # Skip this message batch - it's part of historical backend tool interaction
                     # Mark the messages as processed
-                    logger.debug(f"[RUN_LOOP] Skipping message batch (upcoming tool batch will be skipped)")
+                    logger.debug("[RUN_LOOP] Skipping message batch (upcoming tool batch will be skipped)")
                     batch_ids = self._collect_message_ids(message_batch)
                     if batch_ids:
                         self._session_manager.mark_messages_processed(app_name, input.thread_id, batch_ids)
                     continue
 
-                logger.debug(f"[RUN_LOOP] Calling _start_new_execution with message_batch of {len(message_batch)} messages")
+                logger.debug("[RUN_LOOP] Calling _start_new_execution with message_batch of %s messages", len(message_batch))
                 async for event in self._start_new_execution(input, message_batch=message_batch):
                     yield event
     
@@ -722,11 +828,14 @@ class ADKAgent:
         """Ensure a session exists, creating it if necessary via session manager."""
         try:
             # Use session manager to get or create session
-            adk_session = await self._session_manager.get_or_create_session(
-                session_id=session_id,
-                app_name=app_name,  # Use app_name for session management
-                user_id=user_id,
-                initial_state=initial_state
+            adk_session = await self._timed_session_call(
+                "get_or_create_session",
+                self._session_manager.get_or_create_session(
+                    session_id=session_id,
+                    app_name=app_name,  # Use app_name for session management
+                    user_id=user_id,
+                    initial_state=initial_state
+                ),
             )
 
             # Update session lookup cache for efficient session ID to metadata mapping
@@ -735,10 +844,10 @@ class ADKAgent:
                 "user_id": user_id
             }
 
-            logger.debug(f"Session ready: {session_id} for user: {user_id}")
+            logger.debug("Session ready: %s for user: %s", session_id, user_id)
             return adk_session
         except Exception as e:
-            logger.error(f"Failed to ensure session {session_id}: {e}")
+            logger.error("Failed to ensure session %s: %s", session_id, e)
             raise
 
     async def _convert_latest_message(
@@ -890,7 +999,7 @@ class ADKAgent:
 
         # If there were no actual tool messages at all, this is an error
         if not tool_results:
-            logger.error(f"Tool result submission without tool results for thread {thread_id}")
+            logger.error("Tool result submission without tool results for thread %s", thread_id)
             yield RunErrorEvent(
                 type=EventType.RUN_ERROR,
                 message="No tool results found in submission",
@@ -924,7 +1033,7 @@ class ADKAgent:
                 yield event
 
         except Exception as e:
-            logger.error(f"Error handling tool results: {e}", exc_info=True)
+            logger.error("Error handling tool results: %s", e, exc_info=True)
             yield RunErrorEvent(
                 type=EventType.RUN_ERROR,
                 message=f"Failed to process tool results: {str(e)}",
@@ -1004,39 +1113,49 @@ class ADKAgent:
         Yields:
             AG-UI events from the queue
         """
-        logger.debug(f"Starting _stream_events for thread {execution.thread_id}, queue ID: {id(execution.event_queue)}")
+        logger.debug("Starting _stream_events for thread %s, queue ID: %s", execution.thread_id, id(execution.event_queue))
         event_count = 0
         timeout_count = 0
+        # Start of the current wait; spans the 1 s polls until an event arrives
+        wait_started: Optional[float] = None
         
         while True:
             try:
-                logger.debug(f"Waiting for event from queue (thread {execution.thread_id}, queue size: {execution.event_queue.qsize()})")
+                logger.debug("Waiting for event from queue (thread %s, queue size: %s)", execution.thread_id, execution.event_queue.qsize())
                 
                 # Wait for event with timeout
+                if wait_started is None:
+                    wait_started = time.perf_counter()
                 event = await asyncio.wait_for(
                     execution.event_queue.get(),
                     timeout=1.0  # Check every second
                 )
+                self._record_metric(
+                    "record_queue_wait",
+                    time.perf_counter() - wait_started,
+                    thread_id=execution.thread_id,
+                )
+                wait_started = None
                 
                 event_count += 1
-                logger.debug(f"Got event #{event_count} from queue: {type(event).__name__ if event else 'None'} (thread {execution.thread_id})")
+                logger.debug("Got event #%s from queue: %s (thread %s)", event_count, type(event).__name__ if event else 'None', execution.thread_id)
 
                 if event is None:
                     # Execution complete
                     execution.is_complete = True
-                    logger.debug(f"Execution complete for thread {execution.thread_id} after {event_count} events")
+                    logger.debug("Execution complete for thread %s after %s events", execution.thread_id, event_count)
                     break
                 
-                logger.debug(f"Streaming event #{event_count}: {type(event).__name__} (thread {execution.thread_id})")
+                logger.debug("Streaming event #%s: %s (thread %s)", event_count, type(event).__name__, execution.thread_id)
                 yield event
                 
             except asyncio.TimeoutError:
                 timeout_count += 1
-                logger.debug(f"Timeout #{timeout_count} waiting for events (thread {execution.thread_id}, task done: {execution.task.done()}, queue size: {execution.event_queue.qsize()})")
+                logger.debug("Timeout #%s waiting for events (thread %s, task done: %s, queue size: %s)", timeout_count, execution.thread_id, execution.task.done(), execution.event_queue.qsize())
                 
                 # Check if execution is stale
                 if execution.is_stale(self._execution_timeout):
-                    logger.error(f"Execution timed out for thread {execution.thread_id}")
+                    logger.error("Execution timed out for thread %s", execution.thread_id)
                     yield RunErrorEvent(
                         type=EventType.RUN_ERROR,
                         message="Execution timed out",
@@ -1050,17 +1169,17 @@ class ADKAgent:
                     execution.is_complete = True
                     try:
                         task_result = execution.task.result()
-                        logger.debug(f"Task completed with result: {task_result} (thread {execution.thread_id})")
+                        logger.debug("Task completed with result: %s (thread %s)", task_result, execution.thread_id)
                     except Exception as e:
-                        logger.debug(f"Task completed with exception: {e} (thread {execution.thread_id})")
+                        logger.debug("Task completed with exception: %s (thread %s)", e, execution.thread_id)
                     
                     # Wait a bit more in case there are events still coming
-                    logger.debug(f"Task done but no None signal - checking queue one more time (thread {execution.thread_id}, queue size: {execution.event_queue.qsize()})")
+                    logger.debug("Task done but no None signal - checking queue one more time (thread %s, queue size: %s)", execution.thread_id, execution.event_queue.qsize())
                     if execution.event_queue.qsize() > 0:
-                        logger.debug(f"Found {execution.event_queue.qsize()} events in queue after task completion, continuing...")
+                        logger.debug("Found %s events in queue after task completion, continuing...", execution.event_queue.qsize())
                         continue
                     
-                    logger.debug(f"Task completed without sending None signal (thread {execution.thread_id})")
+                    logger.debug("Task completed without sending None signal (thread %s)", execution.thread_id)
                     break
     
     async def _start_new_execution(
@@ -1078,14 +1197,24 @@ class ADKAgent:
         Yields:
             AG-UI events from the execution
         """
+        metrics_token = self._record_metric("start_execution", input.thread_id, input.run_id)
+        streamed_events = 0
+        execution_error: Optional[BaseException] = None
+        execution: Optional[ExecutionState] = None
+        tool_call_ids: List[str] = []
+        # Calls of frontend tools, whose results come from the client
+        client_tool_names = {tool.name for tool in input.tools or []}
+        client_tool_call_ids: Set[str] = set()
+        stream_finished = False
         try:
             # Emit RUN_STARTED
-            logger.debug(f"Emitting RUN_STARTED for thread {input.thread_id}, run {input.run_id}")
+            logger.debug("Emitting RUN_STARTED for thread %s, run %s", input.thread_id, input.run_id)
             yield RunStartedEvent(
                 type=EventType.RUN_STARTED,
                 thread_id=input.thread_id,
                 run_id=input.run_id
             )
+            run_started_at = time.perf_counter()
             
             # Check concurrent execution limit
             async with self._execution_lock:
@@ -1103,11 +1232,11 @@ class ADKAgent:
 
             # If there was an existing execution, wait for it to complete
             if existing_execution and not existing_execution.is_complete:
-                logger.debug(f"Waiting for existing execution to complete for thread {input.thread_id}")
+                logger.debug("Waiting for existing execution to complete for thread %s", input.thread_id)
                 try:
                     await existing_execution.task
                 except Exception as e:
-                    logger.debug(f"Previous execution completed with error: {e}")
+                    logger.debug("Previous execution completed with error: %s", e)
             
             # Start background execution
             execution = await self._start_background_execution(
@@ -1121,32 +1250,49 @@ class ADKAgent:
                 self._active_executions[input.thread_id] = execution
             
             # Stream events and track tool calls
-            logger.debug(f"Starting to stream events for execution {execution.thread_id}")
+            logger.debug("Starting to stream events for execution %s", execution.thread_id)
             has_tool_calls = False
-            tool_call_ids = []
 
-            logger.debug(f"About to iterate over _stream_events for execution {execution.thread_id}")
+            logger.debug("About to iterate over _stream_events for execution %s", execution.thread_id)
             async for event in self._stream_events(execution):
+                streamed_events += 1
+                if streamed_events == 1:
+                    self._record_metric(
+                        "record_time_to_first_event",
+                        time.perf_counter() - run_started_at, thread_id=input.thread_id
+                    )
+
                 # Track tool calls for HITL scenarios
+                if (
+                    isinstance(event, ToolCallStartEvent)
+                    and event.tool_call_name in client_tool_names
+                ):
+                    client_tool_call_ids.add(event.tool_call_id)
                 if isinstance(event, ToolCallEndEvent):
-                    logger.info(f"Detected ToolCallEndEvent with id: {event.tool_call_id}")
+                    logger.info("Detected ToolCallEndEvent with id: %s", event.tool_call_id)
                     has_tool_calls = True
                     tool_call_ids.append(event.tool_call_id)
+                    # Only client-side calls get their result back through
+                    # _remove_pending_tool_call
+                    if event.tool_call_id in client_tool_call_ids:
+                        self._mark_tool_call_emitted(event.tool_call_id)
 
                 # backend tools will always emit ToolCallResultEvent
                 # If it is a backend tool then we don't need to add the tool_id in pending_tools
                 if isinstance(event, ToolCallResultEvent) and event.tool_call_id in tool_call_ids:
-                    logger.info(f"Detected ToolCallResultEvent with id: {event.tool_call_id}")
+                    logger.info("Detected ToolCallResultEvent with id: %s", event.tool_call_id)
                     tool_call_ids.remove(event.tool_call_id)
                     # Mark tool_call_id as processed so replay will skip it (fixes #437 replay bug)
                     self._session_manager.mark_messages_processed(
                         self._get_app_name(input), execution.thread_id, [event.tool_call_id]
                     )
 
-                logger.debug(f"Yielding event: {type(event).__name__}")
+                logger.debug("Yielding event: %s", type(event).__name__)
                 yield event
 
-            logger.debug(f"Finished iterating over _stream_events for execution {execution.thread_id}")
+            stream_finished = True
+            logger.debug("Finished iterating over _stream_events for execution %s", execution.thread_id)
+            self._record_metric("record_events_per_execution", streamed_events, thread_id=input.thread_id)
 
             # If we found tool calls, add them to session state BEFORE cleanup
             if has_tool_calls:
@@ -1156,10 +1302,10 @@ class ADKAgent:
                     await self._add_pending_tool_call_with_context(
                         execution.thread_id, tool_call_id, app_name, user_id
                     )
-            logger.debug(f"Finished streaming events for execution {execution.thread_id}")
+            logger.debug("Finished streaming events for execution %s", execution.thread_id)
             
             # Emit RUN_FINISHED
-            logger.debug(f"Emitting RUN_FINISHED for thread {input.thread_id}, run {input.run_id}")
+            logger.debug("Emitting RUN_FINISHED for thread %s, run %s", input.thread_id, input.run_id)
             yield RunFinishedEvent(
                 type=EventType.RUN_FINISHED,
                 thread_id=input.thread_id,
@@ -1167,18 +1313,37 @@ class ADKAgent:
             )
             
         except Exception as e:
-            logger.error(f"Error in new execution: {e}", exc_info=True)
+            stream_finished = True
+            execution_error = e
+            logger.error("Error in new execution: %s", e, exc_info=True)
             yield RunErrorEvent(
                 type=EventType.RUN_ERROR,
                 message=str(e),
                 code="EXECUTION_ERROR"
             )
         finally:
+            self._record_metric(
+                "end_execution",
+                metrics_token, event_count=streamed_events, error=execution_error
+            )
+
+            # The consumer went away mid-stream (client disconnect): the
+            # background task would otherwise keep running unobserved
+            if execution is not None and not stream_finished and not execution.task.done():
+                # Backend tools still executing don't count: nobody will
+                # collect their results
+                self.handle_client_disconnect(
+                    execution.thread_id,
+                    execution=execution,
+                    awaiting_tool_results=any(
+                        tool_call_id in client_tool_call_ids for tool_call_id in tool_call_ids
+                    ),
+                )
             # Clean up execution if complete and no pending tool calls (HITL scenarios)
             async with self._execution_lock:
                 if input.thread_id in self._active_executions:
-                    execution = self._active_executions[input.thread_id]
-                    execution.is_complete = True
+                    active_execution = self._active_executions[input.thread_id]
+                    active_execution.is_complete = True
 
                     # Check if session has pending tool calls before cleanup
                     has_pending = await self._has_pending_tool_calls(input.thread_id)
@@ -1201,7 +1366,7 @@ class ADKAgent:
             ExecutionState tracking the background execution
         """
         event_queue = asyncio.Queue()
-        logger.debug(f"Created event queue {id(event_queue)} for thread {input.thread_id}")
+        logger.debug("Created event queue %s for thread %s", id(event_queue), input.thread_id)
         # Extract necessary information
         user_id = self._get_user_id(input)
         app_name = self._get_app_name(input)
@@ -1240,14 +1405,14 @@ class ADKAgent:
                         new_instruction = instruction_provider_wrapper_sync
 
                     logger.debug(
-                        f"Will wrap callable InstructionProvider and append SystemMessage: '{system_content[:100]}...'")
+                        "Will wrap callable InstructionProvider and append SystemMessage: '%s...'", system_content[:100])
                 else:
                     # Handle string instructions
                     if current_instruction:
                         new_instruction = f"{current_instruction}\n\n{system_content}"
                     else:
                         new_instruction = system_content
-                    logger.debug(f"Will append SystemMessage to string instructions: '{system_content[:100]}...'")
+                    logger.debug("Will append SystemMessage to string instructions: '%s...'", system_content[:100])
 
                 agent_updates['instruction'] = new_instruction
 
@@ -1276,15 +1441,15 @@ class ADKAgent:
             # Combine existing tools with our proxy toolset
             combined_tools = existing_tools + [toolset]
             agent_updates['tools'] = combined_tools
-            logger.debug(f"Will combine {len(existing_tools)} existing tools with proxy toolset")
+            logger.debug("Will combine %s existing tools with proxy toolset", len(existing_tools))
         
         # Create a single copy of the agent with all updates if any modifications needed
         if agent_updates:
             adk_agent = adk_agent.model_copy(update=agent_updates)
-            logger.debug(f"Created modified agent copy with updates: {list(agent_updates.keys())}")
+            logger.debug("Created modified agent copy with updates: %s", list(agent_updates.keys()))
         
         # Create background task
-        logger.debug(f"Creating background task for thread {input.thread_id}")
+        logger.debug("Creating background task for thread %s", input.thread_id)
         run_kwargs = {
             "input": input,
             "adk_agent": adk_agent,
@@ -1300,12 +1465,13 @@ class ADKAgent:
             run_kwargs["message_batch"] = message_batch
 
         task = asyncio.create_task(self._run_adk_in_background(**run_kwargs))
-        logger.debug(f"Background task created for thread {input.thread_id}: {task}")
+        logger.debug("Background task created for thread %s: %s", input.thread_id, task)
         
         return ExecutionState(
             task=task,
             thread_id=input.thread_id,
-            event_queue=event_queue
+            event_queue=event_queue,
+            run_id=input.run_id
         )
     
     async def _run_adk_in_background(
@@ -1328,8 +1494,8 @@ class ADKAgent:
             event_queue: Queue for emitting events
         """
         runner: Optional[Runner] = None
-        logger.debug(f"[BG_EXEC] _run_adk_in_background called for thread={input.thread_id}")
-        logger.debug(f"[BG_EXEC]   tool_results={len(tool_results) if tool_results else 0}, message_batch={len(message_batch) if message_batch else 0}")
+        logger.debug("[BG_EXEC] _run_adk_in_background called for thread=%s", input.thread_id)
+        logger.debug("[BG_EXEC]   tool_results=%s, message_batch=%s", len(tool_results) if tool_results else 0, len(message_batch) if message_batch else 0)
         try:
             # Agent is already prepared with tools and SystemMessage instructions (if any)
             # from _start_background_execution, so no additional agent copying needed here
@@ -1351,7 +1517,10 @@ class ADKAgent:
 
             # this will always update the backend states with the frontend states
             # Recipe Demo Example: if there is a state "salt" in the ingredients state and in frontend user remove this salt state using UI from the ingredients list then our backend should also update these state changes as well to sync both the states
-            await self._session_manager.update_session_state(input.thread_id,app_name,user_id,input.state)
+            await self._timed_session_call(
+                "update_session_state",
+                self._session_manager.update_session_state(input.thread_id,app_name,user_id,input.state),
+            )
 
             # Convert messages
             unseen_messages = message_batch if message_batch is not None else await self._get_unseen_messages(input)
@@ -1386,7 +1555,7 @@ class ADKAgent:
                     content = tool_msg['message'].content
 
                     # Debug: Log the actual tool message content we received
-                    logger.debug(f"Received tool result for call {tool_call_id}: content='{content}', type={type(content)}")
+                    logger.debug("Received tool result for call %s: content='%s', type=%s", tool_call_id, content, type(content))
 
                     # Parse content - try JSON first, fall back to plain string
                     try:
@@ -1397,15 +1566,15 @@ class ADKAgent:
                             except json.JSONDecodeError:
                                 # Not valid JSON - treat as plain string result
                                 result = {"success": True, "result": content, "status": "completed"}
-                                logger.debug(f"Tool result for {tool_call_id} is plain string, wrapped in result object")
+                                logger.debug("Tool result for %s is plain string, wrapped in result object", tool_call_id)
                         else:
                             # Handle empty content as a success with empty result
                             result = {"success": True, "result": None, "status": "completed"}
-                            logger.warning(f"Empty tool result content for tool call {tool_call_id}, using empty success result")
+                            logger.warning("Empty tool result content for tool call %s, using empty success result", tool_call_id)
                     except Exception as e:
                         # Handle any other error
                         result = {"success": True, "result": str(content) if content else None, "status": "completed"}
-                        logger.warning(f"Error processing tool result for {tool_call_id}: {e}, using string fallback")
+                        logger.warning("Error processing tool result for %s: %s, using string fallback", tool_call_id, e)
 
                     updated_function_response_part = types.Part(
                         function_response=types.FunctionResponse(
@@ -1417,15 +1586,17 @@ class ADKAgent:
                     function_response_parts.append(updated_function_response_part)
 
                 # Add FunctionResponse as separate event to session
-                session = await self._session_manager.get_or_create_session(
-                    session_id=input.thread_id,
-                    app_name=app_name,
-                    user_id=user_id,
-                    initial_state=input.state
+                session = await self._timed_session_call(
+                    "get_or_create_session",
+                    self._session_manager.get_or_create_session(
+                        session_id=input.thread_id,
+                        app_name=app_name,
+                        user_id=user_id,
+                        initial_state=input.state
+                    ),
                 )
 
                 from google.adk.sessions.session import Event
-                import time
 
                 function_response_content = types.Content(parts=function_response_parts, role='user')
                 function_response_event = Event(
@@ -1434,7 +1605,10 @@ class ADKAgent:
                     content=function_response_content
                 )
 
-                await self._session_manager._session_service.append_event(session, function_response_event)
+                await self._timed_session_call(
+                    "append_event",
+                    self._session_manager._session_service.append_event(session, function_response_event),
+                )
 
                 # Mark user messages from message_batch as processed
                 if message_batch:
@@ -1452,7 +1626,7 @@ class ADKAgent:
                     tool_call_id = tool_msg['message'].tool_call_id
                     content = tool_msg['message'].content
 
-                    logger.debug(f"Received tool result for call {tool_call_id}: content='{content}', type={type(content)}")
+                    logger.debug("Received tool result for call %s: content='%s', type=%s", tool_call_id, content, type(content))
 
                     # Parse content - try JSON first, fall back to plain string
                     try:
@@ -1463,14 +1637,14 @@ class ADKAgent:
                             except json.JSONDecodeError:
                                 # Not valid JSON - treat as plain string result
                                 result = {"success": True, "result": content, "status": "completed"}
-                                logger.debug(f"Tool result for {tool_call_id} is plain string, wrapped in result object")
+                                logger.debug("Tool result for %s is plain string, wrapped in result object", tool_call_id)
                         else:
                             result = {"success": True, "result": None, "status": "completed"}
-                            logger.warning(f"Empty tool result content for tool call {tool_call_id}, using empty success result")
+                            logger.warning("Empty tool result content for tool call %s, using empty success result", tool_call_id)
                     except Exception as e:
                         # Handle any other error
                         result = {"success": True, "result": str(content) if content else None, "status": "completed"}
-                        logger.warning(f"Error processing tool result for {tool_call_id}: {e}, using string fallback")
+                        logger.warning("Error processing tool result for %s: %s, using string fallback", tool_call_id, e)
 
                     updated_function_response_part = types.Part(
                         function_response=types.FunctionResponse(
@@ -1490,15 +1664,22 @@ class ADKAgent:
                     user_message = await self._convert_latest_message(input, input.messages)
                 new_message = user_message
 
-            # Create event translator with predictive state configuration
-            event_translator = EventTranslator(predict_state=self._predict_state)
+            # Create event translator with predictive state and tool response configuration
+            event_translator = EventTranslator(
+                predict_state=self._predict_state,
+                tool_response_config=self._tool_response_config,
+                tool_call_args_config=self._tool_call_args_config,
+            )
 
             try:
-                session = await self._session_manager.get_or_create_session(
-                    session_id=input.thread_id,
-                    app_name=app_name,
-                    user_id=user_id,
-                    initial_state=input.state
+                session = await self._timed_session_call(
+                    "get_or_create_session",
+                    self._session_manager.get_or_create_session(
+                        session_id=input.thread_id,
+                        app_name=app_name,
+                        user_id=user_id,
+                        initial_state=input.state
+                    ),
                 )
 
                 # Check session events (ADK stores conversation in events)
@@ -1572,22 +1753,28 @@ class ADKAgent:
                 # Note: We don't exclude based on finish_reason - final responses with content
                 # (e.g., after backend tool completion) must still be translated.
                 if (not has_lro_function_call) and (is_streaming_chunk or has_content or has_function_responses):
-                    # Regular translation path
+                    # Regular translation path; translator time excludes queue puts
+                    translator_seconds = 0.0
+                    translate_started = time.perf_counter()
                     async for ag_ui_event in event_translator.translate(
                         adk_event,
                         input.thread_id,
                         input.run_id
                     ):
+                        translator_seconds += time.perf_counter() - translate_started
 
-                        logger.debug(f"Emitting event to queue: {type(ag_ui_event).__name__} (thread {input.thread_id}, queue size before: {event_queue.qsize()})")
+                        logger.debug("Emitting event to queue: %s (thread %s, queue size before: %s)", type(ag_ui_event).__name__, input.thread_id, event_queue.qsize())
                         await event_queue.put(ag_ui_event)
-                        logger.debug(f"Event queued: {type(ag_ui_event).__name__} (thread {input.thread_id}, queue size after: {event_queue.qsize()})")
+                        logger.debug("Event queued: %s (thread %s, queue size after: %s)", type(ag_ui_event).__name__, input.thread_id, event_queue.qsize())
+                        translate_started = time.perf_counter()
+                    translator_seconds += time.perf_counter() - translate_started
+                    self._record_metric("record_translator_time", translator_seconds, thread_id=input.thread_id)
                 else:
                     # LongRunning Tool events are usually emitted in final response
                     # Ensure any active streaming text message is closed BEFORE tool calls
                     async for end_event in event_translator.force_close_streaming_message():
                         await event_queue.put(end_event)
-                        logger.debug(f"Event queued (forced close): {type(end_event).__name__} (thread {input.thread_id}, queue size after: {event_queue.qsize()})")
+                        logger.debug("Event queued (forced close): %s (thread %s, queue size after: %s)", type(end_event).__name__, input.thread_id, event_queue.qsize())
 
                     async for ag_ui_event in event_translator.translate_lro_function_calls(
                         adk_event
@@ -1595,7 +1782,7 @@ class ADKAgent:
                         await event_queue.put(ag_ui_event)
                         if ag_ui_event.type == EventType.TOOL_CALL_END:
                             is_long_running_tool = True
-                        logger.debug(f"Event queued: {type(ag_ui_event).__name__} (thread {input.thread_id}, queue size after: {event_queue.qsize()})")
+                        logger.debug("Event queued: %s (thread %s, queue size after: %s)", type(ag_ui_event).__name__, input.thread_id, event_queue.qsize())
                     # hard stop the execution if we find any long running tool
                     if is_long_running_tool:
                         return
@@ -1604,7 +1791,10 @@ class ADKAgent:
             async for ag_ui_event in event_translator.force_close_streaming_message():
                 await event_queue.put(ag_ui_event)
             # moving states snapshot events after the text event clousure to avoid this error https://github.com/Contextable/ag-ui/issues/28
-            final_state = await self._session_manager.get_session_state(input.thread_id,app_name,user_id)
+            final_state = await self._timed_session_call(
+                "get_session_state",
+                self._session_manager.get_session_state(input.thread_id,app_name,user_id),
+            )
             if final_state:
                 ag_ui_event =  event_translator._create_state_snapshot_event(final_state)
                 await event_queue.put(ag_ui_event)
@@ -1613,10 +1803,13 @@ class ADKAgent:
             if self._emit_messages_snapshot:
                 try:
                     # Get the existing session (should exist since we're at end of run)
-                    session = await self._session_manager.get_or_create_session(
-                        session_id=input.thread_id,
-                        app_name=app_name,
-                        user_id=user_id
+                    session = await self._timed_session_call(
+                        "get_or_create_session",
+                        self._session_manager.get_or_create_session(
+                            session_id=input.thread_id,
+                            app_name=app_name,
+                            user_id=user_id
+                        ),
                     )
                     if session and hasattr(session, 'events') and session.events:
                         messages = adk_events_to_messages(session.events)
@@ -1626,24 +1819,24 @@ class ADKAgent:
                                 messages=messages
                             )
                             await event_queue.put(messages_snapshot_event)
-                            logger.debug(f"Emitted MESSAGES_SNAPSHOT with {len(messages)} messages for thread {input.thread_id}")
+                            logger.debug("Emitted MESSAGES_SNAPSHOT with %s messages for thread %s", len(messages), input.thread_id)
                 except Exception as snapshot_error:
-                    logger.warning(f"Failed to emit MESSAGES_SNAPSHOT for thread {input.thread_id}: {snapshot_error}")
+                    logger.warning("Failed to emit MESSAGES_SNAPSHOT for thread %s: %s", input.thread_id, snapshot_error)
 
             # Emit any deferred confirm_changes events LAST, right before completion
             # This ensures the frontend sees confirm_changes as the last tool call event,
             # keeping the confirmation dialog in "executing" status with buttons enabled
             for deferred_event in event_translator.get_and_clear_deferred_confirm_events():
-                logger.debug(f"Emitting deferred confirm_changes event: {type(deferred_event).__name__}")
+                logger.debug("Emitting deferred confirm_changes event: %s", type(deferred_event).__name__)
                 await event_queue.put(deferred_event)
 
             # Signal completion - ADK execution is done
-            logger.debug(f"Background task sending completion signal for thread {input.thread_id}")
+            logger.debug("Background task sending completion signal for thread %s", input.thread_id)
             await event_queue.put(None)
-            logger.debug(f"Background task completion signal sent for thread {input.thread_id}")
+            logger.debug("Background task completion signal sent for thread %s", input.thread_id)
             
         except Exception as e:
-            logger.error(f"Background execution error: {e}", exc_info=True)
+            logger.error("Background execution error: %s", e, exc_info=True)
             # Put error in queue
             await event_queue.put(
                 RunErrorEvent(
@@ -1670,6 +1863,95 @@ class ADKAgent:
                             close_error,
                         )
     
+    @property
+    def client_disconnect_grace_seconds(self) -> Optional[float]:
+        """Grace period before abandoned executions are cancelled (None when disabled)."""
+        return self._disconnect_grace
+
+    @property
+    def cancelled_execution_count(self) -> int:
+        """Number of executions cancelled because their client disconnected."""
+        return self._cancelled_execution_count
+
+    @property
+    def preserved_execution_count(self) -> int:
+        """Number of disconnected executions kept alive for pending HITL tool calls."""
+        return self._preserved_execution_count
+
+    def handle_client_disconnect(
+        self,
+        thread_id: str,
+        *,
+        run_id: Optional[str] = None,
+        execution: Optional[ExecutionState] = None,
+        awaiting_tool_results: bool = False,
+    ) -> None:
+        """Schedule cancellation of a thread's execution after its client disconnected.
+
+        The execution is cancelled once ``client_disconnect_grace_seconds`` have
+        elapsed, unless it finished in the meantime or is waiting on client-side
+        tool results (HITL), in which case it is preserved.
+
+        Args:
+            thread_id: Thread whose client disconnected
+            run_id: Run whose client disconnected. The thread's active execution
+                is left alone if it belongs to another run (e.g. a newer
+                request on the same thread after a page refresh).
+            execution: The abandoned execution (defaults to the thread's active one)
+            awaiting_tool_results: Whether client-side tool calls were emitted
+                without a result yet
+        """
+        if self._disconnect_grace is None:
+            return
+
+        if execution is None:
+            execution = self._active_executions.get(thread_id)
+            if execution is not None and run_id is not None and execution.run_id != run_id:
+                return
+        if execution is None or execution.task.done():
+            return
+        if getattr(execution, "client_disconnected", False):
+            return
+        execution.client_disconnected = True
+
+        logger.info(
+            "Client disconnected from thread %s; cancelling execution in %ss",
+            thread_id,
+            self._disconnect_grace,
+        )
+        task = asyncio.create_task(
+            self._cancel_abandoned_execution(execution, awaiting_tool_results)
+        )
+        self._disconnect_tasks.add(task)
+        task.add_done_callback(self._disconnect_tasks.discard)
+
+    async def _cancel_abandoned_execution(
+        self, execution: ExecutionState, awaiting_tool_results: bool
+    ) -> None:
+        """Cancel an abandoned execution after the disconnect grace period."""
+        await asyncio.sleep(self._disconnect_grace)
+        if execution.task.done():
+            return
+
+        thread_id = execution.thread_id
+        if (
+            awaiting_tool_results
+            or execution.has_pending_tool_calls()
+            or await self._has_pending_tool_calls(thread_id)
+        ):
+            self._preserved_execution_count += 1
+            logger.info("Preserving disconnected execution for thread %s (pending tool calls)", thread_id)
+            return
+
+        await execution.cancel()
+        async with self._execution_lock:
+            if self._active_executions.get(thread_id) is execution:
+                del self._active_executions[thread_id]
+
+        self._cancelled_execution_count += 1
+        self._record_metric("record_cancelled_execution", thread_id=thread_id, reason="client_disconnect")
+        logger.info("Cancelled execution for thread %s after client disconnect", thread_id)
+
     async def _cleanup_stale_executions(self):
         """Clean up stale executions."""
         stale_threads = []
@@ -1681,11 +1963,14 @@ class ADKAgent:
         for thread_id in stale_threads:
             execution = self._active_executions.pop(thread_id)
             await execution.cancel()
-            logger.info(f"Cleaned up stale execution for thread {thread_id}")
+            logger.info("Cleaned up stale execution for thread %s", thread_id)
 
     async def close(self):
         """Clean up resources including active executions."""
-        # Cancel all active executions
+        # Cancel pending disconnect handling, then all active executions
+        for task in list(self._disconnect_tasks):
+            task.cancel()
+
         async with self._execution_lock:
             for execution in self._active_executions.values():
                 await execution.cancel()
@@ -97,8 +97,8 @@ class ClientProxyTool(BaseTool):
         the ADK's automatic function calling has difficulty parsing our
         dynamically created function signature without proper type annotations.
         """
-        logger.debug(f"_get_declaration called for {self.name}")
-        logger.debug(f"AG-UI tool parameters: {self.ag_ui_tool.parameters}")
+        logger.debug("_get_declaration called for %s", self.name)
+        logger.debug("AG-UI tool parameters: %s", self.ag_ui_tool.parameters)
 
         # Convert AG-UI parameters (JSON Schema) to ADK format
         parameters = self.ag_ui_tool.parameters
@@ -107,7 +107,7 @@ class ClientProxyTool(BaseTool):
         # Ensure it's a proper object schema
         if not isinstance(parameters, dict):
             parameters = {"type": "object", "properties": {}}
-            logger.warning(f"Tool {self.name} had non-dict parameters, using empty schema")
+            logger.warning("Tool %s had non-dict parameters, using empty schema", self.name)
 
         # Create FunctionDeclaration
         function_declaration = types.FunctionDeclaration(
@@ -115,7 +115,7 @@ class ClientProxyTool(BaseTool):
             description=self.description,
             parameters=types.Schema.model_validate(parameters)
         )
-        logger.debug(f"Created FunctionDeclaration for {self.name}: {function_declaration}")
+        logger.debug("Created FunctionDeclaration for %s: %s", self.name, function_declaration)
         return function_declaration
 
     async def run_async(
@@ -150,20 +150,20 @@ class ClientProxyTool(BaseTool):
         Returns:
             None for long-running tools
         """
-        logger.debug(f"Proxy tool execution: {self.ag_ui_tool.name}")
-        logger.debug(f"Arguments received: {args}")
-        logger.debug(f"Tool context type: {type(tool_context)}")
+        logger.debug("Proxy tool execution: %s", self.ag_ui_tool.name)
+        logger.debug("Arguments received: %s", args)
+        logger.debug("Tool context type: %s", type(tool_context))
 
         # Extract ADK-generated function call ID if available
         adk_function_call_id = None
         if tool_context and hasattr(tool_context, 'function_call_id'):
             adk_function_call_id = tool_context.function_call_id
-            logger.debug(f"Using ADK function_call_id: {adk_function_call_id}")
+            logger.debug("Using ADK function_call_id: %s", adk_function_call_id)
 
         # Use ADK ID if available, otherwise fall back to generated ID
         tool_call_id = adk_function_call_id or f"call_{uuid.uuid4().hex[:8]}"
         if not adk_function_call_id:
-            logger.warning(f"ADK function_call_id not available, generated: {tool_call_id}")
+            logger.warning("ADK function_call_id not available, generated: %s", tool_call_id)
 
         try:
             # Emit TOOL_CALL_START event
@@ -173,7 +173,7 @@ class ClientProxyTool(BaseTool):
                 tool_call_name=self.ag_ui_tool.name
             )
             await self.event_queue.put(start_event)
-            logger.debug(f"Emitted TOOL_CALL_START for {tool_call_id}")
+            logger.debug("Emitted TOOL_CALL_START for %s", tool_call_id)
 
             # Emit TOOL_CALL_ARGS event
             args_json = json.dumps(args)
@@ -183,7 +183,7 @@ class ClientProxyTool(BaseTool):
                 delta=args_json
             )
             await self.event_queue.put(args_event)
-            logger.debug(f"Emitted TOOL_CALL_ARGS for {tool_call_id}")
+            logger.debug("Emitted TOOL_CALL_ARGS for %s", tool_call_id)
 
             # Emit TOOL_CALL_END event
             end_event = ToolCallEndEvent(
@@ -191,14 +191,14 @@ class ClientProxyTool(BaseTool):
                 tool_call_id=tool_call_id
             )
             await self.event_queue.put(end_event)
-            logger.debug(f"Emitted TOOL_CALL_END for {tool_call_id}")
+            logger.debug("Emitted TOOL_CALL_END for %s", tool_call_id)
 
             # Return None for long-running tools - client handles the actual execution
-            logger.debug(f"Returning None for long-running tool {tool_call_id}")
+            logger.debug("Returning None for long-running tool %s", tool_call_id)
             return None
 
         except Exception as e:
-            logger.error(f"Error in proxy tool execution for {tool_call_id}: {e}")
+            logger.error("Error in proxy tool execution for %s: %s", tool_call_id, e)
             raise
 
     def __repr__(self) -> str:
@@ -38,7 +38,7 @@ class ClientProxyToolset(BaseToolset):
         self.ag_ui_tools = ag_ui_tools
         self.event_queue = event_queue
 
-        logger.info(f"Initialized ClientProxyToolset with {len(ag_ui_tools)} tools (all long-running)")
+        logger.info("Initialized ClientProxyToolset with %s tools (all long-running)", len(ag_ui_tools))
 
     async def get_tools(
         self,
@@ -65,10 +65,10 @@ class ClientProxyToolset(BaseToolset):
                     event_queue=self.event_queue
                 )
                 proxy_tools.append(proxy_tool)
-                logger.debug(f"Created proxy tool for '{ag_ui_tool.name}' (long-running)")
+                logger.debug("Created proxy tool for '%s' (long-running)", ag_ui_tool.name)
 
             except Exception as e:
-                logger.error(f"Failed to create proxy tool for '{ag_ui_tool.name}': {e}")
+                logger.error("Failed to create proxy tool for '%s': %s", ag_ui_tool.name, e)
                 # Continue with other tools rather than failing completely
 
         return proxy_tools
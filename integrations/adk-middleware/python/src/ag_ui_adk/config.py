@@ -5,7 +5,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from .tool_response import ToolResponseBlobStore
 
 
 @dataclass
@@ -51,3 +56,70 @@ def normalize_predict_state(value: Optional[Iterable[PredictStateMapping]]) -> L
     if isinstance(value, PredictStateMapping):
         return [value]
     return list(value)
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+@dataclass
+class ToolResponseConfig:
+    """Size limits applied when serializing tool responses for the UI.
+
+    Tool responses are streamed straight from the source object into JSON, so
+    the limits below are enforced while writing rather than after a full copy.
+    All limits default to ``None`` (unlimited), which preserves the historical
+    output byte-for-byte.
+
+    Attributes:
+        max_string_chars: Truncate individual string values longer than this.
+        max_collection_items: Emit at most this many items per list or mapping.
+        max_chars: Upper bound on the serialized payload. Larger payloads are
+            replaced by a summary object containing a preview, or offloaded to
+            a blob store when ``offload_oversized`` is enabled.
+        preview_chars: Length of the JSON preview included in summaries and
+            blob references.
+        offload_oversized: If True, payloads exceeding ``max_chars`` are written
+            in full to ``blob_store`` and a reference is emitted instead.
+        blob_store: Destination for offloaded payloads. Defaults to a
+            ``LocalDiskBlobStore`` in a private per-process temp directory
+            when ``offload_oversized`` is enabled.
+    """
+
+    max_string_chars: Optional[int] = None
+    max_collection_items: Optional[int] = None
+    max_chars: Optional[int] = None
+    preview_chars: int = 1024
+    offload_oversized: bool = False
+    blob_store: Optional["ToolResponseBlobStore"] = None
+
+
+@dataclass
+class ToolCallArgsConfig:
+    """Controls how tool call arguments are serialized and streamed to the UI.
+
+    Attributes:
+        chunk_size: Maximum characters per TOOL_CALL_ARGS delta. Larger argument
+            payloads are split across several events. ``None`` (default) sends
+            the arguments in a single event.
+        offload_threshold: Estimated argument size (in characters) above which
+            JSON serialization runs in ``executor`` instead of on the event loop.
+            The arguments of all function calls in an ADK event are serialized
+            concurrently and emitted in order. ``None`` (default) always
+            serializes inline.
+        executor: Executor used for offloaded serialization. Defaults to the
+            event loop's default thread pool; pass a ``ProcessPoolExecutor`` to
+            keep very large payloads from contending for the GIL.
+    """
+
+    chunk_size: Optional[int] = None
+    offload_threshold: Optional[int] = None
+    executor: Optional["Executor"] = None
+
+    def __post_init__(self) -> None:
+        if self.chunk_size is not None and (not _is_int(self.chunk_size) or self.chunk_size <= 0):
+            raise ValueError("chunk_size must be a positive integer")
+        if self.offload_threshold is not None and (
+            not _is_int(self.offload_threshold) or self.offload_threshold < 0
+        ):
+            raise ValueError("offload_threshold must be a non-negative integer")
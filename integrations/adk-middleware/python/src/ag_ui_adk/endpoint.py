@@ -3,6 +3,7 @@
 """FastAPI endpoint for ADK middleware."""
 
 from typing import List, Optional, Any
+import asyncio
 import json
 
 from fastapi import FastAPI, Request
@@ -47,11 +48,28 @@ def _header_to_key(header_name: str) -> str:
     return key.replace("-", "_")
 
 
+async def _watch_for_disconnect(
+    request: Request, agent: ADKAgent, thread_id: str, run_id: str, interval: float
+) -> None:
+    """Poll the client connection and hand a disconnect over to the agent.
+
+    The response stream only notices a dropped connection when it next sends
+    an event, which can take a long time while a model or tool is working.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        if await request.is_disconnected():
+            logger.info("Client disconnected from thread %s", thread_id)
+            agent.handle_client_disconnect(thread_id, run_id=run_id)
+            return
+
+
 def add_adk_fastapi_endpoint(
     app: FastAPI,
     agent: ADKAgent,
     path: str = "/",
     extract_headers: Optional[List[str]] = None,
+    disconnect_poll_interval: Optional[float] = 1.0,
 ):
     """Add ADK middleware endpoint to FastAPI app.
 
@@ -64,6 +82,11 @@ def add_adk_fastapi_endpoint(
             Headers are stored in state.headers with the 'x-' prefix stripped and
             hyphens converted to underscores (e.g., x-user-id -> user_id).
             Client-provided state.headers values take precedence over extracted headers.
+        disconnect_poll_interval: Seconds between client connection checks while a
+            run is streaming. A detected disconnect cancels the run's background
+            execution after the agent's client_disconnect_grace_seconds. Only
+            used when the agent has cancellation enabled; set to None to disable
+            polling.
 
     Note:
         This function also adds an experimental POST /agents/state endpoint for
@@ -102,15 +125,29 @@ def add_adk_fastapi_endpoint(
         
         async def event_generator():
             """Generate events from ADK agent."""
+            disconnect_watcher = None
+            if (
+                disconnect_poll_interval is not None
+                and agent.client_disconnect_grace_seconds is not None
+            ):
+                disconnect_watcher = asyncio.create_task(
+                    _watch_for_disconnect(
+                        request,
+                        agent,
+                        input_data.thread_id,
+                        input_data.run_id,
+                        disconnect_poll_interval,
+                    )
+                )
             try:
                 async for event in agent.run(input_data):
                     try:
                         encoded = encoder.encode(event)
-                        logger.debug(f"HTTP Response: {encoded}")
+                        logger.debug("HTTP Response: %s", encoded)
                         yield encoded
                     except Exception as encoding_error:
                         # Handle encoding-specific errors
-                        logger.error(f"❌ Event encoding error: {encoding_error}", exc_info=True)
+                        logger.error("❌ Event encoding error: %s", encoding_error, exc_info=True)
                         # Create a RunErrorEvent for encoding failures
                         from ag_ui.core import RunErrorEvent, EventType
                         error_event = RunErrorEvent(
@@ -128,7 +165,7 @@ def add_adk_fastapi_endpoint(
                         break  # Stop the stream after an encoding error
             except Exception as agent_error:
                 # Handle errors from ADKAgent.run() itself
-                logger.error(f"❌ ADKAgent error: {agent_error}", exc_info=True)
+                logger.error("❌ ADKAgent error: %s", agent_error, exc_info=True)
                 # ADKAgent should have yielded a RunErrorEvent, but if something went wrong
                 # in the async generator itself, we need to handle it
                 try:
@@ -144,6 +181,9 @@ def add_adk_fastapi_endpoint(
                     # If we can't encode the error event, yield a basic SSE error
                     logger.error("Failed to encode agent error event, yielding basic SSE error")
                     yield "event: error\ndata: {\"error\": \"Agent execution failed\"}\n\n"
+            finally:
+                if disconnect_watcher is not None:
+                    disconnect_watcher.cancel()
         
         return StreamingResponse(event_generator(), media_type=encoder.get_content_type())
 
@@ -212,7 +252,7 @@ def add_adk_fastapi_endpoint(
             })
 
         except Exception as e:
-            logger.error(f"Error in /agents/state endpoint: {e}", exc_info=True)
+            logger.error("Error in /agents/state endpoint: %s", e, exc_info=True)
             return JSONResponse(
                 status_code=500,
                 content={
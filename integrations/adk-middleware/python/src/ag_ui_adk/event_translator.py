@@ -2,9 +2,9 @@
 
 """Event translator for converting ADK events to AG-UI protocol events."""
 
-import dataclasses
+import asyncio
 from collections.abc import Iterable, Mapping
-from typing import AsyncGenerator, Optional, Dict, Any, List
+from typing import AsyncGenerator, Optional, Dict, Any, List, Union
 import uuid
 
 from google.genai import types
@@ -20,108 +20,57 @@ from ag_ui.core import (
 import json
 from google.adk.events import Event as ADKEvent
 
-from .config import PredictStateMapping, normalize_predict_state
+from .config import (
+    PredictStateMapping,
+    ToolCallArgsConfig,
+    ToolResponseConfig,
+    normalize_predict_state,
+)
+from .tool_response import ToolResponseSerializer, serialize_tool_response
 
 import logging
 logger = logging.getLogger(__name__)
 
-def _coerce_tool_response(value: Any, _visited: Optional[set[int]] = None) -> Any:
-    """Recursively convert arbitrary tool responses into JSON-serializable structures."""
+def _serialize_tool_response(
+    response: Any,
+    serializer: Optional[ToolResponseSerializer] = None,
+    key: Optional[str] = None,
+) -> str:
+    """Serialize a tool response into a JSON string."""
 
-    if isinstance(value, (str, int, float, bool)) or value is None:
-        return value
+    return serialize_tool_response(response, serializer, key)
 
-    if isinstance(value, (bytes, bytearray, memoryview)):
-        try:
-            return value.decode()  # type: ignore[union-attr]
-        except Exception:
-            return list(value)
-
-    if _visited is None:
-        _visited = set()
-
-    obj_id = id(value)
-    if obj_id in _visited:
-        return str(value)
-
-    _visited.add(obj_id)
-    try:
-        if dataclasses.is_dataclass(value) and not isinstance(value, type):
-            return {
-                field.name: _coerce_tool_response(getattr(value, field.name), _visited)
-                for field in dataclasses.fields(value)
-            }
-
-        if hasattr(value, "_asdict") and callable(getattr(value, "_asdict")):
-            try:
-                return {
-                    str(k): _coerce_tool_response(v, _visited)
-                    for k, v in value._asdict().items()  # type: ignore[attr-defined]
-                }
-            except Exception:
-                pass
-
-        for method_name in ("model_dump", "to_dict"):
-            method = getattr(value, method_name, None)
-            if callable(method):
-                try:
-                    dumped = method()
-                except TypeError:
-                    try:
-                        dumped = method(exclude_none=False)
-                    except Exception:
-                        continue
-                except Exception:
-                    continue
+def _serialize_tool_call_args(args: Any) -> str:
+    """Serialize function call arguments for TOOL_CALL_ARGS deltas."""
 
-                return _coerce_tool_response(dumped, _visited)
+    return json.dumps(args) if isinstance(args, dict) else str(args)
 
-        if isinstance(value, Mapping):
-            return {
-                str(k): _coerce_tool_response(v, _visited)
-                for k, v in value.items()
-            }
 
-        if isinstance(value, (list, tuple, set, frozenset)):
-            return [_coerce_tool_response(item, _visited) for item in value]
+def _estimate_args_size(args: Any, limit: int) -> int:
+    """Cheaply estimate the serialized size of ``args``.
 
-        if isinstance(value, Iterable):
-            try:
-                return [_coerce_tool_response(item, _visited) for item in list(value)]
-            except TypeError:
-                pass
+    Walks the structure summing string lengths, but stops as soon as the
+    estimate exceeds ``limit`` so large payloads are detected without a full
+    traversal.
+    """
 
-        try:
-            obj_vars = vars(value)
-        except TypeError:
-            obj_vars = None
-
-        if obj_vars:
-            coerced = {
-                key: _coerce_tool_response(val, _visited)
-                for key, val in obj_vars.items()
-                if not key.startswith("_")
-            }
-            if coerced:
-                return coerced
-
-        return str(value)
-    finally:
-        _visited.discard(obj_id)
-
-def _serialize_tool_response(response: Any) -> str:
-    """Serialize a tool response into a JSON string."""
+    size = 0
+    stack = [args]
+    while stack and size <= limit:
+        value = stack.pop()
+        if isinstance(value, str):
+            size += len(value) + 2
+        elif isinstance(value, Mapping):
+            for key, item in value.items():
+                size += len(str(key)) + 4
+                stack.append(item)
+        elif isinstance(value, (list, tuple)):
+            size += 2
+            stack.extend(value)
+        else:
+            size += 8
+    return size
 
-    try:
-        coerced = _coerce_tool_response(response)
-        return json.dumps(coerced, ensure_ascii=False)
-    except Exception as exc:
-        logger.warning("Failed to coerce tool response to JSON: %s", exc, exc_info=True)
-        try:
-            return json.dumps(str(response), ensure_ascii=False)
-        except Exception:
-            logger.warning("Failed to stringify tool response; returning empty string.")
-            return json.dumps("", ensure_ascii=False)
 
 class EventTranslator:
     """Translates Google ADK events to AG-UI protocol events.
@@ -133,6 +82,8 @@ class EventTranslator:
     def __init__(
         self,
         predict_state: Optional[Iterable[PredictStateMapping]] = None,
+        tool_response_config: Optional[ToolResponseConfig] = None,
+        tool_call_args_config: Optional[ToolCallArgsConfig] = None,
     ):
         """Initialize the event translator.
 
@@ -141,6 +92,10 @@ class EventTranslator:
                 When provided, the translator will emit PredictState CustomEvents
                 for matching tool calls, enabling the UI to show state changes
                 in real-time as tool arguments are streamed.
+            tool_response_config: Optional size limits for serialized tool
+                responses emitted as TOOL_CALL_RESULT content.
+            tool_call_args_config: Optional chunking and offloading settings for
+                TOOL_CALL_ARGS serialization.
         """
         # Track tool call IDs for consistency
         self._active_tool_calls: Dict[str, str] = {}  # Tool call ID -> Tool call ID (for consistency)
@@ -171,6 +126,12 @@ class EventTranslator:
         # to ensure the frontend shows the confirmation dialog with buttons enabled
         self._deferred_confirm_events: List[BaseEvent] = []
 
+        # Tool response serialization (streams JSON straight from the source object)
+        self._tool_response_serializer = ToolResponseSerializer(tool_response_config)
+
+        # Tool call argument streaming configuration
+        self._tool_call_args_config = tool_call_args_config or ToolCallArgsConfig()
+
     def get_and_clear_deferred_confirm_events(self) -> List[BaseEvent]:
         """Get and clear any deferred confirm_changes events.
 
@@ -192,6 +153,44 @@ class EventTranslator:
         """
         return len(self._deferred_confirm_events) > 0
 
+    def _begin_args_serialization(self, args: Any) -> Union[str, "asyncio.Future[str]"]:
+        """Serialize tool call arguments, offloading large payloads to a worker.
+
+        Returns either the serialized string or a future resolving to it, so
+        callers can start serialization for several calls before awaiting any.
+        """
+        threshold = self._tool_call_args_config.offload_threshold
+        if threshold is not None and _estimate_args_size(args, threshold) > threshold:
+            loop = asyncio.get_running_loop()
+            return loop.run_in_executor(
+                self._tool_call_args_config.executor, _serialize_tool_call_args, args
+            )
+        return _serialize_tool_call_args(args)
+
+    async def _tool_call_args_events(
+        self,
+        tool_call_id: str,
+        serialized: Union[str, "asyncio.Future[str]"],
+    ) -> AsyncGenerator[BaseEvent, None]:
+        """Yield TOOL_CALL_ARGS events, split into chunks when configured."""
+        args_str = serialized if isinstance(serialized, str) else await serialized
+        chunk_size = self._tool_call_args_config.chunk_size
+
+        if not chunk_size or len(args_str) <= chunk_size:
+            yield ToolCallArgsEvent(
+                type=EventType.TOOL_CALL_ARGS,
+                tool_call_id=tool_call_id,
+                delta=args_str
+            )
+            return
+
+        for start in range(0, len(args_str), chunk_size):
+            yield ToolCallArgsEvent(
+                type=EventType.TOOL_CALL_ARGS,
+                tool_call_id=tool_call_id,
+                delta=args_str[start:start + chunk_size]
+            )
+
     async def translate(
         self, 
         adk_event: ADKEvent,
@@ -249,7 +248,7 @@ class EventTranslator:
                     non_lro_calls = [fc for fc in function_calls if getattr(fc, 'id', None) not in lro_ids]
 
                     if non_lro_calls:
-                        logger.debug(f"ADK function calls detected (non-LRO): {len(non_lro_calls)} of {len(function_calls)} total")
+                        logger.debug("ADK function calls detected (non-LRO): %s of %s total", len(non_lro_calls), len(function_calls))
                         # CRITICAL FIX: End any active text message stream before starting tool calls
                         # Per AG-UI protocol: TEXT_MESSAGE_END must be sent before TOOL_CALL_START
                         async for event in self.force_close_streaming_message():
@@ -291,7 +290,7 @@ class EventTranslator:
                 )
                 
         except Exception as e:
-            logger.error(f"Error translating ADK event: {e}", exc_info=True)
+            logger.error("Error translating ADK event: %s", e, exc_info=True)
             # Don't yield error events here - let the caller handle errors
     
     async def _translate_text_content(
@@ -494,14 +493,12 @@ class EventTranslator:
                             parent_message_id=None
                         )
                         if hasattr(long_running_function_call, 'args') and long_running_function_call.args:
-                            # Convert args to string (JSON format)
-                            import json
-                            args_str = json.dumps(long_running_function_call.args) if isinstance(long_running_function_call.args, dict) else str(long_running_function_call.args)
-                            yield ToolCallArgsEvent(
-                                type=EventType.TOOL_CALL_ARGS,
-                                tool_call_id=long_running_function_call.id,
-                                delta=args_str
-                            )
+                            # Convert args to string (JSON format), chunked if configured
+                            async for args_event in self._tool_call_args_events(
+                                long_running_function_call.id,
+                                self._begin_args_serialization(long_running_function_call.args),
+                            ):
+                                yield args_event
                         
                         # Emit TOOL_CALL_END
                         yield ToolCallEndEvent(
@@ -530,102 +527,114 @@ class EventTranslator:
         # Since we're not tracking streaming messages, use None for parent message
         parent_message_id = None
 
-        for func_call in function_calls:
-            tool_call_id = getattr(func_call, 'id', str(uuid.uuid4()))
-            tool_name = func_call.name
-
-            # Check if this tool call ID already exists
-            if tool_call_id in self._active_tool_calls:
-                logger.warning(f"⚠️  DUPLICATE TOOL CALL! Tool call ID {tool_call_id} (name: {tool_name}) already exists in active calls!")
-
-            # Track the tool call
-            self._active_tool_calls[tool_call_id] = tool_call_id
-
-            # Check if this tool has predictive state configuration
-            # Emit PredictState CustomEvent BEFORE the tool call events
-            if tool_name in self._predict_state_by_tool:
-                # Track this tool call ID so we can suppress its TOOL_CALL_RESULT event
-                # The frontend handles state updates via the predictive state mechanism
-                self._predictive_state_tool_call_ids.add(tool_call_id)
+        # Start argument serialization for every call up front so offloaded
+        # payloads are serialized concurrently; events are still emitted in order
+        serialized_args = [
+            self._begin_args_serialization(func_call.args)
+            if hasattr(func_call, 'args') and func_call.args else None
+            for func_call in function_calls
+        ]
 
-                if tool_name not in self._emitted_predict_state_for_tools:
-                    mappings = self._predict_state_by_tool[tool_name]
-                    predict_state_payload = [mapping.to_payload() for mapping in mappings]
-                    logger.debug(f"Emitting PredictState CustomEvent for tool '{tool_name}': {predict_state_payload}")
-                    yield CustomEvent(
-                        type=EventType.CUSTOM,
-                        name="PredictState",
-                        value=predict_state_payload,
-                    )
-                    self._emitted_predict_state_for_tools.add(tool_name)
-
-            # Emit TOOL_CALL_START
-            yield ToolCallStartEvent(
-                type=EventType.TOOL_CALL_START,
-                tool_call_id=tool_call_id,
-                tool_call_name=tool_name,
-                parent_message_id=parent_message_id
-            )
-
-            # Emit TOOL_CALL_ARGS if we have arguments
-            if hasattr(func_call, 'args') and func_call.args:
-                # Convert args to string (JSON format)
-                args_str = json.dumps(func_call.args) if isinstance(func_call.args, dict) else str(func_call.args)
+        try:
+            for func_call, serialized in zip(function_calls, serialized_args):
+                tool_call_id = getattr(func_call, 'id', str(uuid.uuid4()))
+                tool_name = func_call.name
+
+                # Check if this tool call ID already exists
+                if tool_call_id in self._active_tool_calls:
+                    logger.warning("⚠️  DUPLICATE TOOL CALL! Tool call ID %s (name: %s) already exists in active calls!", tool_call_id, tool_name)
+
+                # Track the tool call
+                self._active_tool_calls[tool_call_id] = tool_call_id
+
+                # Check if this tool has predictive state configuration
+                # Emit PredictState CustomEvent BEFORE the tool call events
+                if tool_name in self._predict_state_by_tool:
+                    # Track this tool call ID so we can suppress its TOOL_CALL_RESULT event
+                    # The frontend handles state updates via the predictive state mechanism
+                    self._predictive_state_tool_call_ids.add(tool_call_id)
+
+                    if tool_name not in self._emitted_predict_state_for_tools:
+                        mappings = self._predict_state_by_tool[tool_name]
+                        predict_state_payload = [mapping.to_payload() for mapping in mappings]
+                        logger.debug("Emitting PredictState CustomEvent for tool '%s': %s", tool_name, predict_state_payload)
+                        yield CustomEvent(
+                            type=EventType.CUSTOM,
+                            name="PredictState",
+                            value=predict_state_payload,
+                        )
+                        self._emitted_predict_state_for_tools.add(tool_name)
 
-                yield ToolCallArgsEvent(
-                    type=EventType.TOOL_CALL_ARGS,
+                # Emit TOOL_CALL_START
+                yield ToolCallStartEvent(
+                    type=EventType.TOOL_CALL_START,
                     tool_call_id=tool_call_id,
-                    delta=args_str
+                    tool_call_name=tool_name,
+                    parent_message_id=parent_message_id
                 )
 
-            # Emit TOOL_CALL_END
-            yield ToolCallEndEvent(
-                type=EventType.TOOL_CALL_END,
-                tool_call_id=tool_call_id
-            )
+                # Emit TOOL_CALL_ARGS if we have arguments
+                if serialized is not None:
+                    async for args_event in self._tool_call_args_events(tool_call_id, serialized):
+                        yield args_event
 
-            # Clean up tracking
-            self._active_tool_calls.pop(tool_call_id, None)
-
-            # Check if we should emit confirm_changes tool call after this tool
-            # This follows the pattern used by LangGraph, CrewAI, and server-starter-all-features
-            # where the backend uses a "local" tool (e.g., write_document_local) and
-            # then emits confirm_changes to trigger the frontend confirmation UI
-            #
-            # IMPORTANT: We DEFER these events to be emitted right before RUN_FINISHED.
-            # If we emit them immediately, subsequent events (TOOL_CALL_RESULT, TEXT_MESSAGE, etc.)
-            # can cause the frontend to transition the confirm_changes status away from "executing",
-            # which disables the confirmation dialog buttons.
-            if tool_name in self._predict_state_by_tool and tool_name not in self._emitted_confirm_for_tools:
-                mappings = self._predict_state_by_tool[tool_name]
-                # Check if any mapping has emit_confirm_tool=True
-                should_emit_confirm = any(m.emit_confirm_tool for m in mappings)
-                if should_emit_confirm:
-                    confirm_tool_call_id = str(uuid.uuid4())
-                    logger.debug(f"Deferring confirm_changes tool call events after '{tool_name}' (will emit before RUN_FINISHED)")
-
-                    # Store events for later emission (right before RUN_FINISHED)
-                    self._deferred_confirm_events.append(ToolCallStartEvent(
-                        type=EventType.TOOL_CALL_START,
-                        tool_call_id=confirm_tool_call_id,
-                        tool_call_name="confirm_changes",
-                        parent_message_id=parent_message_id
-                    ))
-
-                    self._deferred_confirm_events.append(ToolCallArgsEvent(
-                        type=EventType.TOOL_CALL_ARGS,
-                        tool_call_id=confirm_tool_call_id,
-                        delta="{}"
-                    ))
-
-                    self._deferred_confirm_events.append(ToolCallEndEvent(
-                        type=EventType.TOOL_CALL_END,
-                        tool_call_id=confirm_tool_call_id
-                    ))
-
-                    self._emitted_confirm_for_tools.add(tool_name)
+                # Emit TOOL_CALL_END
+                yield ToolCallEndEvent(
+                    type=EventType.TOOL_CALL_END,
+                    tool_call_id=tool_call_id
+                )
 
-    
+                # Clean up tracking
+                self._active_tool_calls.pop(tool_call_id, None)
+
+                # Check if we should emit confirm_changes tool call after this tool
+                # This follows the pattern used by LangGraph, CrewAI, and server-starter-all-features
+                # where the backend uses a "local" tool (e.g., write_document_local) and
+                # then emits confirm_changes to trigger the frontend confirmation UI
+                #
+                # IMPORTANT: We DEFER these events to be emitted right before RUN_FINISHED.
+                # If we emit them immediately, subsequent events (TOOL_CALL_RESULT, TEXT_MESSAGE, etc.)
+                # can cause the frontend to transition the confirm_changes status away from "executing",
+                # which disables the confirmation dialog buttons.
+                if tool_name in self._predict_state_by_tool and tool_name not in self._emitted_confirm_for_tools:
+                    mappings = self._predict_state_by_tool[tool_name]
+                    # Check if any mapping has emit_confirm_tool=True
+                    should_emit_confirm = any(m.emit_confirm_tool for m in mappings)
+                    if should_emit_confirm:
+                        confirm_tool_call_id = str(uuid.uuid4())
+                        logger.debug("Deferring confirm_changes tool call events after '%s' (will emit before RUN_FINISHED)", tool_name)
+
+                        # Store events for later emission (right before RUN_FINISHED)
+                        self._deferred_confirm_events.append(ToolCallStartEvent(
+                            type=EventType.TOOL_CALL_START,
+                            tool_call_id=confirm_tool_call_id,
+                            tool_call_name="confirm_changes",
+                            parent_message_id=parent_message_id
+                        ))
+
+                        self._deferred_confirm_events.append(ToolCallArgsEvent(
+                            type=EventType.TOOL_CALL_ARGS,
+                            tool_call_id=confirm_tool_call_id,
+                            delta="{}"
+                        ))
+
+                        self._deferred_confirm_events.append(ToolCallEndEvent(
+                            type=EventType.TOOL_CALL_END,
+                            tool_call_id=confirm_tool_call_id
+                        ))
+
+                        self._emitted_confirm_for_tools.add(tool_name)
+        finally:
+            # Closed early: cancel the serializations nobody will read and let
+            # the cancellation reach the executor before returning
+            pending = [
+                serialized for serialized in serialized_args
+                if isinstance(serialized, asyncio.Future) and not serialized.done()
+            ]
+            for serialized in pending:
+                serialized.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
 
     async def _translate_function_response(
         self,
@@ -647,21 +656,24 @@ class EventTranslator:
             tool_call_id = getattr(func_response, 'id', str(uuid.uuid4()))
             # Skip TOOL_CALL_RESULT for long-running tools (handled by frontend)
             if tool_call_id in self.long_running_tool_ids:
-                logger.debug(f"Skipping ToolCallResultEvent for long-running tool: {tool_call_id}")
+                logger.debug("Skipping ToolCallResultEvent for long-running tool: %s", tool_call_id)
                 continue
 
             # Skip TOOL_CALL_RESULT for predictive state tools
             # The frontend handles state updates via the predictive state mechanism,
             # and emitting a result event causes "No function call event found" errors
             if tool_call_id in self._predictive_state_tool_call_ids:
-                logger.debug(f"Skipping ToolCallResultEvent for predictive state tool: {tool_call_id}")
+                logger.debug("Skipping ToolCallResultEvent for predictive state tool: %s", tool_call_id)
                 continue
 
             yield ToolCallResultEvent(
                 message_id=str(uuid.uuid4()),
                 type=EventType.TOOL_CALL_RESULT,
                 tool_call_id=tool_call_id,
-                content=_serialize_tool_response(func_response.response)
+                content=await self._tool_response_serializer.aserialize(
+                    func_response.response,
+                    key=tool_call_id,
+                )
             )
   
     def _create_state_delta_event(
@@ -722,7 +734,7 @@ class EventTranslator:
             TEXT_MESSAGE_END event if there was an open streaming message
         """
         if self._is_streaming and self._streaming_message_id:
-            logger.warning(f"🚨 Force-closing unterminated streaming message: {self._streaming_message_id}")
+            logger.warning("🚨 Force-closing unterminated streaming message: %s", self._streaming_message_id)
 
             end_event = TextMessageEndEvent(
                 type=EventType.TEXT_MESSAGE_END,
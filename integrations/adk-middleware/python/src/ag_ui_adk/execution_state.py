@@ -23,7 +23,8 @@ class ExecutionState:
         self,
         task: asyncio.Task,
         thread_id: str,
-        event_queue: asyncio.Queue
+        event_queue: asyncio.Queue,
+        run_id: Optional[str] = None
     ):
         """Initialize execution state.
 
@@ -31,15 +32,18 @@ class ExecutionState:
             task: The asyncio task running the ADK agent
             thread_id: The thread ID for this execution
             event_queue: Queue containing events to stream to client
+            run_id: The AG-UI run this execution belongs to
         """
         self.task = task
         self.thread_id = thread_id
+        self.run_id = run_id
         self.event_queue = event_queue
         self.start_time = time.time()
         self.is_complete = False
         self.pending_tool_calls: Set[str] = set()  # Track outstanding tool call IDs for HITL
+        self.client_disconnected = False  # Disconnect handling already scheduled
 
-        logger.debug(f"Created execution state for thread {thread_id}")
+        logger.debug("Created execution state for thread %s", thread_id)
 
     def is_stale(self, timeout_seconds: int) -> bool:
         """Check if this execution has been running too long.
@@ -54,7 +58,7 @@ class ExecutionState:
 
     async def cancel(self):
         """Cancel the execution and clean up resources."""
-        logger.info(f"Cancelling execution for thread {self.thread_id}")
+        logger.info("Cancelling execution for thread %s", self.thread_id)
 
         # Cancel the background task
         if not self.task.done():
@@ -81,7 +85,7 @@ class ExecutionState:
             tool_call_id: The tool call ID to track
         """
         self.pending_tool_calls.add(tool_call_id)
-        logger.debug(f"Added pending tool call {tool_call_id} to thread {self.thread_id}")
+        logger.debug("Added pending tool call %s to thread %s", tool_call_id, self.thread_id)
 
     def remove_pending_tool_call(self, tool_call_id: str):
         """Remove a tool call ID from the pending set.
@@ -90,7 +94,7 @@ class ExecutionState:
             tool_call_id: The tool call ID to remove
         """
         self.pending_tool_calls.discard(tool_call_id)
-        logger.debug(f"Removed pending tool call {tool_call_id} from thread {self.thread_id}")
+        logger.debug("Removed pending tool call %s from thread %s", tool_call_id, self.thread_id)
 
     def has_pending_tool_calls(self) -> bool:
         """Check if there are outstanding tool calls waiting for responses.
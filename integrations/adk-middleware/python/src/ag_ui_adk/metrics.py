@@ -0,0 +1,209 @@
+# src/ag_ui_adk/metrics.py
+
+"""Metrics and tracing hooks for ADKAgent executions."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class AgentMetrics:
+    """Instrumentation surface for ADKAgent.
+
+    Every hook is a no-op by default, so subclasses only override what they
+    need. Hooks are called on the event loop in hot paths and must not block.
+    Durations are reported in seconds.
+    """
+
+    def start_execution(self, thread_id: str, run_id: str) -> Any:
+        """Called when an execution starts; the return value is passed to end_execution."""
+        return None
+
+    def end_execution(
+        self,
+        token: Any,
+        *,
+        event_count: int,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """Called when an execution finishes streaming (successfully or not)."""
+
+    def record_time_to_first_event(self, seconds: float, *, thread_id: str) -> None:
+        """Time from RUN_STARTED to the first event produced by the ADK run."""
+
+    def record_events_per_execution(self, count: int, *, thread_id: str) -> None:
+        """Number of events streamed for one execution (excluding RUN_STARTED/FINISHED)."""
+
+    def record_queue_wait(self, seconds: float, *, thread_id: str) -> None:
+        """Time the stream waited on the execution's event queue for one event."""
+
+    def record_session_call(self, operation: str, seconds: float) -> None:
+        """Latency of one session service call made by the middleware."""
+
+    def record_translator_time(self, seconds: float, *, thread_id: str) -> None:
+        """Time spent translating one ADK event into AG-UI events."""
+
+    def record_tool_round_trip(self, seconds: float, *, tool_call_id: str) -> None:
+        """Time from a client-side tool call being emitted to its result arriving."""
+
+    def record_cancelled_execution(self, *, thread_id: str, reason: str) -> None:
+        """Called when a background execution is cancelled (e.g. client disconnect)."""
+
+
+class NoOpMetrics(AgentMetrics):
+    """Default metrics implementation that discards everything."""
+
+
+class InMemoryMetricsRecorder(AgentMetrics):
+    """Metrics implementation that keeps every observation in memory.
+
+    Intended for tests and local debugging; observations accumulate without
+    bound.
+    """
+
+    def __init__(self):
+        self.executions: List[Dict[str, Any]] = []
+        self.time_to_first_event: List[Tuple[str, float]] = []
+        self.events_per_execution: List[Tuple[str, int]] = []
+        self.queue_waits: List[Tuple[str, float]] = []
+        self.session_calls: Dict[str, List[float]] = defaultdict(list)
+        self.translator_times: List[Tuple[str, float]] = []
+        self.tool_round_trips: List[Tuple[str, float]] = []
+        self.cancelled_executions: List[Tuple[str, str]] = []
+
+    def start_execution(self, thread_id: str, run_id: str) -> Any:
+        record = {"thread_id": thread_id, "run_id": run_id, "finished": False}
+        self.executions.append(record)
+        return record
+
+    def end_execution(
+        self,
+        token: Any,
+        *,
+        event_count: int,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if token is not None:
+            token.update(finished=True, event_count=event_count, error=error)
+
+    def record_time_to_first_event(self, seconds: float, *, thread_id: str) -> None:
+        self.time_to_first_event.append((thread_id, seconds))
+
+    def record_events_per_execution(self, count: int, *, thread_id: str) -> None:
+        self.events_per_execution.append((thread_id, count))
+
+    def record_queue_wait(self, seconds: float, *, thread_id: str) -> None:
+        self.queue_waits.append((thread_id, seconds))
+
+    def record_session_call(self, operation: str, seconds: float) -> None:
+        self.session_calls[operation].append(seconds)
+
+    def record_translator_time(self, seconds: float, *, thread_id: str) -> None:
+        self.translator_times.append((thread_id, seconds))
+
+    def record_tool_round_trip(self, seconds: float, *, tool_call_id: str) -> None:
+        self.tool_round_trips.append((tool_call_id, seconds))
+
+    def record_cancelled_execution(self, *, thread_id: str, reason: str) -> None:
+        self.cancelled_executions.append((thread_id, reason))
+
+
+class OpenTelemetryMetrics(AgentMetrics):
+    """Metrics implementation backed by the OpenTelemetry API.
+
+    Executions are recorded as spans and every measurement as a histogram.
+    Requires ``opentelemetry-api`` (installed with google-adk); exporters are
+    configured through the usual OpenTelemetry SDK setup.
+    """
+
+    def __init__(self, meter_provider: Any = None, tracer_provider: Any = None):
+        """Initialize the adapter.
+
+        Args:
+            meter_provider: Optional MeterProvider (defaults to the global provider)
+            tracer_provider: Optional TracerProvider (defaults to the global provider)
+        """
+        try:
+            from opentelemetry import metrics as otel_metrics, trace as otel_trace
+        except ImportError as exc:  # pragma: no cover - depends on environment
+            raise ImportError(
+                "OpenTelemetryMetrics requires the 'opentelemetry-api' package"
+            ) from exc
+
+        self._status_error = otel_trace.StatusCode.ERROR
+        meter = otel_metrics.get_meter("ag_ui_adk", meter_provider=meter_provider)
+        self._tracer = otel_trace.get_tracer("ag_ui_adk", tracer_provider=tracer_provider)
+
+        self._time_to_first_event = meter.create_histogram(
+            "ag_ui_adk.execution.time_to_first_event", unit="s",
+            description="Time from RUN_STARTED to the first ADK-produced event",
+        )
+        self._events_per_execution = meter.create_histogram(
+            "ag_ui_adk.execution.events", unit="{event}",
+            description="Events streamed per execution",
+        )
+        self._queue_wait = meter.create_histogram(
+            "ag_ui_adk.queue.wait", unit="s",
+            description="Time spent waiting on the execution event queue",
+        )
+        self._session_call = meter.create_histogram(
+            "ag_ui_adk.session.call.duration", unit="s",
+            description="Session service call latency",
+        )
+        self._translator_time = meter.create_histogram(
+            "ag_ui_adk.translator.duration", unit="s",
+            description="Time spent translating one ADK event",
+        )
+        self._tool_round_trip = meter.create_histogram(
+            "ag_ui_adk.tool.round_trip", unit="s",
+            description="Client-side tool call round-trip time",
+        )
+        self._cancelled_executions = meter.create_counter(
+            "ag_ui_adk.execution.cancelled", unit="{execution}",
+            description="Background executions cancelled before completion",
+        )
+
+    def start_execution(self, thread_id: str, run_id: str) -> Any:
+        # Spans are not made current: executions are async generators and the
+        # context would otherwise leak across yields.
+        return self._tracer.start_span(
+            "ag_ui_adk.execution",
+            attributes={"ag_ui.thread_id": thread_id, "ag_ui.run_id": run_id},
+        )
+
+    def end_execution(
+        self,
+        token: Any,
+        *,
+        event_count: int,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        if token is None:
+            return
+        token.set_attribute("ag_ui.event_count", event_count)
+        if error is not None:
+            token.record_exception(error)
+            token.set_status(self._status_error, str(error))
+        token.end()
+
+    def record_time_to_first_event(self, seconds: float, *, thread_id: str) -> None:
+        self._time_to_first_event.record(seconds)
+
+    def record_events_per_execution(self, count: int, *, thread_id: str) -> None:
+        self._events_per_execution.record(count)
+
+    def record_queue_wait(self, seconds: float, *, thread_id: str) -> None:
+        self._queue_wait.record(seconds)
+
+    def record_session_call(self, operation: str, seconds: float) -> None:
+        self._session_call.record(seconds, {"operation": operation})
+
+    def record_translator_time(self, seconds: float, *, thread_id: str) -> None:
+        self._translator_time.record(seconds)
+
+    def record_tool_round_trip(self, seconds: float, *, tool_call_id: str) -> None:
+        self._tool_round_trip.record(seconds)
+
+    def record_cancelled_execution(self, *, thread_id: str, reason: str) -> None:
+        self._cancelled_executions.add(1, {"reason": reason})
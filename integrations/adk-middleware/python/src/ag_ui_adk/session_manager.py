@@ -73,11 +73,11 @@ class SessionManager:
         self._initialized = True
         
         logger.info(
-            f"Initialized SessionManager - "
-            f"timeout: {session_timeout_seconds}s, "
-            f"cleanup: {cleanup_interval_seconds}s, "
-            f"max/user: {max_sessions_per_user or 'unlimited'}, "
-            f"memory: {'enabled' if memory_service else 'disabled'}"
+            "Initialized SessionManager - timeout: %ss, cleanup: %ss, max/user: %s, memory: %s",
+            session_timeout_seconds,
+            cleanup_interval_seconds,
+            max_sessions_per_user or 'unlimited',
+            'enabled' if memory_service else 'disabled',
         )
     
     @classmethod
@@ -132,9 +132,9 @@ class SessionManager:
                 app_name=app_name,
                 state=initial_state or {}
             )
-            logger.info(f"Created new session: {session_key}")
+            logger.info("Created new session: %s", session_key)
         else:
-            logger.debug(f"Retrieved existing session: {session_key}")
+            logger.debug("Retrieved existing session: %s", session_key)
         
         # Track the session key
         self._track_session(session_key, user_id)
@@ -175,11 +175,11 @@ class SessionManager:
             )
             
             if not session:
-                logger.debug(f"Session not found for update: {app_name}:{session_id} - this may be normal if session is still being created")
+                logger.debug("Session not found for update: %s:%s - this may be normal if session is still being created", app_name, session_id)
                 return False
             
             if not state_updates:
-                logger.debug(f"No state updates provided for session: {app_name}:{session_id}")
+                logger.debug("No state updates provided for session: %s:%s", app_name, session_id)
                 return False
             
             # Apply state updates using EventActions
@@ -209,13 +209,13 @@ class SessionManager:
             # Apply changes through ADK's event system
             await self._session_service.append_event(session, event)
             
-            logger.info(f"Updated state for session {app_name}:{session_id}")
-            logger.debug(f"State updates: {state_updates}")
+            logger.info("Updated state for session %s:%s", app_name, session_id)
+            logger.debug("State updates: %s", state_updates)
             
             return True
             
         except Exception as e:
-            logger.error(f"Failed to update session state: {e}", exc_info=True)
+            logger.error("Failed to update session state: %s", e, exc_info=True)
             return False
     
     async def get_session_state(
@@ -242,7 +242,7 @@ class SessionManager:
             )
             
             if not session:
-                logger.debug(f"Session not found when getting state: {app_name}:{session_id}")
+                logger.debug("Session not found when getting state: %s:%s", app_name, session_id)
                 return None
             
             # Return state as dictionary
@@ -253,7 +253,7 @@ class SessionManager:
                 return dict(session.state)
                 
         except Exception as e:
-            logger.error(f"Failed to get session state: {e}", exc_info=True)
+            logger.error("Failed to get session state: %s", e, exc_info=True)
             return None
     
     async def get_state_value(
@@ -284,7 +284,7 @@ class SessionManager:
             )
             
             if not session:
-                logger.debug(f"Session not found when getting state value: {app_name}:{session_id}")
+                logger.debug("Session not found when getting state value: %s:%s", app_name, session_id)
                 return default
             
             if hasattr(session.state, 'get'):
@@ -293,7 +293,7 @@ class SessionManager:
                 return session.state.get(key, default) if key in session.state else default
                 
         except Exception as e:
-            logger.error(f"Failed to get state value: {e}", exc_info=True)
+            logger.error("Failed to get state value: %s", e, exc_info=True)
             return default
     
     async def set_state_value(
@@ -354,7 +354,7 @@ class SessionManager:
             state_delta = {key: None for key in keys if key in current_state}
             
             if not state_delta:
-                logger.info(f"No keys to remove from session {app_name}:{session_id}")
+                logger.info("No keys to remove from session %s:%s", app_name, session_id)
                 return True
             
             return await self.update_session_state(
@@ -365,7 +365,7 @@ class SessionManager:
             )
             
         except Exception as e:
-            logger.error(f"Failed to remove state keys: {e}", exc_info=True)
+            logger.error("Failed to remove state keys: %s", e, exc_info=True)
             return False
     
     async def clear_session_state(
@@ -411,7 +411,7 @@ class SessionManager:
             return True
             
         except Exception as e:
-            logger.error(f"Failed to clear session state: {e}", exc_info=True)
+            logger.error("Failed to clear session state: %s", e, exc_info=True)
             return False
     
     async def initialize_session_state(
@@ -445,7 +445,7 @@ class SessionManager:
                         if key not in current_state
                     }
                     if not filtered_state:
-                        logger.info(f"No new state values to initialize for session {app_name}:{session_id}")
+                        logger.info("No new state values to initialize for session %s:%s", app_name, session_id)
                         return True
                     initial_state = filtered_state
             
@@ -457,7 +457,7 @@ class SessionManager:
             )
             
         except Exception as e:
-            logger.error(f"Failed to initialize session state: {e}", exc_info=True)
+            logger.error("Failed to initialize session state: %s", e, exc_info=True)
             return False
     
     # ===== BULK STATE OPERATIONS =====
@@ -481,7 +481,7 @@ class SessionManager:
         results = {}
         
         if user_id not in self._user_sessions:
-            logger.info(f"No sessions found for user {user_id}")
+            logger.info("No sessions found for user %s", user_id)
             return results
         
         for session_key in self._user_sessions[user_id]:
@@ -565,12 +565,12 @@ class SessionManager:
                         oldest_time = update_time
                         oldest_session = session
             except Exception as e:
-                logger.error(f"Error checking session {session_key}: {e}")
+                logger.error("Error checking session %s: %s", session_key, e)
         
         if oldest_session:
             session_key = self._make_session_key(oldest_session.app_name, oldest_session.id)
             await self._delete_session(oldest_session)
-            logger.info(f"Removed oldest session for user {user_id}: {session_key}")
+            logger.info("Removed oldest session for user %s: %s", user_id, session_key)
     
     async def _delete_session(self, session):
         """Delete a session using the session object directly.
@@ -585,13 +585,13 @@ class SessionManager:
         session_key = f"{session.app_name}:{session.id}"
         
         # If memory service is available, add session to memory before deletion
-        logger.debug(f"Deleting session {session_key}, memory_service: {self._memory_service is not None}")
+        logger.debug("Deleting session %s, memory_service: %s", session_key, self._memory_service is not None)
         if self._memory_service:
             try:
                 await self._memory_service.add_session_to_memory(session)
-                logger.debug(f"Added session {session_key} to memory before deletion")
+                logger.debug("Added session %s to memory before deletion", session_key)
             except Exception as e:
-                logger.error(f"Failed to add session {session_key} to memory: {e}")
+                logger.error("Failed to add session %s to memory: %s", session_key, e)
         
         try:
             await self._session_service.delete_session(
@@ -599,9 +599,9 @@ class SessionManager:
                 app_name=session.app_name,
                 user_id=session.user_id
             )
-            logger.debug(f"Deleted session: {session_key}")
+            logger.debug("Deleted session: %s", session_key)
         except Exception as e:
-            logger.error(f"Failed to delete session {session_key}: {e}")
+            logger.error("Failed to delete session %s: %s", session_key, e)
         
         self._untrack_session(session_key, session.user_id)
     
@@ -610,23 +610,23 @@ class SessionManager:
         try:
             loop = asyncio.get_running_loop()
             self._cleanup_task = loop.create_task(self._cleanup_loop())
-            logger.debug(f"Started session cleanup task {id(self._cleanup_task)} for SessionManager {id(self)}")
+            logger.debug("Started session cleanup task %s for SessionManager %s", id(self._cleanup_task), id(self))
         except RuntimeError:
             logger.debug("No event loop, cleanup will start later")
     
     async def _cleanup_loop(self):
         """Periodically clean up expired sessions."""
-        logger.debug(f"Cleanup loop started for SessionManager {id(self)}")
+        logger.debug("Cleanup loop started for SessionManager %s", id(self))
         while True:
             try:
                 await asyncio.sleep(self._cleanup_interval)
-                logger.debug(f"Running cleanup on SessionManager {id(self)}")
+                logger.debug("Running cleanup on SessionManager %s", id(self))
                 await self._cleanup_expired_sessions()
             except asyncio.CancelledError:
                 logger.info("Cleanup task cancelled")
                 break
             except Exception as e:
-                logger.error(f"Cleanup error: {e}", exc_info=True)
+                logger.error("Cleanup error: %s", e, exc_info=True)
     
     async def _cleanup_expired_sessions(self):
         """Find and remove expired sessions based on lastUpdateTime."""
@@ -661,7 +661,7 @@ class SessionManager:
                         pending_calls = session.state.get("pending_tool_calls", []) if session.state else []
                         has_pending = len(pending_calls) > 0
                         if has_pending:
-                            logger.info(f"Preserving expired session {session_key} - has {len(pending_calls)} pending tool calls (HITL)")
+                            logger.info("Preserving expired session %s - has %s pending tool calls (HITL)", session_key, len(pending_calls))
                         else:
                             await self._delete_session(session)
                             expired_count += 1
@@ -670,10 +670,10 @@ class SessionManager:
                     self._untrack_session(session_key, user_id)
                     
             except Exception as e:
-                logger.error(f"Error checking session {session_key}: {e}")
+                logger.error("Error checking session %s: %s", session_key, e)
         
         if expired_count > 0:
-            logger.info(f"Cleaned up {expired_count} expired sessions")
+            logger.info("Cleaned up %s expired sessions", expired_count)
     
     def get_session_count(self) -> int:
         """Get total number of tracked sessions."""
@@ -0,0 +1,483 @@
+# src/ag_ui_adk/tool_response.py
+
+"""Streaming JSON serialization of tool responses with size caps."""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import json
+import os
+import re
+import tempfile
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .config import ToolResponseConfig
+
+import logging
+logger = logging.getLogger(__name__)
+
+# Encoders matching json.dumps(..., ensure_ascii=False) output exactly
+_encode_str = json.encoder.encode_basestring
+_INFINITY = float("inf")
+
+# Token kinds produced while walking a value
+_TEXT = 0
+_VALUE = 1
+_EXIT = 2
+
+# Coercion strategies, resolved once per type
+_DATACLASS = "dataclass"
+_ASDICT = "asdict"
+_MODEL_DUMP = "model_dump"
+_TO_DICT = "to_dict"
+_MAPPING = "mapping"
+_SEQUENCE = "sequence"
+_ITERABLE = "iterable"
+_VARS = "vars"
+
+_strategy_cache: Dict[type, Tuple[str, ...]] = {}
+# Types created at runtime (e.g. per-call namedtuples) would otherwise grow
+# the cache without bound
+_MAX_CACHED_TYPES = 1024
+
+# Guards against values that keep producing fresh objects (e.g. mocks whose
+# model_dump() returns another mock); mirrors the interpreter recursion limit
+_MAX_DEPTH = 1000
+
+
+def _float_repr(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == _INFINITY:
+        return "Infinity"
+    if value == -_INFINITY:
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def _probe_strategies(obj: Any) -> Tuple[str, ...]:
+    """Return the coercion strategies that apply to ``obj``, in priority order."""
+    strategies: List[str] = []
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        strategies.append(_DATACLASS)
+    if callable(getattr(obj, "_asdict", None)):
+        strategies.append(_ASDICT)
+    if callable(getattr(obj, "model_dump", None)):
+        strategies.append(_MODEL_DUMP)
+    if callable(getattr(obj, "to_dict", None)):
+        strategies.append(_TO_DICT)
+    if isinstance(obj, Mapping):
+        strategies.append(_MAPPING)
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        strategies.append(_SEQUENCE)
+    elif isinstance(obj, Iterable):
+        strategies.append(_ITERABLE)
+    strategies.append(_VARS)
+    return tuple(strategies)
+
+
+def _strategies_for(value: Any) -> Tuple[str, ...]:
+    """Look up (and memoize) the coercion strategies for ``value``'s type.
+
+    Types with a dynamic ``__getattr__`` (and class objects themselves) can
+    expose attributes their type does not declare, so they are probed per
+    instance instead of being cached.
+    """
+    value_type = type(value)
+    cached = _strategy_cache.get(value_type)
+    if cached is not None:
+        return cached
+
+    if isinstance(value, type) or hasattr(value_type, "__getattr__"):
+        return _probe_strategies(value)
+
+    strategies = _probe_strategies(value)
+    if len(_strategy_cache) >= _MAX_CACHED_TYPES:
+        _strategy_cache.clear()
+    _strategy_cache[value_type] = strategies
+    return strategies
+
+
+_default_blob_directory: Optional[str] = None
+_default_blob_directory_lock = threading.Lock()
+
+
+def _string_keyed_items(mapping: Mapping) -> Any:
+    """Items of ``mapping`` keyed by ``str(key)``.
+
+    Keys that stringify the same (``1`` and ``"1"``) are merged as a dict
+    built from ``str(key)`` would: the last value wins, in the first key's
+    position.
+    """
+    if all(type(key) is str for key in mapping):
+        return mapping.items()
+    return {str(key): item for key, item in mapping.items()}.items()
+
+
+def _private_blob_directory() -> str:
+    """Return this process's private offload directory, creating it once."""
+    global _default_blob_directory
+    with _default_blob_directory_lock:
+        if _default_blob_directory is None:
+            _default_blob_directory = tempfile.mkdtemp(prefix="ag_ui_adk_tool_responses-")
+        return _default_blob_directory
+
+
+class ToolResponseBlobStore(ABC):
+    """Destination for tool responses that are too large to send inline."""
+
+    @abstractmethod
+    def put(self, key: str, chunks: Iterable[str]) -> str:
+        """Persist a serialized payload.
+
+        Called from a worker thread when serializing on the event loop, so it
+        may block.
+
+        Args:
+            key: Identifier for the payload (usually the tool call ID)
+            chunks: JSON text fragments, consumed lazily in order
+
+        Returns:
+            A reference (e.g. URI) the client can use to retrieve the payload
+        """
+
+
+class LocalDiskBlobStore(ToolResponseBlobStore):
+    """Blob store writing payloads as JSON files to a local directory.
+
+    The returned ``file://`` references are only usable by clients that share
+    the server's filesystem; implement ``ToolResponseBlobStore`` to offload to
+    storage remote clients can reach.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """Initialize the blob store.
+
+        Args:
+            directory: Target directory, created on first write. Defaults to a
+                private (0700) directory under the system temp directory,
+                unique to this process.
+        """
+        self.directory = directory
+
+    def put(self, key: str, chunks: Iterable[str]) -> str:
+        if self.directory is None:
+            self.directory = _private_blob_directory()
+        else:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        safe_key = re.sub(r"[^A-Za-z0-9_.-]", "_", key) or "tool_response"
+        # Unique per write, so runs reusing a tool call ID don't overwrite each other
+        path = os.path.join(self.directory, f"{safe_key}-{uuid.uuid4().hex}.json")
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with open(fd, "w", encoding="utf-8") as handle:
+            for chunk in chunks:
+                handle.write(chunk)
+        return "file://" + os.path.abspath(path)
+
+
+class ToolResponseSerializer:
+    """Serialize arbitrary tool responses to JSON without an intermediate copy.
+
+    The serializer walks the source object iteratively and emits JSON text
+    fragments directly, applying the same coercion rules the middleware has
+    always used (dataclasses, named tuples, ``model_dump``/``to_dict``,
+    mappings, iterables, public attributes, then ``str``). Cycles are broken by
+    tracking only the current ancestor chain, so shared sub-objects are still
+    serialized in full.
+    """
+
+    def __init__(self, config: Optional[ToolResponseConfig] = None):
+        """Initialize the serializer.
+
+        Args:
+            config: Size limits and offloading options. Defaults to no limits.
+        """
+        self.config = config or ToolResponseConfig()
+        self._blob_store = self.config.blob_store
+        if self.config.offload_oversized and self._blob_store is None:
+            self._blob_store = LocalDiskBlobStore()
+
+    def iter_json(self, value: Any) -> Iterator[str]:
+        """Yield JSON text fragments for ``value``.
+
+        Args:
+            value: The tool response to serialize
+
+        Yields:
+            Consecutive fragments of the JSON document
+        """
+        ancestors: set[int] = set()
+        stack: List[Iterator[Tuple[int, Any]]] = [iter(((_VALUE, value),))]
+
+        while stack:
+            try:
+                kind, payload = next(stack[-1])
+            except StopIteration:
+                stack.pop()
+                continue
+
+            if kind == _TEXT:
+                yield payload
+                continue
+            if kind == _EXIT:
+                ancestors.discard(payload)
+                continue
+
+            scalar = self._encode_scalar(payload)
+            if scalar is not None:
+                yield scalar
+                continue
+
+            obj_id = id(payload)
+            if obj_id in ancestors:
+                yield self._encode_string(str(payload))
+                continue
+
+            if len(stack) > _MAX_DEPTH:
+                raise ValueError("Tool response nesting exceeds maximum depth")
+
+            ancestors.add(obj_id)
+            tokens = self._expand(payload)
+            stack.append(chain(tokens, ((_EXIT, obj_id),)))
+
+    def serialize(self, response: Any, key: Optional[str] = None) -> str:
+        """Serialize a tool response into a JSON string, enforcing size caps.
+
+        Args:
+            response: The tool response to serialize
+            key: Identifier used when offloading to the blob store
+
+        Returns:
+            The JSON document, a summary object, or a blob reference
+        """
+        try:
+            result, oversized = self._serialize_inline(response)
+            if oversized is not None:
+                result = self._offload(oversized, key)
+            return result
+        except Exception as exc:
+            return self._fallback(response, exc)
+
+    async def aserialize(self, response: Any, key: Optional[str] = None) -> str:
+        """Serialize a tool response from the event loop.
+
+        Same output as ``serialize``; offloaded payloads are written to the
+        blob store in a worker thread so the loop is not blocked on I/O.
+
+        Args:
+            response: The tool response to serialize
+            key: Identifier used when offloading to the blob store
+
+        Returns:
+            The JSON document, a summary object, or a blob reference
+        """
+        try:
+            result, oversized = self._serialize_inline(response)
+            if oversized is not None:
+                result = await asyncio.to_thread(self._offload, oversized, key)
+            return result
+        except Exception as exc:
+            return self._fallback(response, exc)
+
+    def _fallback(self, response: Any, exc: Exception) -> str:
+        logger.warning("Failed to coerce tool response to JSON: %s", exc, exc_info=True)
+        try:
+            return json.dumps(str(response), ensure_ascii=False)
+        except Exception:
+            logger.warning("Failed to stringify tool response; returning empty string.")
+            return json.dumps("", ensure_ascii=False)
+
+    def _serialize_inline(
+        self, response: Any
+    ) -> Tuple[Optional[str], Optional[Tuple[List[str], Iterator[str], str]]]:
+        """Serialize up to ``max_chars``.
+
+        Returns the result, or ``(None, oversized)`` when the payload has to be
+        offloaded, where ``oversized`` holds the fragments written so far, the
+        remaining fragments and the preview.
+        """
+        max_chars = self.config.max_chars
+        fragments = self.iter_json(response)
+        if max_chars is None:
+            return "".join(fragments), None
+
+        buffered: List[str] = []
+        size = 0
+        for fragment in fragments:
+            buffered.append(fragment)
+            size += len(fragment)
+            if size > max_chars:
+                break
+        else:
+            return "".join(buffered), None
+
+        preview = "".join(buffered)[: min(self.config.preview_chars, max_chars)]
+
+        if self._blob_store is not None:
+            return None, (buffered, fragments, preview)
+
+        fragments.close()
+        return json.dumps(
+            {"truncated": True, "max_chars": max_chars, "preview": preview},
+            ensure_ascii=False,
+        ), None
+
+    def _offload(
+        self, oversized: Tuple[List[str], Iterator[str], str], key: Optional[str]
+    ) -> str:
+        buffered, fragments, preview = oversized
+        written = [0]
+
+        def counted() -> Iterator[str]:
+            for fragment in chain(buffered, fragments):
+                written[0] += len(fragment)
+                yield fragment
+
+        reference = self._blob_store.put(key or str(uuid.uuid4()), counted())
+        logger.debug("Offloaded %d-char tool response to %s", written[0], reference)
+        return json.dumps(
+            {
+                "truncated": True,
+                "blob_ref": reference,
+                "size_chars": written[0],
+                "preview": preview,
+            },
+            ensure_ascii=False,
+        )
+
+    def _encode_scalar(self, value: Any) -> Optional[str]:
+        if value is None:
+            return "null"
+        if isinstance(value, str):
+            return self._encode_string(value)
+        if value is True:
+            return "true"
+        if value is False:
+            return "false"
+        if isinstance(value, int):
+            return int.__repr__(value)
+        if isinstance(value, float):
+            return _float_repr(value)
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            try:
+                return self._encode_string(value.decode())  # type: ignore[union-attr]
+            except Exception:
+                return "[" + ", ".join(int.__repr__(b) for b in value) + "]"
+        return None
+
+    def _encode_string(self, value: str) -> str:
+        limit = self.config.max_string_chars
+        if limit is not None and len(value) > limit:
+            value = f"{value[:limit]}... [truncated {len(value) - limit} chars]"
+        return _encode_str(value)
+
+    def _expand(self, value: Any) -> Iterator[Tuple[int, Any]]:
+        """Return the token stream for a non-scalar value."""
+        for strategy in _strategies_for(value):
+            if strategy == _DATACLASS:
+                fields = dataclasses.fields(value)
+                return self._mapping_tokens(
+                    ((field.name, getattr(value, field.name)) for field in fields),
+                    len(fields),
+                )
+            if strategy == _ASDICT:
+                try:
+                    items = list(value._asdict().items())
+                except Exception:
+                    continue
+                return self._mapping_tokens(items, len(items))
+            if strategy in (_MODEL_DUMP, _TO_DICT):
+                method = getattr(value, strategy, None)
+                if not callable(method):
+                    continue
+                try:
+                    dumped = method()
+                except TypeError:
+                    try:
+                        dumped = method(exclude_none=False)
+                    except Exception:
+                        continue
+                except Exception:
+                    continue
+                return iter(((_VALUE, dumped),))
+            if strategy == _MAPPING:
+                items = _string_keyed_items(value)
+                return self._mapping_tokens(items, len(items))
+            if strategy == _SEQUENCE:
+                return self._sequence_tokens(value, len(value))
+            if strategy == _ITERABLE:
+                try:
+                    items = list(value)
+                except TypeError:
+                    continue
+                return self._sequence_tokens(items, len(items))
+            if strategy == _VARS:
+                try:
+                    obj_vars = vars(value)
+                except TypeError:
+                    obj_vars = None
+                if obj_vars:
+                    public = [(k, v) for k, v in obj_vars.items() if not k.startswith("_")]
+                    if public:
+                        return self._mapping_tokens(public, len(public))
+
+        return iter(((_TEXT, self._encode_string(str(value))),))
+
+    def _mapping_tokens(
+        self, items: Iterable[Tuple[Any, Any]], total: Optional[int] = None
+    ) -> Iterator[Tuple[int, Any]]:
+        limit = self.config.max_collection_items
+        yield _TEXT, "{"
+        count = 0
+        for key, item in items:
+            if limit is not None and count >= limit:
+                if total is not None:
+                    prefix = ", " if count else ""
+                    yield _TEXT, f'{prefix}"__truncated_items__": {total - count}'
+                break
+            yield _TEXT, (", " if count else "") + _encode_str(str(key)) + ": "
+            yield _VALUE, item
+            count += 1
+        yield _TEXT, "}"
+
+    def _sequence_tokens(self, items: Iterable[Any], total: int) -> Iterator[Tuple[int, Any]]:
+        limit = self.config.max_collection_items
+        yield _TEXT, "["
+        count = 0
+        for item in items:
+            if limit is not None and count >= limit:
+                prefix = ", " if count else ""
+                yield _TEXT, prefix + _encode_str(f"... [{total - count} more items truncated]")
+                break
+            if count:
+                yield _TEXT, ", "
+            yield _VALUE, item
+            count += 1
+        yield _TEXT, "]"
+
+
+_default_serializer = ToolResponseSerializer()
+
+
+def serialize_tool_response(
+    response: Any,
+    serializer: Optional[ToolResponseSerializer] = None,
+    key: Optional[str] = None,
+) -> str:
+    """Serialize a tool response into a JSON string.
+
+    Args:
+        response: The tool response to serialize
+        serializer: Serializer to use; defaults to an unlimited serializer
+        key: Identifier used when an oversized payload is offloaded
+
+    Returns:
+        The serialized JSON string
+    """
+    return (serializer or _default_serializer).serialize(response, key)
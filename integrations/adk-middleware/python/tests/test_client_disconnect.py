@@ -0,0 +1,271 @@
+# tests/test_client_disconnect.py
+
+"""Tests for cancelling background executions when the client disconnects."""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+from ag_ui.core import (
+    EventType, RunAgentInput, TextMessageChunkEvent, Tool, ToolCallEndEvent,
+    ToolCallStartEvent, UserMessage,
+)
+from ag_ui_adk import ADKAgent, InMemoryMetricsRecorder, SessionManager
+from ag_ui_adk.endpoint import _watch_for_disconnect
+from ag_ui_adk.execution_state import ExecutionState
+from google.adk.agents import Agent
+
+
+def _text_event():
+    return SimpleNamespace(
+        id="event-1",
+        author="assistant",
+        content=SimpleNamespace(parts=[SimpleNamespace(text="hello")]),
+        partial=True,
+        turn_complete=False,
+        usage_metadata=None,
+        finish_reason=None,
+        actions=None,
+        custom_data=None,
+        get_function_calls=lambda: [],
+        get_function_responses=lambda: [],
+        is_final_response=lambda: False,
+    )
+
+
+class HangingRunner:
+    """Runner that emits one event and then works forever."""
+
+    def __init__(self):
+        self.cancelled = False
+
+    async def run_async(self, *args, **kwargs):
+        yield _text_event()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+
+
+async def fake_translate(self, adk_event, thread_id, run_id):
+    yield TextMessageChunkEvent(
+        type=EventType.TEXT_MESSAGE_CHUNK, message_id=adk_event.id, delta="chunk"
+    )
+
+
+async def fake_translate_tool_call(self, adk_event, thread_id, run_id):
+    """Emit a call of the "search" tool without a result."""
+    yield ToolCallStartEvent(
+        type=EventType.TOOL_CALL_START, tool_call_id="call-1", tool_call_name="search"
+    )
+    yield ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id="call-1")
+
+
+class TestClientDisconnect:
+    """Tests for ADKAgent.handle_client_disconnect and abandoned streams."""
+
+    @pytest.fixture(autouse=True)
+    def reset_session_manager(self):
+        SessionManager.reset_instance()
+        yield
+        SessionManager.reset_instance()
+
+    @pytest.fixture
+    def recorder(self):
+        return InMemoryMetricsRecorder()
+
+    def _make_agent(self, recorder, grace):
+        agent = Mock(spec=Agent)
+        agent.name = "test_agent"
+        return ADKAgent(
+            adk_agent=agent,
+            app_name="test_app",
+            user_id="test_user",
+            use_in_memory_services=True,
+            client_disconnect_grace_seconds=grace,
+            metrics=recorder,
+        )
+
+    @pytest.fixture
+    def sample_input(self):
+        return RunAgentInput(
+            thread_id="disconnect_thread",
+            run_id="run_1",
+            messages=[UserMessage(id="msg1", role="user", content="Hello")],
+            context=[],
+            state={},
+            tools=[],
+            forwarded_props={},
+        )
+
+    async def _abandon_stream(self, adk_agent, sample_input, events=1):
+        """Start a run, read the first ``events`` translated events, then drop the stream."""
+        stream = adk_agent.run(sample_input)
+        assert (await stream.__anext__()).type == EventType.RUN_STARTED
+        for _ in range(events):
+            await stream.__anext__()
+        execution = adk_agent._active_executions["disconnect_thread"]
+        await stream.aclose()
+        # Let the inner generators be finalized
+        for _ in range(5):
+            await asyncio.sleep(0)
+        return execution
+
+    @pytest.mark.asyncio
+    async def test_abandoned_execution_is_cancelled_after_grace(self, recorder, sample_input):
+        adk_agent = self._make_agent(recorder, grace=0.05)
+        runner = HangingRunner()
+
+        with patch("ag_ui_adk.adk_agent.EventTranslator.translate", new=fake_translate), \
+             patch.object(adk_agent, "_create_runner", return_value=runner):
+            execution = await self._abandon_stream(adk_agent, sample_input)
+
+            assert not execution.task.done()
+            await asyncio.sleep(0.2)
+
+        assert execution.task.cancelled()
+        assert runner.cancelled
+        assert adk_agent.cancelled_execution_count == 1
+        assert recorder.cancelled_executions == [("disconnect_thread", "client_disconnect")]
+        assert "disconnect_thread" not in adk_agent._active_executions
+
+    @pytest.mark.asyncio
+    async def test_disabled_grace_leaves_execution_running(self, recorder, sample_input):
+        adk_agent = self._make_agent(recorder, grace=None)
+
+        with patch("ag_ui_adk.adk_agent.EventTranslator.translate", new=fake_translate), \
+             patch.object(adk_agent, "_create_runner", return_value=HangingRunner()):
+            execution = await self._abandon_stream(adk_agent, sample_input)
+            await asyncio.sleep(0.1)
+
+            assert not execution.task.done()
+            assert adk_agent.cancelled_execution_count == 0
+            await execution.cancel()
+
+    def test_cancellation_is_opt_in(self):
+        agent = Mock(spec=Agent)
+        agent.name = "test_agent"
+
+        adk_agent = ADKAgent(adk_agent=agent, app_name="test_app", user_id="test_user")
+
+        assert adk_agent.client_disconnect_grace_seconds is None
+
+    @pytest.mark.asyncio
+    async def test_running_backend_tool_does_not_preserve_execution(self, recorder, sample_input):
+        adk_agent = self._make_agent(recorder, grace=0.05)
+        runner = HangingRunner()
+
+        with patch("ag_ui_adk.adk_agent.EventTranslator.translate", new=fake_translate_tool_call), \
+             patch.object(adk_agent, "_create_runner", return_value=runner):
+            execution = await self._abandon_stream(adk_agent, sample_input, events=2)
+            await asyncio.sleep(0.2)
+
+        assert execution.task.cancelled()
+        assert adk_agent.cancelled_execution_count == 1
+        assert adk_agent.preserved_execution_count == 0
+
+    @pytest.mark.asyncio
+    async def test_pending_client_tool_preserves_execution(self, recorder, sample_input):
+        adk_agent = self._make_agent(recorder, grace=0.05)
+        client_input = sample_input.model_copy(update={
+            "tools": [Tool(name="search", description="Frontend tool", parameters={})]
+        })
+
+        with patch("ag_ui_adk.adk_agent.EventTranslator.translate", new=fake_translate_tool_call), \
+             patch.object(adk_agent, "_create_runner", return_value=HangingRunner()):
+            execution = await self._abandon_stream(adk_agent, client_input, events=2)
+            await asyncio.sleep(0.2)
+
+            assert not execution.task.done()
+            assert adk_agent.preserved_execution_count == 1
+            assert adk_agent.cancelled_execution_count == 0
+            await execution.cancel()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_of_older_run_spares_newer_execution(self, recorder):
+        adk_agent = self._make_agent(recorder, grace=0.01)
+        task = asyncio.create_task(asyncio.Event().wait())
+        adk_agent._active_executions["thread"] = ExecutionState(
+            task=task, thread_id="thread", event_queue=asyncio.Queue(), run_id="run_2"
+        )
+
+        adk_agent.handle_client_disconnect("thread", run_id="run_1")
+        await asyncio.sleep(0.05)
+
+        assert not task.done()
+        assert not adk_agent._disconnect_tasks
+        assert adk_agent.cancelled_execution_count == 0
+
+        adk_agent.handle_client_disconnect("thread", run_id="run_2")
+        await asyncio.sleep(0.05)
+
+        assert task.cancelled()
+        assert adk_agent.cancelled_execution_count == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_disconnect_is_handled_once(self, recorder):
+        adk_agent = self._make_agent(recorder, grace=0.01)
+        task = asyncio.create_task(asyncio.Event().wait())
+        execution = SimpleNamespace(
+            task=task,
+            thread_id="hitl_thread",
+            has_pending_tool_calls=lambda: False,
+        )
+
+        adk_agent.handle_client_disconnect("hitl_thread", execution=execution, awaiting_tool_results=True)
+        adk_agent.handle_client_disconnect("hitl_thread", execution=execution, awaiting_tool_results=True)
+        await asyncio.sleep(0.05)
+
+        assert adk_agent.preserved_execution_count == 1
+        task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_execution_awaiting_tool_results_is_preserved(self, recorder):
+        adk_agent = self._make_agent(recorder, grace=0.01)
+        task = asyncio.create_task(asyncio.Event().wait())
+        execution = SimpleNamespace(
+            task=task,
+            thread_id="hitl_thread",
+            has_pending_tool_calls=lambda: False,
+        )
+
+        adk_agent.handle_client_disconnect(
+            "hitl_thread", execution=execution, awaiting_tool_results=True
+        )
+        await asyncio.sleep(0.05)
+
+        assert not task.done()
+        assert adk_agent.preserved_execution_count == 1
+        assert adk_agent.cancelled_execution_count == 0
+        task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_unknown_thread_is_ignored(self, recorder):
+        adk_agent = self._make_agent(recorder, grace=0.01)
+
+        adk_agent.handle_client_disconnect("missing_thread")
+
+        assert not adk_agent._disconnect_tasks
+
+
+class TestDisconnectWatcher:
+    """Tests for the endpoint's disconnect polling."""
+
+    @pytest.mark.asyncio
+    async def test_watcher_notifies_agent_on_disconnect(self):
+        request = MagicMock()
+        states = iter([False, False, True])
+
+        async def is_disconnected():
+            return next(states)
+
+        request.is_disconnected = is_disconnected
+        agent = MagicMock()
+
+        await asyncio.wait_for(
+            _watch_for_disconnect(request, agent, "thread-1", "run-1", 0.001), timeout=1.0
+        )
+
+        agent.handle_client_disconnect.assert_called_once_with("thread-1", run_id="run-1")
@@ -0,0 +1,255 @@
+# tests/test_metrics.py
+
+"""Tests for ADKAgent metrics and tracing hooks."""
+
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+from ag_ui.core import (
+    EventType,
+    RunAgentInput,
+    TextMessageChunkEvent,
+    Tool,
+    ToolCallEndEvent,
+    ToolCallStartEvent,
+    UserMessage,
+)
+from ag_ui_adk import (
+    ADKAgent,
+    AgentMetrics,
+    InMemoryMetricsRecorder,
+    NoOpMetrics,
+    SessionManager,
+)
+from ag_ui_adk.execution_state import ExecutionState
+from google.adk.agents import Agent
+
+
+def _text_event():
+    return SimpleNamespace(
+        id="event-1",
+        author="assistant",
+        content=SimpleNamespace(parts=[SimpleNamespace(text="hello")]),
+        partial=True,
+        turn_complete=True,
+        usage_metadata=None,
+        finish_reason="STOP",
+        actions=None,
+        custom_data=None,
+        get_function_calls=lambda: [],
+        get_function_responses=lambda: [],
+        is_final_response=lambda: True,
+    )
+
+
+class FailingMetrics(AgentMetrics):
+    """Metrics whose every hook raises."""
+
+    def __getattribute__(self, name):
+        if name.startswith(("record_", "start_", "end_")):
+            def hook(*args, **kwargs):
+                raise RuntimeError(f"{name} failed")
+            return hook
+        return super().__getattribute__(name)
+
+
+class FakeRunner:
+    async def run_async(self, *args, **kwargs):
+        yield _text_event()
+
+
+class TestAgentMetrics:
+    """Tests for the metrics hooks wired through ADKAgent."""
+
+    @pytest.fixture(autouse=True)
+    def reset_session_manager(self):
+        SessionManager.reset_instance()
+        yield
+        SessionManager.reset_instance()
+
+    @pytest.fixture
+    def recorder(self):
+        return InMemoryMetricsRecorder()
+
+    @pytest.fixture
+    def adk_agent(self, recorder):
+        agent = Mock(spec=Agent)
+        agent.name = "test_agent"
+        return ADKAgent(
+            adk_agent=agent,
+            app_name="test_app",
+            user_id="test_user",
+            use_in_memory_services=True,
+            metrics=recorder,
+        )
+
+    @pytest.fixture
+    def sample_input(self):
+        return RunAgentInput(
+            thread_id="metrics_thread",
+            run_id="metrics_run",
+            messages=[UserMessage(id="msg1", role="user", content="Hello")],
+            context=[],
+            state={},
+            tools=[],
+            forwarded_props={},
+        )
+
+    def test_defaults_to_noop(self):
+        agent = Mock(spec=Agent)
+        agent.name = "test_agent"
+        adk_agent = ADKAgent(adk_agent=agent, app_name="app", user_id="user")
+        assert isinstance(adk_agent._metrics, NoOpMetrics)
+
+    @pytest.mark.asyncio
+    async def test_execution_metrics_are_recorded(self, adk_agent, sample_input, recorder):
+        async def fake_translate(self, adk_event, thread_id, run_id):
+            yield TextMessageChunkEvent(
+                type=EventType.TEXT_MESSAGE_CHUNK, message_id=adk_event.id, delta="chunk"
+            )
+
+        with patch("ag_ui_adk.adk_agent.EventTranslator.translate", new=fake_translate), \
+             patch.object(adk_agent, "_create_runner", return_value=FakeRunner()):
+            events = [event async for event in adk_agent.run(sample_input)]
+
+        assert events[0].type == EventType.RUN_STARTED
+        assert events[-1].type == EventType.RUN_FINISHED
+        streamed = len(events) - 2
+
+        assert len(recorder.executions) == 1
+        execution = recorder.executions[0]
+        assert execution["thread_id"] == "metrics_thread"
+        assert execution["run_id"] == "metrics_run"
+        assert execution["finished"] is True
+        assert execution["event_count"] == streamed
+        assert execution["error"] is None
+
+        assert recorder.events_per_execution == [("metrics_thread", streamed)]
+        assert len(recorder.time_to_first_event) == 1
+        assert len(recorder.translator_times) == 1
+        # One wait per queued event plus the completion sentinel
+        assert len(recorder.queue_waits) == streamed + 1
+        assert recorder.session_calls["get_or_create_session"]
+        assert all(seconds >= 0 for seconds in recorder.session_calls["get_or_create_session"])
+
+    @pytest.mark.asyncio
+    async def test_execution_error_is_reported(self, adk_agent, sample_input, recorder):
+        with patch.object(
+            adk_agent, "_start_background_execution", side_effect=RuntimeError("boom")
+        ):
+            events = [event async for event in adk_agent.run(sample_input)]
+
+        assert events[-1].type == EventType.RUN_ERROR
+        assert isinstance(recorder.executions[0]["error"], RuntimeError)
+        assert recorder.events_per_execution == []
+
+    @pytest.mark.asyncio
+    async def test_failing_recorder_does_not_break_the_run(self, sample_input):
+        agent = Mock(spec=Agent)
+        agent.name = "test_agent"
+        adk_agent = ADKAgent(
+            adk_agent=agent,
+            app_name="test_app",
+            user_id="test_user",
+            use_in_memory_services=True,
+            metrics=FailingMetrics(),
+        )
+
+        with patch.object(adk_agent, "_create_runner", return_value=FakeRunner()):
+            events = [event async for event in adk_agent.run(sample_input)]
+
+        assert events[0].type == EventType.RUN_STARTED
+        assert events[-1].type == EventType.RUN_FINISHED
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_spans_polling_timeouts(self, adk_agent, recorder):
+        queue = asyncio.Queue()
+        task = asyncio.get_running_loop().create_future()
+        execution = ExecutionState(task=task, thread_id="slow_thread", event_queue=queue)
+
+        async def produce():
+            # Longer than the stream's 1 s polling interval
+            await asyncio.sleep(1.3)
+            await queue.put(None)
+
+        producer = asyncio.create_task(produce())
+        events = [event async for event in adk_agent._stream_events(execution)]
+        await producer
+
+        assert events == []
+        assert len(recorder.queue_waits) == 1
+        assert recorder.queue_waits[0][1] >= 1.3
+
+    @pytest.mark.asyncio
+    async def test_only_client_tool_calls_are_tracked(self, adk_agent, sample_input):
+        async def fake_translate(self, adk_event, thread_id, run_id):
+            for call_id, name in [("backend-call", "search"), ("client-call", "confirm")]:
+                yield ToolCallStartEvent(
+                    type=EventType.TOOL_CALL_START, tool_call_id=call_id, tool_call_name=name
+                )
+                yield ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id=call_id)
+
+        sample_input.tools = [Tool(name="confirm", description="Ask the user", parameters={})]
+        with patch("ag_ui_adk.adk_agent.EventTranslator.translate", new=fake_translate), \
+             patch.object(adk_agent, "_create_runner", return_value=FakeRunner()):
+            [event async for event in adk_agent.run(sample_input)]
+
+        assert list(adk_agent._tool_call_emitted_at) == ["client-call"]
+
+    @pytest.mark.asyncio
+    async def test_tool_round_trip(self, adk_agent, recorder):
+        adk_agent._mark_tool_call_emitted("call-1")
+
+        await adk_agent._remove_pending_tool_call("unknown-session", "call-1")
+        await adk_agent._remove_pending_tool_call("unknown-session", "call-1")
+
+        assert [call_id for call_id, _ in recorder.tool_round_trips] == ["call-1"]
+
+    def test_tool_call_tracking_is_bounded(self, adk_agent):
+        with patch("ag_ui_adk.adk_agent._MAX_TRACKED_TOOL_CALLS", 3):
+            for i in range(5):
+                adk_agent._mark_tool_call_emitted(f"call-{i}")
+
+        assert list(adk_agent._tool_call_emitted_at) == ["call-2", "call-3", "call-4"]
+
+
+class TestOpenTelemetryMetrics:
+    """Smoke tests for the OpenTelemetry adapter."""
+
+    def test_records_span_and_histograms(self):
+        pytest.importorskip("opentelemetry.sdk")
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+        from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+        from ag_ui_adk import OpenTelemetryMetrics
+
+        reader = InMemoryMetricReader()
+        exporter = InMemorySpanExporter()
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+        metrics = OpenTelemetryMetrics(
+            meter_provider=MeterProvider(metric_readers=[reader]),
+            tracer_provider=tracer_provider,
+        )
+
+        token = metrics.start_execution("thread", "run")
+        metrics.record_time_to_first_event(0.01, thread_id="thread")
+        metrics.record_session_call("get_state_value", 0.002)
+        metrics.end_execution(token, event_count=3)
+
+        spans = exporter.get_finished_spans()
+        assert [span.name for span in spans] == ["ag_ui_adk.execution"]
+        assert spans[0].attributes["ag_ui.event_count"] == 3
+
+        names = {
+            metric.name
+            for resource in reader.get_metrics_data().resource_metrics
+            for scope in resource.scope_metrics
+            for metric in scope.metrics
+        }
+        assert "ag_ui_adk.execution.time_to_first_event" in names
+        assert "ag_ui_adk.session.call.duration" in names
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+"""Tests for chunked and offloaded TOOL_CALL_ARGS serialization."""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from ag_ui.core import EventType, ToolCallArgsEvent
+from ag_ui_adk import EventTranslator, ToolCallArgsConfig
+
+
+def _function_call(call_id, name, args):
+    func_call = MagicMock()
+    func_call.id = call_id
+    func_call.name = name
+    func_call.args = args
+    return func_call
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Thread pool that records submitted callables."""
+
+    def __init__(self, max_workers=2):
+        super().__init__(max_workers=max_workers)
+        self.submitted = []
+        self.futures = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted.append(args)
+        future = super().submit(fn, *args, **kwargs)
+        self.futures.append(future)
+        return future
+
+
+class TestToolCallArgsStreaming:
+    """Tests for ToolCallArgsConfig handling in EventTranslator."""
+
+    @pytest.mark.asyncio
+    async def test_args_are_split_into_chunks(self):
+        translator = EventTranslator(tool_call_args_config=ToolCallArgsConfig(chunk_size=10))
+        args = {"document": "x" * 45}
+
+        events = [
+            event async for event in translator._translate_function_calls(
+                [_function_call("call-1", "write", args)]
+            )
+        ]
+
+        arg_events = [e for e in events if isinstance(e, ToolCallArgsEvent)]
+        assert len(arg_events) == 7  # 61 serialized chars
+        assert all(len(e.delta) <= 10 for e in arg_events)
+        assert json.loads("".join(e.delta for e in arg_events)) == args
+        assert events[0].type == EventType.TOOL_CALL_START
+        assert events[-1].type == EventType.TOOL_CALL_END
+
+    @pytest.mark.asyncio
+    async def test_small_args_stay_in_single_event(self):
+        translator = EventTranslator(tool_call_args_config=ToolCallArgsConfig(chunk_size=100))
+
+        events = [
+            event async for event in translator._translate_function_calls(
+                [_function_call("call-1", "lookup", {"q": "hi"})]
+            )
+        ]
+
+        assert [e.type for e in events] == [
+            EventType.TOOL_CALL_START, EventType.TOOL_CALL_ARGS, EventType.TOOL_CALL_END
+        ]
+        assert events[1].delta == '{"q": "hi"}'
+
+    @pytest.mark.asyncio
+    async def test_large_args_are_offloaded_and_order_is_preserved(self):
+        executor = RecordingExecutor()
+        translator = EventTranslator(
+            tool_call_args_config=ToolCallArgsConfig(offload_threshold=100, executor=executor)
+        )
+        large_a = {"rows": ["a" * 20] * 20}
+        small = {"q": "hi"}
+        large_b = {"rows": ["b" * 20] * 20}
+
+        try:
+            events = [
+                event async for event in translator._translate_function_calls([
+                    _function_call("call-a", "tool_a", large_a),
+                    _function_call("call-s", "tool_s", small),
+                    _function_call("call-b", "tool_b", large_b),
+                ])
+            ]
+        finally:
+            executor.shutdown()
+
+        assert executor.submitted == [(large_a,), (large_b,)]
+        arg_events = [e for e in events if isinstance(e, ToolCallArgsEvent)]
+        assert [e.tool_call_id for e in arg_events] == ["call-a", "call-s", "call-b"]
+        assert [json.loads(e.delta) for e in arg_events] == [large_a, small, large_b]
+
+    @pytest.mark.asyncio
+    async def test_lro_args_are_chunked(self):
+        translator = EventTranslator(tool_call_args_config=ToolCallArgsConfig(chunk_size=8))
+        args = {"plan": ["step one", "step two"]}
+
+        part = MagicMock()
+        part.function_call = _function_call("lro-1", "approve_plan", args)
+        adk_event = MagicMock()
+        adk_event.content.parts = [part]
+        adk_event.long_running_tool_ids = ["lro-1"]
+
+        events = [event async for event in translator.translate_lro_function_calls(adk_event)]
+
+        arg_events = [e for e in events if isinstance(e, ToolCallArgsEvent)]
+        assert len(arg_events) > 1
+        assert json.loads("".join(e.delta for e in arg_events)) == args
+        assert translator.long_running_tool_ids == ["lro-1"]
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_pending_serialization(self):
+        executor = RecordingExecutor(max_workers=1)
+        # Keep the only worker busy so the offloaded calls stay queued
+        release = threading.Event()
+        executor.submit(release.wait)
+        translator = EventTranslator(
+            tool_call_args_config=ToolCallArgsConfig(offload_threshold=0, executor=executor)
+        )
+
+        try:
+            events = translator._translate_function_calls([
+                _function_call("call-a", "tool_a", {"q": "a"}),
+                _function_call("call-b", "tool_b", {"q": "b"}),
+            ])
+            first = await events.__anext__()
+            await events.aclose()
+        finally:
+            release.set()
+            executor.shutdown()
+
+        assert first.type == EventType.TOOL_CALL_START
+        assert [future.cancelled() for future in executor.futures[1:]] == [True, True]
+
+    @pytest.mark.parametrize("chunk_size", [0, -1, 2.5, "10", True])
+    def test_invalid_chunk_size_rejected(self, chunk_size):
+        with pytest.raises(ValueError):
+            ToolCallArgsConfig(chunk_size=chunk_size)
+
+    @pytest.mark.parametrize("offload_threshold", [-1, 2.5, "100", True])
+    def test_invalid_offload_threshold_rejected(self, offload_threshold):
+        with pytest.raises(ValueError):
+            ToolCallArgsConfig(offload_threshold=offload_threshold)
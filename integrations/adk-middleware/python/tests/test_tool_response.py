@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+"""Tests for streaming tool response serialization."""
+
+import json
+import os
+import stat
+import threading
+from collections import namedtuple
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import List, Optional
+
+import pytest
+from pydantic import BaseModel
+
+from ag_ui.core import ToolCallResultEvent
+from ag_ui_adk import tool_response
+from ag_ui_adk import (
+    EventTranslator,
+    LocalDiskBlobStore,
+    ToolResponseBlobStore,
+    ToolResponseConfig,
+    ToolResponseSerializer,
+)
+
+
+@dataclass
+class Row:
+    name: str
+    score: float
+    tags: List[str] = field(default_factory=list)
+
+
+class Document(BaseModel):
+    title: str
+    body: Optional[str] = None
+
+
+Point = namedtuple("Point", ["x", "y"])
+
+
+class RecordingBlobStore(ToolResponseBlobStore):
+    """Blob store that keeps payloads in memory."""
+
+    def __init__(self):
+        self.blobs = {}
+
+    def put(self, key, chunks):
+        self.blobs[key] = "".join(chunks)
+        return f"memory://{key}"
+
+
+class TestToolResponseSerializer:
+    """Tests for ToolResponseSerializer."""
+
+    @pytest.fixture
+    def serializer(self):
+        return ToolResponseSerializer()
+
+    def test_matches_json_dumps_for_plain_structures(self, serializer):
+        payload = {
+            "text": "héllo \"quoted\"\n",
+            "int": 3,
+            "float": 1.5,
+            "bool": True,
+            "none": None,
+            "list": [1, 2.0, "three"],
+            "nested": {"tuple": (1, 2), "empty": {}, "empty_list": []},
+        }
+
+        expected = json.dumps(payload, ensure_ascii=False)
+        assert serializer.serialize(payload) == expected
+
+    def test_coerces_rich_objects(self, serializer):
+        payload = {
+            "rows": [Row("a", 1.0, ["x"]), Row("b", 2.5)],
+            "doc": Document(title="Report"),
+            "point": Point(1, 2),
+            "ns": SimpleNamespace(visible=1, _hidden=2),
+            "raw": b"bytes",
+        }
+
+        assert json.loads(serializer.serialize(payload)) == {
+            "rows": [
+                {"name": "a", "score": 1.0, "tags": ["x"]},
+                {"name": "b", "score": 2.5, "tags": []},
+            ],
+            "doc": {"title": "Report", "body": None},
+            "point": {"x": 1, "y": 2},
+            "ns": {"visible": 1},
+            "raw": "bytes",
+        }
+
+    def test_keys_that_stringify_the_same_are_merged(self, serializer):
+        payload = {1: "int", "a": 0, "1": "str", None: "none", "None": {"k": "v"}}
+
+        result = serializer.serialize(payload)
+
+        # As a dict built from str(key): last value wins, first key's position
+        assert result == '{"1": "str", "a": 0, "None": {"k": "v"}}'
+
+    def test_cycles_are_broken(self, serializer):
+        payload = {"name": "root"}
+        payload["self"] = payload
+
+        result = json.loads(serializer.serialize(payload))
+        assert result["name"] == "root"
+        assert isinstance(result["self"], str)
+
+    def test_shared_substructures_are_not_treated_as_cycles(self, serializer):
+        shared = {"value": 1}
+        payload = {"a": shared, "b": shared, "c": [shared, shared]}
+
+        assert json.loads(serializer.serialize(payload)) == {
+            "a": {"value": 1},
+            "b": {"value": 1},
+            "c": [{"value": 1}, {"value": 1}],
+        }
+
+    def test_deep_nesting_does_not_hit_recursion_limit(self, serializer):
+        payload = []
+        node = payload
+        for _ in range(900):
+            child = []
+            node.append(child)
+            node = child
+
+        assert serializer.serialize(payload) == "[" * 901 + "]" * 901
+
+    def test_string_and_collection_truncation(self):
+        serializer = ToolResponseSerializer(
+            ToolResponseConfig(max_string_chars=5, max_collection_items=2)
+        )
+
+        result = json.loads(serializer.serialize({
+            "text": "abcdefghij",
+            "nested": {
+                "items": [1, 2, 3, 4],
+                "map": {"a": 1, "b": 2, "c": 3},
+            },
+        }))
+
+        assert result["text"] == "abcde... [truncated 5 chars]"
+        assert result["nested"]["items"] == [1, 2, "... [2 more items truncated]"]
+        assert result["nested"]["map"] == {"a": 1, "b": 2, "__truncated_items__": 1}
+
+    def test_oversized_payload_is_summarized(self):
+        serializer = ToolResponseSerializer(ToolResponseConfig(max_chars=100, preview_chars=20))
+
+        result = json.loads(serializer.serialize({"rows": ["x" * 50] * 100}))
+
+        assert result["truncated"] is True
+        assert result["max_chars"] == 100
+        assert result["preview"] == '{"rows": ["' + "x" * 9
+
+    def test_oversized_payload_is_offloaded(self):
+        store = RecordingBlobStore()
+        serializer = ToolResponseSerializer(
+            ToolResponseConfig(max_chars=100, offload_oversized=True, blob_store=store)
+        )
+        payload = {"rows": ["x" * 50] * 100}
+
+        result = json.loads(serializer.serialize(payload, key="call-1"))
+
+        assert result["blob_ref"] == "memory://call-1"
+        assert result["size_chars"] == len(store.blobs["call-1"])
+        assert json.loads(store.blobs["call-1"]) == payload
+
+    def test_small_payload_is_not_offloaded(self):
+        store = RecordingBlobStore()
+        serializer = ToolResponseSerializer(
+            ToolResponseConfig(max_chars=100, offload_oversized=True, blob_store=store)
+        )
+
+        assert json.loads(serializer.serialize({"ok": True})) == {"ok": True}
+        assert store.blobs == {}
+
+    def test_local_disk_blob_store(self, tmp_path):
+        serializer = ToolResponseSerializer(
+            ToolResponseConfig(
+                max_chars=10,
+                offload_oversized=True,
+                blob_store=LocalDiskBlobStore(str(tmp_path)),
+            )
+        )
+
+        result = json.loads(serializer.serialize({"data": "y" * 100}, key="call/2"))
+
+        assert result["blob_ref"].startswith("file://")
+        (path,) = tmp_path.glob("call_2-*.json")
+        assert result["blob_ref"] == "file://" + str(path)
+        assert json.loads(path.read_text(encoding="utf-8")) == {"data": "y" * 100}
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+    def test_local_disk_blob_store_does_not_overwrite_same_key(self, tmp_path):
+        store = LocalDiskBlobStore(str(tmp_path))
+
+        first = store.put("call-1", ['"a"'])
+        second = store.put("call-1", ['"b"'])
+
+        assert first != second
+        assert len(list(tmp_path.glob("call-1-*.json"))) == 2
+
+    def test_local_disk_blob_store_default_directory_is_private(self):
+        store = LocalDiskBlobStore()
+
+        reference = store.put("call-1", ["{}"])
+
+        assert reference.startswith("file://" + store.directory)
+        assert stat.S_IMODE(os.stat(store.directory).st_mode) == 0o700
+        assert LocalDiskBlobStore().directory is None
+
+    @pytest.mark.asyncio
+    async def test_aserialize_offloads_in_worker_thread(self):
+        threads = []
+
+        class ThreadRecordingBlobStore(RecordingBlobStore):
+            def put(self, key, chunks):
+                threads.append(threading.current_thread())
+                return super().put(key, chunks)
+
+        store = ThreadRecordingBlobStore()
+        serializer = ToolResponseSerializer(
+            ToolResponseConfig(max_chars=100, offload_oversized=True, blob_store=store)
+        )
+        payload = {"rows": ["x" * 50] * 100}
+
+        result = json.loads(await serializer.aserialize(payload, key="call-1"))
+
+        assert result == json.loads(serializer.serialize(payload, key="call-1"))
+        assert json.loads(store.blobs["call-1"]) == payload
+        assert threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_aserialize_small_payload_matches_serialize(self, serializer):
+        payload = {"rows": [Row("a", 1.0)], "doc": Document(title="t")}
+
+        assert await serializer.aserialize(payload) == serializer.serialize(payload)
+
+    def test_strategy_cache_is_bounded(self, serializer, monkeypatch):
+        monkeypatch.setattr(tool_response, "_MAX_CACHED_TYPES", 4)
+        monkeypatch.setattr(tool_response, "_strategy_cache", {})
+
+        for index in range(10):
+            point_type = namedtuple(f"Point{index}", ["x"])
+            assert json.loads(serializer.serialize(point_type(index))) == {"x": index}
+
+        assert len(tool_response._strategy_cache) <= 4
+
+
+class TestTranslatorToolResponseConfig:
+    """Tests for tool response limits applied by EventTranslator."""
+
+    @pytest.mark.asyncio
+    async def test_translator_applies_tool_response_config(self):
+        translator = EventTranslator(
+            tool_response_config=ToolResponseConfig(max_collection_items=1)
+        )
+        function_response = SimpleNamespace(id="tool-1", response={"rows": [1, 2, 3]})
+
+        events = []
+        async for event in translator._translate_function_response([function_response]):
+            events.append(event)
+
+        assert len(events) == 1
+        assert isinstance(events[0], ToolCallResultEvent)
+        assert json.loads(events[0].content) == {
+            "rows": [1, "... [2 more items truncated]"]
+        }
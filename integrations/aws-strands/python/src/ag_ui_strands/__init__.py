@@ -4,8 +4,17 @@ AWS Strands Integration for AG-UI.
 Simple adapter following the Agno pattern.
 """
 from .agent import StrandsAgent
+from .agent_cache import (
+    AgentCache,
+    AgentCacheStats,
+    HibernationStore,
+    InMemoryHibernationStore,
+    LocalFileHibernationStore,
+)
 from .utils import create_strands_app
 from .endpoint import add_strands_fastapi_endpoint, add_ping
+from .concurrency import RunLimiter, RunLimiterStats, RunRejectedError
+from .tracing import InMemoryTraceSink, LoggingTraceSink, RunSpan, TraceSink
 from .config import (
     StrandsAgentConfig,
     ToolBehavior,
@@ -24,5 +33,17 @@ __all__ = [
     "ToolCallContext",
     "ToolResultContext",
     "PredictStateMapping",
+    "AgentCache",
+    "AgentCacheStats",
+    "HibernationStore",
+    "InMemoryHibernationStore",
+    "LocalFileHibernationStore",
+    "RunLimiter",
+    "RunLimiterStats",
+    "RunRejectedError",
+    "TraceSink",
+    "LoggingTraceSink",
+    "InMemoryTraceSink",
+    "RunSpan",
 ]
 
@@ -6,7 +6,7 @@ Simple adapter following the Agno pattern.
 import json
 import logging
 import uuid
-from typing import Any, AsyncIterator, Dict, List
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from strands import Agent as StrandsAgentCore
 
@@ -20,6 +20,7 @@ from ag_ui.core import (
     RunErrorEvent,
     RunFinishedEvent,
     RunStartedEvent,
+    StateDeltaEvent,
     StateSnapshotEvent,
     TextMessageContentEvent,
     TextMessageEndEvent,
@@ -32,13 +33,22 @@ from ag_ui.core import (
     ToolMessage,
 )
 
+from .agent_cache import AgentCache, AgentCacheStats
+from .concurrency import RunLimiter, RunRejectedError
 from .config import (
     StrandsAgentConfig,
     ToolCallContext,
     ToolResultContext,
     maybe_await,
-    normalize_predict_state,
 )
+from .messages import (
+    agui_messages_to_strands,
+    ends_with_tool_result,
+    latest_prompt_index,
+)
+from .tool_calls import ToolCallRegistry, ToolInfo
+from .tool_results import tool_result_from_content
+from .tracing import RunSpan, TraceSink
 
 
 class StrandsAgent:
@@ -50,6 +60,9 @@ class StrandsAgent:
         name: str,
         description: str = "",
         config: "StrandsAgentConfig | None" = None,
+        agent_cache: "AgentCache | None" = None,
+        trace_sink: "TraceSink | None" = None,
+        run_limiter: "RunLimiter | None" = None,
     ):
         # Store template agent configuration for creating fresh instances
         self._model = agent.model
@@ -69,8 +82,119 @@ class StrandsAgent:
         self.description = description
         self.config = config or StrandsAgentConfig()
 
-        # Dictionary to store agent instances per thread
-        self._agents_by_thread: Dict[str, StrandsAgentCore] = {}
+        # Agent instances per thread; unbounded unless a configured cache is passed
+        self._agent_cache = agent_cache or AgentCache()
+        self._trace_sink = trace_sink or TraceSink()
+        # One run per thread at a time; no global limit unless configured
+        self._run_limiter = run_limiter or RunLimiter()
+
+    @property
+    def agent_cache(self) -> AgentCache:
+        return self._agent_cache
+
+    @property
+    def cache_stats(self) -> AgentCacheStats:
+        return self._agent_cache.stats
+
+    @property
+    def run_limiter(self) -> RunLimiter:
+        return self._run_limiter
+
+    def _create_agent(
+        self, messages: Optional[List[Dict[str, Any]]] = None
+    ) -> StrandsAgentCore:
+        kwargs = dict(self._agent_kwargs)
+        if messages is not None:
+            # Rehydrating a hibernated thread
+            kwargs["messages"] = messages
+        return StrandsAgentCore(
+            model=self._model,
+            system_prompt=self._system_prompt,
+            tools=self._tools,
+            **kwargs,
+        )
+
+    async def _acquire_run(self, thread_id: str) -> Tuple[StrandsAgentCore, float]:
+        """Wait for the thread's turn and lease its agent; returns the seconds waited."""
+        queue_wait = await self._run_limiter.acquire(thread_id)
+        try:
+            strands_agent = await self._agent_cache.acquire(
+                thread_id, self._create_agent
+            )
+        except BaseException:
+            self._run_limiter.release(thread_id)
+            raise
+        return strands_agent, queue_wait
+
+    def _release_run(self, thread_id: str) -> None:
+        # Leased agents are never evicted; let this one go
+        self._agent_cache.release(thread_id)
+        self._run_limiter.release(thread_id)
+
+    def _record_span(self, span: RunSpan) -> None:
+        try:
+            self._trace_sink.record_run(span)
+        except Exception as e:
+            logger.warning("Trace sink failed: %s", e)
+
+    def _seed_history(
+        self,
+        strands_agent: StrandsAgentCore,
+        input_data: RunAgentInput,
+        prompt_index: Optional[int],
+        prompt_text: Any,
+    ) -> Tuple[int, bool]:
+        """Give an agent without history the conversation preceding the prompt.
+
+        Happens when the thread's agent is created in a new process or was
+        evicted without hibernation; agents that already have messages are left
+        alone, so hot threads never convert history. Returns the number of
+        messages seeded and whether the prompt is one of them.
+
+        A user prompt is added as a user message by Strands itself, so the
+        history stops before it. A tool result prompt has to answer the
+        `toolUse` of the assistant turn before it, so it is seeded as a
+        `toolResult` (carrying `prompt_text`) and the agent resumes from there.
+        """
+        if strands_agent.messages or not prompt_index:
+            return 0, False
+        messages = input_data.messages
+        prompt = messages[prompt_index]
+        try:
+            history: List[Dict[str, Any]] = []
+            if prompt.role == "tool":
+                history = agui_messages_to_strands(
+                    [
+                        *messages[:prompt_index],
+                        prompt.model_copy(update={"content": prompt_text}),
+                    ]
+                )
+                if not ends_with_tool_result(history, prompt.tool_call_id):
+                    # The call it answers is gone; send it as a plain prompt
+                    history = []
+            prompt_seeded = bool(history)
+            if not prompt_seeded:
+                history = agui_messages_to_strands(
+                    messages[:prompt_index], end_with_assistant=True
+                )
+        except Exception as e:
+            logger.warning(
+                "Could not convert message history for thread %s: %s",
+                input_data.thread_id,
+                e,
+                exc_info=True,
+            )
+            return 0, False
+        strands_agent.messages.extend(history)
+        return len(history), prompt_seeded
+
+    @staticmethod
+    def _predict_state_event(tool: ToolInfo) -> CustomEvent:
+        return CustomEvent(
+            type=EventType.CUSTOM,
+            name="PredictState",
+            value=tool.predict_state,
+        )
 
     async def run(self, input_data: RunAgentInput) -> AsyncIterator[Any]:
         """Run the Strands agent and yield AG-UI events."""
@@ -78,23 +202,30 @@ class StrandsAgent:
         # Get or create agent instance for this thread
         # Each thread (user session) maintains its own conversation state
         thread_id = input_data.thread_id or "default"
-        if thread_id not in self._agents_by_thread:
-            self._agents_by_thread[thread_id] = StrandsAgentCore(
-                model=self._model,
-                system_prompt=self._system_prompt,
-                tools=self._tools,
-                **self._agent_kwargs,
-            )
-        strands_agent = self._agents_by_thread[thread_id]
+        span = RunSpan(thread_id, input_data.run_id)
+        try:
+            strands_agent, span.queue_wait = await self._acquire_run(thread_id)
+        except RunRejectedError as e:
+            span.end(e)
+            self._record_span(span)
+            yield RunErrorEvent(type=EventType.RUN_ERROR, message=str(e), code=e.code)
+            return
 
-        # Start run
-        yield RunStartedEvent(
-            type=EventType.RUN_STARTED,
-            thread_id=input_data.thread_id,
-            run_id=input_data.run_id,
-        )
+        # Checked once per run: per-chunk debug calls are skipped entirely when off
+        debug = logger.isEnabledFor(logging.DEBUG)
 
         try:
+            # Only the newest prompt is sent; the agent keeps its own history.
+            # A fresh agent is first given the history the client already has.
+            prompt_index = latest_prompt_index(input_data.messages)
+
+            # Start run
+            yield RunStartedEvent(
+                type=EventType.RUN_STARTED,
+                thread_id=input_data.thread_id,
+                run_id=input_data.run_id,
+            )
+
             # Emit state snapshot if provided
             if hasattr(input_data, "state") and input_data.state is not None:
                 # Filter out messages from state to avoid "Unknown message role" errors
@@ -125,103 +256,15 @@ class StrandsAgent:
                 if last_msg.role == "tool":
                     has_pending_tool_result = True
                     logger.debug(
-                        f"Has pending tool result detected: tool_call_id={getattr(last_msg, 'tool_call_id', 'unknown')}, thread_id={input_data.thread_id}"
+                        "Has pending tool result detected: tool_call_id=%s, thread_id=%s",
+                        getattr(last_msg, "tool_call_id", "unknown"),
+                        input_data.thread_id,
                     )
 
-            # Convert AG-UI messages to Strands format
-            # Strands expects content as List[ContentBlock] for most messages
-            # OpenAI requires tool messages to follow assistant messages with tool_calls
-            strands_messages = []
-            last_msg_had_tool_calls = False
-            expected_tool_call_ids = set()  # Track which tool_call_ids are valid
-
-            logger.debug(
-                f"Converting {len(input_data.messages)} messages to Strands format, thread_id={input_data.thread_id}"
-            )
-
-            for i, msg in enumerate(input_data.messages):
-                logger.debug(
-                    f"Message {i}: role={msg.role}, has_tool_calls={hasattr(msg, 'tool_calls') and bool(msg.tool_calls)}, tool_call_id={getattr(msg, 'tool_call_id', None)}"
-                )
-                strands_msg: Dict[str, Any] = {"role": msg.role}
-
-                # Handle assistant messages with tool_calls
-                if (
-                    msg.role == "assistant"
-                    and hasattr(msg, "tool_calls")
-                    and msg.tool_calls
-                ):
-                    # Convert tool calls to format expected by Strands/OpenAI
-                    strands_msg["content"] = []
-                    if msg.content:
-                        if isinstance(msg.content, str):
-                            strands_msg["content"].append({"text": msg.content})
-                        elif isinstance(msg.content, list):
-                            strands_msg["content"] = msg.content
-
-                    strands_msg["tool_calls"] = []
-                    expected_tool_call_ids.clear()  # Reset for this assistant message
-                    for tc in msg.tool_calls:
-                        expected_tool_call_ids.add(tc.id)  # Track this tool call ID
-                        strands_msg["tool_calls"].append(
-                            {
-                                "id": tc.id,
-                                "type": "function",
-                                "function": {
-                                    "name": tc.function.get("name")
-                                    if isinstance(tc.function, dict)
-                                    else tc.function.name,
-                                    "arguments": tc.function.get("arguments")
-                                    if isinstance(tc.function, dict)
-                                    else tc.function.arguments,
-                                },
-                            }
-                        )
-                    last_msg_had_tool_calls = True
-                    strands_messages.append(strands_msg)
-
-                # Handle tool messages (must follow assistant message with tool_calls)
-                elif msg.role == "tool":
-                    # Skip tool messages that don't have a preceding assistant message with tool_calls
-                    if (
-                        not last_msg_had_tool_calls
-                        or msg.tool_call_id not in expected_tool_call_ids
-                    ):
-                        logger.debug(
-                            f"Skipping orphaned tool message: tool_call_id={msg.tool_call_id}, last_msg_had_tool_calls={last_msg_had_tool_calls}, valid_ids={expected_tool_call_ids}, thread_id={input_data.thread_id}"
-                        )
-                        continue
-
-                    # Include the tool message for OpenAI format compliance
-                    strands_msg["tool_call_id"] = msg.tool_call_id
-                    if isinstance(msg.content, str):
-                        strands_msg["content"] = [{"text": msg.content}]
-                    else:
-                        strands_msg["content"] = msg.content
-
-                    expected_tool_call_ids.remove(msg.tool_call_id)
-                    if not expected_tool_call_ids:
-                        last_msg_had_tool_calls = False
-                    strands_messages.append(strands_msg)
-
-                # Handle regular messages (user, assistant without tool_calls)
-                else:
-                    if isinstance(msg.content, str):
-                        strands_msg["content"] = [{"text": msg.content}]
-                    elif isinstance(msg.content, list):
-                        strands_msg["content"] = msg.content
-                    else:
-                        strands_msg["content"] = [{"text": ""}]
-                    last_msg_had_tool_calls = False
-                    strands_messages.append(strands_msg)
-
             # Get the latest user message for state context builder
             user_message = "Hello"
-            if input_data.messages:
-                for msg in reversed(input_data.messages):
-                    if (msg.role == "user" or msg.role == "tool") and msg.content:
-                        user_message = msg.content
-                        break
+            if prompt_index is not None:
+                user_message = input_data.messages[prompt_index].content
 
             # Optionally allow configuration to adjust the outgoing user message
             if self.config.state_context_builder:
@@ -229,27 +272,38 @@ class StrandsAgent:
                     user_message = self.config.state_context_builder(
                         input_data, user_message
                     )
-                    # If state_context_builder modifies the message, update the last user message
-                    if strands_messages and strands_messages[-1]["role"] == "user":
-                        strands_messages[-1]["content"] = [{"text": user_message}]
                 except Exception as e:
                     # If the builder fails, keep the original message
-                    logger.warning(f"State context builder failed: {e}", exc_info=True)
+                    logger.warning("State context builder failed: %s", e, exc_info=True)
+
+            seeded_message_count, prompt_seeded = self._seed_history(
+                strands_agent, input_data, prompt_index, user_message
+            )
 
             # Generate unique message ID
             message_id = str(uuid.uuid4())
             message_started = False
-            tool_calls_seen = {}
+            tool_calls = ToolCallRegistry(
+                self.config.tool_behaviors, frontend_tool_names
+            )
             stop_text_streaming = False
             halt_event_stream = False
 
             logger.debug(
-                f"Starting agent run: thread_id={input_data.thread_id}, run_id={input_data.run_id}, has_pending_tool_result={has_pending_tool_result}, message_count={len(input_data.messages)}, strands_message_count={len(strands_messages)}"
+                "Starting agent run: thread_id=%s, run_id=%s, has_pending_tool_result=%s, message_count=%d, seeded_message_count=%d",
+                input_data.thread_id,
+                input_data.run_id,
+                has_pending_tool_result,
+                len(input_data.messages),
+                seeded_message_count,
             )
 
             # Stream from persistent Strands agent with only the new user message
-            # The agent maintains its own conversation history internally
-            agent_stream = strands_agent.stream_async(user_message)
+            # The agent maintains its own conversation history internally.
+            # A seeded prompt is already the last message: resume from it.
+            agent_stream = strands_agent.stream_async(
+                None if prompt_seeded else user_message
+            )
 
             try:
                 async for event in agent_stream:
@@ -257,14 +311,19 @@ class StrandsAgent:
                     if halt_event_stream:
                         continue
 
-                    logger.debug(f"Received event: {event}")
+                    span.chunks += 1
+                    if debug:
+                        logger.debug("Received event: %s", event)
 
                     # Skip lifecycle events
                     if event.get("init_event_loop") or event.get("start_event_loop"):
                         continue
                     if event.get("complete") or event.get("force_stop"):
                         logger.debug(
-                            f"Breaking event stream: received complete or force_stop event (thread_id={input_data.thread_id}, complete={event.get('complete')}, force_stop={event.get('force_stop')})"
+                            "Breaking event stream: received complete or force_stop event (thread_id=%s, complete=%s, force_stop=%s)",
+                            input_data.thread_id,
+                            event.get("complete"),
+                            event.get("force_stop"),
                         )
                         # Generator will end naturally, no need to break
                         break
@@ -283,6 +342,9 @@ class StrandsAgent:
                             message_started = True
 
                         text_chunk = str(event["data"])
+                        span.mark_first_token()
+                        span.text_chunks += 1
+                        span.text_chars += len(text_chunk)
                         yield TextMessageContentEvent(
                             type=EventType.TEXT_MESSAGE_CONTENT,
                             message_id=message_id,
@@ -301,42 +363,27 @@ class StrandsAgent:
 
                             tool_result = item["toolResult"]
                             result_tool_id = tool_result.get("toolUseId")
-                            result_content = tool_result.get("content", [])
-
-                            result_data = None
-                            if result_content and isinstance(result_content, list):
-                                for content_item in result_content:
-                                    if (
-                                        isinstance(content_item, dict)
-                                        and "text" in content_item
-                                    ):
-                                        text_content = content_item["text"]
-                                        try:
-                                            result_data = json.loads(text_content)
-                                        except json.JSONDecodeError:
-                                            try:
-                                                json_text = text_content.replace(
-                                                    "'", '"'
-                                                )
-                                                result_data = json.loads(json_text)
-                                            except Exception:
-                                                result_data = text_content
+                            # Decoded lazily: only result hooks need the value
+                            result = tool_result_from_content(
+                                tool_result.get("content", []),
+                                self.config.max_tool_result_decode_size,
+                            )
 
-                            if not result_tool_id or result_data is None:
+                            if not result_tool_id or result is None:
                                 continue
 
-                            call_info = tool_calls_seen.get(result_tool_id, {})
-                            tool_name = call_info.get("name")
-                            tool_args = call_info.get("args")
-                            tool_input = call_info.get("input")
-                            behavior = (
-                                self.config.tool_behaviors.get(tool_name)
-                                if tool_name
-                                else None
-                            )
+                            call = tool_calls.get(result_tool_id)
+                            tool_name = call.name if call else None
+                            tool_args = call.args if call else None
+                            tool_input = call.input if call else None
+                            behavior = call.tool.behavior if call else None
 
                             logger.debug(
-                                f"Processing tool result: tool_name={tool_name}, result_tool_id={result_tool_id}, has_pending_tool_result={has_pending_tool_result}, thread_id={input_data.thread_id}"
+                                "Processing tool result: tool_name=%s, result_tool_id=%s, has_pending_tool_result=%s, thread_id=%s",
+                                tool_name,
+                                result_tool_id,
+                                has_pending_tool_result,
+                                input_data.thread_id,
                             )
 
                             # Emit ToolCallResultEvent WITHOUT role field to complete the tool in UI
@@ -345,20 +392,24 @@ class StrandsAgent:
                                 type=EventType.TOOL_CALL_RESULT,
                                 tool_call_id=result_tool_id,
                                 message_id=message_id,
-                                content=json.dumps(result_data),
+                                content=result.json(),
                                 # role is intentionally omitted - without role="tool",
                                 # the frontend won't add this to conversation history
                             )
 
-                            result_context = ToolResultContext(
-                                input_data=input_data,
-                                tool_name=tool_name or "",
-                                tool_use_id=result_tool_id,
-                                tool_input=tool_input,
-                                args_str=tool_args or "{}",
-                                result_data=result_data,
-                                message_id=message_id,
-                            )
+                            if behavior and (
+                                behavior.state_from_result
+                                or behavior.custom_result_handler
+                            ):
+                                result_context = ToolResultContext(
+                                    input_data=input_data,
+                                    tool_name=tool_name or "",
+                                    tool_use_id=result_tool_id,
+                                    tool_input=tool_input,
+                                    args_str=tool_args or "{}",
+                                    result_data=result.value(),
+                                    message_id=message_id,
+                                )
 
                             if behavior and behavior.state_from_result:
                                 try:
@@ -372,7 +423,9 @@ class StrandsAgent:
                                         )
                                 except Exception as e:
                                     logger.warning(
-                                        f"state_from_result failed for {tool_name}: {e}",
+                                        "state_from_result failed for %s: %s",
+                                        tool_name,
+                                        e,
                                         exc_info=True,
                                     )
 
@@ -385,7 +438,9 @@ class StrandsAgent:
                                             yield custom_event
                                 except Exception as e:
                                     logger.warning(
-                                        f"custom_result_handler failed for {tool_name}: {e}",
+                                        "custom_result_handler failed for %s: %s",
+                                        tool_name,
+                                        e,
                                         exc_info=True,
                                     )
 
@@ -399,7 +454,9 @@ class StrandsAgent:
                                     message_started = False
                                 halt_event_stream = True
                                 logger.debug(
-                                    f"Breaking event stream: stop_streaming_after_result behavior triggered (thread_id={input_data.thread_id}, tool_name={tool_name})"
+                                    "Breaking event stream: stop_streaming_after_result behavior triggered (thread_id=%s, tool_name=%s)",
+                                    input_data.thread_id,
+                                    tool_name,
                                 )
                                 # Continue consuming events silently to allow proper cleanup
                                 continue
@@ -410,96 +467,97 @@ class StrandsAgent:
                         tool_name = tool_use.get("name")
                         strands_tool_id = tool_use.get("toolUseId")
 
-                        # Generate unique ID for frontend tools (to avoid ID conflicts across requests)
-                        # Use Strands' ID for backend tools (so result lookup works)
-                        is_frontend_tool = tool_name in frontend_tool_names
-
-                        # Check if we've already seen this tool (by Strands' internal ID)
-                        existing_entry = None
-                        for tid, data in tool_calls_seen.items():
-                            if data.get("strands_tool_id") == strands_tool_id:
-                                existing_entry = tid
-                                break
-
-                        if existing_entry:
-                            # Reuse the existing ID
-                            tool_use_id = existing_entry
-                        elif is_frontend_tool:
-                            # Generate new UUID for frontend tools
-                            tool_use_id = str(uuid.uuid4())
-                        else:
-                            # Use Strands' ID for backend tools
-                            tool_use_id = strands_tool_id or str(uuid.uuid4())
+                        if not tool_name:
+                            continue
 
-                        logger.debug(
-                            f"Tool call event received: tool_name={tool_name}, tool_use_id={tool_use_id}, strands_id={strands_tool_id}, is_frontend={is_frontend_tool}, already_seen={tool_use_id in tool_calls_seen}, thread_id={input_data.thread_id}"
-                        )
+                        # Frontend tools get a fresh ID (to avoid ID conflicts across
+                        # requests), backend tools keep Strands' ID (so result lookup works)
+                        call = tool_calls.track(strands_tool_id, tool_name)
+                        tool_use_id = call.tool_use_id
 
-                        # Update tool input as it streams in
-                        tool_input_raw = tool_use.get("input", "")
+                        span.mark_first_token()
+                        if debug:
+                            logger.debug(
+                                "Tool call event received: tool_name=%s, tool_use_id=%s, strands_id=%s, is_frontend=%s, already_started=%s, thread_id=%s",
+                                tool_name,
+                                tool_use_id,
+                                strands_tool_id,
+                                call.tool.is_frontend,
+                                call.started,
+                                input_data.thread_id,
+                            )
 
-                        # Try to parse as JSON if it looks complete
-                        tool_input = {}
-                        if isinstance(tool_input_raw, str) and tool_input_raw:
-                            try:
-                                tool_input = json.loads(tool_input_raw)
-                            except json.JSONDecodeError:
-                                # Input is still streaming, keep as string
-                                tool_input = tool_input_raw
+                        # Strands reports the input accumulated so far; only
+                        # the part added since the previous event is scanned
+                        tool_input_raw = tool_use.get("input", "")
+                        delta = ""
+                        if isinstance(tool_input_raw, str):
+                            delta = call.scanner.feed(tool_input_raw)
+                            call.args = call.scanner.text
                         elif isinstance(tool_input_raw, dict):
-                            tool_input = tool_input_raw
+                            call.input = tool_input_raw
+                            call.args = json.dumps(tool_input_raw)
 
-                        args_str = (
-                            json.dumps(tool_input)
-                            if isinstance(tool_input, dict)
-                            else str(tool_input)
-                        )
+                        if not delta or has_pending_tool_result:
+                            continue
 
-                        # Track or update tool call as input streams in
-                        is_new_tool_call = (
-                            tool_name and tool_use_id not in tool_calls_seen
-                        )
-                        if is_new_tool_call:
-                            tool_calls_seen[tool_use_id] = {
-                                "name": tool_name,
-                                "args": args_str,
-                                "input": tool_input,
-                                "emitted": False,  # Track if we've emitted events
-                                "strands_tool_id": strands_tool_id,
-                            }
-                        elif tool_name and tool_use_id in tool_calls_seen:
-                            # Update the input and args as they stream in
-                            tool_calls_seen[tool_use_id]["input"] = tool_input
-                            tool_calls_seen[tool_use_id]["args"] = args_str
+                        # Stream the arguments as they arrive
+                        if call.tool.streams_args:
+                            if not call.started:
+                                call.started = True
+                                if call.tool.predict_state:
+                                    yield self._predict_state_event(call.tool)
+                                yield ToolCallStartEvent(
+                                    type=EventType.TOOL_CALL_START,
+                                    tool_call_id=tool_use_id,
+                                    tool_call_name=tool_name,
+                                    parent_message_id=message_id,
+                                )
+                            yield ToolCallArgsEvent(
+                                type=EventType.TOOL_CALL_ARGS,
+                                tool_call_id=tool_use_id,
+                                delta=delta,
+                            )
+
+                        # Predicted state follows the mapped argument as it streams
+                        if call.state_extractors:
+                            state_patches = call.state_patches(delta)
+                            if state_patches:
+                                yield StateDeltaEvent(
+                                    type=EventType.STATE_DELTA, delta=state_patches
+                                )
 
                     # Handle content block stop - this signals tool input is complete
                     elif "event" in event and isinstance(event.get("event"), dict):
                         inner_event = event["event"]
                         if "contentBlockStop" in inner_event:
-                            # Find the most recent tool call that hasn't been emitted yet
-                            tool_name = None
-                            tool_input = None
-                            args_str = None
-                            tool_use_id = None
-
-                            for tid, tool_data in tool_calls_seen.items():
-                                if not tool_data.get("emitted", True):
-                                    tool_name = tool_data["name"]
-                                    tool_input = tool_data["input"]
-                                    args_str = tool_data["args"]
-                                    tool_use_id = tid
-                                    break  # Process one tool at a time
+                            # Take the oldest tool call that hasn't been emitted yet
+                            # (one tool at a time)
+                            call = tool_calls.next_unemitted()
 
                             # Only process if we found a tool to emit
-                            if tool_name and tool_use_id:
-                                # Mark as emitted
-                                tool_calls_seen[tool_use_id]["emitted"] = True
+                            if call is not None:
+                                tool_name = call.name
+                                tool_use_id = call.tool_use_id
+                                already_started = call.started
+
+                                # The input is complete now; parse it once
+                                if call.input is None:
+                                    call.input = call.scanner.value() if call.args else {}
+                                tool_input = call.input
+                                args_str = call.args or "{}"
 
-                                is_frontend_tool = tool_name in frontend_tool_names
-                                behavior = self.config.tool_behaviors.get(tool_name)
+                                is_frontend_tool = call.tool.is_frontend
+                                behavior = call.tool.behavior
 
                                 logger.debug(
-                                    f"Processing tool call on contentBlockStop: tool_name={tool_name}, tool_use_id={tool_use_id}, is_frontend_tool={is_frontend_tool}, has_pending_tool_result={has_pending_tool_result}, args_str={args_str}, thread_id={input_data.thread_id}"
+                                    "Processing tool call on contentBlockStop: tool_name=%s, tool_use_id=%s, is_frontend_tool=%s, has_pending_tool_result=%s, args_str=%s, thread_id=%s",
+                                    tool_name,
+                                    tool_use_id,
+                                    is_frontend_tool,
+                                    has_pending_tool_result,
+                                    args_str,
+                                    input_data.thread_id,
                                 )
                                 call_context = ToolCallContext(
                                     input_data=input_data,
@@ -521,40 +579,41 @@ class StrandsAgent:
                                             )
                                     except Exception as e:
                                         logger.warning(
-                                            f"state_from_args failed for {tool_name}: {e}",
+                                            "state_from_args failed for %s: %s",
+                                            tool_name,
+                                            e,
                                             exc_info=True,
                                         )
 
-                                if behavior:
-                                    predict_state_payload = [
-                                        mapping.to_payload()
-                                        for mapping in normalize_predict_state(
-                                            behavior.predict_state
-                                        )
-                                    ]
-                                    if predict_state_payload:
-                                        yield CustomEvent(
-                                            type=EventType.CUSTOM,
-                                            name="PredictState",
-                                            value=predict_state_payload,
-                                        )
+                                if not already_started and call.tool.predict_state:
+                                    yield self._predict_state_event(call.tool)
                                 if has_pending_tool_result:
                                     logger.debug(
-                                        f"Skipping tool call START event due to has_pending_tool_result for {tool_name} (tool_use_id={tool_use_id}, thread_id={input_data.thread_id})"
+                                        "Skipping tool call START event due to has_pending_tool_result for %s (tool_use_id=%s, thread_id=%s)",
+                                        tool_name,
+                                        tool_use_id,
+                                        input_data.thread_id,
                                     )
 
                                 if not has_pending_tool_result:
                                     logger.debug(
-                                        f"Emitting tool call events for {tool_name} (tool_use_id={tool_use_id}, thread_id={input_data.thread_id})"
-                                    )
-                                    yield ToolCallStartEvent(
-                                        type=EventType.TOOL_CALL_START,
-                                        tool_call_id=tool_use_id,
-                                        tool_call_name=tool_name,
-                                        parent_message_id=message_id,
+                                        "Emitting tool call events for %s (tool_use_id=%s, thread_id=%s)",
+                                        tool_name,
+                                        tool_use_id,
+                                        input_data.thread_id,
                                     )
+                                    if not already_started:
+                                        yield ToolCallStartEvent(
+                                            type=EventType.TOOL_CALL_START,
+                                            tool_call_id=tool_use_id,
+                                            tool_call_name=tool_name,
+                                            parent_message_id=message_id,
+                                        )
 
-                                    if behavior and behavior.args_streamer:
+                                    if already_started:
+                                        # Arguments were streamed as they arrived
+                                        pass
+                                    elif behavior and behavior.args_streamer:
                                         try:
                                             async for chunk in behavior.args_streamer(
                                                 call_context
@@ -568,7 +627,9 @@ class StrandsAgent:
                                                 )
                                         except Exception as e:
                                             logger.warning(
-                                                f"args_streamer failed for {tool_name}, falling back to full args: {e}"
+                                                "args_streamer failed for %s, falling back to full args: %s",
+                                                tool_name,
+                                                e,
                                             )
                                             yield ToolCallArgsEvent(
                                                 type=EventType.TOOL_CALL_ARGS,
@@ -592,7 +653,12 @@ class StrandsAgent:
                                         and behavior.continue_after_frontend_call
                                     ):
                                         logger.debug(
-                                            f"Breaking event stream: frontend tool call completed (thread_id={input_data.thread_id}, tool_name={tool_name}, tool_call_id={tool_use_id}, has_behavior={behavior is not None}, continue_after_frontend_call={behavior.continue_after_frontend_call if behavior else None})"
+                                            "Breaking event stream: frontend tool call completed (thread_id=%s, tool_name=%s, tool_call_id=%s, has_behavior=%s, continue_after_frontend_call=%s)",
+                                            input_data.thread_id,
+                                            tool_name,
+                                            tool_use_id,
+                                            behavior is not None,
+                                            behavior.continue_after_frontend_call if behavior else None,
                                         )
                                         halt_event_stream = True
                                         # Continue consuming events silently to allow proper cleanup
@@ -633,7 +699,8 @@ class StrandsAgent:
                         pass
                 except Exception as e:
                     # Log other errors but don't fail
-                    logger.warning(f"Error closing agent stream: {e}")
+                    logger.warning("Error closing agent stream: %s", e)
+                span.tool_calls = len(tool_calls)
 
             # End message if started
             if message_started:
@@ -652,6 +719,11 @@ class StrandsAgent:
             import traceback
 
             traceback.print_exc()
+            span.error = e
             yield RunErrorEvent(
                 type=EventType.RUN_ERROR, message=str(e), code="STRANDS_ERROR"
             )
+        finally:
+            self._release_run(thread_id)
+            span.end()
+            self._record_span(span)
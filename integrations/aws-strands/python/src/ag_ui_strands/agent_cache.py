@@ -0,0 +1,319 @@
+"""Bounded per-thread cache of Strands agent instances."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+HibernatedMessages = List[Dict[str, Any]]
+AgentFactory = Callable[[Optional[HibernatedMessages]], Any]
+
+
+class HibernationStore(ABC):
+    """Keeps the conversation of evicted agents until their thread comes back.
+
+    `load` consumes the saved conversation: a thread is rehydrated at most once
+    from what it saved.
+    """
+
+    @abstractmethod
+    async def save(self, thread_id: str, messages: HibernatedMessages) -> None:
+        """Save the conversation of an evicted agent."""
+
+    @abstractmethod
+    async def load(self, thread_id: str) -> Optional[HibernatedMessages]:
+        """Return and forget the saved conversation, or None if there is none."""
+
+    @abstractmethod
+    async def delete(self, thread_id: str) -> None:
+        """Forget the saved conversation, if any."""
+
+
+class InMemoryHibernationStore(HibernationStore):
+    """Hibernation store backed by a dict; lost when the process exits."""
+
+    def __init__(self):
+        self._messages: Dict[str, HibernatedMessages] = {}
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    async def save(self, thread_id: str, messages: HibernatedMessages) -> None:
+        self._messages[thread_id] = messages
+
+    async def load(self, thread_id: str) -> Optional[HibernatedMessages]:
+        return self._messages.pop(thread_id, None)
+
+    async def delete(self, thread_id: str) -> None:
+        self._messages.pop(thread_id, None)
+
+
+def _encode_json_value(value: Any) -> Any:
+    # Image and document content blocks carry raw bytes
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(value).decode("ascii")}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _decode_json_object(value: Dict[str, Any]) -> Any:
+    if len(value) == 1 and "__bytes__" in value:
+        return base64.b64decode(value["__bytes__"])
+    return value
+
+
+class LocalFileHibernationStore(HibernationStore):
+    """Hibernation store writing one JSON file per thread to a local directory."""
+
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, thread_id: str) -> Path:
+        # Thread IDs come from clients; never use them as file names directly
+        digest = hashlib.sha256(thread_id.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def _write(self, path: Path, messages: HibernatedMessages) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(messages, f, default=_encode_json_value)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _read(self, path: Path) -> Optional[HibernatedMessages]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                messages = json.load(f, object_hook=_decode_json_object)
+        except FileNotFoundError:
+            return None
+        path.unlink(missing_ok=True)
+        return messages
+
+    async def save(self, thread_id: str, messages: HibernatedMessages) -> None:
+        await asyncio.to_thread(self._write, self._path(thread_id), messages)
+
+    async def load(self, thread_id: str) -> Optional[HibernatedMessages]:
+        return await asyncio.to_thread(self._read, self._path(thread_id))
+
+    async def delete(self, thread_id: str) -> None:
+        await asyncio.to_thread(self._path(thread_id).unlink, missing_ok=True)
+
+
+@dataclass
+class AgentCacheStats:
+    """Counters describing how well the agent cache is doing."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    hibernations: int = 0
+    rehydrations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class _CacheEntry:
+    __slots__ = ("agent", "last_used", "leases")
+
+    def __init__(self, agent: Any, now: float):
+        self.agent = agent
+        self.last_used = now
+        self.leases = 0
+
+
+class AgentCache:
+    """LRU cache of Strands agents keyed by thread ID.
+
+    At most `max_size` agents are kept, and agents idle for longer than
+    `idle_timeout` seconds are dropped on the next access. Agents leased to a
+    running request are never evicted, so the cache can briefly exceed
+    `max_size` when every agent is busy. When a `hibernation_store` is given,
+    an evicted agent's messages are saved there and used to rebuild the agent
+    the next time its thread is requested. Both limits default to None, which
+    keeps every agent for the lifetime of the process.
+    """
+
+    def __init__(
+        self,
+        max_size: Optional[int] = None,
+        idle_timeout: Optional[float] = None,
+        hibernation_store: Optional[HibernationStore] = None,
+    ):
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.hibernation_store = hibernation_store
+        self.stats = AgentCacheStats()
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        # Messages of evicted agents whose save has not completed yet
+        self._hibernating: Dict[str, HibernatedMessages] = {}
+        # Per-thread locks serializing hibernation store accesses, with the
+        # number of tasks using each
+        self._store_locks: Dict[str, Tuple[asyncio.Lock, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, thread_id: str) -> bool:
+        return thread_id in self._entries
+
+    async def acquire(self, thread_id: str, factory: AgentFactory) -> Any:
+        """Return the agent for `thread_id`, creating or rehydrating it if needed.
+
+        `factory` is called with the hibernated messages, or None for a fresh
+        agent. Every call must be paired with `release`.
+        """
+        now = time.monotonic()
+        victims = self._take_victims(now, keep=thread_id)
+
+        entry = self._entries.get(thread_id)
+        if entry is not None:
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+            messages = await self._take_hibernated(thread_id)
+            # Another request for this thread may have created it meanwhile
+            entry = self._entries.get(thread_id)
+            if entry is None:
+                entry = _CacheEntry(factory(messages), now)
+                self._entries[thread_id] = entry
+                if messages is not None:
+                    self.stats.rehydrations += 1
+
+        entry.leases += 1
+        entry.last_used = now
+        self._entries.move_to_end(thread_id)
+        victims.extend(self._take_victims(now))
+
+        for victim_id, victim in victims:
+            await self._hibernate(victim_id, victim)
+        return entry.agent
+
+    def release(self, thread_id: str) -> None:
+        """Return an agent obtained from `acquire`."""
+        entry = self._entries.get(thread_id)
+        if entry is None:
+            return
+        entry.leases = max(entry.leases - 1, 0)
+        entry.last_used = time.monotonic()
+        self._entries.move_to_end(thread_id)
+
+    async def expire_idle(self) -> int:
+        """Drop agents idle for longer than `idle_timeout`; returns how many."""
+        victims = self._take_victims(time.monotonic())
+        for victim_id, victim in victims:
+            await self._hibernate(victim_id, victim)
+        return len(victims)
+
+    def _take_victims(
+        self, now: float, keep: Optional[str] = None
+    ) -> List[Tuple[str, _CacheEntry]]:
+        # Runs without awaiting so the entries can't change underneath it
+        victims: List[Tuple[str, _CacheEntry]] = []
+
+        if self.idle_timeout is not None:
+            # Entries are ordered by last use, so stop at the first fresh one
+            for thread_id, entry in list(self._entries.items()):
+                if now - entry.last_used < self.idle_timeout:
+                    break
+                if entry.leases or thread_id == keep:
+                    continue
+                del self._entries[thread_id]
+                self.stats.expirations += 1
+                victims.append((thread_id, entry))
+
+        if self.max_size is not None and len(self._entries) > self.max_size:
+            for thread_id, entry in list(self._entries.items()):
+                if len(self._entries) <= self.max_size:
+                    break
+                if entry.leases or thread_id == keep:
+                    continue
+                del self._entries[thread_id]
+                self.stats.evictions += 1
+                victims.append((thread_id, entry))
+
+        if self.hibernation_store is not None:
+            for thread_id, entry in victims:
+                messages = list(getattr(entry.agent, "messages", None) or [])
+                if messages:
+                    self._hibernating[thread_id] = messages
+        return victims
+
+    async def _hibernate(self, thread_id: str, entry: _CacheEntry) -> None:
+        messages = self._hibernating.get(thread_id)
+        if messages is None:
+            return
+
+        # A thread evicted again while an older save is in flight must not have
+        # its newer save overwritten or deleted by the older one
+        async with self._store_lock(thread_id):
+            if self._hibernating.get(thread_id) is not messages:
+                # Rehydrated before the save started
+                return
+            try:
+                await self.hibernation_store.save(thread_id, messages)
+                self.stats.hibernations += 1
+            except Exception as e:
+                logger.warning("Failed to hibernate agent for thread %s: %s", thread_id, e)
+
+            if self._hibernating.get(thread_id) is messages:
+                del self._hibernating[thread_id]
+                return
+            # Rehydrated while saving; the saved copy is already stale
+            try:
+                await self.hibernation_store.delete(thread_id)
+            except Exception as e:
+                logger.warning("Failed to delete stale hibernated agent for thread %s: %s", thread_id, e)
+
+    async def _take_hibernated(self, thread_id: str) -> Optional[HibernatedMessages]:
+        messages = self._hibernating.pop(thread_id, None)
+        if messages is not None or self.hibernation_store is None:
+            return messages
+        # Concurrent requests for the thread load one at a time, so the one that
+        # gets the saved messages creates the agent before the others check
+        async with self._store_lock(thread_id):
+            if thread_id in self._entries:
+                return None
+            try:
+                return await self.hibernation_store.load(thread_id)
+            except Exception as e:
+                logger.warning("Failed to rehydrate agent for thread %s: %s", thread_id, e)
+                return None
+
+    @asynccontextmanager
+    async def _store_lock(self, thread_id: str) -> AsyncIterator[None]:
+        lock, users = self._store_locks.get(thread_id, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._store_locks[thread_id] = (lock, users + 1)
+        try:
+            async with lock:
+                yield
+        finally:
+            lock, users = self._store_locks[thread_id]
+            if users == 1:
+                del self._store_locks[thread_id]
+            else:
+                self._store_locks[thread_id] = (lock, users - 1)
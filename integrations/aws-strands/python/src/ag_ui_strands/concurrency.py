@@ -0,0 +1,149 @@
+"""Admission control for StrandsAgent runs."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, Literal, Optional
+
+BusyThreadPolicy = Literal["queue", "reject"]
+
+
+class RunRejectedError(Exception):
+    """Raised when a run can't be admitted."""
+
+    def __init__(self, message: str, code: str):
+        super().__init__(message)
+        self.code = code
+
+
+@dataclass
+class RunLimiterStats:
+    """Admission counters; wait times are in seconds."""
+
+    admitted: int = 0
+    queued: int = 0
+    rejected: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.admitted if self.admitted else 0.0
+
+
+class _ThreadGate:
+    __slots__ = ("lock", "users")
+
+    def __init__(self):
+        self.lock = asyncio.Lock()
+        # Runs holding or waiting for the lock
+        self.users = 0
+
+
+class RunLimiter:
+    """Serializes runs per thread and caps the runs in flight.
+
+    A thread's agent holds its conversation, so only one run per thread may
+    stream at a time. Further runs for a busy thread wait their turn
+    (`busy_thread_policy="queue"`) or are refused (`"reject"`). A run takes
+    its thread's lock before a global slot, so each thread occupies at most
+    one place in the global queue and a chatty thread can't crowd out the
+    others. Runs that wait longer than `max_wait` seconds are refused.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_runs: Optional[int] = None,
+        busy_thread_policy: BusyThreadPolicy = "queue",
+        max_wait: Optional[float] = None,
+    ):
+        if busy_thread_policy not in ("queue", "reject"):
+            raise ValueError(f"Unknown busy_thread_policy: {busy_thread_policy!r}")
+        self.max_concurrent_runs = max_concurrent_runs
+        self.busy_thread_policy = busy_thread_policy
+        self.max_wait = max_wait
+        self.stats = RunLimiterStats()
+        self._slots = (
+            asyncio.Semaphore(max_concurrent_runs) if max_concurrent_runs else None
+        )
+        self._gates: Dict[str, _ThreadGate] = {}
+        self._active = 0
+        self._waiting = 0
+
+    @property
+    def active_runs(self) -> int:
+        return self._active
+
+    @property
+    def waiting_runs(self) -> int:
+        return self._waiting
+
+    async def acquire(self, thread_id: str) -> float:
+        """Wait until a run for `thread_id` may start; returns the seconds waited.
+
+        Raises RunRejectedError when the run is refused. Every successful call
+        must be paired with `release`.
+        """
+        started = time.perf_counter()
+        gate = self._gates.get(thread_id)
+        if gate is None:
+            gate = self._gates[thread_id] = _ThreadGate()
+        elif gate.users and self.busy_thread_policy == "reject":
+            self.stats.rejected += 1
+            raise RunRejectedError(
+                f"Thread {thread_id} already has a run in progress", "THREAD_BUSY"
+            )
+
+        contended = gate.lock.locked() or (
+            self._slots is not None and self._slots.locked()
+        )
+        gate.users += 1
+        self._waiting += 1
+        try:
+            async with asyncio.timeout(self.max_wait):
+                await gate.lock.acquire()
+                try:
+                    if self._slots is not None:
+                        await self._slots.acquire()
+                except BaseException:
+                    gate.lock.release()
+                    raise
+        except TimeoutError:
+            self._leave(thread_id, gate)
+            self.stats.rejected += 1
+            raise RunRejectedError(
+                f"Run for thread {thread_id} waited more than {self.max_wait}s to start",
+                "RUN_QUEUE_TIMEOUT",
+            ) from None
+        except BaseException:
+            self._leave(thread_id, gate)
+            raise
+        finally:
+            self._waiting -= 1
+
+        self._active += 1
+        waited = time.perf_counter() - started
+        self.stats.admitted += 1
+        self.stats.total_wait += waited
+        if waited > self.stats.max_wait:
+            self.stats.max_wait = waited
+        if contended:
+            self.stats.queued += 1
+        return waited
+
+    def release(self, thread_id: str) -> None:
+        gate = self._gates.get(thread_id)
+        if gate is None:
+            return
+        self._active -= 1
+        if self._slots is not None:
+            self._slots.release()
+        gate.lock.release()
+        self._leave(thread_id, gate)
+
+    def _leave(self, thread_id: str, gate: _ThreadGate) -> None:
+        gate.users -= 1
+        if not gate.users:
+            del self._gates[thread_id]
@@ -75,6 +75,9 @@ class ToolBehavior:
     state_from_args: Optional[StateFromArgs] = None
     state_from_result: Optional[StateFromResult] = None
     custom_result_handler: Optional[CustomResultHandler] = None
+    # Emit StateDeltaEvent patches for the predict_state mappings while the
+    # tool arguments stream in, instead of leaving prediction to the client
+    stream_state_deltas: bool = False
 
 
 @dataclass
@@ -83,6 +86,9 @@ class StrandsAgentConfig:
 
     tool_behaviors: Dict[str, ToolBehavior] = field(default_factory=dict)
     state_context_builder: Optional[StateContextBuilder] = None
+    # Tool results longer than this (in characters) are handed to result hooks
+    # as raw text instead of being decoded; None decodes everything.
+    max_tool_result_decode_size: Optional[int] = None
 
 
 async def maybe_await(value: Any) -> Any:
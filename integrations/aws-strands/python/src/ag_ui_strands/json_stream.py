@@ -0,0 +1,384 @@
+"""Incremental scanning of JSON documents that arrive in pieces."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, List, Optional, Tuple
+
+_STRING_SPECIAL = re.compile(r'["\\]')
+_STRUCTURAL = re.compile(r'["{}\[\]]')
+_PUNCTUATION = re.compile(r'["{}\[\],:]')
+_SCALAR_END = re.compile(r'[,}\]\s]')
+_WHITESPACE = " \t\r\n"
+_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+_UNSET = object()
+
+# PartialJsonMemberExtractor phases
+_SEEK, _VALUE, _STRING, _CONTAINER, _SCALAR, _DONE = range(6)
+
+# (op, path below the member, value)
+MemberUpdate = Tuple[str, str, Any]
+
+
+class IncrementalJsonScanner:
+    """Follows a streamed JSON document without re-parsing it.
+
+    Strands reports tool input as the text accumulated so far. `feed` only
+    scans the characters added since the previous call, keeping track of
+    string/escape state and container depth, so `complete` flips as soon as
+    the top-level object, array or string is closed. The document is parsed
+    at most once, by `value`.
+    """
+
+    __slots__ = ("text", "complete", "_depth", "_in_string", "_escape", "_value")
+
+    def __init__(self):
+        self.text = ""
+        self.complete = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._value: Any = _UNSET
+
+    def feed(self, text: str) -> str:
+        """Consume the accumulated `text` and return the part not seen before."""
+        seen = len(self.text)
+        if len(text) < seen or (seen and text[seen - 1] != self.text[-1]):
+            # Not a continuation of what we have; start over
+            self.__init__()
+            seen = 0
+        suffix = text[seen:]
+        if suffix:
+            self.text = text
+            self._value = _UNSET
+            if not self.complete:
+                self._scan(suffix)
+        return suffix
+
+    def value(self) -> Any:
+        """The parsed document, or the raw text if it doesn't parse."""
+        if self._value is _UNSET:
+            try:
+                self._value = json.loads(self.text)
+            except ValueError:
+                self._value = self.text
+        return self._value
+
+    def _scan(self, chunk: str) -> None:
+        i = 0
+        end = len(chunk)
+        while i < end:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    i += 1
+                    continue
+                match = _STRING_SPECIAL.search(chunk, i)
+                if match is None:
+                    return
+                i = match.end()
+                if match.group() == "\\":
+                    self._escape = True
+                    continue
+                self._in_string = False
+                if self._depth == 0:
+                    self.complete = True
+                    return
+            else:
+                match = _STRUCTURAL.search(chunk, i)
+                if match is None:
+                    return
+                i = match.end()
+                char = match.group()
+                if char == '"':
+                    self._in_string = True
+                elif char in "{[":
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth <= 0:
+                        self.complete = True
+                        return
+
+
+def escape_json_pointer(token: str) -> str:
+    """Escape one JSON Pointer reference token."""
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+class PartialJsonMemberExtractor:
+    """Follows one top-level member of a streamed JSON object.
+
+    Chunks go to `feed`, which returns JSON Patch style updates for the
+    member's value as it arrives, relative to the member itself:
+    `("add", "", initial)` once the value starts, then for a string
+    `("replace", "", text_so_far)` whenever it has grown by an eighth since
+    the previous update (so the text resent stays linear in its length) and
+    once it is complete, for an array
+    `("add", "/-", element)` per completed element, for an object
+    `("add", "/<key>", value)` per completed member, and for a scalar a single
+    `("add", "", value)`. Each character is looked at once and only completed
+    elements are parsed.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self._phase = _SEEK
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+        self._key_parts: Optional[List[str]] = None
+        self._current_key: Optional[str] = None
+        # Target value state
+        self._string_parts: List[str] = []
+        self._string_length = 0
+        self._sent_length = 0
+        self._carry = ""
+        self._container = ""
+        self._value_depth = 0
+        self._parts: List[str] = []
+        self._updates: List[MemberUpdate] = []
+
+    @property
+    def done(self) -> bool:
+        return self._phase == _DONE
+
+    def feed(self, chunk: str) -> List[MemberUpdate]:
+        i = 0
+        end = len(chunk)
+        while i < end and self._phase != _DONE:
+            if self._phase == _SEEK:
+                i = self._seek(chunk, i)
+            elif self._phase == _VALUE:
+                i = self._value_start(chunk, i)
+            elif self._phase == _STRING:
+                i = self._string_value(chunk, i)
+            elif self._phase == _CONTAINER:
+                i = self._container_value(chunk, i)
+            else:
+                i = self._scalar_value(chunk, i)
+        updates, self._updates = self._updates, []
+        return updates
+
+    def _seek(self, chunk: str, i: int) -> int:
+        end = len(chunk)
+        while i < end:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    if self._key_parts is not None:
+                        self._key_parts.append(chunk[i])
+                    i += 1
+                    continue
+                match = _STRING_SPECIAL.search(chunk, i)
+                stop = end if match is None else match.start()
+                if self._key_parts is not None:
+                    self._key_parts.append(chunk[i:stop])
+                if match is None:
+                    return end
+                i = match.end()
+                if match.group() == "\\":
+                    self._escape = True
+                    if self._key_parts is not None:
+                        self._key_parts.append("\\")
+                    continue
+                self._in_string = False
+                if self._key_parts is not None:
+                    self._current_key = json.loads('"' + "".join(self._key_parts) + '"')
+                    self._key_parts = None
+                continue
+
+            match = _PUNCTUATION.search(chunk, i)
+            if match is None:
+                return end
+            i = match.end()
+            char = match.group()
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1 and self._expect_key:
+                    self._key_parts = []
+                    self._expect_key = False
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    self._expect_key = char == "{"
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth <= 0:
+                    # The object ended without the member
+                    self._phase = _DONE
+                    return end
+            elif self._depth == 1:
+                if char == ":":
+                    if self._current_key == self.key:
+                        self._phase = _VALUE
+                        return i
+                    self._current_key = None
+                else:
+                    self._expect_key = True
+        return end
+
+    def _value_start(self, chunk: str, i: int) -> int:
+        end = len(chunk)
+        while i < end and chunk[i] in _WHITESPACE:
+            i += 1
+        if i == end:
+            return end
+        char = chunk[i]
+        if char == '"':
+            self._phase = _STRING
+            self._updates.append(("add", "", ""))
+            return i + 1
+        if char in "{[":
+            self._phase = _CONTAINER
+            self._container = char
+            self._value_depth = 1
+            self._updates.append(("add", "", {} if char == "{" else []))
+            return i + 1
+        self._phase = _SCALAR
+        return i
+
+    def _string_value(self, chunk: str, i: int) -> int:
+        text = self._carry + chunk[i:]
+        self._carry = ""
+        pieces = []
+        pos = 0
+        end = len(text)
+        finished = False
+        while pos < end:
+            match = _STRING_SPECIAL.search(text, pos)
+            if match is None:
+                pieces.append(text[pos:])
+                pos = end
+                break
+            pieces.append(text[pos:match.start()])
+            pos = match.start()
+            if match.group() == '"':
+                pos += 1
+                finished = True
+                break
+            decoded, consumed = self._decode_escape(text, pos)
+            if consumed == 0:
+                # Escape sequence cut off by the end of the chunk
+                self._carry = text[pos:]
+                pos = end
+                break
+            pieces.append(decoded)
+            pos += consumed
+
+        added = "".join(pieces)
+        if added:
+            self._string_parts.append(added)
+            self._string_length += len(added)
+        unsent = self._string_length - self._sent_length
+        if unsent and (finished or unsent * 8 >= self._sent_length):
+            value = "".join(self._string_parts)
+            self._string_parts = [value]
+            self._sent_length = len(value)
+            self._updates.append(("replace", "", value))
+        if finished:
+            self._phase = _DONE
+        # Positions past the carry map back onto the chunk
+        return len(chunk) - (end - pos)
+
+    @staticmethod
+    def _decode_escape(text: str, pos: int) -> Tuple[str, int]:
+        """Decode the escape at `pos`; consumed is 0 if it is incomplete."""
+        if pos + 1 >= len(text):
+            return "", 0
+        char = text[pos + 1]
+        if char != "u":
+            return _ESCAPES.get(char, char), 2
+        if pos + 6 > len(text):
+            return "", 0
+        try:
+            code = int(text[pos + 2:pos + 6], 16)
+        except ValueError:
+            return text[pos:pos + 6], 6
+        if 0xD800 <= code < 0xDC00:
+            # High surrogate; combine it with the low one that should follow
+            if pos + 12 > len(text):
+                return "", 0
+            if text[pos + 6:pos + 8] == "\\u":
+                try:
+                    low = int(text[pos + 8:pos + 12], 16)
+                except ValueError:
+                    low = 0
+                if 0xDC00 <= low < 0xE000:
+                    return chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)), 12
+        return chr(code), 6
+
+    def _container_value(self, chunk: str, i: int) -> int:
+        end = len(chunk)
+        start = i
+        while i < end:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    i += 1
+                    continue
+                match = _STRING_SPECIAL.search(chunk, i)
+                if match is None:
+                    i = end
+                    break
+                i = match.end()
+                if match.group() == "\\":
+                    self._escape = True
+                else:
+                    self._in_string = False
+                continue
+
+            match = _PUNCTUATION.search(chunk, i)
+            if match is None:
+                i = end
+                break
+            i = match.end()
+            char = match.group()
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._value_depth += 1
+            elif char in "}]" or (char == "," and self._value_depth == 1):
+                if char != ",":
+                    self._value_depth -= 1
+                if self._value_depth == 0 or char == ",":
+                    self._parts.append(chunk[start:i - 1])
+                    start = i
+                    self._complete_element()
+                    if self._value_depth == 0:
+                        self._phase = _DONE
+                        return end
+        self._parts.append(chunk[start:i])
+        return i
+
+    def _complete_element(self) -> None:
+        raw = "".join(self._parts).strip()
+        self._parts = []
+        if not raw:
+            return
+        try:
+            if self._container == "[":
+                self._updates.append(("add", "/-", json.loads(raw)))
+            else:
+                for key, value in json.loads("{" + raw + "}").items():
+                    self._updates.append(("add", "/" + escape_json_pointer(key), value))
+        except ValueError:
+            # Malformed element; the final arguments are still parsed as a whole
+            pass
+
+    def _scalar_value(self, chunk: str, i: int) -> int:
+        match = _SCALAR_END.search(chunk, i)
+        if match is None:
+            self._parts.append(chunk[i:])
+            return len(chunk)
+        self._parts.append(chunk[i:match.start()])
+        raw = "".join(self._parts)
+        self._parts = []
+        self._phase = _DONE
+        try:
+            self._updates.append(("add", "", json.loads(raw)))
+        except ValueError:
+            pass
+        return len(chunk)
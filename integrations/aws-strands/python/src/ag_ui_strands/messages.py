@@ -0,0 +1,116 @@
+"""Conversion of AG-UI message history into Strands messages."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional, Sequence
+
+
+def latest_prompt_index(messages: Sequence[Any]) -> Optional[int]:
+    """Index of the message sent to Strands as this turn's prompt.
+
+    That is the newest user or tool message with content. The search starts
+    from the end, so it only looks at what was added since the last turn.
+    """
+    for index in range(len(messages) - 1, -1, -1):
+        msg = messages[index]
+        if msg.role in ("user", "tool") and msg.content:
+            return index
+    return None
+
+
+def _text_blocks(content: Any) -> List[Dict[str, Any]]:
+    if isinstance(content, str):
+        return [{"text": content}] if content else []
+    blocks = []
+    for part in content or []:
+        text = part.get("text") if isinstance(part, dict) else getattr(part, "text", None)
+        if text:
+            blocks.append({"text": text})
+    return blocks
+
+
+def _tool_use_block(tool_call: Any) -> Dict[str, Any]:
+    function = tool_call.function
+    if isinstance(function, dict):
+        name, arguments = function.get("name"), function.get("arguments")
+    else:
+        name, arguments = function.name, function.arguments
+    try:
+        tool_input = json.loads(arguments) if arguments else {}
+    except ValueError:
+        tool_input = {}
+    return {"toolUse": {"toolUseId": tool_call.id, "name": name, "input": tool_input}}
+
+
+def ends_with_tool_result(strands_messages: Sequence[Dict[str, Any]], tool_use_id: str) -> bool:
+    """Whether the last message answers `tool_use_id` with a `toolResult`."""
+    if not strands_messages or strands_messages[-1]["role"] != "user":
+        return False
+    return any(
+        block.get("toolResult", {}).get("toolUseId") == tool_use_id
+        for block in strands_messages[-1]["content"]
+    )
+
+
+def agui_messages_to_strands(
+    messages: Sequence[Any], *, end_with_assistant: bool = False
+) -> List[Dict[str, Any]]:
+    """Convert AG-UI history into Strands' content-block messages.
+
+    Tool calls become `toolUse` blocks and tool messages `toolResult` blocks of
+    the following user message. Calls without a result and results without a
+    call are dropped, as are system messages (the agent has its own prompt):
+    model providers reject unpaired tool blocks. Consecutive messages of the
+    same role are merged so roles alternate, starting with the user. With
+    `end_with_assistant`, trailing user turns are dropped along with the tool
+    calls they answered, so a new user prompt can follow.
+    """
+    answered = {msg.tool_call_id for msg in messages if msg.role == "tool"}
+    announced = set()
+    strands_messages: List[Dict[str, Any]] = []
+
+    for msg in messages:
+        if msg.role == "assistant":
+            role = "assistant"
+            content = _text_blocks(msg.content)
+            for tool_call in getattr(msg, "tool_calls", None) or []:
+                if tool_call.id in answered:
+                    announced.add(tool_call.id)
+                    content.append(_tool_use_block(tool_call))
+        elif msg.role == "tool":
+            if msg.tool_call_id not in announced:
+                continue
+            role = "user"
+            content = [
+                {
+                    "toolResult": {
+                        "toolUseId": msg.tool_call_id,
+                        "status": "success",
+                        "content": [{"text": msg.content or ""}],
+                    }
+                }
+            ]
+        elif msg.role == "user":
+            role = "user"
+            content = _text_blocks(msg.content)
+        else:
+            continue
+
+        if not content or (not strands_messages and role != "user"):
+            continue
+        if strands_messages and strands_messages[-1]["role"] == role:
+            strands_messages[-1]["content"].extend(content)
+        else:
+            strands_messages.append({"role": role, "content": content})
+
+    if end_with_assistant:
+        while strands_messages and strands_messages[-1]["role"] == "user":
+            strands_messages.pop()
+            if strands_messages:
+                last = strands_messages[-1]
+                last["content"] = [block for block in last["content"] if "toolUse" not in block]
+                if not last["content"]:
+                    strands_messages.pop()
+
+    return strands_messages
@@ -0,0 +1,157 @@
+"""Per-run bookkeeping for the tool calls seen in a Strands stream."""
+
+from __future__ import annotations
+
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .config import PredictStateMapping, ToolBehavior, normalize_predict_state
+from .json_stream import (
+    IncrementalJsonScanner,
+    PartialJsonMemberExtractor,
+    escape_json_pointer,
+)
+
+
+class ToolInfo:
+    """Everything the event loop needs to know about a tool name, resolved once."""
+
+    __slots__ = ("name", "behavior", "is_frontend", "predict_state", "state_mappings")
+
+    def __init__(self, name: str, behavior: Optional[ToolBehavior], is_frontend: bool):
+        self.name = name
+        self.behavior = behavior
+        self.is_frontend = is_frontend
+        mappings = normalize_predict_state(behavior.predict_state) if behavior else []
+        self.predict_state: List[Dict[str, str]] = [
+            mapping.to_payload() for mapping in mappings
+        ]
+        # Mappings whose state is streamed as StateDeltaEvent patches
+        self.state_mappings: List[PredictStateMapping] = (
+            [mapping for mapping in mappings if mapping.tool == name]
+            if behavior and behavior.stream_state_deltas
+            else []
+        )
+
+    @property
+    def streams_args(self) -> bool:
+        """Whether raw argument chunks can be forwarded as they arrive."""
+        return not (self.behavior and self.behavior.args_streamer)
+
+
+class ToolCall:
+    """A tool call being streamed by Strands."""
+
+    __slots__ = (
+        "tool_use_id",
+        "strands_tool_id",
+        "tool",
+        "scanner",
+        "input",
+        "args",
+        "started",
+        "emitted",
+        "state_extractors",
+    )
+
+    def __init__(self, tool_use_id: str, strands_tool_id: Optional[str], tool: ToolInfo):
+        self.tool_use_id = tool_use_id
+        self.strands_tool_id = strands_tool_id
+        self.tool = tool
+        self.scanner = IncrementalJsonScanner()
+        self.input: Any = None
+        self.args = ""
+        # ToolCallStart already sent to the client
+        self.started = False
+        # The call's content block has stopped and was handled
+        self.emitted = False
+        self.state_extractors: List[Tuple[str, PartialJsonMemberExtractor]] = [
+            (
+                "/" + escape_json_pointer(mapping.state_key),
+                PartialJsonMemberExtractor(mapping.tool_argument),
+            )
+            for mapping in tool.state_mappings
+        ]
+
+    @property
+    def name(self) -> str:
+        return self.tool.name
+
+    def state_patches(self, delta: str) -> List[Dict[str, Any]]:
+        """JSON Patch operations for the predicted state touched by `delta`."""
+        return [
+            {"op": op, "path": state_path + path, "value": value}
+            for state_path, extractor in self.state_extractors
+            if not extractor.done
+            for op, path, value in extractor.feed(delta)
+        ]
+
+
+class ToolCallRegistry:
+    """Tool calls of one run, indexed by both AG-UI and Strands IDs.
+
+    Frontend tools get a fresh AG-UI ID so they can't collide across requests;
+    backend tools keep the Strands ID so their results can be matched up.
+    Every lookup made per streamed chunk is a dict access.
+    """
+
+    def __init__(
+        self,
+        tool_behaviors: Dict[str, ToolBehavior],
+        frontend_tool_names: Iterable[str],
+    ):
+        self._tool_behaviors = tool_behaviors
+        self._frontend_tool_names = set(frontend_tool_names)
+        self._tools: Dict[str, ToolInfo] = {}
+        self._calls: Dict[str, ToolCall] = {}
+        self._ids_by_strands_id: Dict[Optional[str], str] = {}
+        # Calls waiting for their contentBlockStop, in arrival order
+        self._unemitted: "OrderedDict[str, ToolCall]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def tool(self, name: str) -> ToolInfo:
+        info = self._tools.get(name)
+        if info is None:
+            info = self._tools[name] = ToolInfo(
+                name,
+                self._tool_behaviors.get(name),
+                name in self._frontend_tool_names,
+            )
+        return info
+
+    def track(self, strands_tool_id: Optional[str], name: str) -> ToolCall:
+        """Return the call for `strands_tool_id`, registering it on first sight."""
+        tool_use_id = self._ids_by_strands_id.get(strands_tool_id)
+        if tool_use_id is not None:
+            return self._calls[tool_use_id]
+
+        tool = self.tool(name)
+        if tool.is_frontend or not strands_tool_id:
+            tool_use_id = str(uuid.uuid4())
+        else:
+            tool_use_id = strands_tool_id
+        call = ToolCall(tool_use_id, strands_tool_id, tool)
+        self._calls[tool_use_id] = call
+        self._ids_by_strands_id[strands_tool_id] = tool_use_id
+        self._unemitted[tool_use_id] = call
+        return call
+
+    def get(self, tool_use_id: str) -> Optional[ToolCall]:
+        """Look a call up by its AG-UI ID or, failing that, its Strands ID."""
+        call = self._calls.get(tool_use_id)
+        if call is None:
+            mapped = self._ids_by_strands_id.get(tool_use_id)
+            if mapped is not None:
+                call = self._calls[mapped]
+        return call
+
+    def next_unemitted(self) -> Optional[ToolCall]:
+        """Take the oldest call whose content block hasn't stopped yet."""
+        if not self._unemitted:
+            return None
+        _, call = self._unemitted.popitem(last=False)
+        call.emitted = True
+        return call
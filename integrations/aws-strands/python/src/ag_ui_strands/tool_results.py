@@ -0,0 +1,105 @@
+"""Decoding of Strands tool results, done only as far as needed."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Optional
+
+# An object opening with a key (or closing), or an array opening with a JSON value.
+# Only a pre-filter: matching text is still validated before being passed through.
+_JSON_CONTAINER_START = re.compile(
+    r'\s*(?:(?P<object>\{)\s*["}]|\[\s*(?:[-"\d{\[\]]|true\b|false\b|null\b))'
+)
+_WHITESPACE = " \t\r\n"
+_UNSET = object()
+
+
+def _looks_like_json_container(text: str) -> bool:
+    match = _JSON_CONTAINER_START.match(text)
+    if match is None:
+        return False
+    end = len(text) - 1
+    while end >= 0 and text[end] in _WHITESPACE:
+        end -= 1
+    closing = "}" if match.group("object") else "]"
+    return end > 0 and text[end] == closing
+
+
+class ToolResult:
+    """The payload of one Strands `toolResult`.
+
+    `json()` gives the text for `ToolCallResultEvent.content`: text that is
+    already a valid JSON object or array is passed through untouched, skipping
+    the re-encode; anything else is decoded and re-encoded as before. `value()`
+    decodes on first use, so the decoded value is only built when a hook asks
+    for it. Texts longer than `max_decode_size` characters are never decoded
+    for hooks; `value()` returns them as-is.
+    """
+
+    __slots__ = ("text", "max_decode_size", "_value", "_json")
+
+    def __init__(self, text: Optional[str] = None, value: Any = _UNSET, max_decode_size: Optional[int] = None):
+        self.text = text
+        self.max_decode_size = max_decode_size
+        self._value = value
+        self._json: Optional[str] = None
+
+    def value(self) -> Any:
+        if self._value is _UNSET:
+            self._value = self._decode(self.text)
+        return self._value
+
+    def json(self) -> str:
+        if self._json is None:
+            if self.text is not None and _looks_like_json_container(self.text):
+                self._json = self._validated_json(self.text)
+            if self._json is None:
+                self._json = json.dumps(self.value())
+        return self._json
+
+    def _validated_json(self, text: str) -> Optional[str]:
+        # Parsing alone is well under half the cost of parsing and re-encoding,
+        # and only valid JSON may be forwarded verbatim
+        try:
+            value = json.loads(text)
+        except ValueError:
+            if self._value is _UNSET:
+                self._value = self._decode(text, try_json=False)
+            return None
+        if self._value is _UNSET and not self._too_large(text):
+            self._value = value
+        return text
+
+    def _too_large(self, text: str) -> bool:
+        return self.max_decode_size is not None and len(text) > self.max_decode_size
+
+    def _decode(self, text: str, try_json: bool = True) -> Any:
+        if self._too_large(text):
+            return text
+        if try_json:
+            try:
+                return json.loads(text)
+            except ValueError:
+                pass
+        if text.lstrip()[:1] in ("{", "["):
+            # Python reprs of dicts and lists
+            try:
+                return json.loads(text.replace("'", '"'))
+            except ValueError:
+                pass
+        return text
+
+
+def tool_result_from_content(content: Any, max_decode_size: Optional[int] = None) -> Optional[ToolResult]:
+    """Pick the payload of a `toolResult` content list (the last text or json item)."""
+    if not content or not isinstance(content, list):
+        return None
+    for item in reversed(content):
+        if not isinstance(item, dict):
+            continue
+        if "text" in item:
+            return ToolResult(text=item["text"], max_decode_size=max_decode_size)
+        if "json" in item:
+            return ToolResult(value=item["json"], max_decode_size=max_decode_size)
+    return None
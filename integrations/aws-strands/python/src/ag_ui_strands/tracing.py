@@ -0,0 +1,131 @@
+"""Lightweight tracing of StrandsAgent runs."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RunSpan:
+    """Counters for one run, updated in place by the streaming loop.
+
+    Plain attribute increments keep the per-chunk cost negligible; nothing is
+    formatted until a sink asks for it.
+    """
+
+    __slots__ = (
+        "thread_id",
+        "run_id",
+        "started_at",
+        "first_token_at",
+        "ended_at",
+        "chunks",
+        "text_chunks",
+        "text_chars",
+        "tool_calls",
+        "queue_wait",
+        "error",
+    )
+
+    def __init__(self, thread_id: str, run_id: str):
+        self.thread_id = thread_id
+        self.run_id = run_id
+        self.started_at = time.perf_counter()
+        self.first_token_at: Optional[float] = None
+        self.ended_at: Optional[float] = None
+        # Strands events received
+        self.chunks = 0
+        self.text_chunks = 0
+        # Characters, not bytes, of streamed text
+        self.text_chars = 0
+        self.tool_calls = 0
+        # Seconds spent waiting for the thread's turn or a global run slot
+        self.queue_wait = 0.0
+        self.error: Optional[BaseException] = None
+
+    def mark_first_token(self) -> None:
+        if self.first_token_at is None:
+            self.first_token_at = time.perf_counter()
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        self.ended_at = time.perf_counter()
+        if error is not None:
+            self.error = error
+
+    @property
+    def time_to_first_token(self) -> Optional[float]:
+        """Seconds from the start of the run to the first text or tool chunk."""
+        if self.first_token_at is None:
+            return None
+        return self.first_token_at - self.started_at
+
+    @property
+    def duration(self) -> Optional[float]:
+        if self.ended_at is None:
+            return None
+        return self.ended_at - self.started_at
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "thread_id": self.thread_id,
+            "run_id": self.run_id,
+            "duration": self.duration,
+            "time_to_first_token": self.time_to_first_token,
+            "chunks": self.chunks,
+            "text_chunks": self.text_chunks,
+            "text_chars": self.text_chars,
+            "tool_calls": self.tool_calls,
+            "queue_wait": self.queue_wait,
+            "error": repr(self.error) if self.error is not None else None,
+        }
+
+
+class TraceSink:
+    """Receives finished run spans.
+
+    Called on the event loop once per run, after its last event; must not
+    block. The default implementation discards the span.
+    """
+
+    def record_run(self, span: RunSpan) -> None:
+        pass
+
+
+class LoggingTraceSink(TraceSink):
+    """Logs one summary line per run."""
+
+    def __init__(self, level: int = logging.INFO, logger_: Optional[logging.Logger] = None):
+        self.level = level
+        self.logger = logger_ or logger
+
+    def record_run(self, span: RunSpan) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+        self.logger.log(
+            self.level,
+            "Strands run finished: thread_id=%s run_id=%s duration=%.3fs "
+            "queue_wait=%.3fs ttft=%s chunks=%d text_chars=%d tool_calls=%d error=%r",
+            span.thread_id,
+            span.run_id,
+            span.duration or 0.0,
+            span.queue_wait,
+            f"{span.time_to_first_token:.3f}s" if span.time_to_first_token is not None else None,
+            span.chunks,
+            span.text_chars,
+            span.tool_calls,
+            span.error,
+        )
+
+
+class InMemoryTraceSink(TraceSink):
+    """Keeps the most recent `max_runs` spans; intended for tests and debugging."""
+
+    def __init__(self, max_runs: int = 1000):
+        self.runs: Deque[RunSpan] = deque(maxlen=max_runs)
+
+    def record_run(self, span: RunSpan) -> None:
+        self.runs.append(span)
@@ -0,0 +1,283 @@
+"""Tests for the per-thread agent cache and its hibernation stores."""
+
+import asyncio
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from ag_ui_strands.agent_cache import (
+    AgentCache,
+    HibernationStore,
+    InMemoryHibernationStore,
+    LocalFileHibernationStore,
+)
+
+
+class FakeAgent(SimpleNamespace):
+    pass
+
+
+def make_factory(created):
+    def factory(messages):
+        agent = FakeAgent(messages=list(messages or []))
+        created.append(agent)
+        return agent
+
+    return factory
+
+
+class BlockingStore(InMemoryHibernationStore):
+    """In-memory store whose n-th save (or load) completes once `saves[n]`
+    (or `loads[n]`) is set, so tests choose the order calls finish in.
+
+    Loads are let through unless a test clears their events first.
+    """
+
+    def __init__(self, calls=4):
+        super().__init__()
+        self.save_started = asyncio.Event()
+        self.saves = [asyncio.Event() for _ in range(calls)]
+        self.loads = [asyncio.Event() for _ in range(calls)]
+        for gate in self.loads:
+            gate.set()
+        self._save_calls = 0
+        self._load_calls = 0
+
+    async def save(self, thread_id, messages):
+        gate = self.saves[self._save_calls]
+        self._save_calls += 1
+        self.save_started.set()
+        await gate.wait()
+        await super().save(thread_id, messages)
+
+    async def load(self, thread_id):
+        gate = self.loads[self._load_calls]
+        self._load_calls += 1
+        messages = await super().load(thread_id)
+        await gate.wait()
+        return messages
+
+
+async def settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestAgentCacheEviction(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.created = []
+        self.factory = make_factory(self.created)
+
+    async def use(self, cache, thread_id):
+        agent = await cache.acquire(thread_id, self.factory)
+        cache.release(thread_id)
+        return agent
+
+    async def test_least_recently_used_agent_is_evicted(self):
+        cache = AgentCache(max_size=2)
+        first = await self.use(cache, "a")
+        await self.use(cache, "b")
+        self.assertIs(await self.use(cache, "a"), first)
+
+        await self.use(cache, "c")
+
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 3))
+
+    async def test_idle_agents_expire(self):
+        clock = Clock()
+        cache = AgentCache(idle_timeout=60)
+        with patch("ag_ui_strands.agent_cache.time.monotonic", clock):
+            await self.use(cache, "a")
+            clock.now += 30
+            await self.use(cache, "b")
+            clock.now += 45
+
+            self.assertEqual(await cache.expire_idle(), 1)
+
+        self.assertNotIn("a", cache)
+        self.assertIn("b", cache)
+        self.assertEqual(cache.stats.expirations, 1)
+
+    async def test_leased_agents_are_not_evicted(self):
+        cache = AgentCache(max_size=1)
+        busy = await cache.acquire("a", self.factory)
+
+        await cache.acquire("b", self.factory)
+
+        # Both are leased, so the cache is allowed to grow past max_size
+        self.assertEqual(len(cache), 2)
+        cache.release("b")
+        await self.use(cache, "c")
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+
+        cache.release("a")
+        await self.use(cache, "d")
+        self.assertNotIn("a", cache)
+        self.assertEqual(busy.messages, [])
+
+    async def test_leased_agents_do_not_expire(self):
+        clock = Clock()
+        cache = AgentCache(idle_timeout=10)
+        with patch("ag_ui_strands.agent_cache.time.monotonic", clock):
+            await cache.acquire("a", self.factory)
+            clock.now += 60
+
+            self.assertEqual(await cache.expire_idle(), 0)
+            cache.release("a")
+            clock.now += 60
+            self.assertEqual(await cache.expire_idle(), 1)
+
+    def test_max_size_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            AgentCache(max_size=0)
+
+
+class TestAgentCacheHibernation(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.created = []
+        self.factory = make_factory(self.created)
+
+    async def test_evicted_agent_is_rehydrated(self):
+        store = InMemoryHibernationStore()
+        cache = AgentCache(max_size=1, hibernation_store=store)
+        agent = await cache.acquire("a", self.factory)
+        agent.messages.append({"role": "user", "content": [{"text": "hi"}]})
+        cache.release("a")
+
+        await cache.acquire("b", self.factory)
+        cache.release("b")
+        self.assertEqual(len(store), 1)
+
+        rehydrated = await cache.acquire("a", self.factory)
+
+        self.assertEqual(rehydrated.messages, [{"role": "user", "content": [{"text": "hi"}]}])
+        # b was evicted in turn, but had no conversation to save
+        self.assertEqual(len(store), 0)
+        self.assertEqual((cache.stats.hibernations, cache.stats.rehydrations), (1, 1))
+
+    async def test_rehydrated_while_saving_discards_the_stale_copy(self):
+        store = BlockingStore()
+        cache = AgentCache(max_size=1, hibernation_store=store)
+        agent = await cache.acquire("a", self.factory)
+        agent.messages.append({"role": "user", "content": [{"text": "first"}]})
+        cache.release("a")
+
+        evicting = asyncio.create_task(cache.acquire("b", self.factory))
+        await store.save_started.wait()
+
+        # The thread comes back before its save completed: it is rebuilt from
+        # the in-memory copy without touching the store
+        rehydrated = await cache.acquire("a", self.factory)
+        self.assertEqual(rehydrated.messages, agent.messages)
+
+        store.saves[0].set()
+        await evicting
+        self.assertIsNone(await store.load("a"))
+
+    async def test_older_save_does_not_clobber_a_newer_one(self):
+        store = BlockingStore()
+        cache = AgentCache(max_size=1, hibernation_store=store)
+        agent = await cache.acquire("a", self.factory)
+        agent.messages.append({"role": "user", "content": [{"text": "first"}]})
+        cache.release("a")
+
+        first_eviction = asyncio.create_task(cache.acquire("b", self.factory))
+        await store.save_started.wait()
+        cache.release("b")
+
+        # Rehydrate "a" from memory, extend the conversation, and evict it again
+        # while its first save is still in flight
+        rehydrated = await cache.acquire("a", self.factory)
+        rehydrated.messages.append({"role": "user", "content": [{"text": "second"}]})
+        cache.release("a")
+        second_eviction = asyncio.create_task(cache.acquire("c", self.factory))
+        await settle()
+
+        # Let the newer save finish first
+        store.saves[1].set()
+        await settle()
+        store.saves[0].set()
+        await asyncio.gather(first_eviction, second_eviction)
+
+        saved = await store.load("a")
+        self.assertEqual([m["content"][0]["text"] for m in saved], ["first", "second"])
+
+    async def test_concurrent_rehydrations_share_the_saved_conversation(self):
+        store = BlockingStore()
+        await InMemoryHibernationStore.save(store, "a", [{"role": "user", "content": [{"text": "saved"}]}])
+        for gate in store.loads:
+            gate.clear()
+        cache = AgentCache(hibernation_store=store)
+
+        first = asyncio.create_task(cache.acquire("a", self.factory))
+        second = asyncio.create_task(cache.acquire("a", self.factory))
+        await settle()
+        # Whichever load was started second finishes first
+        store.loads[1].set()
+        await settle()
+        store.loads[0].set()
+        agents = await asyncio.gather(first, second)
+
+        self.assertIs(agents[0], agents[1])
+        self.assertEqual(len(self.created), 1)
+        self.assertEqual(agents[0].messages, [{"role": "user", "content": [{"text": "saved"}]}])
+
+    async def test_failed_save_is_logged_and_dropped(self):
+        class FailingStore(InMemoryHibernationStore):
+            async def save(self, thread_id, messages):
+                raise OSError("disk full")
+
+        cache = AgentCache(max_size=1, hibernation_store=FailingStore())
+        agent = await cache.acquire("a", self.factory)
+        agent.messages.append({"role": "user", "content": [{"text": "hi"}]})
+        cache.release("a")
+
+        with self.assertLogs("ag_ui_strands.agent_cache", level="WARNING") as logs:
+            await cache.acquire("b", self.factory)
+
+        self.assertIn("Failed to hibernate agent for thread a: disk full", logs.output[0])
+        self.assertEqual(cache.stats.hibernations, 0)
+
+
+class TestHibernationStore(unittest.TestCase):
+
+    def test_incomplete_store_cannot_be_created(self):
+        class SaveOnlyStore(HibernationStore):
+            async def save(self, thread_id, messages):
+                pass
+
+        with self.assertRaises(TypeError):
+            SaveOnlyStore()
+
+
+class TestLocalFileHibernationStore(unittest.IsolatedAsyncioTestCase):
+
+    async def test_round_trip_consumes_the_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = LocalFileHibernationStore(directory)
+            messages = [{"role": "user", "content": [{"image": {"source": {"bytes": b"\x89PNG"}}}]}]
+
+            await store.save("../thread", messages)
+
+            self.assertEqual(await store.load("../thread"), messages)
+            self.assertIsNone(await store.load("../thread"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+"""Tests for RunLimiter admission control."""
+
+import asyncio
+import unittest
+
+from ag_ui_strands.concurrency import RunLimiter, RunRejectedError
+
+
+async def settle():
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+class TestBusyThreadPolicies(unittest.IsolatedAsyncioTestCase):
+
+    async def test_queue_serializes_runs_of_a_thread(self):
+        limiter = RunLimiter()
+        await limiter.acquire("t1")
+
+        second = asyncio.create_task(limiter.acquire("t1"))
+        await settle()
+        self.assertFalse(second.done())
+        self.assertEqual((limiter.active_runs, limiter.waiting_runs), (1, 1))
+
+        limiter.release("t1")
+        await second
+        self.assertEqual((limiter.active_runs, limiter.waiting_runs), (1, 0))
+        limiter.release("t1")
+
+        self.assertEqual(limiter.active_runs, 0)
+        self.assertEqual((limiter.stats.admitted, limiter.stats.queued), (2, 1))
+        self.assertEqual(limiter._gates, {})
+
+    async def test_other_threads_are_not_blocked(self):
+        limiter = RunLimiter()
+        await limiter.acquire("t1")
+
+        await asyncio.wait_for(limiter.acquire("t2"), timeout=1)
+
+        self.assertEqual(limiter.active_runs, 2)
+        self.assertEqual(limiter.stats.queued, 0)
+
+    async def test_reject_refuses_a_busy_thread(self):
+        limiter = RunLimiter(busy_thread_policy="reject")
+        await limiter.acquire("t1")
+
+        with self.assertRaises(RunRejectedError) as caught:
+            await limiter.acquire("t1")
+
+        self.assertEqual(caught.exception.code, "THREAD_BUSY")
+        self.assertEqual(limiter.stats.rejected, 1)
+        await asyncio.wait_for(limiter.acquire("t2"), timeout=1)
+
+        limiter.release("t1")
+        await asyncio.wait_for(limiter.acquire("t1"), timeout=1)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            RunLimiter(busy_thread_policy="drop")
+
+
+class TestGlobalLimit(unittest.IsolatedAsyncioTestCase):
+
+    async def test_runs_beyond_the_limit_wait_for_a_slot(self):
+        limiter = RunLimiter(max_concurrent_runs=2)
+        await limiter.acquire("t1")
+        await limiter.acquire("t2")
+
+        third = asyncio.create_task(limiter.acquire("t3"))
+        await settle()
+        self.assertFalse(third.done())
+
+        limiter.release("t1")
+        waited = await asyncio.wait_for(third, timeout=1)
+
+        self.assertGreaterEqual(waited, 0)
+        self.assertEqual(limiter.active_runs, 2)
+        self.assertEqual(limiter.stats.queued, 1)
+
+    async def test_a_busy_thread_takes_one_place_in_the_queue(self):
+        limiter = RunLimiter(max_concurrent_runs=1)
+        await limiter.acquire("t1")
+        queued = [asyncio.create_task(limiter.acquire("t1")) for _ in range(3)]
+        other = asyncio.create_task(limiter.acquire("t2"))
+        await settle()
+
+        limiter.release("t1")
+        await settle()
+
+        # t1's followers queue on their thread's lock, not for a slot, so the
+        # slot goes to t2 ahead of them
+        self.assertTrue(other.done())
+        self.assertFalse(any(task.done() for task in queued))
+        self.assertEqual(limiter.active_runs, 1)
+        for task in queued + [other]:
+            task.cancel()
+        await asyncio.gather(*queued, other, return_exceptions=True)
+
+
+class TestMaxWait(unittest.IsolatedAsyncioTestCase):
+
+    async def test_waiting_on_a_busy_thread_times_out(self):
+        limiter = RunLimiter(max_wait=0.05)
+        await limiter.acquire("t1")
+
+        with self.assertRaises(RunRejectedError) as caught:
+            await limiter.acquire("t1")
+
+        self.assertEqual(caught.exception.code, "RUN_QUEUE_TIMEOUT")
+        self.assertEqual(limiter.stats.rejected, 1)
+        self.assertEqual(limiter.waiting_runs, 0)
+        self.assertEqual(limiter._gates["t1"].users, 1)
+
+        limiter.release("t1")
+        self.assertEqual(limiter._gates, {})
+        await asyncio.wait_for(limiter.acquire("t1"), timeout=1)
+
+    async def test_waiting_for_a_slot_times_out_and_frees_the_thread(self):
+        limiter = RunLimiter(max_concurrent_runs=1, max_wait=0.05)
+        await limiter.acquire("t1")
+
+        with self.assertRaises(RunRejectedError):
+            await limiter.acquire("t2")
+
+        # The timed out run held t2's lock while waiting for the slot
+        self.assertNotIn("t2", limiter._gates)
+        limiter.release("t1")
+        await asyncio.wait_for(limiter.acquire("t2"), timeout=1)
+        self.assertEqual(limiter.active_runs, 1)
+
+    async def test_cancelled_waiter_leaves_no_trace(self):
+        limiter = RunLimiter(max_concurrent_runs=1)
+        await limiter.acquire("t1")
+        waiter = asyncio.create_task(limiter.acquire("t2"))
+        await settle()
+
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+
+        self.assertEqual(limiter.waiting_runs, 0)
+        self.assertNotIn("t2", limiter._gates)
+        limiter.release("t1")
+        await asyncio.wait_for(limiter.acquire("t2"), timeout=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
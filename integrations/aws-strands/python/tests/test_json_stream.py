@@ -0,0 +1,235 @@
+"""Chunk-boundary tests for the streamed JSON helpers."""
+
+import json
+import unittest
+
+from ag_ui_strands.config import PredictStateMapping, ToolBehavior
+from ag_ui_strands.json_stream import IncrementalJsonScanner, PartialJsonMemberExtractor
+from ag_ui_strands.tool_calls import ToolCall, ToolInfo
+
+DOCUMENTS = [
+    '{"query": "weather", "limit": 3}',
+    '{"a": {"b": [1, {"c": "}]"}], "d": []}, "e": "[{"}',
+    '{"quote": "say \\"hi\\" \\\\", "path": "C:\\\\tmp\\\\"}',
+    '{"emoji": "\\ud83d\\ude00", "accent": "caf\\u00e9"}',
+    '[1, [2, [3, "]"]], {"k": "v"}]',
+    '"just a \\"string\\""',
+]
+
+
+def splits(text):
+    """Every way of cutting `text` in two, plus one chunk per character."""
+    for cut in range(1, len(text)):
+        yield [text[:cut], text[cut:]]
+    yield list(text)
+
+
+def apply_patch(document, operations):
+    """Apply the add/replace operations the extractor emits."""
+    for operation in operations:
+        tokens = [
+            token.replace("~1", "/").replace("~0", "~")
+            for token in operation["path"].split("/")[1:]
+        ]
+        if not tokens:
+            document = operation["value"]
+            continue
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+        if isinstance(parent, list):
+            if last == "-":
+                parent.append(operation["value"])
+            else:
+                parent[int(last)] = operation["value"]
+        else:
+            parent[last] = operation["value"]
+    return document
+
+
+def member_updates(key, chunks):
+    extractor = PartialJsonMemberExtractor(key)
+    operations = []
+    for chunk in chunks:
+        for op, path, value in extractor.feed(chunk):
+            operations.append({"op": op, "path": path, "value": value})
+    return extractor, operations
+
+
+def accumulate(chunks):
+    text = ""
+    for chunk in chunks:
+        text += chunk
+        yield text
+
+
+class TestIncrementalJsonScanner(unittest.TestCase):
+
+    def assert_scans(self, document, chunks):
+        scanner = IncrementalJsonScanner()
+        received = []
+        for text in accumulate(chunks):
+            self.assertFalse(scanner.complete, (document, chunks))
+            received.append(scanner.feed(text))
+        self.assertTrue(scanner.complete, (document, chunks))
+        self.assertEqual("".join(received), document)
+        self.assertEqual(scanner.value(), json.loads(document))
+
+    def test_every_chunk_boundary(self):
+        for document in DOCUMENTS:
+            for chunks in splits(document):
+                self.assert_scans(document, chunks)
+
+    def test_escape_split_before_quote_stays_in_string(self):
+        scanner = IncrementalJsonScanner()
+        scanner.feed('{"a": "x\\')
+        scanner.feed('{"a": "x\\"')
+        scanner.feed('{"a": "x\\"}')
+
+        self.assertFalse(scanner.complete)
+        scanner.feed('{"a": "x\\"}"}')
+        self.assertTrue(scanner.complete)
+        self.assertEqual(scanner.value(), {"a": 'x"}'})
+
+    def test_unicode_escape_split_across_chunks(self):
+        document = '{"a": "\\u00e9\\ud83d\\ude00"}'
+        for cut in range(document.index("\\"), document.rindex("0") + 1):
+            self.assert_scans(document, [document[:cut], document[cut:]])
+
+    def test_incomplete_document_is_returned_as_text(self):
+        scanner = IncrementalJsonScanner()
+        scanner.feed('{"a": [1, 2')
+
+        self.assertFalse(scanner.complete)
+        self.assertEqual(scanner.value(), '{"a": [1, 2')
+
+    def test_repeated_text_returns_no_suffix(self):
+        scanner = IncrementalJsonScanner()
+        scanner.feed('{"a": ')
+
+        self.assertEqual(scanner.feed('{"a": '), "")
+        self.assertEqual(scanner.feed('{"a": 1}'), "1}")
+
+    def test_text_that_is_not_a_continuation_restarts(self):
+        scanner = IncrementalJsonScanner()
+        scanner.feed('{"a": "unfinished')
+
+        self.assertEqual(scanner.feed('{"b": 2}'), '{"b": 2}')
+        self.assertTrue(scanner.complete)
+        self.assertEqual(scanner.value(), {"b": 2})
+
+
+class TestPartialJsonMemberExtractor(unittest.TestCase):
+
+    def assert_extracts(self, document, key, chunks):
+        extractor, operations = member_updates(key, chunks)
+        self.assertTrue(extractor.done, (document, chunks))
+        self.assertEqual(apply_patch(None, operations), json.loads(document)[key], (document, chunks))
+        return operations
+
+    def test_string_member_at_every_chunk_boundary(self):
+        document = '{"title": "x", "content": "line\\n \\"quoted\\" caf\\u00e9 \\ud83d\\ude00 end", "n": 1}'
+        for chunks in splits(document):
+            self.assert_extracts(document, "content", chunks)
+
+    def test_escape_split_across_chunks(self):
+        document = '{"content": "a\\u00e9b\\"c"}'
+        backslash = document.index("\\")
+        for cut in range(backslash + 1, backslash + 6):
+            operations = self.assert_extracts(document, "content", [document[:cut], document[cut:]])
+            # Partial values never contain half an escape
+            for operation in operations:
+                self.assertNotIn("\\", operation["value"])
+
+    def test_nested_containers_at_every_chunk_boundary(self):
+        documents = [
+            '{"skip": {"content": 0}, "content": {"a": [1, {"b": "]}"}], "c/d": {"e": null}}, "z": 2}',
+            '{"content": [[1, 2], {"k": "v,}"}, "s", 3.5, true]}',
+        ]
+        for document in documents:
+            for chunks in splits(document):
+                self.assert_extracts(document, "content", chunks)
+
+    def test_container_elements_are_added_as_they_complete(self):
+        document = '{"content": [{"id": 1}, {"id": 2}]}'
+        _, operations = member_updates("content", [document])
+
+        self.assertEqual(operations, [
+            {"op": "add", "path": "", "value": []},
+            {"op": "add", "path": "/-", "value": {"id": 1}},
+            {"op": "add", "path": "/-", "value": {"id": 2}},
+        ])
+
+    def test_scalar_members(self):
+        for value in ["42", "-1.5e3", "true", "null"]:
+            document = '{"content": %s}' % value
+            for chunks in splits(document):
+                self.assert_extracts(document, "content", chunks)
+
+    def test_missing_member(self):
+        document = '{"title": "content", "nested": {"content": "no"}}'
+        for chunks in splits(document):
+            extractor, operations = member_updates("content", chunks)
+            self.assertTrue(extractor.done)
+            self.assertEqual(operations, [])
+
+    def test_long_string_updates_stay_linear(self):
+        text = "word " * 2000
+        document = json.dumps({"content": text})
+        _, operations = member_updates("content", [document[i:i + 7] for i in range(0, len(document), 7)])
+
+        self.assertEqual(operations[-1]["value"], text)
+        resent = sum(len(operation["value"]) for operation in operations)
+        self.assertLess(resent, 10 * len(text))
+
+
+class TestPredictedStatePatches(unittest.TestCase):
+
+    def make_call(self, *mappings):
+        behavior = ToolBehavior(
+            predict_state=[
+                PredictStateMapping(state_key=state_key, tool="write_document", tool_argument=argument)
+                for state_key, argument in mappings
+            ],
+            stream_state_deltas=True,
+        )
+        return ToolCall("call-1", "tool-1", ToolInfo("write_document", behavior, False))
+
+    def test_patches_rebuild_the_final_arguments(self):
+        arguments = {
+            "document": "Dear \"team\",\nsee caf\u00e9 \U0001F600",
+            "steps": [{"description": "one", "status": "enabled"}, {"description": "t]{o"}],
+        }
+        document = json.dumps(arguments)
+        for chunks in splits(document):
+            call = self.make_call(("document", "document"), ("steps/list", "steps"))
+            state = {"unrelated": 1}
+            for chunk in chunks:
+                state = apply_patch(state, call.state_patches(chunk))
+
+            self.assertEqual(state, {
+                "unrelated": 1,
+                "document": arguments["document"],
+                "steps/list": arguments["steps"],
+            })
+
+    def test_paths_are_escaped_state_keys(self):
+        call = self.make_call(("a/b~c", "text"))
+
+        patches = call.state_patches('{"text": "hi"}')
+
+        self.assertEqual({patch["path"] for patch in patches}, {"/a~1b~0c"})
+
+    def test_no_patches_without_stream_state_deltas(self):
+        behavior = ToolBehavior(
+            predict_state=[PredictStateMapping(state_key="document", tool="write_document", tool_argument="document")],
+        )
+        call = ToolCall("call-1", "tool-1", ToolInfo("write_document", behavior, False))
+
+        self.assertEqual(call.state_extractors, [])
+        self.assertEqual(call.state_patches('{"document": "hi"}'), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+"""Tests for the AG-UI -> Strands history conversion used to seed fresh agents."""
+
+import unittest
+
+from ag_ui.core import (
+    AssistantMessage,
+    FunctionCall,
+    RunAgentInput,
+    SystemMessage,
+    ToolCall,
+    ToolMessage,
+    UserMessage,
+)
+
+from ag_ui_strands import StrandsAgentConfig
+from ag_ui_strands.messages import (
+    agui_messages_to_strands,
+    ends_with_tool_result,
+    latest_prompt_index,
+)
+from .test_tool_call_replay import ReplayingStrandsAgent
+
+
+def user(message_id, text):
+    return UserMessage(id=message_id, role="user", content=text)
+
+
+def assistant(message_id, text=None, *call_ids):
+    tool_calls = [
+        ToolCall(id=call_id, type="function", function=FunctionCall(name="lookup", arguments='{"q": 1}'))
+        for call_id in call_ids
+    ]
+    return AssistantMessage(id=message_id, role="assistant", content=text, tool_calls=tool_calls or None)
+
+
+def tool(message_id, call_id, text):
+    return ToolMessage(id=message_id, role="tool", content=text, tool_call_id=call_id)
+
+
+def tool_use(call_id):
+    return {"toolUse": {"toolUseId": call_id, "name": "lookup", "input": {"q": 1}}}
+
+
+def tool_result(call_id, text):
+    return {"toolResult": {"toolUseId": call_id, "status": "success", "content": [{"text": text}]}}
+
+
+class TestLatestPromptIndex(unittest.TestCase):
+
+    def test_newest_user_or_tool_message(self):
+        self.assertEqual(latest_prompt_index([user("u1", "hi"), assistant("a1", "hello")]), 0)
+        self.assertEqual(latest_prompt_index([user("u1", "hi"), assistant("a1", None, "t1"), tool("r1", "t1", "42")]), 2)
+
+    def test_empty_messages_are_skipped(self):
+        self.assertEqual(latest_prompt_index([user("u1", "hi"), user("u2", "")]), 0)
+        self.assertIsNone(latest_prompt_index([assistant("a1", "hello")]))
+        self.assertIsNone(latest_prompt_index([]))
+
+
+class TestAguiMessagesToStrands(unittest.TestCase):
+
+    def test_tool_calls_are_paired_with_their_results(self):
+        converted = agui_messages_to_strands([
+            SystemMessage(id="s1", role="system", content="be brief"),
+            user("u1", "hi"),
+            assistant("a1", "looking", "t1", "t2"),
+            tool("r1", "t1", "42"),
+            tool("r2", "orphan", "dropped"),
+            user("u2", "thanks"),
+        ])
+
+        self.assertEqual(converted, [
+            {"role": "user", "content": [{"text": "hi"}]},
+            {"role": "assistant", "content": [{"text": "looking"}, tool_use("t1")]},
+            {"role": "user", "content": [tool_result("t1", "42"), {"text": "thanks"}]},
+        ])
+
+    def test_conversation_starts_with_the_user(self):
+        converted = agui_messages_to_strands([assistant("a0", "welcome"), user("u1", "hi")])
+
+        self.assertEqual(converted, [{"role": "user", "content": [{"text": "hi"}]}])
+
+    def test_end_with_assistant_drops_trailing_user_turns(self):
+        converted = agui_messages_to_strands(
+            [user("u1", "hi"), assistant("a1", "sure", "t1"), tool("r1", "t1", "42")],
+            end_with_assistant=True,
+        )
+
+        self.assertEqual(converted, [
+            {"role": "user", "content": [{"text": "hi"}]},
+            {"role": "assistant", "content": [{"text": "sure"}]},
+        ])
+
+    def test_ends_with_tool_result(self):
+        converted = agui_messages_to_strands([user("u1", "hi"), assistant("a1", None, "t1"), tool("r1", "t1", "42")])
+
+        self.assertTrue(ends_with_tool_result(converted, "t1"))
+        self.assertFalse(ends_with_tool_result(converted, "t2"))
+        self.assertFalse(ends_with_tool_result(converted[:2], "t1"))
+
+
+def run_input(messages):
+    return RunAgentInput(
+        thread_id="thread-1",
+        run_id="run-1",
+        state=None,
+        messages=messages,
+        tools=[],
+        context=[],
+        forwarded_props={},
+    )
+
+
+class TestSeedHistory(unittest.IsolatedAsyncioTestCase):
+
+    async def _run(self, messages, agent=None):
+        agent = agent or ReplayingStrandsAgent([{"complete": True}], StrandsAgentConfig())
+        async for _ in agent.run(run_input(messages)):
+            pass
+        return agent, await agent.agent_cache.acquire("thread-1", agent._create_agent)
+
+    async def test_fresh_agent_gets_the_history_before_a_user_prompt(self):
+        _, strands_agent = await self._run([user("u1", "hi"), assistant("a1", "hello"), user("u2", "again")])
+
+        self.assertEqual(strands_agent.prompts, ["again"])
+        self.assertEqual(strands_agent.messages, [
+            {"role": "user", "content": [{"text": "hi"}]},
+            {"role": "assistant", "content": [{"text": "hello"}]},
+        ])
+
+    async def test_tool_result_prompt_keeps_the_conversation(self):
+        _, strands_agent = await self._run([user("u1", "hi"), assistant("a1", None, "t1"), tool("r1", "t1", "42")])
+
+        # The result answers the seeded call and the agent resumes from it
+        self.assertEqual(strands_agent.prompts, [None])
+        self.assertEqual(strands_agent.messages, [
+            {"role": "user", "content": [{"text": "hi"}]},
+            {"role": "assistant", "content": [tool_use("t1")]},
+            {"role": "user", "content": [tool_result("t1", "42")]},
+        ])
+
+    async def test_tool_result_prompt_carries_the_state_context(self):
+        config = StrandsAgentConfig(state_context_builder=lambda input_data, text: f"{text} (state: ok)")
+        agent = ReplayingStrandsAgent([{"complete": True}], config)
+
+        _, strands_agent = await self._run(
+            [user("u1", "hi"), assistant("a1", None, "t1"), tool("r1", "t1", "42")], agent
+        )
+
+        self.assertEqual(strands_agent.messages[-1], {"role": "user", "content": [tool_result("t1", "42 (state: ok)")]})
+
+    async def test_tool_result_without_its_call_is_sent_as_the_prompt(self):
+        _, strands_agent = await self._run([user("u1", "hi"), assistant("a1", "hello"), tool("r1", "t1", "42")])
+
+        self.assertEqual(strands_agent.prompts, ["42"])
+        self.assertEqual(strands_agent.messages, [
+            {"role": "user", "content": [{"text": "hi"}]},
+            {"role": "assistant", "content": [{"text": "hello"}]},
+        ])
+
+    async def test_agents_with_history_are_not_seeded(self):
+        agent, strands_agent = await self._run([user("u1", "hi")])
+        strands_agent.messages.append({"role": "user", "content": [{"text": "kept"}]})
+
+        await self._run([user("u0", "older"), assistant("a0", "reply"), user("u1", "hi")], agent)
+
+        self.assertEqual(strands_agent.messages, [{"role": "user", "content": [{"text": "kept"}]}])
+        self.assertEqual(strands_agent.prompts, ["hi", "hi"])
+
+
+if __name__ == "__main__":
+    unittest.main()
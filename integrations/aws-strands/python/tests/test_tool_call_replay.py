@@ -0,0 +1,184 @@
+"""Replay of a Strands turn with many parallel tool calls.
+
+Run as a script to time the replay:
+
+    python -m tests.test_tool_call_replay
+"""
+
+import asyncio
+import json
+import time
+import unittest
+from types import SimpleNamespace
+
+from ag_ui.core import EventType, RunAgentInput, UserMessage
+
+from ag_ui_strands import StrandsAgent, StrandsAgentConfig, ToolBehavior
+from ag_ui_strands.tool_calls import ToolCallRegistry
+
+PARALLEL_CALLS = 50
+CHUNKS_PER_CALL = 40
+TOOL_NAMES = [f"tool_{i}" for i in range(10)]
+FRONTEND_TOOLS = {"tool_1", "tool_3"}
+
+
+def call_args(index):
+    return json.dumps({"query": f"call {index} " + "x" * 200, "limit": index})
+
+
+def tool_turn_events(count=PARALLEL_CALLS):
+    """The stream of one turn: every call's input chunks, its block stop, then the results."""
+    events = [{"init_event_loop": True}]
+    for index in range(count):
+        args = call_args(index)
+        step = max(1, len(args) // CHUNKS_PER_CALL)
+        for end in list(range(step, len(args), step)) + [len(args)]:
+            # Strands reports the input accumulated so far
+            events.append({"current_tool_use": {
+                "toolUseId": f"strands-{index}",
+                "name": TOOL_NAMES[index % len(TOOL_NAMES)],
+                "input": args[:end],
+            }})
+        events.append({"event": {"contentBlockStop": {}}})
+    events.append({"message": {"role": "user", "content": [
+        {"toolResult": {"toolUseId": f"strands-{index}", "content": [{"text": f'{{"hits": {index}}}'}]}}
+        for index in range(count)
+    ]}})
+    events.append({"data": "done"})
+    events.append({"complete": True})
+    return events
+
+
+class ReplayedStrandsAgent:
+    """Stands in for a Strands agent, streaming a recorded turn."""
+
+    def __init__(self, events):
+        self.events = events
+        self.messages = []
+        self.prompts = []
+
+    async def stream_async(self, prompt):
+        self.prompts.append(prompt)
+        for event in self.events:
+            yield event
+
+
+class ReplayingStrandsAgent(StrandsAgent):
+
+    def __init__(self, events, config, **kwargs):
+        template = SimpleNamespace(model=None, system_prompt=None)
+        super().__init__(template, name="replay", config=config, **kwargs)
+        self._events = events
+
+    def _create_agent(self, messages=None):
+        return ReplayedStrandsAgent(self._events)
+
+
+def make_agent(events, continue_after_frontend_call=True, **kwargs):
+    behaviors = {
+        name: ToolBehavior(continue_after_frontend_call=continue_after_frontend_call)
+        for name in FRONTEND_TOOLS
+    }
+    return ReplayingStrandsAgent(events, StrandsAgentConfig(tool_behaviors=behaviors), **kwargs)
+
+
+def make_run_input(run_id="run-1"):
+    return RunAgentInput(
+        thread_id="thread-1",
+        run_id=run_id,
+        state=None,
+        messages=[UserMessage(id="user-1", role="user", content="look everything up")],
+        tools=[{"name": name, "description": "", "parameters": {}} for name in sorted(FRONTEND_TOOLS)],
+        context=[],
+        forwarded_props={},
+    )
+
+
+async def collect(agent, run_id="run-1"):
+    return [event async for event in agent.run(make_run_input(run_id))]
+
+
+class TestToolCallRegistryReplay(unittest.TestCase):
+
+    def test_replayed_turn_tracks_every_call(self):
+        registry = ToolCallRegistry({}, FRONTEND_TOOLS)
+        stopped = []
+        for event in tool_turn_events():
+            if "current_tool_use" in event:
+                tool_use = event["current_tool_use"]
+                call = registry.track(tool_use["toolUseId"], tool_use["name"])
+                call.scanner.feed(tool_use["input"])
+                call.args = call.scanner.text
+            elif "event" in event:
+                stopped.append(registry.next_unemitted())
+
+        self.assertEqual(len(registry), PARALLEL_CALLS)
+        self.assertIsNone(registry.next_unemitted())
+        self.assertEqual([call.strands_tool_id for call in stopped], [f"strands-{i}" for i in range(PARALLEL_CALLS)])
+        for index, call in enumerate(stopped):
+            self.assertEqual(call.args, call_args(index))
+            self.assertEqual(call.tool.is_frontend, call.name in FRONTEND_TOOLS)
+            # Frontend calls get a fresh ID; both IDs find the call
+            self.assertEqual(call.tool_use_id == call.strands_tool_id, not call.tool.is_frontend)
+            self.assertIs(registry.get(call.tool_use_id), call)
+            self.assertIs(registry.get(call.strands_tool_id), call)
+
+    def test_tool_info_is_resolved_once_per_name(self):
+        registry = ToolCallRegistry({}, FRONTEND_TOOLS)
+        first = registry.track("a", "tool_0")
+        second = registry.track("b", "tool_0")
+
+        self.assertIs(first.tool, second.tool)
+        self.assertIs(registry.track("a", "tool_0"), first)
+
+
+class TestStrandsAgentReplay(unittest.IsolatedAsyncioTestCase):
+
+    async def test_parallel_calls_are_streamed_and_completed(self):
+        events = await collect(make_agent(tool_turn_events()))
+        types = [event.type for event in events]
+
+        self.assertEqual(types[0], EventType.RUN_STARTED)
+        self.assertEqual(types[-1], EventType.RUN_FINISHED)
+        starts = [event for event in events if event.type == EventType.TOOL_CALL_START]
+        ends = [event for event in events if event.type == EventType.TOOL_CALL_END]
+        self.assertEqual(len(starts), PARALLEL_CALLS)
+        self.assertEqual([event.tool_call_id for event in ends], [event.tool_call_id for event in starts])
+        self.assertEqual(len({event.tool_call_id for event in starts}), PARALLEL_CALLS)
+
+        args = {}
+        for event in events:
+            if event.type == EventType.TOOL_CALL_ARGS:
+                args[event.tool_call_id] = args.get(event.tool_call_id, "") + event.delta
+        for index, start in enumerate(starts):
+            self.assertEqual(start.tool_call_name, TOOL_NAMES[index % len(TOOL_NAMES)])
+            self.assertEqual(args[start.tool_call_id], call_args(index))
+
+        results = [event for event in events if event.type == EventType.TOOL_CALL_RESULT]
+        self.assertEqual([event.tool_call_id for event in results], [f"strands-{i}" for i in range(PARALLEL_CALLS)])
+        self.assertEqual(results[7].content, '{"hits": 7}')
+
+    async def test_frontend_call_halts_the_turn(self):
+        events = await collect(make_agent(tool_turn_events(), continue_after_frontend_call=False))
+
+        ends = [event for event in events if event.type == EventType.TOOL_CALL_END]
+        # tool_1 is the second call of the turn
+        self.assertEqual(len(ends), 2)
+        self.assertFalse(any(event.type == EventType.TOOL_CALL_RESULT for event in events))
+        self.assertEqual(events[-1].type, EventType.RUN_FINISHED)
+
+
+async def benchmark(turns=20):
+    agent = make_agent(tool_turn_events())
+    best = float("inf")
+    for turn in range(turns):
+        started = time.perf_counter()
+        await collect(agent, run_id=f"run-{turn}")
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+if __name__ == "__main__":
+    events = tool_turn_events()
+    best = asyncio.run(benchmark())
+    print(f"{best * 1000:.2f} ms per turn ({len(events)} events, {PARALLEL_CALLS} parallel tool calls)")
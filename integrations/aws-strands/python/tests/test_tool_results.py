@@ -0,0 +1,57 @@
+"""Tests for the tool result payloads forwarded in ToolCallResultEvent."""
+
+import json
+import unittest
+
+from ag_ui_strands.tool_results import ToolResult, tool_result_from_content
+
+
+class TestToolResultJson(unittest.TestCase):
+
+    def test_valid_json_containers_are_passed_through(self):
+        for text in ['{"a": 1, "b": [true, null]}', ' [1, "two", {"three": 3}]\n', "{}", "[]"]:
+            with self.subTest(text=text):
+                self.assertIs(ToolResult(text=text).json(), text)
+
+    def test_text_that_only_looks_like_json_is_encoded(self):
+        for text in ["[1] see source [2]", '{"a": 1} and {"b": 2}', '["unterminated]']:
+            with self.subTest(text=text):
+                self.assertEqual(ToolResult(text=text).json(), json.dumps(text))
+
+    def test_python_reprs_are_decoded_and_encoded(self):
+        self.assertEqual(ToolResult(text="{'a': 1}").json(), '{"a": 1}')
+        # Not JSON, and not fixable by swapping quotes
+        text = '{"it\'s": True}'
+        self.assertEqual(ToolResult(text=text).json(), json.dumps(text))
+
+    def test_scalars_and_plain_text_are_encoded(self):
+        self.assertEqual(ToolResult(text="42").json(), "42")
+        self.assertEqual(ToolResult(text="done").json(), '"done"')
+
+    def test_validation_provides_the_value(self):
+        result = ToolResult(text='{"a": [1, 2]}')
+        result.json()
+        self.assertEqual(result.value(), {"a": [1, 2]})
+
+    def test_large_texts_are_validated_but_not_decoded_for_hooks(self):
+        valid = ToolResult(text='{"a": [1, 2]}', max_decode_size=5)
+        invalid = ToolResult(text="[1] see source [2]", max_decode_size=5)
+
+        self.assertEqual(valid.json(), valid.text)
+        self.assertEqual(valid.value(), valid.text)
+        self.assertEqual(invalid.json(), json.dumps(invalid.text))
+
+
+class TestToolResultFromContent(unittest.TestCase):
+
+    def test_last_text_or_json_item_is_used(self):
+        result = tool_result_from_content([{"text": "first"}, {"image": {}}, {"json": {"k": "v"}}])
+        self.assertEqual(result.json(), '{"k": "v"}')
+
+    def test_empty_content_has_no_result(self):
+        self.assertIsNone(tool_result_from_content([]))
+        self.assertIsNone(tool_result_from_content([{"image": {}}]))
+
+
+if __name__ == "__main__":
+    unittest.main()
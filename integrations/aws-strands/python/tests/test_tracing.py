@@ -0,0 +1,115 @@
+"""Tests for the run spans recorded by StrandsAgent."""
+
+import asyncio
+import unittest
+
+from ag_ui.core import EventType
+
+from ag_ui_strands import (
+    InMemoryTraceSink,
+    RunLimiter,
+    StrandsAgentConfig,
+    TraceSink,
+)
+from .test_tool_call_replay import (
+    PARALLEL_CALLS,
+    ReplayingStrandsAgent,
+    make_agent,
+    make_run_input,
+    tool_turn_events,
+)
+
+
+class FailingTraceSink(TraceSink):
+
+    def record_run(self, span):
+        raise RuntimeError("sink is down")
+
+
+def text_turn_events(*chunks):
+    return [{"init_event_loop": True}, *({"data": chunk} for chunk in chunks), {"complete": True}]
+
+
+async def collect(agent, run_id="run-1"):
+    return [event async for event in agent.run(make_run_input(run_id))]
+
+
+class TestRunSpans(unittest.IsolatedAsyncioTestCase):
+
+    async def test_text_run_is_counted(self):
+        sink = InMemoryTraceSink()
+        agent = ReplayingStrandsAgent(text_turn_events("Hello", ", wörld"), StrandsAgentConfig(), trace_sink=sink)
+
+        await collect(agent)
+
+        (span,) = sink.runs
+        self.assertEqual((span.thread_id, span.run_id), ("thread-1", "run-1"))
+        self.assertEqual(span.chunks, 4)
+        self.assertEqual(span.text_chunks, 2)
+        self.assertEqual(span.text_chars, len("Hello, wörld"))
+        self.assertEqual(span.tool_calls, 0)
+        self.assertIsNone(span.error)
+        self.assertGreaterEqual(span.time_to_first_token, 0)
+        self.assertLessEqual(span.time_to_first_token, span.duration)
+
+    async def test_tool_calls_are_counted(self):
+        sink = InMemoryTraceSink()
+        events = tool_turn_events()
+        agent = make_agent(events, trace_sink=sink)
+
+        await collect(agent)
+
+        (span,) = sink.runs
+        self.assertEqual(span.chunks, len(events))
+        self.assertEqual(span.tool_calls, PARALLEL_CALLS)
+        self.assertIsNotNone(span.time_to_first_token)
+
+    async def test_queue_wait_covers_the_wait_for_the_thread(self):
+        sink = InMemoryTraceSink()
+        agent = ReplayingStrandsAgent(text_turn_events("hi"), StrandsAgentConfig(), trace_sink=sink)
+
+        first = agent.run(make_run_input("run-1"))
+        await first.__anext__()
+        # run-2 waits for run-1 to release the thread
+        second = asyncio.create_task(collect(agent, "run-2"))
+        await asyncio.sleep(0.05)
+        async for _ in first:
+            pass
+        await second
+
+        spans = {span.run_id: span for span in sink.runs}
+        self.assertLess(spans["run-1"].queue_wait, 0.05)
+        self.assertGreaterEqual(spans["run-2"].queue_wait, 0.05)
+
+    async def test_rejected_run_is_recorded(self):
+        sink = InMemoryTraceSink()
+        agent = ReplayingStrandsAgent(
+            text_turn_events("hi"),
+            StrandsAgentConfig(),
+            trace_sink=sink,
+            run_limiter=RunLimiter(busy_thread_policy="reject"),
+        )
+
+        first = agent.run(make_run_input("run-1"))
+        await first.__anext__()
+        rejected = await collect(agent, "run-2")
+        async for _ in first:
+            pass
+
+        self.assertEqual([event.type for event in rejected], [EventType.RUN_ERROR])
+        spans = {span.run_id: span for span in sink.runs}
+        self.assertEqual(spans["run-2"].error.code, "THREAD_BUSY")
+        self.assertIsNone(spans["run-1"].error)
+
+    async def test_failing_sink_does_not_break_the_run(self):
+        agent = ReplayingStrandsAgent(text_turn_events("hi"), StrandsAgentConfig(), trace_sink=FailingTraceSink())
+
+        with self.assertLogs("ag_ui_strands.agent", "WARNING") as logs:
+            events = await collect(agent)
+
+        self.assertEqual(events[-1].type, EventType.RUN_FINISHED)
+        self.assertIn("sink is down", logs.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
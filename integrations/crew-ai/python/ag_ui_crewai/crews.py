@@ -1,7 +1,12 @@
+import os
 import uuid
 import copy
 import json
-from typing import Any, cast
+import asyncio
+import functools
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, cast
 from crewai import Crew, Flow
 from crewai.flow import start
 from crewai.cli.crew_chat import (
@@ -20,6 +25,62 @@ from .sdk import (
 _CREW_INPUTS_CACHE = {}
 
 
+def max_concurrent_crews_from_env() -> int:
+    """Read AGUI_CREWAI_MAX_CONCURRENT_CREWS (default 4), which must be a positive integer."""
+    value = os.getenv("AGUI_CREWAI_MAX_CONCURRENT_CREWS", "4")
+    try:
+        max_crews = int(value)
+    except ValueError:
+        max_crews = 0
+    if max_crews < 1:
+        raise ValueError(
+            f"AGUI_CREWAI_MAX_CONCURRENT_CREWS must be a positive integer, got {value!r}"
+        )
+    return max_crews
+
+
+# Checked at import so a bad setting fails at startup rather than mid-request
+MAX_CONCURRENT_CREWS = max_concurrent_crews_from_env()
+
+_CREW_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+
+def crew_executor() -> ThreadPoolExecutor:
+    """
+    The thread pool all crews of this process run on.
+
+    Its size caps how many crews execute at once per worker process; further
+    runs wait for a free thread without blocking the event loop. Set
+    AGUI_CREWAI_MAX_CONCURRENT_CREWS to change it (default 4).
+    """
+    global _CREW_EXECUTOR  # pylint: disable=global-statement
+    if _CREW_EXECUTOR is None:
+        _CREW_EXECUTOR = ThreadPoolExecutor(
+            max_workers=MAX_CONCURRENT_CREWS,
+            thread_name_prefix="crew",
+        )
+    return _CREW_EXECUTOR
+
+
+async def run_crew(crew_function: Callable[..., Any], **kwargs) -> Any:
+    """
+    Run a blocking crew call on the crew pool.
+
+    The current context is carried over, so events the crew emits can find the
+    running flow and reach its request's queue.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    try:
+        return await loop.run_in_executor(
+            crew_executor(),
+            functools.partial(context.run, crew_function, **kwargs)
+        )
+    except SystemExit as e:
+        # crewai's crew chat tool exits the process when the crew fails
+        raise RuntimeError("An error occurred while running the crew") from e
+
+
 CREW_EXIT_TOOL = {
     "type": "function",
     "function": {
@@ -37,6 +98,16 @@ CREW_EXIT_TOOL = {
 class ChatWithCrewFlow(Flow):
     """Chat with crew"""
 
+    # Read-only after __init__, so per-request copies of the flow share them.
+    # The crew is copied when it actually runs, since kickoff mutates it.
+    shared_attributes = (
+        "crew",
+        "chat_llm",
+        "crew_chat_inputs",
+        "crew_tool_schema",
+        "system_message",
+    )
+
     def __init__(
             self, *,
             crew: Crew
@@ -105,9 +176,9 @@ class ChatWithCrewFlow(Flow):
         if message.get("tool_calls"):
             if message["tool_calls"][0]["function"]["name"] == self.crew_name:
                 # run the crew
-                crew_function = crew_chat_create_tool_function(self.crew, messages)
+                crew_function = crew_chat_create_tool_function(self.crew.copy(), messages)
                 args = json.loads(message["tool_calls"][0]["function"]["arguments"])
-                result = crew_function(**args)
+                result = await run_crew(crew_function, **args)
 
                 if isinstance(result, str):
                     self.state["outputs"] = result
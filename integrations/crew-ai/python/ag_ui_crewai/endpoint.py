@@ -3,7 +3,7 @@ AG-UI FastAPI server for CrewAI.
 """
 import copy
 import asyncio
-from typing import List, Optional
+from typing import Callable, List, Optional, Union
 from fastapi import FastAPI, Request
 from fastapi.responses import StreamingResponse
 
@@ -12,6 +12,9 @@ from crewai.utilities.events import (
     FlowFinishedEvent,
     MethodExecutionStartedEvent,
     MethodExecutionFinishedEvent,
+    TaskStartedEvent,
+    TaskCompletedEvent,
+    TaskFailedEvent,
 )
 from crewai.flow.flow import Flow
 from crewai.utilities.events.base_event_listener import BaseEventListener
@@ -51,11 +54,34 @@ QUEUES = {}
 QUEUES_LOCK = asyncio.Lock()
 
 
+class EventQueue(asyncio.Queue):
+    """
+    An asyncio.Queue that can also be fed from other threads.
+
+    Crews run on worker threads (see crews.run_crew) and emit their events there;
+    put_nowait hands those over to the loop the queue was created on.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._owner_loop = asyncio.get_running_loop()
+
+    def put_nowait(self, item):
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._owner_loop:
+            super().put_nowait(item)
+        else:
+            self._owner_loop.call_soon_threadsafe(super().put_nowait, item)
+
+
 async def create_queue(flow: object) -> asyncio.Queue:
     """Create a queue for a flow."""
     queue_id = id(flow)
     async with QUEUES_LOCK:
-        queue = asyncio.Queue()
+        queue = EventQueue()
         QUEUES[queue_id] = queue
         return queue
 
@@ -73,6 +99,15 @@ async def delete_queue(flow: object) -> None:
         if queue_id in QUEUES:
             del QUEUES[queue_id]
 
+def get_task_queue() -> Optional[asyncio.Queue]:
+    """Get the queue for the flow whose crew is running in the current context."""
+    flow = flow_context.get(None)
+    return get_queue(flow) if flow is not None else None
+
+def task_step_name(task: object) -> str:
+    """Step name reported for a crew task."""
+    return getattr(task, "name", None) or getattr(task, "description", None) or "task"
+
 GLOBAL_EVENT_LISTENER = None
 
 class FastAPICrewFlowEventListener(BaseEventListener):
@@ -138,6 +173,27 @@ class FastAPICrewFlowEventListener(BaseEventListener):
                         step_name=event.method_name
                     )
                 )
+        @crewai_event_bus.on(TaskStartedEvent)
+        def _(source, event):  # pylint: disable=unused-argument
+            queue = get_task_queue()
+            if queue is not None:
+                queue.put_nowait(
+                    StepStartedEvent(
+                        type=EventType.STEP_STARTED,
+                        step_name=task_step_name(event.task or source)
+                    )
+                )
+        @crewai_event_bus.on(TaskCompletedEvent)
+        @crewai_event_bus.on(TaskFailedEvent)
+        def _(source, event):  # pylint: disable=unused-argument
+            queue = get_task_queue()
+            if queue is not None:
+                queue.put_nowait(
+                    StepFinishedEvent(
+                        type=EventType.STEP_FINISHED,
+                        step_name=task_step_name(event.task or source)
+                    )
+                )
         @crewai_event_bus.on(BridgedTextMessageChunkEvent)
         def _(source, event):
             queue = get_queue(source)
@@ -184,8 +240,45 @@ class FastAPICrewFlowEventListener(BaseEventListener):
                     )
                 )
 
-def add_crewai_flow_fastapi_endpoint(app: FastAPI, flow: Flow, path: str = "/"):
-    """Adds a CrewAI endpoint to the FastAPI app."""
+FlowFactory = Callable[[], Flow]
+
+
+def flow_factory(flow: Union[Flow, FlowFactory]) -> FlowFactory:
+    """
+    Return a callable that creates the flow instance for one request.
+
+    A Flow is used as a prototype: every request gets a deep copy of it, except
+    for the attributes listed in the flow's `shared_attributes`, which the copies
+    reference instead of duplicating. Anything else is assumed to already be a
+    factory and is returned unchanged.
+    """
+    if not isinstance(flow, Flow):
+        return flow
+
+    shared = [
+        getattr(flow, name)
+        for name in getattr(flow, "shared_attributes", ())
+        if hasattr(flow, name)
+    ]
+
+    def create_flow() -> Flow:
+        # deepcopy reuses whatever the memo already maps an object's id to
+        return copy.deepcopy(flow, {id(value): value for value in shared})
+
+    return create_flow
+
+
+def add_crewai_flow_fastapi_endpoint(
+        app: FastAPI,
+        flow: Union[Flow, FlowFactory],
+        path: str = "/"
+    ):
+    """
+    Adds a CrewAI endpoint to the FastAPI app.
+
+    `flow` is either a prototype Flow, copied for each request, or a callable
+    returning a fresh Flow for each request.
+    """
     global GLOBAL_EVENT_LISTENER # pylint: disable=global-statement
 
     # Set up the global event listener singleton
@@ -194,11 +287,13 @@ def add_crewai_flow_fastapi_endpoint(app: FastAPI, flow: Flow, path: str = "/"):
     if GLOBAL_EVENT_LISTENER is None:
         GLOBAL_EVENT_LISTENER = FastAPICrewFlowEventListener()
 
+    create_flow = flow_factory(flow)
+
     @app.post(path)
     async def agentic_chat_endpoint(input_data: RunAgentInput, request: Request):
         """Agentic chat endpoint"""
 
-        flow_copy = copy.deepcopy(flow)
+        flow_copy = create_flow()
 
         # Get the accept header from the request
         accept_header = request.headers.get("accept")
@@ -217,7 +312,21 @@ def add_crewai_flow_fastapi_endpoint(app: FastAPI, flow: Flow, path: str = "/"):
             queue = await create_queue(flow_copy)
             token = flow_context.set(flow_copy)
             try:
-                asyncio.create_task(flow_copy.kickoff_async(inputs=inputs))
+                kickoff = asyncio.create_task(flow_copy.kickoff_async(inputs=inputs))
+
+                def on_kickoff_done(task: asyncio.Task):
+                    # A failed flow never emits FlowFinishedEvent; end the stream here
+                    if task.cancelled() or task.exception() is None:
+                        return
+                    queue.put_nowait(
+                        RunErrorEvent(
+                            type=EventType.RUN_ERROR,
+                            message=str(task.exception()),
+                        )
+                    )
+                    queue.put_nowait(None)
+
+                kickoff.add_done_callback(on_kickoff_done)
 
                 while True:
                     item = await queue.get()
@@ -234,9 +343,7 @@ def add_crewai_flow_fastapi_endpoint(app: FastAPI, flow: Flow, path: str = "/"):
                 yield encoder.encode(
                     RunErrorEvent(
                         type=EventType.RUN_ERROR,
-                        thread_id=input_data.thread_id,
-                        run_id=input_data.run_id,
-                        error=str(e),
+                        message=str(e),
                     )
                 )
             finally:
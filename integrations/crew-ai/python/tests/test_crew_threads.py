@@ -0,0 +1,142 @@
+"""
+Tests for running crews off the event loop and bridging their events back.
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+import httpx
+from crewai.flow.flow import Flow, start
+from fastapi import FastAPI
+
+from ag_ui_crewai import crews
+from ag_ui_crewai.context import flow_context
+from ag_ui_crewai.endpoint import EventQueue, add_crewai_flow_fastapi_endpoint
+
+
+def run_input(thread_id="thread-1"):
+    return {
+        "threadId": thread_id,
+        "runId": "run-1",
+        "state": {},
+        "messages": [],
+        "tools": [],
+        "context": [],
+        "forwardedProps": {},
+    }
+
+
+def exiting_crew(topic):  # pylint: disable=unused-argument
+    # What crewai's crew chat tool does when the crew fails
+    sys.exit(1)
+
+
+def event_types(response):
+    return [
+        line.split('"type":"')[1].split('"')[0]
+        for line in response.text.splitlines()
+        if line.startswith("data:")
+    ]
+
+
+class TestEventQueue(unittest.IsolatedAsyncioTestCase):
+
+    async def test_items_from_worker_threads_reach_the_loop_in_order(self):
+        queue = EventQueue()
+        worker = threading.Thread(target=lambda: [queue.put_nowait(i) for i in range(100)])
+
+        worker.start()
+        received = [await asyncio.wait_for(queue.get(), timeout=1) for _ in range(100)]
+        worker.join()
+
+        self.assertEqual(received, list(range(100)))
+
+    async def test_waiting_loop_is_woken_by_a_worker_thread(self):
+        queue = EventQueue()
+        getter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        # The loop is idle in select() by the time the item arrives
+        worker = threading.Timer(0.05, queue.put_nowait, args=["item"])
+
+        started = time.monotonic()
+        worker.start()
+        item = await asyncio.wait_for(getter, timeout=5)
+        worker.join()
+
+        self.assertEqual(item, "item")
+        self.assertLess(time.monotonic() - started, 1)
+
+    async def test_items_from_the_loop_are_queued_directly(self):
+        queue = EventQueue()
+
+        queue.put_nowait("item")
+
+        self.assertEqual(queue.get_nowait(), "item")
+
+
+class TestRunCrew(unittest.IsolatedAsyncioTestCase):
+
+    async def test_crews_run_on_the_pool_with_the_callers_context(self):
+        flow = object()
+        token = flow_context.set(flow)
+        try:
+            thread_name, running_flow = await crews.run_crew(
+                lambda: (threading.current_thread().name, flow_context.get(None))
+            )
+        finally:
+            flow_context.reset(token)
+
+        self.assertTrue(thread_name.startswith("crew"))
+        self.assertIs(running_flow, flow)
+
+    async def test_exiting_crew_raises_runtime_error(self):
+        with self.assertRaises(RuntimeError) as caught:
+            await crews.run_crew(exiting_crew, topic="otters")
+
+        self.assertIsInstance(caught.exception.__cause__, SystemExit)
+
+
+class TestMaxConcurrentCrews(unittest.TestCase):
+
+    def test_default(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop("AGUI_CREWAI_MAX_CONCURRENT_CREWS", None)
+            self.assertEqual(crews.max_concurrent_crews_from_env(), 4)
+
+    def test_invalid_values_are_rejected(self):
+        for value in ["0", "-2", "four", ""]:
+            with self.subTest(value=value), \
+                    mock.patch.dict(os.environ, {"AGUI_CREWAI_MAX_CONCURRENT_CREWS": value}):
+                with self.assertRaises(ValueError):
+                    crews.max_concurrent_crews_from_env()
+
+
+class FailingFlow(Flow):
+    @start()
+    async def chat(self):
+        await crews.run_crew(exiting_crew, topic="otters")
+
+
+class TestFailedKickoff(unittest.IsolatedAsyncioTestCase):
+
+    async def test_failed_flow_ends_the_stream_with_run_error(self):
+        app = FastAPI()
+        add_crewai_flow_fastapi_endpoint(app, FailingFlow(), "/")
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await asyncio.wait_for(client.post("/", json=run_input()), timeout=10)
+
+        types = event_types(response)
+        self.assertEqual(types[0], "RUN_STARTED")
+        self.assertEqual(types[-1], "RUN_ERROR")
+        self.assertNotIn("RUN_FINISHED", types)
+        self.assertIn("An error occurred while running the crew", response.text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,160 @@
+"""
+Tests for the per-request copies of a crew chat flow.
+
+Run as a script to measure request setup time and memory per request:
+
+    python -m tests.test_flow_factory
+"""
+import copy
+import gc
+import time
+import tracemalloc
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from crewai import LLM, Agent, Crew, Task
+from crewai.cli.crew_chat import ChatInputField, ChatInputs
+
+from ag_ui_crewai import crews
+from ag_ui_crewai.endpoint import flow_factory
+
+
+class ResearchCrew:
+    """A crew definition in the shape @CrewBase classes have."""
+
+    name = "research_crew"
+
+    def __init__(self, agent_count=1):
+        self.agent_count = agent_count
+
+    def crew(self):
+        agents = [
+            Agent(
+                role=f"Researcher {i}",
+                goal="Find facts about {topic}",
+                backstory="An experienced analyst. " * 50,
+                llm=LLM(model="gpt-4o-mini"),
+            )
+            for i in range(self.agent_count)
+        ]
+        tasks = [
+            Task(description="Research {topic}. " * 30, expected_output="A report", agent=agent)
+            for agent in agents
+        ]
+        return Crew(agents=agents, tasks=tasks, chat_llm="gpt-4o-mini")
+
+
+def chat_inputs(crew, crew_name, chat_llm):  # pylint: disable=unused-argument
+    # The real one asks the chat LLM to describe the crew
+    return ChatInputs(
+        crew_name=crew_name,
+        crew_description="Researches topics",
+        inputs=[ChatInputField(name="topic", description="The topic")],
+    )
+
+
+def make_flow(agent_count=1):
+    with mock.patch.object(crews, "crew_chat_generate_crew_chat_inputs", chat_inputs):
+        return crews.ChatWithCrewFlow(crew=ResearchCrew(agent_count))
+
+
+def crew_tool_call_response(crew_name):
+    message = {
+        "role": "assistant",
+        "content": "",
+        "tool_calls": [{
+            "id": "call-1",
+            "type": "function",
+            "function": {"name": crew_name, "arguments": '{"topic": "otters"}'},
+        }],
+    }
+    return SimpleNamespace(choices=[{"message": message}])
+
+
+class TestFlowFactory(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        crews._CREW_INPUTS_CACHE.clear()  # pylint: disable=protected-access
+        cls.prototype = make_flow()
+
+    def test_copies_share_read_only_attributes(self):
+        create_flow = flow_factory(self.prototype)
+        first, second = create_flow(), create_flow()
+
+        self.assertIsNot(first, second)
+        for name in crews.ChatWithCrewFlow.shared_attributes:
+            with self.subTest(attribute=name):
+                self.assertIs(getattr(first, name), getattr(self.prototype, name))
+                self.assertIs(getattr(second, name), getattr(self.prototype, name))
+
+    def test_copies_have_separate_state(self):
+        create_flow = flow_factory(self.prototype)
+        first, second = create_flow(), create_flow()
+
+        first.state["messages"] = [{"role": "user", "content": "hi"}]
+
+        self.assertIsNot(first.state, second.state)
+        self.assertNotIn("messages", second.state)
+        self.assertNotIn("messages", self.prototype.state)
+
+    def test_factories_are_returned_unchanged(self):
+        def create_flow():
+            return copy.deepcopy(self.prototype)
+
+        self.assertIs(flow_factory(create_flow), create_flow)
+
+
+class TestChatRunsACrewCopy(unittest.IsolatedAsyncioTestCase):
+
+    async def test_chat_runs_a_copy_of_the_shared_crew(self):
+        crews._CREW_INPUTS_CACHE.clear()  # pylint: disable=protected-access
+        flow = flow_factory(make_flow())()
+        flow.state["messages"] = [{"role": "user", "content": "research otters", "id": "user-1"}]
+        flow.state["copilotkit"] = {"actions": []}
+        run_copies = []
+
+        def create_tool_function(crew, messages):  # pylint: disable=unused-argument
+            run_copies.append(crew)
+            return lambda topic: f"report on {topic}"
+
+        async def stream(response):
+            return response
+
+        with mock.patch.object(crews, "completion", return_value=crew_tool_call_response(flow.crew_name)), \
+                mock.patch.object(crews, "copilotkit_stream", stream), \
+                mock.patch.object(crews, "crew_chat_create_tool_function", create_tool_function):
+            await flow.chat()
+
+        self.assertEqual(len(run_copies), 1)
+        self.assertIsNot(run_copies[0], flow.crew)
+        self.assertEqual([agent.role for agent in run_copies[0].agents], [agent.role for agent in flow.crew.agents])
+        self.assertEqual(flow.state["outputs"], "report on otters")
+
+
+def benchmark(agent_count, requests=200):
+    """Seconds and bytes of request setup per request."""
+    create_flow = flow_factory(make_flow(agent_count))
+    for _ in range(5):
+        create_flow()
+    started = time.perf_counter()
+    for _ in range(requests):
+        create_flow()
+    elapsed = (time.perf_counter() - started) / requests
+
+    kept_count = 20
+    gc.collect()
+    tracemalloc.start()
+    kept = [create_flow() for _ in range(kept_count)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return elapsed, allocated / kept_count
+
+
+if __name__ == "__main__":
+    for count in (1, 4, 16):
+        crews._CREW_INPUTS_CACHE.clear()  # pylint: disable=protected-access
+        seconds, size = benchmark(count)
+        print(f"{count:>2} agents: {seconds * 1e3:.3f} ms / {size / 1024:.1f} KiB per request")
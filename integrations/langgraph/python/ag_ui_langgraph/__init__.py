@@ -1,7 +1,10 @@
-from .agent import LangGraphAgent
+from .agent import LangGraphAgent, RunContext
+from .checkpoint_index import MessageCheckpointIndex
 from .types import (
     LangGraphEventTypes,
     CustomEventNames,
+    RawEventPolicy,
+    StateUpdateMode,
     State,
     SchemaKeys,
     MessageInProgress,
@@ -18,8 +21,12 @@ from .endpoint import add_langgraph_fastapi_endpoint
 
 __all__ = [
     "LangGraphAgent",
+    "RunContext",
+    "MessageCheckpointIndex",
     "LangGraphEventTypes",
     "CustomEventNames",
+    "RawEventPolicy",
+    "StateUpdateMode",
     "State",
     "SchemaKeys",
     "MessageInProgress",
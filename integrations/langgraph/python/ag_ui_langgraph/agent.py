@@ -1,7 +1,10 @@
 import uuid
 import json
-from typing import Optional, List, Any, Union, AsyncGenerator, Generator, Literal, Dict
+import warnings
+from contextvars import ContextVar
+from typing import Optional, List, Any, Union, AsyncGenerator, Generator, Literal, Dict, FrozenSet, Iterable, Set, Tuple
 import inspect
+from contextlib import aclosing
 
 from langgraph.graph.state import CompiledStateGraph
 
@@ -24,14 +27,26 @@ from .types import (
     RunMetadata,
     LangGraphEventTypes,
     CustomEventNames,
-    LangGraphReasoning
+    LangGraphReasoning,
+    RawEventPolicy,
+    StateUpdateMode,
+)
+from .checkpoint_index import (
+    MessageCheckpointIndex,
+    get_checkpoint_index,
+    snapshot_checkpoint_id,
+    snapshot_message_ids,
+    snapshot_parent_checkpoint_id,
 )
 from .utils import (
+    agui_message_to_langchain,
     agui_messages_to_langchain,
     DEFAULT_SCHEMA_KEYS,
     filter_object_by_schema_keys,
     get_stream_payload_input,
     langchain_messages_to_agui,
+    MessageConversionCache,
+    tools_to_dicts,
     resolve_reasoning_content,
     resolve_message_content,
     camel_to_snake,
@@ -86,224 +101,439 @@ ProcessedEvents = Union[
     StepFinishedEvent,
 ]
 
+class RunContext:
+    """
+    Mutable state of a single LangGraphAgent run.
+
+    A new context is created for every call to `run`, so one agent instance can
+    serve any number of concurrent streams without sharing node/step tracking
+    or messages in progress.
+    """
+
+    def __init__(self, active_run: RunMetadata):
+        self.active_run = active_run
+        self.messages_in_process: MessagesInProgressRecord = {}
+        self.stream_events_seen = 0
+        # Per-key state versions, bumped from on_chain_end outputs, and the
+        # versions last sent to the client (None until a snapshot went out)
+        self.state_versions: Dict[str, int] = {}
+        self.emitted_state_versions: Optional[Dict[str, int]] = None
+        self.state_value_sizes: Dict[str, Tuple[int, int]] = {}
+        # Subgraphs whose inner events are translated (None: all of them), and
+        # the decision made for each checkpoint namespace seen so far
+        self.subgraph_namespaces: Optional[FrozenSet[str]] = None
+        self.namespace_decisions: Dict[str, bool] = {}
+
+    def bump_state_versions(self, keys) -> None:
+        for key in keys:
+            self.state_versions[key] = self.state_versions.get(key, 0) + 1
+
+    def should_translate(self, event: Any) -> bool:
+        if self.subgraph_namespaces is None:
+            return True
+        checkpoint_ns = event.get("metadata", {}).get("langgraph_checkpoint_ns")
+        if not checkpoint_ns or "|" not in checkpoint_ns:
+            # Root graph event
+            return True
+
+        decision = self.namespace_decisions.get(checkpoint_ns)
+        if decision is None:
+            # "outer:<task>|inner:<task>": every segment but the last names a
+            # node running a subgraph
+            path = [segment.split(":", 1)[0] for segment in checkpoint_ns.split("|")[:-1]]
+            decision = any("|".join(path[:depth]) in self.subgraph_namespaces for depth in range(1, len(path) + 1))
+            self.namespace_decisions[checkpoint_ns] = decision
+        return decision
+
+    def get_message_in_progress(self, run_id: str) -> Optional[MessageInProgress]:
+        return self.messages_in_process.get(run_id)
+
+    def clear_message_in_progress(self, run_id: str) -> None:
+        self.messages_in_process.pop(run_id, None)
+
+    def close(self) -> None:
+        """Release everything held for the run; called when its stream ends."""
+        self.messages_in_process.clear()
+        self.state_versions.clear()
+        self.emitted_state_versions = None
+        self.state_value_sizes.clear()
+        self.namespace_decisions.clear()
+        self.active_run.clear()
+
+    def set_message_in_progress(self, run_id: str, data: MessageInProgress):
+        current_message_in_progress = self.messages_in_process.get(run_id, {})
+        self.messages_in_process[run_id] = {
+            **current_message_in_progress,
+            **data,
+        }
+
+
+# Context of the run being streamed in the current task; only used to back the
+# deprecated agent-level accessors (active_run, messages_in_process, ...)
+_current_run: ContextVar[Optional[RunContext]] = ContextVar("ag_ui_langgraph_current_run", default=None)
+
+
+def _deprecated(name: str) -> None:
+    warnings.warn(
+        f"LangGraphAgent.{name} is deprecated: per-run state now lives in the RunContext "
+        "passed to the agent's methods",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
 class LangGraphAgent:
-    def __init__(self, *, name: str, graph: CompiledStateGraph, description: Optional[str] = None, config:  Union[Optional[RunnableConfig], dict] = None):
+    def __init__(
+        self,
+        *,
+        name: str,
+        graph: CompiledStateGraph,
+        description: Optional[str] = None,
+        config:  Union[Optional[RunnableConfig], dict] = None,
+        raw_event_policy: Union[RawEventPolicy, str] = RawEventPolicy.Full,
+        raw_event_sample_every: int = 10,
+        attach_raw_events: bool = False,
+        state_update_mode: Union[StateUpdateMode, str] = StateUpdateMode.Snapshot,
+        subgraph_namespaces: Optional[Iterable[str]] = None,
+    ):
+        """
+        :param raw_event_policy: Which LangGraph events are forwarded as RAW events:
+            "off", "lifecycle" (everything except token/chunk stream events),
+            "sampled" (lifecycle events plus every `raw_event_sample_every`-th
+            stream event) or "full".
+        :param attach_raw_events: Whether derived events (text, tool call, state...)
+            carry the originating LangGraph event in `raw_event`.
+        :param state_update_mode: "snapshot" emits a full STATE_SNAPSHOT on every
+            state change; "delta" emits JSON Patch STATE_DELTA events for the keys
+            changed since the last emission, falling back to a snapshot for the
+            first emission of a run or when the patch would be larger.
+        :param subgraph_namespaces: Subgraphs whose inner events are translated, as
+            "|"-separated paths of the nodes running them (e.g. "research" or
+            "research|search"); events of the root graph are always translated.
+            None translates every event. Can be overridden per request by passing
+            a list as the `stream_subgraphs` forwarded prop.
+        """
+        if raw_event_sample_every < 1:
+            raise ValueError("raw_event_sample_every must be at least 1")
+
         self.name = name
         self.description = description
         self.graph = graph
         self.config = config or {}
-        self.messages_in_process: MessagesInProgressRecord = {}
-        self.active_run: Optional[RunMetadata] = None
         self.constant_schema_keys = ['messages', 'tools']
+        self.raw_event_policy = RawEventPolicy(raw_event_policy)
+        self.raw_event_sample_every = raw_event_sample_every
+        self.attach_raw_events = attach_raw_events
+        self.state_update_mode = StateUpdateMode(state_update_mode)
+        self.subgraph_namespaces = frozenset(subgraph_namespaces) if subgraph_namespaces is not None else None
+        self._message_conversion_cache = MessageConversionCache()
+
+        # Contexts of the runs currently streaming; each is removed and closed
+        # when its stream completes, fails or is cancelled
+        self._active_runs: Set[RunContext] = set()
+
+        # LangGraph event type -> translation handler
+        self._event_handlers = {
+            LangGraphEventTypes.OnChatModelStream.value: self._handle_chat_model_stream,
+            LangGraphEventTypes.OnChatModelEnd.value: self._handle_chat_model_end,
+            LangGraphEventTypes.OnCustomEvent.value: self._handle_custom_event,
+            LangGraphEventTypes.OnToolEnd.value: self._handle_tool_end,
+        }
+
+        # Graph introspection results, memoized per graph (see invalidate_graph_cache)
+        self._cached_graph: Optional[CompiledStateGraph] = None
+        self._schema_keys_cache: Dict[Tuple[str, ...], SchemaKeys] = {}
+        self._stream_supports_context: Optional[bool] = None
+
+    @property
+    def active_run_count(self) -> int:
+        """Number of runs whose streams have not finished yet."""
+        return len(self._active_runs)
+
+    def _deprecated_current_run(self) -> Optional[RunContext]:
+        run = _current_run.get()
+        if run is not None and run in self._active_runs:
+            return run
+        # Outside of a stream (e.g. from another task), only unambiguous when a
+        # single run is in progress
+        if len(self._active_runs) == 1:
+            return next(iter(self._active_runs))
+        return None
+
+    @property
+    def active_run(self) -> Optional[RunMetadata]:
+        """Deprecated: use `RunContext.active_run`."""
+        _deprecated("active_run")
+        run = self._deprecated_current_run()
+        return run.active_run if run is not None else None
+
+    @active_run.setter
+    def active_run(self, value: RunMetadata) -> None:
+        _deprecated("active_run")
+        run = self._deprecated_current_run()
+        if run is not None:
+            run.active_run = value
+
+    @property
+    def messages_in_process(self) -> MessagesInProgressRecord:
+        """Deprecated: use `RunContext.messages_in_process`."""
+        _deprecated("messages_in_process")
+        run = self._deprecated_current_run()
+        return run.messages_in_process if run is not None else {}
+
+    def get_message_in_progress(self, run_id: str) -> Optional[MessageInProgress]:
+        """Deprecated: use `RunContext.get_message_in_progress`."""
+        _deprecated("get_message_in_progress")
+        run = self._deprecated_current_run()
+        return run.get_message_in_progress(run_id) if run is not None else None
+
+    def set_message_in_progress(self, run_id: str, data: MessageInProgress):
+        """Deprecated: use `RunContext.set_message_in_progress`."""
+        _deprecated("set_message_in_progress")
+        run = self._deprecated_current_run()
+        if run is not None:
+            run.set_message_in_progress(run_id, data)
 
     def _dispatch_event(self, event: ProcessedEvents) -> str:
         if event.type == EventType.RAW:
             event.event = make_json_safe(event.event)
-        elif event.raw_event:
-            event.raw_event = make_json_safe(event.raw_event)
+        elif event.raw_event is not None:
+            event.raw_event = make_json_safe(event.raw_event) if self.attach_raw_events else None
 
         return event
 
+    def should_emit_raw_event(self, run: RunContext, event: Any) -> bool:
+        policy = self.raw_event_policy
+        if policy == RawEventPolicy.Full:
+            return True
+        if policy == RawEventPolicy.Off:
+            return False
+
+        if not event.get("event", "").endswith("_stream"):
+            return True
+        if policy == RawEventPolicy.Lifecycle:
+            return False
+
+        run.stream_events_seen += 1
+        return (run.stream_events_seen - 1) % self.raw_event_sample_every == 0
+
     async def run(self, input: RunAgentInput) -> AsyncGenerator[str, None]:
         forwarded_props = {}
         if hasattr(input, "forwarded_props") and input.forwarded_props:
             forwarded_props = {
                 camel_to_snake(k): v for k, v in input.forwarded_props.items()
             }
-        async for event_str in self._handle_stream_events(input.copy(update={"forwarded_props": forwarded_props})):
-            yield event_str
+        # aclosing: a cancelled consumer must still run the inner stream's cleanup
+        async with aclosing(self._handle_stream_events(input.copy(update={"forwarded_props": forwarded_props}))) as stream:
+            async for event_str in stream:
+                yield event_str
 
     async def _handle_stream_events(self, input: RunAgentInput) -> AsyncGenerator[str, None]:
         thread_id = input.thread_id or str(uuid.uuid4())
-        INITIAL_ACTIVE_RUN = {
+        run = RunContext({
             "id": input.run_id,
             "thread_id": thread_id,
             "thinking_process": None,
             "node_name": None,
             "has_function_streaming": False,
-        }
-        self.active_run = INITIAL_ACTIVE_RUN
+        })
+        self._active_runs.add(run)
+        _current_run.set(run)
 
-        forwarded_props = input.forwarded_props
-        node_name_input = forwarded_props.get('node_name', None) if forwarded_props else None
+        try:
+            forwarded_props = input.forwarded_props
+            node_name_input = forwarded_props.get('node_name', None) if forwarded_props else None
 
-        self.active_run["manually_emitted_state"] = None
+            run.active_run["manually_emitted_state"] = None
 
-        config = ensure_config(self.config.copy() if self.config else {})
-        config["configurable"] = {**(config.get('configurable', {})), "thread_id": thread_id}
+            config = ensure_config(self.config.copy() if self.config else {})
+            config["configurable"] = {**(config.get('configurable', {})), "thread_id": thread_id}
 
-        agent_state = await self.graph.aget_state(config)
-        resume_input = forwarded_props.get('command', {}).get('resume', None)
+            agent_state = await self.graph.aget_state(config)
+            resume_input = forwarded_props.get('command', {}).get('resume', None)
 
-        if resume_input is None and thread_id and self.active_run.get("node_name") != "__end__" and self.active_run.get("node_name"):
-            self.active_run["mode"] = "continue"
-        else:
-            self.active_run["mode"] = "start"
+            if resume_input is None and thread_id and run.active_run.get("node_name") != "__end__" and run.active_run.get("node_name"):
+                run.active_run["mode"] = "continue"
+            else:
+                run.active_run["mode"] = "start"
 
-        prepared_stream_response = await self.prepare_stream(input=input, agent_state=agent_state, config=config)
+            prepared_stream_response = await self.prepare_stream(input=input, agent_state=agent_state, config=config, run=run)
 
-        yield self._dispatch_event(
-            RunStartedEvent(type=EventType.RUN_STARTED, thread_id=thread_id, run_id=self.active_run["id"])
-        )
-        self.handle_node_change(node_name_input)
+            yield self._dispatch_event(
+                RunStartedEvent(type=EventType.RUN_STARTED, thread_id=thread_id, run_id=run.active_run["id"])
+            )
+            self.handle_node_change(run, node_name_input)
 
-        # In case of resume (interrupt), re-start resumed step
-        if resume_input and self.active_run.get("node_name"):
-            for ev in self.handle_node_change(self.active_run.get("node_name")):
-                yield ev
+            # In case of resume (interrupt), re-start resumed step
+            if resume_input and run.active_run.get("node_name"):
+                for ev in self.handle_node_change(run, run.active_run.get("node_name")):
+                    yield ev
 
-        state = prepared_stream_response["state"]
-        stream = prepared_stream_response["stream"]
-        config = prepared_stream_response["config"]
-        events_to_dispatch = prepared_stream_response.get('events_to_dispatch', None)
+            state = prepared_stream_response["state"]
+            stream = prepared_stream_response["stream"]
+            config = prepared_stream_response["config"]
+            events_to_dispatch = prepared_stream_response.get('events_to_dispatch', None)
 
-        if events_to_dispatch is not None and len(events_to_dispatch) > 0:
-            for event in events_to_dispatch:
-                yield self._dispatch_event(event)
-            return
+            if events_to_dispatch is not None and len(events_to_dispatch) > 0:
+                for event in events_to_dispatch:
+                    yield self._dispatch_event(event)
+                return
 
-        should_exit = False
-        current_graph_state = state
+            should_exit = False
+            current_graph_state = state
         
-        async for event in stream:
-            subgraphs_stream_enabled = input.forwarded_props.get('stream_subgraphs') if input.forwarded_props else False
-            is_subgraph_stream = (subgraphs_stream_enabled and (
-                event.get("event", "").startswith("events") or 
-                event.get("event", "").startswith("values")
-            ))
-            if event["event"] == "error":
-                yield self._dispatch_event(
-                    RunErrorEvent(type=EventType.RUN_ERROR, message=event["data"]["message"], raw_event=event)
-                )
-                break
-
-            current_node_name = event.get("metadata", {}).get("langgraph_node")
-            event_type = event.get("event")
-            self.active_run["id"] = event.get("run_id")
-            exiting_node = False
-
-            if event_type == "on_chain_end" and isinstance(
-                    event.get("data", {}).get("output"), dict
-            ):
-                current_graph_state.update(event["data"]["output"])
-                exiting_node = self.active_run["node_name"] == current_node_name
-
-            should_exit = should_exit or (
-                    event_type == "on_custom_event" and
-                    event["name"] == "exit"
-                )
+            run.subgraph_namespaces = self.get_subgraph_namespaces(input)
 
-            if current_node_name and current_node_name != self.active_run.get("node_name"):
-                for ev in self.handle_node_change(current_node_name):
-                    yield ev
+            async for event in stream:
+                event_type = event.get("event")
+                if event_type == "error":
+                    yield self._dispatch_event(
+                        RunErrorEvent(type=EventType.RUN_ERROR, message=event["data"]["message"], raw_event=event)
+                    )
+                    break
 
-            updated_state = self.active_run.get("manually_emitted_state") or current_graph_state
-            has_state_diff = updated_state != state
-            if exiting_node or (has_state_diff and not self.get_message_in_progress(self.active_run["id"])):
-                state = updated_state
-                self.active_run["prev_node_name"] = self.active_run["node_name"]
-                current_graph_state.update(updated_state)
-                yield self._dispatch_event(
-                    StateSnapshotEvent(
-                        type=EventType.STATE_SNAPSHOT,
-                        snapshot=self.get_state_snapshot(state),
-                        raw_event=event,
+                if not run.should_translate(event):
+                    continue
+
+                current_node_name = event.get("metadata", {}).get("langgraph_node")
+                run.active_run["id"] = event.get("run_id")
+                exiting_node = False
+
+                if event_type == "on_chain_end" and isinstance(
+                        event.get("data", {}).get("output"), dict
+                ):
+                    current_graph_state.update(event["data"]["output"])
+                    run.bump_state_versions(event["data"]["output"].keys())
+                    exiting_node = run.active_run["node_name"] == current_node_name
+
+                should_exit = should_exit or (
+                        event_type == "on_custom_event" and
+                        event["name"] == "exit"
                     )
-                )
 
-            yield self._dispatch_event(
-                RawEvent(type=EventType.RAW, event=event)
-            )
+                if current_node_name and current_node_name != run.active_run.get("node_name"):
+                    for ev in self.handle_node_change(run, current_node_name):
+                        yield ev
+
+                updated_state = run.active_run.get("manually_emitted_state") or current_graph_state
+                has_state_diff = updated_state is not state and updated_state != state
+                if exiting_node or (has_state_diff and not run.get_message_in_progress(run.active_run["id"])):
+                    state = updated_state
+                    run.active_run["prev_node_name"] = run.active_run["node_name"]
+                    if updated_state is not current_graph_state:
+                        run.bump_state_versions(updated_state.keys())
+                    current_graph_state.update(updated_state)
+                    state_event = self.get_state_update_event(run, state, raw_event=event)
+                    if state_event is not None:
+                        yield self._dispatch_event(state_event)
+
+                if self.should_emit_raw_event(run, event):
+                    yield self._dispatch_event(
+                        RawEvent(type=EventType.RAW, event=event)
+                    )
 
-            async for single_event in self._handle_single_event(event, state):
-                yield single_event
+                async for single_event in self._handle_single_event(run, event, state):
+                    yield single_event
 
-        state = await self.graph.aget_state(config)
+            state = await self.graph.aget_state(config)
 
-        tasks = state.tasks if len(state.tasks) > 0 else None
-        interrupts = tasks[0].interrupts if tasks else []
+            tasks = state.tasks if len(state.tasks) > 0 else None
+            interrupts = tasks[0].interrupts if tasks else []
 
-        writes = state.metadata.get("writes", {}) or {}
-        node_name = self.active_run["node_name"] if interrupts else next(iter(writes), None)
-        next_nodes = state.next or ()
-        is_end_node = len(next_nodes) == 0 and not interrupts
+            writes = state.metadata.get("writes", {}) or {}
+            node_name = run.active_run["node_name"] if interrupts else next(iter(writes), None)
+            next_nodes = state.next or ()
+            is_end_node = len(next_nodes) == 0 and not interrupts
 
-        node_name = "__end__" if is_end_node else node_name
+            node_name = "__end__" if is_end_node else node_name
 
-        for interrupt in interrupts:
+            for interrupt in interrupts:
+                yield self._dispatch_event(
+                    CustomEvent(
+                        type=EventType.CUSTOM,
+                        name=LangGraphEventTypes.OnInterrupt.value,
+                        value=dump_json_safe(interrupt.value),
+                        raw_event=interrupt,
+                    )
+                )
+
+            if run.active_run.get("node_name") != node_name:
+                for ev in self.handle_node_change(run, node_name):
+                    yield ev
+
+            state_values = state.values if state.values else state
             yield self._dispatch_event(
-                CustomEvent(
-                    type=EventType.CUSTOM,
-                    name=LangGraphEventTypes.OnInterrupt.value,
-                    value=dump_json_safe(interrupt.value),
-                    raw_event=interrupt,
+                StateSnapshotEvent(type=EventType.STATE_SNAPSHOT, snapshot=self.get_state_snapshot(state_values, run))
+            )
+
+            yield self._dispatch_event(
+                MessagesSnapshotEvent(
+                    type=EventType.MESSAGES_SNAPSHOT,
+                    messages=self.get_messages_snapshot(state_values.get("messages", [])),
                 )
             )
 
-        if self.active_run.get("node_name") != node_name:
-            for ev in self.handle_node_change(node_name):
+            for ev in self.handle_node_change(run, None):
                 yield ev
 
-        state_values = state.values if state.values else state
-        yield self._dispatch_event(
-            StateSnapshotEvent(type=EventType.STATE_SNAPSHOT, snapshot=self.get_state_snapshot(state_values))
-        )
-
-        yield self._dispatch_event(
-            MessagesSnapshotEvent(
-                type=EventType.MESSAGES_SNAPSHOT,
-                messages=langchain_messages_to_agui(state_values.get("messages", [])),
+            yield self._dispatch_event(
+                RunFinishedEvent(type=EventType.RUN_FINISHED, thread_id=thread_id, run_id=run.active_run["id"])
             )
-        )
 
-        for ev in self.handle_node_change(None):
-            yield ev
-
-        yield self._dispatch_event(
-            RunFinishedEvent(type=EventType.RUN_FINISHED, thread_id=thread_id, run_id=self.active_run["id"])
-        )
-        # Reset active run to how it was before the stream started
-        self.active_run = INITIAL_ACTIVE_RUN
+        finally:
+            self._active_runs.discard(run)
+            if _current_run.get() is run:
+                _current_run.set(None)
+            run.close()
 
 
-    async def prepare_stream(self, input: RunAgentInput, agent_state: State, config: RunnableConfig):
+    async def prepare_stream(self, input: RunAgentInput, agent_state: State, config: RunnableConfig, run: RunContext):
         state_input = input.state or {}
         messages = input.messages or []
         forwarded_props = input.forwarded_props or {}
         thread_id = input.thread_id
 
-        state_input["messages"] = agent_state.values.get("messages", [])
-        self.active_run["current_graph_state"] = agent_state.values.copy()
-        langchain_messages = agui_messages_to_langchain(messages)
+        existing_messages = agent_state.values.get("messages", [])
+        state_input["messages"] = existing_messages
+        run.active_run["current_graph_state"] = agent_state.values.copy()
+        # Only messages the thread doesn't have yet are converted; the merge would
+        # drop the others by ID. A leading system message is kept for the merge to strip.
+        existing_message_ids = {message.id for message in existing_messages}
+        langchain_messages = agui_messages_to_langchain([
+            message for index, message in enumerate(messages)
+            if message.id not in existing_message_ids or (index == 0 and message.role == "system")
+        ])
         state = self.langgraph_default_merge_state(state_input, langchain_messages, input)
-        self.active_run["current_graph_state"].update(state)
+        run.active_run["current_graph_state"].update(state)
         config["configurable"]["thread_id"] = thread_id
         interrupts = agent_state.tasks[0].interrupts if agent_state.tasks and len(agent_state.tasks) > 0 else []
         has_active_interrupts = len(interrupts) > 0
         resume_input = forwarded_props.get('command', {}).get('resume', None)
 
-        self.active_run["schema_keys"] = self.get_schema_keys(config)
+        run.active_run["schema_keys"] = self.get_schema_keys(config)
 
-        non_system_messages = [msg for msg in langchain_messages if not isinstance(msg, SystemMessage)]
-        if len(agent_state.values.get("messages", [])) > len(non_system_messages):
+        # Regenerate/edit detection looks at the full client history
+        non_system_message_count = sum(1 for message in messages if message.role != "system")
+        if len(existing_messages) > non_system_message_count:
             # Find the last user message by working backwards from the last message
             last_user_message = None
-            for i in range(len(langchain_messages) - 1, -1, -1):
-                if isinstance(langchain_messages[i], HumanMessage):
-                    last_user_message = langchain_messages[i]
+            for i in range(len(messages) - 1, -1, -1):
+                if messages[i].role == "user":
+                    last_user_message = agui_message_to_langchain(messages[i])
                     break
 
             if last_user_message:
                 return await self.prepare_regenerate_stream(
                     input=input,
                     message_checkpoint=last_user_message,
-                    config=config
+                    config=config,
+                    run=run,
                 )
 
         events_to_dispatch = []
         if has_active_interrupts and not resume_input:
             events_to_dispatch.append(
-                RunStartedEvent(type=EventType.RUN_STARTED, thread_id=thread_id, run_id=self.active_run["id"])
+                RunStartedEvent(type=EventType.RUN_STARTED, thread_id=thread_id, run_id=run.active_run["id"])
             )
 
             for interrupt in interrupts:
@@ -317,7 +547,7 @@ class LangGraphAgent:
                 )
 
             events_to_dispatch.append(
-                RunFinishedEvent(type=EventType.RUN_FINISHED, thread_id=thread_id, run_id=self.active_run["id"])
+                RunFinishedEvent(type=EventType.RUN_FINISHED, thread_id=thread_id, run_id=run.active_run["id"])
             )
             return {
                 "stream": None,
@@ -326,16 +556,16 @@ class LangGraphAgent:
                 "events_to_dispatch": events_to_dispatch,
             }
 
-        if self.active_run["mode"] == "continue":
-            await self.graph.aupdate_state(config, state, as_node=self.active_run.get("node_name"))
+        if run.active_run["mode"] == "continue":
+            await self.graph.aupdate_state(config, state, as_node=run.active_run.get("node_name"))
 
         if resume_input:
             stream_input = Command(resume=resume_input)
         else:
             payload_input = get_stream_payload_input(
-                mode=self.active_run["mode"],
+                mode=run.active_run["mode"],
                 state=state,
-                schema_keys=self.active_run["schema_keys"],
+                schema_keys=run.active_run["schema_keys"],
             )
             stream_input = {**forwarded_props, **payload_input} if payload_input else None
 
@@ -361,7 +591,8 @@ class LangGraphAgent:
             self,
             input: RunAgentInput,
             message_checkpoint: HumanMessage,
-            config: RunnableConfig
+            config: RunnableConfig,
+            run: RunContext,
     ):
         tools = input.tools or []
         thread_id = input.thread_id
@@ -393,17 +624,43 @@ class LangGraphAgent:
             "config": config
         }
 
-    def get_message_in_progress(self, run_id: str) -> Optional[MessageInProgress]:
-        return self.messages_in_process.get(run_id)
+    def invalidate_graph_cache(self) -> None:
+        """
+        Drop memoized schema keys and stream signature introspection.
 
-    def set_message_in_progress(self, run_id: str, data: MessageInProgress):
-        current_message_in_progress = self.messages_in_process.get(run_id, {})
-        self.messages_in_process[run_id] = {
-            **current_message_in_progress,
-            **data,
-        }
+        Call this after mutating the compiled graph or its schemas in place;
+        replacing `self.graph` invalidates the cache automatically.
+        """
+        self._cached_graph = self.graph
+        self._schema_keys_cache = {}
+        self._stream_supports_context = None
+
+    def _ensure_graph_cache(self) -> None:
+        if self._cached_graph is not self.graph:
+            self.invalidate_graph_cache()
+
+    def warm_up(self, config: Optional[RunnableConfig] = None) -> None:
+        """
+        Precompute graph introspection (JSON schemas, stream signature) so the first
+        request does not pay for it. Uses the agent's config unless one is given.
+        """
+        config = ensure_config((config if config is not None else self.config).copy())
+        config["configurable"] = {**(config.get("configurable", {})), "thread_id": ""}
+        self.get_schema_keys(config)
+        self.get_stream_kwargs(input=None, config=config)
 
     def get_schema_keys(self, config) -> SchemaKeys:
+        self._ensure_graph_cache()
+        configurable = config.get("configurable", {}) if isinstance(config, dict) else {}
+        config_shape = tuple(sorted(configurable)) if isinstance(configurable, dict) else ()
+
+        schema_keys = self._schema_keys_cache.get(config_shape)
+        if schema_keys is None:
+            schema_keys = self._compute_schema_keys(config)
+            self._schema_keys_cache[config_shape] = schema_keys
+        return {**schema_keys}
+
+    def _compute_schema_keys(self, config) -> SchemaKeys:
         try:
             input_schema = self.graph.get_input_jsonschema(config)
             output_schema = self.graph.get_output_jsonschema(config)
@@ -442,16 +699,7 @@ class LangGraphAgent:
 
         new_messages = [msg for msg in messages if msg.id not in existing_message_ids]
 
-        tools = input.tools or []
-        tools_as_dicts = []
-        if tools:
-            for tool in tools:
-                if hasattr(tool, "model_dump"):
-                    tools_as_dicts.append(tool.model_dump())
-                elif hasattr(tool, "dict"):
-                    tools_as_dicts.append(tool.dict())
-                else:
-                    tools_as_dicts.append(tool)
+        tools_as_dicts = tools_to_dicts(input.tools or [])
 
         all_tools = [*state.get("tools", []), *tools_as_dicts]
 
@@ -477,303 +725,371 @@ class LangGraphAgent:
             }
         }
 
-    def get_state_snapshot(self, state: State) -> State:
-        schema_keys = self.active_run["schema_keys"]
+    def get_state_snapshot(self, state: State, run: RunContext) -> State:
+        schema_keys = run.active_run["schema_keys"]
         if schema_keys and schema_keys.get("output"):
             state = filter_object_by_schema_keys(state, [*DEFAULT_SCHEMA_KEYS, *schema_keys["output"]])
         return state
 
-    async def _handle_single_event(self, event: Any, state: State) -> AsyncGenerator[str, None]:
-        event_type = event.get("event")
-        if event_type == LangGraphEventTypes.OnChatModelStream:
-            should_emit_messages = event["metadata"].get("emit-messages", True)
-            should_emit_tool_calls = event["metadata"].get("emit-tool-calls", True)
+    def get_subgraph_namespaces(self, input: RunAgentInput) -> Optional[FrozenSet[str]]:
+        stream_subgraphs = input.forwarded_props.get('stream_subgraphs') if input.forwarded_props else None
+        if isinstance(stream_subgraphs, (list, tuple)):
+            return frozenset(stream_subgraphs)
+        return self.subgraph_namespaces
 
-            if event["data"]["chunk"].response_metadata.get('finish_reason', None):
-                return
+    def get_messages_snapshot(self, messages: List[BaseMessage]) -> List[Any]:
+        return langchain_messages_to_agui(messages, cache=self._message_conversion_cache)
 
-            current_stream = self.get_message_in_progress(self.active_run["id"])
-            has_current_stream = bool(current_stream and current_stream.get("id"))
-            tool_call_data = event["data"]["chunk"].tool_call_chunks[0] if event["data"]["chunk"].tool_call_chunks else None
-            predict_state_metadata = event["metadata"].get("predict_state", [])
-            tool_call_used_to_predict_state = False
-            if tool_call_data and tool_call_data.get("name") and predict_state_metadata:
-                tool_call_used_to_predict_state = any(
-                    predict_tool.get("tool") == tool_call_data["name"]
-                    for predict_tool in predict_state_metadata
-                )
+    def get_state_update_event(
+            self,
+            run: RunContext,
+            state: State,
+            raw_event: Any = None,
+    ) -> Optional[Union[StateSnapshotEvent, StateDeltaEvent]]:
+        """
+        Build the event that brings the client up to date with `state`.
 
-            is_tool_call_start_event = not has_current_stream and tool_call_data and tool_call_data.get("name")
-            is_tool_call_args_event = has_current_stream and current_stream.get("tool_call_id") and tool_call_data and tool_call_data.get("args")
-            is_tool_call_end_event = has_current_stream and current_stream.get("tool_call_id") and not tool_call_data
+        In delta mode, returns a JSON Patch covering the keys whose version changed
+        since the last emission (None if nothing changed), or a full snapshot when
+        there is no baseline yet or the patch would not be smaller.
+        """
+        snapshot = self.get_state_snapshot(state, run)
+        versions = {key: run.state_versions.get(key, 0) for key in snapshot}
+        emitted = run.emitted_state_versions
+
+        if self.state_update_mode == StateUpdateMode.Delta and emitted is not None:
+            patch = []
+            patch_size = 0
+            for key in emitted.keys() - snapshot.keys():
+                patch.append({"op": "remove", "path": _json_pointer(key)})
+                patch_size += len(key) + 32
+            for key, version in versions.items():
+                if emitted.get(key) != version:
+                    op = "replace" if key in emitted else "add"
+                    patch.append({"op": op, "path": _json_pointer(key), "value": snapshot[key]})
+                    patch_size += len(key) + 32 + self._state_value_size(run, key, version, snapshot[key])
+
+            if not patch:
+                return None
+
+            snapshot_size = sum(
+                len(key) + self._state_value_size(run, key, version, snapshot[key])
+                for key, version in versions.items()
+            )
+            if patch_size < snapshot_size:
+                run.emitted_state_versions = versions
+                return StateDeltaEvent(type=EventType.STATE_DELTA, delta=patch, raw_event=raw_event)
+
+        run.emitted_state_versions = versions
+        return StateSnapshotEvent(type=EventType.STATE_SNAPSHOT, snapshot=snapshot, raw_event=raw_event)
+
+    @staticmethod
+    def _state_value_size(run: RunContext, key: str, version: int, value: Any) -> int:
+        cached = run.state_value_sizes.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        size = len(dump_json_safe(value))
+        run.state_value_sizes[key] = (version, size)
+        return size
+
+    async def _handle_single_event(self, run: RunContext, event: Any, state: State) -> AsyncGenerator[str, None]:
+        handler = self._event_handlers.get(event.get("event"))
+        if handler is None:
+            return
+        async for single_event in handler(run, event, state):
+            yield single_event
 
-            if is_tool_call_start_event or is_tool_call_end_event or is_tool_call_args_event:
-                self.active_run["has_function_streaming"] = True
+    async def _handle_chat_model_stream(self, run: RunContext, event: Any, state: State) -> AsyncGenerator[str, None]:
+        should_emit_messages = event["metadata"].get("emit-messages", True)
+        should_emit_tool_calls = event["metadata"].get("emit-tool-calls", True)
 
-            reasoning_data = resolve_reasoning_content(event["data"]["chunk"]) if event["data"]["chunk"] else None
-            message_content = resolve_message_content(event["data"]["chunk"].content) if event["data"]["chunk"] and event["data"]["chunk"].content else None
-            is_message_content_event = tool_call_data is None and message_content
-            is_message_end_event = has_current_stream and not current_stream.get("tool_call_id") and not is_message_content_event
+        if event["data"]["chunk"].response_metadata.get('finish_reason', None):
+            return
 
-            if reasoning_data:
-                self.handle_thinking_event(reasoning_data)
-                return
+        current_stream = run.get_message_in_progress(run.active_run["id"])
+        has_current_stream = bool(current_stream and current_stream.get("id"))
+        tool_call_data = event["data"]["chunk"].tool_call_chunks[0] if event["data"]["chunk"].tool_call_chunks else None
+        predict_state_metadata = event["metadata"].get("predict_state", [])
+        tool_call_used_to_predict_state = False
+        if tool_call_data and tool_call_data.get("name") and predict_state_metadata:
+            tool_call_used_to_predict_state = any(
+                predict_tool.get("tool") == tool_call_data["name"]
+                for predict_tool in predict_state_metadata
+            )
 
-            if reasoning_data is None and self.active_run.get('thinking_process', None) is not None:
-                yield self._dispatch_event(
-                    ThinkingTextMessageEndEvent(
-                        type=EventType.THINKING_TEXT_MESSAGE_END,
-                    )
-                )
-                yield self._dispatch_event(
-                    ThinkingEndEvent(
-                        type=EventType.THINKING_END,
-                    )
-                )
-                self.active_run["thinking_process"] = None
+        is_tool_call_start_event = not has_current_stream and tool_call_data and tool_call_data.get("name")
+        is_tool_call_args_event = has_current_stream and current_stream.get("tool_call_id") and tool_call_data and tool_call_data.get("args")
+        is_tool_call_end_event = has_current_stream and current_stream.get("tool_call_id") and not tool_call_data
 
-            if tool_call_used_to_predict_state:
-                yield self._dispatch_event(
-                    CustomEvent(
-                        type=EventType.CUSTOM,
-                        name="PredictState",
-                        value=predict_state_metadata,
-                        raw_event=event
-                    )
-                )
+        if is_tool_call_start_event or is_tool_call_end_event or is_tool_call_args_event:
+            run.active_run["has_function_streaming"] = True
 
-            if is_tool_call_end_event:
-                yield self._dispatch_event(
-                    ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id=current_stream["tool_call_id"], raw_event=event)
-                )
-                self.messages_in_process[self.active_run["id"]] = None
-                return
+        reasoning_data = resolve_reasoning_content(event["data"]["chunk"]) if event["data"]["chunk"] else None
+        message_content = resolve_message_content(event["data"]["chunk"].content) if event["data"]["chunk"] and event["data"]["chunk"].content else None
+        is_message_content_event = tool_call_data is None and message_content
+        is_message_end_event = has_current_stream and not current_stream.get("tool_call_id") and not is_message_content_event
 
+        if reasoning_data:
+            self.handle_thinking_event(run, reasoning_data)
+            return
 
-            if is_message_end_event:
-                yield self._dispatch_event(
-                    TextMessageEndEvent(type=EventType.TEXT_MESSAGE_END, message_id=current_stream["id"], raw_event=event)
-                )
-                self.messages_in_process[self.active_run["id"]] = None
-                return
-
-            if is_tool_call_start_event and should_emit_tool_calls:
-                yield self._dispatch_event(
-                    ToolCallStartEvent(
-                        type=EventType.TOOL_CALL_START,
-                        tool_call_id=tool_call_data["id"],
-                        tool_call_name=tool_call_data["name"],
-                        parent_message_id=event["data"]["chunk"].id,
-                        raw_event=event,
-                    )
+        if reasoning_data is None and run.active_run.get('thinking_process', None) is not None:
+            yield self._dispatch_event(
+                ThinkingTextMessageEndEvent(
+                    type=EventType.THINKING_TEXT_MESSAGE_END,
                 )
-                self.set_message_in_progress(
-                    self.active_run["id"],
-                    MessageInProgress(id=event["data"]["chunk"].id, tool_call_id=tool_call_data["id"], tool_call_name=tool_call_data["name"])
+            )
+            yield self._dispatch_event(
+                ThinkingEndEvent(
+                    type=EventType.THINKING_END,
                 )
-                return
+            )
+            run.active_run["thinking_process"] = None
 
-            if is_tool_call_args_event and should_emit_tool_calls:
-                yield self._dispatch_event(
-                    ToolCallArgsEvent(
-                        type=EventType.TOOL_CALL_ARGS,
-                        tool_call_id=current_stream["tool_call_id"],
-                        delta=tool_call_data["args"],
-                        raw_event=event
-                    )
+        if tool_call_used_to_predict_state:
+            yield self._dispatch_event(
+                CustomEvent(
+                    type=EventType.CUSTOM,
+                    name="PredictState",
+                    value=predict_state_metadata,
+                    raw_event=event
                 )
-                return
+            )
 
-            if is_message_content_event and should_emit_messages:
-                if bool(current_stream and current_stream.get("id")) == False:
-                    yield self._dispatch_event(
-                        TextMessageStartEvent(
-                            type=EventType.TEXT_MESSAGE_START,
-                            role="assistant",
-                            message_id=event["data"]["chunk"].id,
-                            raw_event=event,
-                        )
-                    )
-                    self.set_message_in_progress(
-                        self.active_run["id"],
-                        MessageInProgress(
-                            id=event["data"]["chunk"].id,
-                            tool_call_id=None,
-                            tool_call_name=None
-                        )
-                    )
-                    current_stream = self.get_message_in_progress(self.active_run["id"])
+        if is_tool_call_end_event:
+            yield self._dispatch_event(
+                ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id=current_stream["tool_call_id"], raw_event=event)
+            )
+            run.clear_message_in_progress(run.active_run["id"])
+            return
 
-                yield self._dispatch_event(
-                    TextMessageContentEvent(
-                        type=EventType.TEXT_MESSAGE_CONTENT,
-                        message_id=current_stream["id"],
-                        delta=message_content,
-                        raw_event=event,
-                    )
-                )
-                return
 
-        elif event_type == LangGraphEventTypes.OnChatModelEnd:
-            if self.get_message_in_progress(self.active_run["id"]) and self.get_message_in_progress(self.active_run["id"]).get("tool_call_id"):
-                resolved = self._dispatch_event(
-                    ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id=self.get_message_in_progress(self.active_run["id"])["tool_call_id"], raw_event=event)
-                )
-                if resolved:
-                    self.messages_in_process[self.active_run["id"]] = None
-                yield resolved
-            elif self.get_message_in_progress(self.active_run["id"]) and self.get_message_in_progress(self.active_run["id"]).get("id"):
-                resolved = self._dispatch_event(
-                    TextMessageEndEvent(type=EventType.TEXT_MESSAGE_END, message_id=self.get_message_in_progress(self.active_run["id"])["id"], raw_event=event)
-                )
-                if resolved:
-                    self.messages_in_process[self.active_run["id"]] = None
-                yield resolved
+        if is_message_end_event:
+            yield self._dispatch_event(
+                TextMessageEndEvent(type=EventType.TEXT_MESSAGE_END, message_id=current_stream["id"], raw_event=event)
+            )
+            run.clear_message_in_progress(run.active_run["id"])
+            return
 
-        elif event_type == LangGraphEventTypes.OnCustomEvent:
-            if event["name"] == CustomEventNames.ManuallyEmitMessage:
-                yield self._dispatch_event(
-                    TextMessageStartEvent(type=EventType.TEXT_MESSAGE_START, role="assistant", message_id=event["data"]["message_id"], raw_event=event)
-                )
-                yield self._dispatch_event(
-                    TextMessageContentEvent(
-                        type=EventType.TEXT_MESSAGE_CONTENT,
-                        message_id=event["data"]["message_id"],
-                        delta=event["data"]["message"],
-                        raw_event=event,
-                    )
+        if is_tool_call_start_event and should_emit_tool_calls:
+            yield self._dispatch_event(
+                ToolCallStartEvent(
+                    type=EventType.TOOL_CALL_START,
+                    tool_call_id=tool_call_data["id"],
+                    tool_call_name=tool_call_data["name"],
+                    parent_message_id=event["data"]["chunk"].id,
+                    raw_event=event,
                 )
-                yield self._dispatch_event(
-                    TextMessageEndEvent(type=EventType.TEXT_MESSAGE_END, message_id=event["data"]["message_id"], raw_event=event)
+            )
+            run.set_message_in_progress(
+                run.active_run["id"],
+                MessageInProgress(id=event["data"]["chunk"].id, tool_call_id=tool_call_data["id"], tool_call_name=tool_call_data["name"])
+            )
+            return
+
+        if is_tool_call_args_event and should_emit_tool_calls:
+            yield self._dispatch_event(
+                ToolCallArgsEvent(
+                    type=EventType.TOOL_CALL_ARGS,
+                    tool_call_id=current_stream["tool_call_id"],
+                    delta=tool_call_data["args"],
+                    raw_event=event
                 )
+            )
+            return
 
-            elif event["name"] == CustomEventNames.ManuallyEmitToolCall:
+        if is_message_content_event and should_emit_messages:
+            if bool(current_stream and current_stream.get("id")) == False:
                 yield self._dispatch_event(
-                    ToolCallStartEvent(
-                        type=EventType.TOOL_CALL_START,
-                        tool_call_id=event["data"]["id"],
-                        tool_call_name=event["data"]["name"],
-                        parent_message_id=event["data"]["id"],
+                    TextMessageStartEvent(
+                        type=EventType.TEXT_MESSAGE_START,
+                        role="assistant",
+                        message_id=event["data"]["chunk"].id,
                         raw_event=event,
                     )
                 )
-                yield self._dispatch_event(
-                    ToolCallArgsEvent(
-                        type=EventType.TOOL_CALL_ARGS,
-                        tool_call_id=event["data"]["id"],
-                        delta=event["data"]["args"] if isinstance(event["data"]["args"], str) else json.dumps(
-                            event["data"]["args"]),
-                        raw_event=event
+                run.set_message_in_progress(
+                    run.active_run["id"],
+                    MessageInProgress(
+                        id=event["data"]["chunk"].id,
+                        tool_call_id=None,
+                        tool_call_name=None
                     )
                 )
-                yield self._dispatch_event(
-                    ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id=event["data"]["id"], raw_event=event)
+                current_stream = run.get_message_in_progress(run.active_run["id"])
+
+            yield self._dispatch_event(
+                TextMessageContentEvent(
+                    type=EventType.TEXT_MESSAGE_CONTENT,
+                    message_id=current_stream["id"],
+                    delta=message_content,
+                    raw_event=event,
                 )
+            )
+            return
 
-            elif event["name"] == CustomEventNames.ManuallyEmitState:
-                self.active_run["manually_emitted_state"] = event["data"]
-                yield self._dispatch_event(
-                    StateSnapshotEvent(type=EventType.STATE_SNAPSHOT, snapshot=self.get_state_snapshot(self.active_run["manually_emitted_state"]), raw_event=event)
+    async def _handle_chat_model_end(self, run: RunContext, event: Any, state: State) -> AsyncGenerator[str, None]:
+        if run.get_message_in_progress(run.active_run["id"]) and run.get_message_in_progress(run.active_run["id"]).get("tool_call_id"):
+            resolved = self._dispatch_event(
+                ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id=run.get_message_in_progress(run.active_run["id"])["tool_call_id"], raw_event=event)
+            )
+            if resolved:
+                run.clear_message_in_progress(run.active_run["id"])
+            yield resolved
+        elif run.get_message_in_progress(run.active_run["id"]) and run.get_message_in_progress(run.active_run["id"]).get("id"):
+            resolved = self._dispatch_event(
+                TextMessageEndEvent(type=EventType.TEXT_MESSAGE_END, message_id=run.get_message_in_progress(run.active_run["id"])["id"], raw_event=event)
+            )
+            if resolved:
+                run.clear_message_in_progress(run.active_run["id"])
+            yield resolved
+
+    async def _handle_custom_event(self, run: RunContext, event: Any, state: State) -> AsyncGenerator[str, None]:
+        if event["name"] == CustomEventNames.ManuallyEmitMessage:
+            yield self._dispatch_event(
+                TextMessageStartEvent(type=EventType.TEXT_MESSAGE_START, role="assistant", message_id=event["data"]["message_id"], raw_event=event)
+            )
+            yield self._dispatch_event(
+                TextMessageContentEvent(
+                    type=EventType.TEXT_MESSAGE_CONTENT,
+                    message_id=event["data"]["message_id"],
+                    delta=event["data"]["message"],
+                    raw_event=event,
                 )
-            
+            )
             yield self._dispatch_event(
-                CustomEvent(type=EventType.CUSTOM, name=event["name"], value=event["data"], raw_event=event)
-            )
-
-        elif event_type == LangGraphEventTypes.OnToolEnd:
-            tool_call_output = event["data"]["output"]
-
-            if isinstance(tool_call_output, Command):
-                # Extract ToolMessages from Command.update
-                messages = tool_call_output.update.get('messages', [])
-                tool_messages = [m for m in messages if isinstance(m, ToolMessage)]
-
-                # Process each tool message
-                for tool_msg in tool_messages:
-                    if not self.active_run["has_function_streaming"]:
-                        yield self._dispatch_event(
-                            ToolCallStartEvent(
-                                type=EventType.TOOL_CALL_START,
-                                tool_call_id=tool_msg.tool_call_id,
-                                tool_call_name=tool_msg.name,
-                                parent_message_id=tool_msg.id,
-                                raw_event=event,
-                            )
-                        )
-                        yield self._dispatch_event(
-                            ToolCallArgsEvent(
-                                type=EventType.TOOL_CALL_ARGS,
-                                tool_call_id=tool_msg.tool_call_id,
-                                delta=json.dumps(event["data"].get("input", {})),
-                                raw_event=event
-                            )
+                TextMessageEndEvent(type=EventType.TEXT_MESSAGE_END, message_id=event["data"]["message_id"], raw_event=event)
+            )
+
+        elif event["name"] == CustomEventNames.ManuallyEmitToolCall:
+            yield self._dispatch_event(
+                ToolCallStartEvent(
+                    type=EventType.TOOL_CALL_START,
+                    tool_call_id=event["data"]["id"],
+                    tool_call_name=event["data"]["name"],
+                    parent_message_id=event["data"]["id"],
+                    raw_event=event,
+                )
+            )
+            yield self._dispatch_event(
+                ToolCallArgsEvent(
+                    type=EventType.TOOL_CALL_ARGS,
+                    tool_call_id=event["data"]["id"],
+                    delta=event["data"]["args"] if isinstance(event["data"]["args"], str) else json.dumps(
+                        event["data"]["args"]),
+                    raw_event=event
+                )
+            )
+            yield self._dispatch_event(
+                ToolCallEndEvent(type=EventType.TOOL_CALL_END, tool_call_id=event["data"]["id"], raw_event=event)
+            )
+
+        elif event["name"] == CustomEventNames.ManuallyEmitState:
+            run.active_run["manually_emitted_state"] = event["data"]
+            # The client now holds the manually emitted state; re-baseline deltas
+            run.emitted_state_versions = None
+            yield self._dispatch_event(
+                StateSnapshotEvent(type=EventType.STATE_SNAPSHOT, snapshot=self.get_state_snapshot(run.active_run["manually_emitted_state"], run), raw_event=event)
+            )
+        
+        yield self._dispatch_event(
+            CustomEvent(type=EventType.CUSTOM, name=event["name"], value=event["data"], raw_event=event)
+        )
+
+    async def _handle_tool_end(self, run: RunContext, event: Any, state: State) -> AsyncGenerator[str, None]:
+        tool_call_output = event["data"]["output"]
+
+        if isinstance(tool_call_output, Command):
+            # Extract ToolMessages from Command.update
+            messages = tool_call_output.update.get('messages', [])
+            tool_messages = [m for m in messages if isinstance(m, ToolMessage)]
+
+            # Process each tool message
+            for tool_msg in tool_messages:
+                if not run.active_run["has_function_streaming"]:
+                    yield self._dispatch_event(
+                        ToolCallStartEvent(
+                            type=EventType.TOOL_CALL_START,
+                            tool_call_id=tool_msg.tool_call_id,
+                            tool_call_name=tool_msg.name,
+                            parent_message_id=tool_msg.id,
+                            raw_event=event,
                         )
-                        yield self._dispatch_event(
-                            ToolCallEndEvent(
-                                type=EventType.TOOL_CALL_END,
-                                tool_call_id=tool_msg.tool_call_id,
-                                raw_event=event
-                            )
+                    )
+                    yield self._dispatch_event(
+                        ToolCallArgsEvent(
+                            type=EventType.TOOL_CALL_ARGS,
+                            tool_call_id=tool_msg.tool_call_id,
+                            delta=json.dumps(event["data"].get("input", {})),
+                            raw_event=event
                         )
-
+                    )
                     yield self._dispatch_event(
-                        ToolCallResultEvent(
-                            type=EventType.TOOL_CALL_RESULT,
+                        ToolCallEndEvent(
+                            type=EventType.TOOL_CALL_END,
                             tool_call_id=tool_msg.tool_call_id,
-                            message_id=str(uuid.uuid4()),
-                            content=tool_msg.content,
-                            role="tool"
+                            raw_event=event
                         )
                     )
-                return
 
-            if not self.active_run["has_function_streaming"]:
                 yield self._dispatch_event(
-                    ToolCallStartEvent(
-                        type=EventType.TOOL_CALL_START,
-                        tool_call_id=tool_call_output.tool_call_id,
-                        tool_call_name=tool_call_output.name,
-                        parent_message_id=tool_call_output.id,
-                        raw_event=event,
+                    ToolCallResultEvent(
+                        type=EventType.TOOL_CALL_RESULT,
+                        tool_call_id=tool_msg.tool_call_id,
+                        message_id=str(uuid.uuid4()),
+                        content=tool_msg.content,
+                        role="tool"
                     )
                 )
-                yield self._dispatch_event(
-                    ToolCallArgsEvent(
-                        type=EventType.TOOL_CALL_ARGS,
-                        tool_call_id=tool_call_output.tool_call_id,
-                        delta=dump_json_safe(event["data"]["input"]),
-                        raw_event=event
-                    )
+            return
+
+        if not run.active_run["has_function_streaming"]:
+            yield self._dispatch_event(
+                ToolCallStartEvent(
+                    type=EventType.TOOL_CALL_START,
+                    tool_call_id=tool_call_output.tool_call_id,
+                    tool_call_name=tool_call_output.name,
+                    parent_message_id=tool_call_output.id,
+                    raw_event=event,
                 )
-                yield self._dispatch_event(
-                    ToolCallEndEvent(
-                        type=EventType.TOOL_CALL_END,
-                        tool_call_id=tool_call_output.tool_call_id,
-                        raw_event=event
-                    )
+            )
+            yield self._dispatch_event(
+                ToolCallArgsEvent(
+                    type=EventType.TOOL_CALL_ARGS,
+                    tool_call_id=tool_call_output.tool_call_id,
+                    delta=dump_json_safe(event["data"]["input"]),
+                    raw_event=event
                 )
-
+            )
             yield self._dispatch_event(
-                ToolCallResultEvent(
-                    type=EventType.TOOL_CALL_RESULT,
+                ToolCallEndEvent(
+                    type=EventType.TOOL_CALL_END,
                     tool_call_id=tool_call_output.tool_call_id,
-                    message_id=str(uuid.uuid4()),
-                    content=dump_json_safe(tool_call_output.content),
-                    role="tool"
+                    raw_event=event
                 )
             )
 
-    def handle_thinking_event(self, reasoning_data: LangGraphReasoning) -> Generator[str, Any, str | None]:
+        yield self._dispatch_event(
+            ToolCallResultEvent(
+                type=EventType.TOOL_CALL_RESULT,
+                tool_call_id=tool_call_output.tool_call_id,
+                message_id=str(uuid.uuid4()),
+                content=dump_json_safe(tool_call_output.content),
+                role="tool"
+            )
+        )
+
+    def handle_thinking_event(self, run: RunContext, reasoning_data: LangGraphReasoning) -> Generator[str, Any, str | None]:
         if not reasoning_data or "type" not in reasoning_data or "text" not in reasoning_data:
             return ""
 
         thinking_step_index = reasoning_data.get("index")
 
-        if (self.active_run.get("thinking_process") and
-                self.active_run["thinking_process"].get("index") and
-                self.active_run["thinking_process"]["index"] != thinking_step_index):
+        if (run.active_run.get("thinking_process") and
+                run.active_run["thinking_process"].get("index") and
+                run.active_run["thinking_process"]["index"] != thinking_step_index):
 
-            if self.active_run["thinking_process"].get("type"):
+            if run.active_run["thinking_process"].get("type"):
                 yield self._dispatch_event(
                     ThinkingTextMessageEndEvent(
                         type=EventType.THINKING_TEXT_MESSAGE_END,
@@ -784,27 +1100,27 @@ class LangGraphAgent:
                     type=EventType.THINKING_END,
                 )
             )
-            self.active_run["thinking_process"] = None
+            run.active_run["thinking_process"] = None
 
-        if not self.active_run.get("thinking_process"):
+        if not run.active_run.get("thinking_process"):
             yield self._dispatch_event(
                 ThinkingStartEvent(
                     type=EventType.THINKING_START,
                 )
             )
-            self.active_run["thinking_process"] = {
+            run.active_run["thinking_process"] = {
                 "index": thinking_step_index
             }
 
-        if self.active_run["thinking_process"].get("type") != reasoning_data["type"]:
+        if run.active_run["thinking_process"].get("type") != reasoning_data["type"]:
             yield self._dispatch_event(
                 ThinkingTextMessageStartEvent(
                     type=EventType.THINKING_TEXT_MESSAGE_START,
                 )
             )
-            self.active_run["thinking_process"]["type"] = reasoning_data["type"]
+            run.active_run["thinking_process"]["type"] = reasoning_data["type"]
 
-        if self.active_run["thinking_process"].get("type"):
+        if run.active_run["thinking_process"].get("type"):
             yield self._dispatch_event(
                 ThinkingTextMessageContentEvent(
                     type=EventType.THINKING_TEXT_MESSAGE_CONTENT,
@@ -812,37 +1128,85 @@ class LangGraphAgent:
                 )
             )
 
+    @property
+    def checkpoint_index(self) -> Optional[MessageCheckpointIndex]:
+        """The message ID -> checkpoint index of the graph's checkpointer, if any."""
+        return get_checkpoint_index(getattr(self.graph, "checkpointer", None))
+
     async def get_checkpoint_before_message(self, message_id: str, thread_id: str):
         if not thread_id:
             raise ValueError("Missing thread_id in config")
 
-        history_list = []
-        async for snapshot in self.graph.aget_state_history({"configurable": {"thread_id": thread_id}}):
-            history_list.append(snapshot)
+        # Both paths return the parent of the first checkpoint containing the
+        # message, following `parent_config` so forked threads stay on the branch
+        # the message belongs to
+        index = self.checkpoint_index
+        indexed_config = index.get(thread_id, message_id) if index is not None else None
+        if indexed_config is not None:
+            snapshot = await self.graph.aget_state(indexed_config)
+            if any(getattr(m, "id", None) == message_id for m in snapshot.values.get("messages", [])):
+                if not snapshot.parent_config:
+                    return self._empty_checkpoint_before(snapshot)
+                checkpoint = await self.graph.aget_state(snapshot.parent_config)
+                return self._merge_checkpoint_before(checkpoint, snapshot)
+            index.invalidate(thread_id)
+
+        # History is streamed newest first and lists every branch of the thread:
+        # from the newest checkpoint containing the message, only its ancestors
+        # are considered, and the scan stops at the first one without the message.
+        # Messages whose first checkpoint is passed on the way are indexed.
+        first_checkpoints = {}
+        parent_checkpoint_id = None
+        first_snapshot_with_message = None
+        try:
+            async for snapshot in self.graph.aget_state_history({"configurable": {"thread_id": thread_id}}):
+                message_ids = set(snapshot_message_ids(snapshot))
+                if first_snapshot_with_message is None:
+                    if message_id not in message_ids:
+                        continue
+                elif snapshot_checkpoint_id(snapshot) != parent_checkpoint_id:
+                    # Checkpoint of another branch
+                    continue
+                else:
+                    for child_message_id in snapshot_message_ids(first_snapshot_with_message):
+                        if child_message_id not in message_ids:
+                            first_checkpoints[child_message_id] = first_snapshot_with_message.config
+                    if message_id not in message_ids:
+                        return self._merge_checkpoint_before(snapshot, first_snapshot_with_message)
+
+                first_snapshot_with_message = snapshot
+                parent_checkpoint_id = snapshot_parent_checkpoint_id(snapshot)
+                if parent_checkpoint_id is None:
+                    # Root checkpoint: everything in it first appeared there
+                    for child_message_id in message_ids:
+                        first_checkpoints[child_message_id] = snapshot.config
+                    break
+        finally:
+            if index is not None:
+                index.record(thread_id, first_checkpoints)
 
-        history_list.reverse()
-        for idx, snapshot in enumerate(history_list):
-            messages = snapshot.values.get("messages", [])
-            if any(getattr(m, "id", None) == message_id for m in messages):
-                if idx == 0:
-                    # No snapshot before this
-                    # Return synthetic "empty before" version
-                    empty_snapshot = snapshot
-                    empty_snapshot.values["messages"] = []
-                    return empty_snapshot
+        if first_snapshot_with_message is not None:
+            return self._empty_checkpoint_before(first_snapshot_with_message)
 
-                snapshot_values_without_messages = snapshot.values.copy()
-                del snapshot_values_without_messages["messages"]
-                checkpoint = history_list[idx - 1]
+        raise ValueError("Message ID not found in history")
 
-                merged_values = {**checkpoint.values, **snapshot_values_without_messages}
-                checkpoint = checkpoint._replace(values=merged_values)
+    @staticmethod
+    def _empty_checkpoint_before(snapshot):
+        # No snapshot before this
+        # Return synthetic "empty before" version
+        empty_snapshot = snapshot
+        empty_snapshot.values["messages"] = []
+        return empty_snapshot
 
-                return checkpoint
+    @staticmethod
+    def _merge_checkpoint_before(checkpoint, snapshot):
+        snapshot_values_without_messages = snapshot.values.copy()
+        del snapshot_values_without_messages["messages"]
 
-        raise ValueError("Message ID not found in history")
+        merged_values = {**checkpoint.values, **snapshot_values_without_messages}
+        return checkpoint._replace(values=merged_values)
 
-    def handle_node_change(self, node_name: Optional[str]):
+    def handle_node_change(self, run: RunContext, node_name: Optional[str]):
         """
         Centralized method to handle node name changes and step transitions.
         Automatically manages step start/end events based on node name changes.
@@ -850,17 +1214,17 @@ class LangGraphAgent:
         if node_name == "__end__":
             node_name = None
 
-        if node_name != self.active_run.get("node_name"):
+        if node_name != run.active_run.get("node_name"):
             # End current step if we have one
-            if self.active_run.get("node_name"):
-                yield self.end_step()
+            if run.active_run.get("node_name"):
+                yield self.end_step(run)
 
             # Start new step if we have a node name
             if node_name:
                 for event in self.start_step(node_name):
                     yield event
 
-        self.active_run["node_name"] = node_name
+        run.active_run["node_name"] = node_name
 
     def start_step(self, step_name: str):
         """Simple step start event dispatcher - node_name management handled by handle_node_change"""
@@ -871,15 +1235,15 @@ class LangGraphAgent:
             )
         )
 
-    def end_step(self):
+    def end_step(self, run: RunContext):
         """Simple step end event dispatcher - node_name management handled by handle_node_change"""
-        if not self.active_run.get("node_name"):
+        if not run.active_run.get("node_name"):
             raise ValueError("No active step to end")
 
         return self._dispatch_event(
             StepFinishedEvent(
                 type=EventType.STEP_FINISHED,
-                step_name=self.active_run["node_name"]
+                step_name=run.active_run["node_name"]
             )
         )
 
@@ -900,8 +1264,11 @@ class LangGraphAgent:
         )
 
         # Only add context if supported
-        sig = inspect.signature(self.graph.astream_events)
-        if 'context' in sig.parameters:
+        self._ensure_graph_cache()
+        if self._stream_supports_context is None:
+            sig = inspect.signature(self.graph.astream_events)
+            self._stream_supports_context = 'context' in sig.parameters
+        if self._stream_supports_context:
             base_context = {}
             if isinstance(config, dict) and 'configurable' in config and isinstance(config['configurable'], dict):
                 base_context.update(config['configurable'])
@@ -919,5 +1286,9 @@ class LangGraphAgent:
         return kwargs
 
 
+def _json_pointer(key: str) -> str:
+    return "/" + key.replace("~", "~0").replace("/", "~1")
+
+
 def dump_json_safe(value):
     return json.dumps(value, default=json_safe_stringify) if not isinstance(value, str) else value
\ No newline at end of file
@@ -0,0 +1,94 @@
+"""
+Message ID -> checkpoint index used to resolve regenerate/edit requests
+without scanning a thread's whole checkpoint history.
+"""
+
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from langchain_core.runnables import RunnableConfig
+
+
+def snapshot_checkpoint_id(snapshot: Any) -> Optional[str]:
+    config = getattr(snapshot, "config", None) or {}
+    return config.get("configurable", {}).get("checkpoint_id")
+
+
+def snapshot_parent_checkpoint_id(snapshot: Any) -> Optional[str]:
+    config = getattr(snapshot, "parent_config", None) or {}
+    return config.get("configurable", {}).get("checkpoint_id")
+
+
+def snapshot_message_ids(snapshot: Any):
+    values = snapshot.values if isinstance(snapshot.values, dict) else {}
+    for message in values.get("messages", []):
+        message_id = getattr(message, "id", None)
+        if message_id is not None:
+            yield message_id
+
+
+class MessageCheckpointIndex:
+    """
+    Maps message IDs to the first checkpoint of a thread that contains them.
+
+    Entries are recorded by regenerate/edit lookups: while walking a thread's
+    checkpoints back to the one preceding the requested message, every message
+    whose first checkpoint was passed is recorded, so later lookups of those
+    messages are point reads. Nothing is read outside of those lookups. Only the
+    `max_threads` most recently used threads are kept.
+    """
+
+    def __init__(self, max_threads: int = 1000):
+        self.max_threads = max_threads
+        # thread id -> message id -> config of the first checkpoint containing it
+        self._threads: "OrderedDict[str, Dict[str, RunnableConfig]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._threads)
+
+    def get(self, thread_id: str, message_id: str) -> Optional[RunnableConfig]:
+        thread = self._threads.get(thread_id)
+        if thread is None:
+            return None
+        self._threads.move_to_end(thread_id)
+        return thread.get(message_id)
+
+    def record(self, thread_id: str, first_checkpoints: Dict[str, RunnableConfig]) -> None:
+        if not first_checkpoints:
+            return
+        thread = self._threads.get(thread_id)
+        if thread is None:
+            thread = self._threads[thread_id] = {}
+        thread.update(first_checkpoints)
+        self._threads.move_to_end(thread_id)
+        while len(self._threads) > self.max_threads:
+            self._threads.popitem(last=False)
+
+    def invalidate(self, thread_id: Optional[str] = None) -> None:
+        if thread_id is None:
+            self._threads.clear()
+        else:
+            self._threads.pop(thread_id, None)
+
+
+_indexes: "weakref.WeakKeyDictionary[Any, MessageCheckpointIndex]" = weakref.WeakKeyDictionary()
+
+
+def get_checkpoint_index(checkpointer: Any) -> Optional[MessageCheckpointIndex]:
+    """
+    Return the index shared by every agent using `checkpointer`.
+
+    The index lives as long as the checkpointer does. Returns None when the
+    graph has no checkpointer object to attach it to.
+    """
+    if checkpointer is None or isinstance(checkpointer, bool):
+        return None
+    try:
+        index = _indexes.get(checkpointer)
+        if index is None:
+            index = _indexes[checkpointer] = MessageCheckpointIndex()
+    except TypeError:
+        # Checkpointer can't be weakly referenced
+        return None
+    return index
@@ -6,8 +6,14 @@ from ag_ui.encoder import EventEncoder
 
 from .agent import LangGraphAgent
 
-def add_langgraph_fastapi_endpoint(app: FastAPI, agent: LangGraphAgent, path: str = "/"):
-    """Adds an endpoint to the FastAPI app."""
+def add_langgraph_fastapi_endpoint(app: FastAPI, agent: LangGraphAgent, path: str = "/", warm_up: bool = True):
+    """Adds an endpoint to the FastAPI app.
+
+    With `warm_up`, graph introspection is computed while the endpoint is registered
+    rather than on the first request.
+    """
+    if warm_up:
+        agent.warm_up()
 
     @app.post(path)
     async def langgraph_agent_endpoint(input_data: RunAgentInput, request: Request):
@@ -20,6 +20,16 @@ class CustomEventNames(str, Enum):
     ManuallyEmitState = "manually_emit_state"
     Exit = "exit"
 
+class RawEventPolicy(str, Enum):
+    Off = "off"
+    Lifecycle = "lifecycle"
+    Sampled = "sampled"
+    Full = "full"
+
+class StateUpdateMode(str, Enum):
+    Snapshot = "snapshot"
+    Delta = "delta"
+
 State = Dict[str, Any]
 
 SchemaKeys = TypedDict("SchemaKeys", {
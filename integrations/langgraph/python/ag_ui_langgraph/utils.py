@@ -1,10 +1,14 @@
 import json
+import logging
 import re
+import sys
 from enum import Enum
 
 from pydantic import TypeAdapter
 from pydantic_core import PydanticSerializationError
-from typing import List, Any, Dict, Union
+from collections import OrderedDict
+from operator import methodcaller
+from typing import List, Any, Dict, Optional, Tuple, Union
 from dataclasses import is_dataclass, asdict
 from datetime import date, datetime
 
@@ -17,11 +21,14 @@ from ag_ui.core import (
     ToolMessage as AGUIToolMessage,
     ToolCall as AGUIToolCall,
     FunctionCall as AGUIFunctionCall,
+    Tool as AGUITool,
     TextInputContent,
     BinaryInputContent,
 )
 from .types import State, SchemaKeys, LangGraphReasoning
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_SCHEMA_KEYS = ["tools"]
 
 def filter_object_by_schema_keys(obj: Dict[str, Any], schema_keys: List[str]) -> Dict[str, Any]:
@@ -83,61 +90,118 @@ def convert_langchain_multimodal_to_agui(content: List[Dict[str, Any]]) -> List[
                     ))
     return agui_content
 
-def langchain_messages_to_agui(messages: List[BaseMessage]) -> List[AGUIMessage]:
-    agui_messages: List[AGUIMessage] = []
-    for message in messages:
-        if isinstance(message, HumanMessage):
-            # Handle multimodal content
-            if isinstance(message.content, list):
-                content = convert_langchain_multimodal_to_agui(message.content)
-            else:
-                content = stringify_if_needed(resolve_message_content(message.content))
-
-            agui_messages.append(AGUIUserMessage(
-                id=str(message.id),
-                role="user",
-                content=content,
-                name=message.name,
-            ))
-        elif isinstance(message, AIMessage):
-            tool_calls = None
-            if message.tool_calls:
-                tool_calls = [
-                    AGUIToolCall(
-                        id=str(tc["id"]),
-                        type="function",
-                        function=AGUIFunctionCall(
-                            name=tc["name"],
-                            arguments=json.dumps(tc.get("args", {})),
-                        ),
-                    )
-                    for tc in message.tool_calls
-                ]
-
-            agui_messages.append(AGUIAssistantMessage(
-                id=str(message.id),
-                role="assistant",
-                content=stringify_if_needed(resolve_message_content(message.content)),
-                tool_calls=tool_calls,
-                name=message.name,
-            ))
-        elif isinstance(message, SystemMessage):
-            agui_messages.append(AGUISystemMessage(
-                id=str(message.id),
-                role="system",
-                content=stringify_if_needed(resolve_message_content(message.content)),
-                name=message.name,
-            ))
-        elif isinstance(message, ToolMessage):
-            agui_messages.append(AGUIToolMessage(
-                id=str(message.id),
-                role="tool",
-                content=stringify_if_needed(resolve_message_content(message.content)),
-                tool_call_id=message.tool_call_id,
-            ))
+class MessageConversionCache:
+    """
+    LRU cache of LangChain -> AG-UI message conversions keyed by message ID.
+
+    Entries are validated against a cheap fingerprint of the source message, so
+    an edited message with a reused ID is converted again. Cached converted
+    messages are shared between calls and must not be mutated.
+    """
+
+    def __init__(self, max_size: int = 4096):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[Any, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def fingerprint(self, message: Any) -> Any:
+        return _langchain_message_fingerprint(message)
+
+    def convert_message(self, message: Any) -> Any:
+        return langchain_message_to_agui(message)
+
+    def convert(self, message: Any) -> Any:
+        if self.max_size <= 0 or message.id is None:
+            return self.convert_message(message)
+
+        fingerprint = self.fingerprint(message)
+        entry = self._entries.get(message.id)
+        if entry is not None and entry[0] == fingerprint:
+            self.hits += 1
+            self._entries.move_to_end(message.id)
+            return entry[1]
+
+        self.misses += 1
+        converted = self.convert_message(message)
+        self._entries[message.id] = (fingerprint, converted)
+        self._entries.move_to_end(message.id)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+        return converted
+
+def _langchain_message_fingerprint(message: BaseMessage) -> Tuple[Any, ...]:
+    content = message.content if isinstance(message.content, str) else repr(message.content)
+    return (
+        type(message),
+        content,
+        message.name,
+        repr(message.tool_calls) if isinstance(message, AIMessage) else None,
+        getattr(message, "tool_call_id", None),
+    )
+
+def langchain_messages_to_agui(
+    messages: List[BaseMessage],
+    cache: Optional[MessageConversionCache] = None,
+) -> List[AGUIMessage]:
+    if cache is None:
+        return [langchain_message_to_agui(message) for message in messages]
+    return [cache.convert(message) for message in messages]
+
+def langchain_message_to_agui(message: BaseMessage) -> AGUIMessage:
+    if isinstance(message, HumanMessage):
+        # Handle multimodal content
+        if isinstance(message.content, list):
+            content = convert_langchain_multimodal_to_agui(message.content)
         else:
-            raise TypeError(f"Unsupported message type: {type(message)}")
-    return agui_messages
+            content = stringify_if_needed(resolve_message_content(message.content))
+
+        return AGUIUserMessage(
+            id=str(message.id),
+            role="user",
+            content=content,
+            name=message.name,
+        )
+    elif isinstance(message, AIMessage):
+        tool_calls = None
+        if message.tool_calls:
+            tool_calls = [
+                AGUIToolCall(
+                    id=str(tc["id"]),
+                    type="function",
+                    function=AGUIFunctionCall(
+                        name=tc["name"],
+                        arguments=json.dumps(tc.get("args", {})),
+                    ),
+                )
+                for tc in message.tool_calls
+            ]
+
+        return AGUIAssistantMessage(
+            id=str(message.id),
+            role="assistant",
+            content=stringify_if_needed(resolve_message_content(message.content)),
+            tool_calls=tool_calls,
+            name=message.name,
+        )
+    elif isinstance(message, SystemMessage):
+        return AGUISystemMessage(
+            id=str(message.id),
+            role="system",
+            content=stringify_if_needed(resolve_message_content(message.content)),
+            name=message.name,
+        )
+    elif isinstance(message, ToolMessage):
+        return AGUIToolMessage(
+            id=str(message.id),
+            role="tool",
+            content=stringify_if_needed(resolve_message_content(message.content)),
+            tool_call_id=message.tool_call_id,
+        )
+    raise TypeError(f"Unsupported message type: {type(message)}")
 
 def convert_agui_multimodal_to_langchain(content: List[Union[TextInputContent, BinaryInputContent]]) -> List[Dict[str, Any]]:
     """Convert AG-UI multimodal content to LangChain's multimodal format."""
@@ -167,54 +231,71 @@ def convert_agui_multimodal_to_langchain(content: List[Union[TextInputContent, B
     return langchain_content
 
 def agui_messages_to_langchain(messages: List[AGUIMessage]) -> List[BaseMessage]:
-    langchain_messages = []
-    for message in messages:
-        role = message.role
-        if role == "user":
-            # Handle multimodal content
-            if isinstance(message.content, str):
-                content = message.content
-            elif isinstance(message.content, list):
-                content = convert_agui_multimodal_to_langchain(message.content)
-            else:
-                content = str(message.content)
-
-            langchain_messages.append(HumanMessage(
-                id=message.id,
-                content=content,
-                name=message.name,
-            ))
-        elif role == "assistant":
-            tool_calls = []
-            if hasattr(message, "tool_calls") and message.tool_calls:
-                for tc in message.tool_calls:
-                    tool_calls.append({
-                        "id": tc.id,
-                        "name": tc.function.name,
-                        "args": json.loads(tc.function.arguments) if hasattr(tc, "function") and tc.function.arguments else {},
-                        "type": "tool_call",
-                    })
-            langchain_messages.append(AIMessage(
-                id=message.id,
-                content=message.content or "",
-                tool_calls=tool_calls,
-                name=message.name,
-            ))
-        elif role == "system":
-            langchain_messages.append(SystemMessage(
-                id=message.id,
-                content=message.content,
-                name=message.name,
-            ))
-        elif role == "tool":
-            langchain_messages.append(ToolMessage(
-                id=message.id,
-                content=message.content,
-                tool_call_id=message.tool_call_id,
-            ))
+    return [agui_message_to_langchain(message) for message in messages]
+
+def agui_message_to_langchain(message: AGUIMessage) -> BaseMessage:
+    role = message.role
+    if role == "user":
+        # Handle multimodal content
+        if isinstance(message.content, str):
+            content = message.content
+        elif isinstance(message.content, list):
+            content = convert_agui_multimodal_to_langchain(message.content)
         else:
-            raise ValueError(f"Unsupported message role: {role}")
-    return langchain_messages
+            content = str(message.content)
+
+        return HumanMessage(
+            id=message.id,
+            content=content,
+            name=message.name,
+        )
+    elif role == "assistant":
+        tool_calls = []
+        if hasattr(message, "tool_calls") and message.tool_calls:
+            for tc in message.tool_calls:
+                tool_calls.append({
+                    "id": tc.id,
+                    "name": tc.function.name,
+                    "args": json.loads(tc.function.arguments) if hasattr(tc, "function") and tc.function.arguments else {},
+                    "type": "tool_call",
+                })
+        return AIMessage(
+            id=message.id,
+            content=message.content or "",
+            tool_calls=tool_calls,
+            name=message.name,
+        )
+    elif role == "system":
+        return SystemMessage(
+            id=message.id,
+            content=message.content,
+            name=message.name,
+        )
+    elif role == "tool":
+        return ToolMessage(
+            id=message.id,
+            content=message.content,
+            tool_call_id=message.tool_call_id,
+        )
+    raise ValueError(f"Unsupported message role: {role}")
+
+_TOOL_LIST_ADAPTER = TypeAdapter(List[AGUITool])
+
+def tools_to_dicts(tools: List[Any]) -> List[Any]:
+    if tools and all(isinstance(tool, AGUITool) for tool in tools):
+        # One batched dump is several times cheaper than model_dump per tool,
+        # and builds fresh dicts just the same
+        return _TOOL_LIST_ADAPTER.dump_python(tools)
+
+    tools_as_dicts = []
+    for tool in tools:
+        if hasattr(tool, "model_dump"):
+            tools_as_dicts.append(tool.model_dump())
+        elif hasattr(tool, "dict"):
+            tools_as_dicts.append(tool.dict())
+        else:
+            tools_as_dicts.append(tool)
+    return tools_as_dicts
 
 def resolve_reasoning_content(chunk: Any) -> LangGraphReasoning | None:
     content = chunk.content
@@ -306,7 +387,182 @@ def json_safe_stringify(o):
         return o.isoformat()
     return str(o)                # last resort
 
-def make_json_safe(value: Any, _seen: set[int] | None = None) -> Any:
+_JSON_PRIMITIVES = (str, int, float, bool, type(None))
+_JSON_LEAF_TYPES = frozenset(_JSON_PRIMITIVES)
+
+# Handler kinds resolved once per type by _json_safe_handler
+_LEAF, _ENUM, _MAPPING, _SEQUENCE, _OBJECT = range(5)
+_json_safe_handlers: Dict[type, Tuple[int, Tuple[Any, ...]]] = {}
+
+def _dump_dataclass(value: Any) -> Any:
+    return asdict(value)
+
+def _json_safe_handler(cls: type) -> Tuple[int, Tuple[Any, ...]]:
+    handler = _json_safe_handlers.get(cls)
+    if handler is not None:
+        return handler
+
+    if issubclass(cls, _JSON_PRIMITIVES):
+        handler = (_LEAF, ())
+    elif issubclass(cls, Enum):
+        handler = (_ENUM, ())
+    elif issubclass(cls, dict):
+        handler = (_MAPPING, ())
+    elif issubclass(cls, (list, tuple, set, frozenset)):
+        handler = (_SEQUENCE, ())
+    else:
+        # Conversions tried in order until one succeeds; repr() is the last resort
+        converters = []
+        if is_dataclass(cls):
+            converters.append(_dump_dataclass)
+        for name in ("model_dump", "dict", "to_dict"):
+            if callable(getattr(cls, name, None)):
+                converters.append(methodcaller(name))
+        converters.append(vars)
+        handler = (_OBJECT, tuple(converters))
+
+    _json_safe_handlers[cls] = handler
+    return handler
+
+# Traversal frame: (source, items iterator, output container, is_mapping, depth)
+_JsonSafeFrame = Tuple[Any, Any, Any, bool, int]
+
+class _JsonSafeConverter:
+    def __init__(self, max_depth: Optional[int], max_size: Optional[int]):
+        self.max_depth = sys.maxsize if max_depth is None else max_depth
+        self.remaining = sys.maxsize if max_size is None else max_size
+        # Set once a container is cut short by either limit
+        self.limited = False
+        # id -> (source, converted); holding the source keeps its id from being reused
+        self.memo: Dict[int, Tuple[Any, Any]] = {}
+        # ids of the containers on the current path, for cycle detection
+        self.ancestors: set[int] = set()
+
+    def convert(self, value: Any) -> Any:
+        result, frame = self.enter(value, 0)
+        if frame is None:
+            return result
+
+        leaf_types = _JSON_LEAF_TYPES
+        stack = [frame]
+        while stack:
+            source, items, out, is_mapping, depth = stack[-1]
+            child_depth = depth + 1
+            child_frame = None
+            if is_mapping:
+                for key, item in items:
+                    if type(key) not in leaf_types:
+                        key = self.convert_key(key)
+                    if self.remaining > 0:
+                        item_type = type(item)
+                        if item_type in leaf_types:
+                            self.remaining -= 1
+                            out[key] = item
+                            continue
+                        if not item and (item_type is dict or item_type is list):
+                            self.remaining -= 1
+                            out[key] = {} if item_type is dict else []
+                            continue
+                    out[key], child_frame = self.enter(item, child_depth)
+                    if child_frame is not None or self.remaining < 0:
+                        break
+            else:
+                for item in items:
+                    if self.remaining > 0:
+                        item_type = type(item)
+                        if item_type in leaf_types:
+                            self.remaining -= 1
+                            out.append(item)
+                            continue
+                        if not item and (item_type is dict or item_type is list):
+                            self.remaining -= 1
+                            out.append({} if item_type is dict else [])
+                            continue
+                    child, child_frame = self.enter(item, child_depth)
+                    out.append(child)
+                    if child_frame is not None or self.remaining < 0:
+                        break
+
+            if child_frame is not None:
+                # The child's container is already linked into its parent and
+                # is filled in place once its frame is on top of the stack
+                stack.append(child_frame)
+            else:
+                # Exhausted, or truncated once the size budget ran out
+                stack.pop()
+                source_id = id(source)
+                self.ancestors.discard(source_id)
+                self.memo[source_id] = (source, out)
+
+        return result
+
+    def convert_key(self, key: Any) -> Any:
+        if isinstance(key, _JSON_PRIMITIVES):
+            return key
+        safe_key = self.convert(key)
+        return safe_key if isinstance(safe_key, _JSON_PRIMITIVES) else str(safe_key)
+
+    def enter(self, value: Any, depth: int) -> Tuple[Any, Optional[_JsonSafeFrame]]:
+        """Return (converted value, None) for leaves or (container, frame) to descend into."""
+        self.remaining -= 1
+        if self.remaining < 0:
+            self.limited = True
+            return "<truncated>", None
+        if type(value) in _JSON_LEAF_TYPES:
+            return value, None
+
+        source_id = id(value)
+        if source_id in self.ancestors:
+            return "<recursive>", None
+        memoized = self.memo.get(source_id)
+        if memoized is not None:
+            return memoized[1], None
+
+        # Enum values and conversion results are resolved in place; only the
+        # original object takes part in cycle detection and memoization
+        source = value
+        while True:
+            kind, converters = _json_safe_handlers.get(type(value)) or _json_safe_handler(type(value))
+            if kind == _LEAF:
+                result = value
+                break
+            if kind == _ENUM:
+                value = value.value
+                continue
+            if kind == _MAPPING or kind == _SEQUENCE:
+                if not value:
+                    result = {} if kind == _MAPPING else []
+                    break
+                if depth > self.max_depth:
+                    self.limited = True
+                    return "<max depth>", None
+                self.ancestors.add(source_id)
+                if kind == _MAPPING:
+                    out = {}
+                    return out, (source, iter(value.items()), out, True, depth)
+                out = []
+                return out, (source, iter(value), out, False, depth)
+
+            for convert in converters:
+                try:
+                    converted = convert(value)
+                except Exception:
+                    continue
+                break
+            else:
+                result = repr(value)
+                break
+            value = converted
+
+        self.memo[source_id] = (source, result)
+        return result, None
+
+def make_json_safe(
+    value: Any,
+    *,
+    max_depth: Optional[int] = None,
+    max_size: Optional[int] = None,
+) -> Any:
     """
     Convert `value` into something that `json.dumps` can always handle.
 
@@ -320,73 +576,19 @@ def make_json_safe(value: Any, _seen: set[int] | None = None) -> Any:
     - objects with __dict__ → vars(obj) then recurse
     - everything else → repr(obj)
 
-    Cycles are detected and replaced with the string "<recursive>".
+    The conversion is iterative, with the handler for each type resolved once
+    and cached. Objects reached more than once are converted once and share
+    the result. Only true cycles (an object nested in itself) are replaced
+    with "<recursive>". Both limits are off by default: with `max_depth`,
+    containers nested deeper become "<max depth>", and with `max_size`, the
+    values left once that many have been visited become "<truncated>". A
+    warning is logged whenever a limit drops data.
     """
-    if _seen is None:
-        _seen = set()
-
-    obj_id = id(value)
-    if obj_id in _seen:
-        return "<recursive>"
-
-    # --- 1. Primitives -----------------------------------------------------
-    if isinstance(value, (str, int, float, bool)) or value is None:
-        return value
-
-    # --- 2. Enum → use underlying value -----------------------------------
-    if isinstance(value, Enum):
-        return make_json_safe(value.value, _seen)
-
-    # --- 3. Dicts ----------------------------------------------------------
-    if isinstance(value, dict):
-        _seen.add(obj_id)
-        return {
-            make_json_safe(k, _seen): make_json_safe(v, _seen)
-            for k, v in value.items()
-        }
-
-    # --- 4. Iterable containers -------------------------------------------
-    if isinstance(value, (list, tuple, set, frozenset)):
-        _seen.add(obj_id)
-        return [make_json_safe(v, _seen) for v in value]
-
-    # --- 5. Dataclasses ----------------------------------------------------
-    if is_dataclass(value):
-        _seen.add(obj_id)
-        return make_json_safe(asdict(value), _seen)
-
-    # --- 6. Pydantic-like models (v2: model_dump) -------------------------
-    if hasattr(value, "model_dump") and callable(getattr(value, "model_dump")):
-        _seen.add(obj_id)
-        try:
-            return make_json_safe(value.model_dump(), _seen)
-        except Exception:
-            # fall through to other options
-            pass
-
-    # --- 7. Pydantic v1-style / other libs with .dict() -------------------
-    if hasattr(value, "dict") and callable(getattr(value, "dict")):
-        _seen.add(obj_id)
-        try:
-            return make_json_safe(value.dict(), _seen)
-        except Exception:
-            pass
-
-    # --- 8. Generic "to_dict" pattern -------------------------------------
-    if hasattr(value, "to_dict") and callable(getattr(value, "to_dict")):
-        _seen.add(obj_id)
-        try:
-            return make_json_safe(value.to_dict(), _seen)
-        except Exception:
-            pass
-
-    # --- 9. Generic Python objects with __dict__ --------------------------
-    if hasattr(value, "__dict__"):
-        _seen.add(obj_id)
-        try:
-            return make_json_safe(vars(value), _seen)
-        except Exception:
-            pass
-
-    # --- 10. Last resort ---------------------------------------------------
-    return repr(value)
\ No newline at end of file
+    converter = _JsonSafeConverter(max_depth, max_size)
+    result = converter.convert(value)
+    if converter.limited:
+        logger.warning(
+            "make_json_safe dropped data past its limits (max_depth=%s, max_size=%s)",
+            max_depth, max_size,
+        )
+    return result
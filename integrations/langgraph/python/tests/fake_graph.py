@@ -0,0 +1,113 @@
+"""
+In-memory stand-in for a compiled LangGraph graph, used by agent tests.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+from ag_ui.core import RunAgentInput, UserMessage
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+
+def node_name_for(thread_id: str) -> str:
+    return f"node-{thread_id}"
+
+
+def make_input(thread_id: str, **overrides) -> RunAgentInput:
+    values = dict(
+        thread_id=thread_id,
+        run_id=f"run-{thread_id}",
+        state={},
+        messages=[UserMessage(id=f"user-{thread_id}", role="user", content="hi")],
+        tools=[],
+        context=[],
+        forwarded_props={},
+    )
+    values.update(overrides)
+    return RunAgentInput(**values)
+
+
+class FakeGraph:
+    """Streams one chat reply per run, yielding control between events."""
+
+    def __init__(self, tokens_per_reply: int = 20):
+        self.tokens_per_reply = tokens_per_reply
+        self.replies = {}
+
+    async def aget_state(self, config):
+        await asyncio.sleep(0)
+        thread_id = config["configurable"]["thread_id"]
+        messages = [self.replies[thread_id]] if thread_id in self.replies else []
+        return SimpleNamespace(
+            values={"messages": messages},
+            tasks=[],
+            next=(),
+            metadata={"writes": {node_name_for(thread_id): {}}},
+        )
+
+    async def astream_events(self, input, config=None, subgraphs=False, version="v2"):
+        thread_id = config["configurable"]["thread_id"]
+        run_id = f"lg-run-{thread_id}"
+        message_id = f"ai-{thread_id}"
+        metadata = {"langgraph_node": node_name_for(thread_id)}
+
+        yield {"event": "on_chain_start", "run_id": run_id, "metadata": metadata, "data": {}}
+        for i in range(self.tokens_per_reply):
+            # Yield control so streams from different requests interleave
+            await asyncio.sleep(0)
+            yield {
+                "event": "on_chat_model_stream",
+                "run_id": run_id,
+                "metadata": metadata,
+                "data": {"chunk": AIMessageChunk(content=f"{thread_id}:{i} ", id=message_id)},
+            }
+        await asyncio.sleep(0)
+        yield {"event": "on_chat_model_end", "run_id": run_id, "metadata": metadata, "data": {}}
+        self.replies[thread_id] = AIMessage(content="done", id=message_id)
+
+
+class _Schema:
+    def __init__(self, keys):
+        self.keys = keys
+
+    def schema(self):
+        return {"properties": {key: {} for key in self.keys}}
+
+
+class ScriptedGraph:
+    """Runs a fixed sequence of nodes, each ending with a state update."""
+
+    context_schema = None
+
+    def __init__(self, state_keys, steps, values=None):
+        self.state_keys = list(state_keys)
+        self.steps = steps
+        self.values = dict(values or {})
+
+    def get_input_jsonschema(self, config=None):
+        return _Schema(self.state_keys).schema()
+
+    def get_output_jsonschema(self, config=None):
+        return _Schema(self.state_keys).schema()
+
+    def config_schema(self):
+        return _Schema([])
+
+    async def aget_state(self, config):
+        await asyncio.sleep(0)
+        return SimpleNamespace(
+            values=dict(self.values),
+            tasks=[],
+            next=(),
+            metadata={"writes": {}},
+        )
+
+    async def astream_events(self, input, config=None, subgraphs=False, version="v2"):
+        self.values.update(input or {})
+        for index, (node, output) in enumerate(self.steps):
+            run_id = f"lg-run-{index}"
+            metadata = {"langgraph_node": node}
+            await asyncio.sleep(0)
+            yield {"event": "on_chain_start", "run_id": run_id, "metadata": metadata, "data": {}}
+            self.values.update(output)
+            yield {"event": "on_chain_end", "run_id": run_id, "metadata": metadata, "data": {"output": output}}
@@ -0,0 +1,167 @@
+"""
+Tests for the message ID -> checkpoint index used by regenerate/edit.
+"""
+
+import unittest
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from ag_ui.core import UserMessage
+
+from ag_ui_langgraph import LangGraphAgent, MessageCheckpointIndex
+from .fake_graph import make_input
+
+
+def _chat(state):
+    return {"messages": [AIMessage(content="ok", id="ai-" + state["messages"][-1].id)]}
+
+
+def _build_graph():
+    builder = StateGraph(MessagesState)
+    builder.add_node("chat", _chat)
+    builder.add_edge(START, "chat")
+    builder.add_edge("chat", END)
+    return builder.compile(checkpointer=InMemorySaver())
+
+
+async def _reference_checkpoint_before(graph, message_id, thread_id):
+    """The original full-history implementation."""
+    history_list = [s async for s in graph.aget_state_history({"configurable": {"thread_id": thread_id}})]
+    history_list.reverse()
+    for idx, snapshot in enumerate(history_list):
+        if any(m.id == message_id for m in snapshot.values.get("messages", [])):
+            if idx == 0:
+                snapshot.values["messages"] = []
+                return snapshot
+            values = snapshot.values.copy()
+            del values["messages"]
+            checkpoint = history_list[idx - 1]
+            return checkpoint._replace(values={**checkpoint.values, **values})
+    raise ValueError("Message ID not found in history")
+
+
+class CountingHistoryGraph:
+    """Wraps a compiled graph and counts the history snapshots read."""
+
+    def __init__(self, graph):
+        self._graph = graph
+        self.snapshots_read = 0
+
+    def __getattr__(self, name):
+        return getattr(self._graph, name)
+
+    async def aget_state_history(self, config):
+        async for snapshot in self._graph.aget_state_history(config):
+            self.snapshots_read += 1
+            yield snapshot
+
+
+class TestCheckpointIndex(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.graph = CountingHistoryGraph(_build_graph())
+        self.agent = LangGraphAgent(name="index", graph=self.graph)
+        self.config = {"configurable": {"thread_id": "t1"}}
+        for i in range(10):
+            await self.graph.ainvoke(
+                {"messages": [HumanMessage(content=f"turn {i}", id=f"u{i}")]}, self.config
+            )
+
+    async def _assert_matches_reference(self, message_id):
+        expected = await _reference_checkpoint_before(self.graph._graph, message_id, "t1")
+        self.graph.snapshots_read = 0
+        actual = await self.agent.get_checkpoint_before_message(message_id, "t1")
+        self.assertEqual(actual.values, expected.values)
+        self.assertEqual(actual.config, expected.config)
+
+    async def test_lazy_lookup_matches_full_scan(self):
+        for message_id in ["u0", "ai-u0", "u5", "u9", "ai-u9"]:
+            await self._assert_matches_reference(message_id)
+
+    async def test_lazy_lookup_stops_early(self):
+        await self._assert_matches_reference("u9")
+        total = len([s async for s in self.graph._graph.aget_state_history(self.config)])
+
+        self.assertLess(self.graph.snapshots_read, 5)
+        self.assertGreaterEqual(total, 30)
+
+    async def test_lookup_fills_index_for_older_messages(self):
+        await self._assert_matches_reference("u5")
+        index = self.agent.checkpoint_index
+        # Messages whose first checkpoint was passed by the walk are indexed
+        for message_id in ["u5", "ai-u5", "u9", "ai-u9"]:
+            self.assertIsNotNone(index.get("t1", message_id))
+        self.assertIsNone(index.get("t1", "u4"))
+
+        for message_id in ["u5", "ai-u7", "u9"]:
+            await self._assert_matches_reference(message_id)
+            self.assertEqual(self.graph.snapshots_read, 0)
+
+    async def test_runs_do_not_read_history(self):
+        self.graph.snapshots_read = 0
+        async for _ in self.agent.run(make_input(
+            "t2", messages=[UserMessage(id="user-1", role="user", content="hi")]
+        )):
+            pass
+
+        self.assertEqual(self.graph.snapshots_read, 0)
+        self.assertIsNone(self.agent.checkpoint_index.get("t2", "user-1"))
+
+    async def test_index_is_shared_per_checkpointer(self):
+        other = LangGraphAgent(name="other", graph=self.graph)
+        self.assertIs(other.checkpoint_index, self.agent.checkpoint_index)
+
+    async def test_unknown_message_raises(self):
+        with self.assertRaises(ValueError):
+            await self.agent.get_checkpoint_before_message("missing", "t1")
+
+    async def test_forked_thread_uses_parent_checkpoint(self):
+        # Fork the thread before u5, as regenerate does, then grow both branches
+        # so their checkpoints interleave in the thread history
+        before_u5 = await _reference_checkpoint_before(self.graph._graph, "u5", "t1")
+        old_branch = (await self.graph.aget_state(self.config)).config
+        fork = await self.graph.aupdate_state(before_u5.config, before_u5.values, as_node="chat")
+        await self.graph.ainvoke({"messages": [HumanMessage(content="again", id="u5b")]}, fork)
+        new_branch = await self.graph.aget_state(self.config)
+        await self.graph.ainvoke({"messages": [HumanMessage(content="old", id="u10")]}, old_branch)
+        await self.graph.ainvoke({"messages": [HumanMessage(content="new", id="u6b")]}, new_branch.config)
+
+        for lookup in range(2):
+            self.graph.snapshots_read = 0
+            checkpoint = await self.agent.get_checkpoint_before_message("u6b", "t1")
+            self.assertEqual(
+                [m.id for m in checkpoint.values["messages"]],
+                [m.id for m in new_branch.values["messages"]],
+            )
+            if lookup:
+                self.assertEqual(self.graph.snapshots_read, 0)
+
+    async def test_message_of_another_branch_uses_its_own_parent(self):
+        # u7 only exists on the branch abandoned by a fork before u5
+        before_u5 = await _reference_checkpoint_before(self.graph._graph, "u5", "t1")
+        expected = await _reference_checkpoint_before(self.graph._graph, "u7", "t1")
+        fork = await self.graph.aupdate_state(before_u5.config, before_u5.values, as_node="chat")
+        await self.graph.ainvoke({"messages": [HumanMessage(content="again", id="u5b")]}, fork)
+
+        for _ in range(2):
+            checkpoint = await self.agent.get_checkpoint_before_message("u7", "t1")
+            self.assertEqual(checkpoint.config, expected.config)
+            self.assertEqual(checkpoint.values, expected.values)
+
+
+class TestMessageCheckpointIndexBounds(unittest.TestCase):
+
+    def test_least_recently_used_threads_are_dropped(self):
+        index = MessageCheckpointIndex(max_threads=2)
+        for thread_id in ["a", "b", "c"]:
+            index.record(thread_id, {f"{thread_id}-1": {"configurable": {"thread_id": thread_id}}})
+
+        self.assertEqual(len(index), 2)
+        self.assertIsNone(index.get("a", "a-1"))
+        self.assertIsNotNone(index.get("c", "c-1"))
+
+
+if __name__ == "__main__":
+    unittest.main()
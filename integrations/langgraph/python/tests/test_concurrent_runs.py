@@ -0,0 +1,89 @@
+"""
+Concurrency stress test: one LangGraphAgent instance serving many streams.
+"""
+
+import asyncio
+import unittest
+import warnings
+
+from ag_ui.core import EventType
+
+from ag_ui_langgraph import LangGraphAgent
+from .fake_graph import FakeGraph, make_input, node_name_for
+
+
+class TestConcurrentRuns(unittest.IsolatedAsyncioTestCase):
+    """Runs sharing an agent instance must not see each other's state."""
+
+    async def test_concurrent_streams_are_isolated(self):
+        graph = FakeGraph()
+        agent = LangGraphAgent(name="stress", graph=graph)
+        thread_ids = [f"t{i}" for i in range(200)]
+
+        async def collect(thread_id):
+            return [event async for event in agent.run(make_input(thread_id))]
+
+        results = await asyncio.gather(*(collect(thread_id) for thread_id in thread_ids))
+
+        for thread_id, events in zip(thread_ids, results):
+            types = [event.type for event in events]
+            self.assertEqual(types[0], EventType.RUN_STARTED)
+            self.assertEqual(types[-1], EventType.RUN_FINISHED)
+            self.assertEqual(types.count(EventType.TEXT_MESSAGE_START), 1)
+            self.assertEqual(types.count(EventType.TEXT_MESSAGE_END), 1)
+            steps = [
+                (event.type, event.step_name) for event in events
+                if event.type in (EventType.STEP_STARTED, EventType.STEP_FINISHED)
+            ]
+            self.assertEqual(steps, [
+                (EventType.STEP_STARTED, node_name_for(thread_id)),
+                (EventType.STEP_FINISHED, node_name_for(thread_id)),
+            ])
+
+            message_ids = {
+                event.message_id for event in events
+                if event.type in (
+                    EventType.TEXT_MESSAGE_START,
+                    EventType.TEXT_MESSAGE_CONTENT,
+                    EventType.TEXT_MESSAGE_END,
+                )
+            }
+            self.assertEqual(message_ids, {f"ai-{thread_id}"})
+
+            content = "".join(
+                event.delta for event in events if event.type == EventType.TEXT_MESSAGE_CONTENT
+            )
+            expected = "".join(f"{thread_id}:{i} " for i in range(graph.tokens_per_reply))
+            self.assertEqual(content, expected)
+
+            finished = events[-1]
+            self.assertEqual(finished.thread_id, thread_id)
+            self.assertEqual(finished.run_id, f"lg-run-{thread_id}")
+
+    async def test_deprecated_accessors_follow_the_current_run(self):
+        agent = LangGraphAgent(name="compat", graph=FakeGraph(tokens_per_reply=3))
+        seen = {}
+
+        async def collect(thread_id):
+            async for event in agent.run(make_input(thread_id)):
+                if event.type == EventType.TEXT_MESSAGE_CONTENT:
+                    with warnings.catch_warnings():
+                        warnings.simplefilter("ignore", DeprecationWarning)
+                        active_run = agent.active_run
+                        seen.setdefault(thread_id, set()).add(active_run["thread_id"])
+                        self.assertEqual(
+                            agent.get_message_in_progress(active_run["id"])["id"],
+                            f"ai-{thread_id}",
+                        )
+
+        await asyncio.gather(collect("a"), collect("b"))
+
+        self.assertEqual(seen, {"a": {"a"}, "b": {"b"}})
+        with self.assertWarns(DeprecationWarning):
+            self.assertIsNone(agent.active_run)
+        with self.assertWarns(DeprecationWarning):
+            self.assertEqual(agent.messages_in_process, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
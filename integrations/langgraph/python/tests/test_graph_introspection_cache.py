@@ -0,0 +1,89 @@
+"""
+Tests for memoized graph schema keys and stream kwargs introspection.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from ag_ui_langgraph import LangGraphAgent
+from .fake_graph import ScriptedGraph
+
+
+class CountingGraph(ScriptedGraph):
+
+    def __init__(self, state_keys):
+        super().__init__(state_keys, [])
+        self.schema_calls = 0
+
+    def get_input_jsonschema(self, config=None):
+        self.schema_calls += 1
+        return super().get_input_jsonschema(config)
+
+
+def _config(thread_id, **configurable):
+    return {"configurable": {"thread_id": thread_id, **configurable}}
+
+
+class TestGraphIntrospectionCache(unittest.TestCase):
+
+    def test_schema_keys_computed_once_per_config_shape(self):
+        graph = CountingGraph(["document"])
+        agent = LangGraphAgent(name="cache", graph=graph)
+
+        first = agent.get_schema_keys(_config("a"))
+        second = agent.get_schema_keys(_config("b"))
+        agent.get_schema_keys(_config("c", model="gpt"))
+
+        self.assertEqual(first, second)
+        self.assertIn("document", first["input"])
+        self.assertEqual(graph.schema_calls, 2)
+
+    def test_returned_schema_keys_do_not_alias_cache(self):
+        agent = LangGraphAgent(name="cache", graph=CountingGraph(["document"]))
+
+        agent.get_schema_keys(_config("a"))["input"] = []
+
+        self.assertIn("document", agent.get_schema_keys(_config("a"))["input"])
+
+    def test_explicit_invalidation(self):
+        graph = CountingGraph(["document"])
+        agent = LangGraphAgent(name="cache", graph=graph)
+
+        agent.get_schema_keys(_config("a"))
+        graph.state_keys.append("summary")
+        agent.invalidate_graph_cache()
+
+        self.assertIn("summary", agent.get_schema_keys(_config("a"))["output"])
+        self.assertEqual(graph.schema_calls, 2)
+
+    def test_replacing_graph_invalidates(self):
+        agent = LangGraphAgent(name="cache", graph=CountingGraph(["document"]))
+        agent.get_schema_keys(_config("a"))
+
+        agent.graph = CountingGraph(["plan"])
+
+        self.assertIn("plan", agent.get_schema_keys(_config("a"))["input"])
+
+    def test_stream_signature_inspected_once(self):
+        agent = LangGraphAgent(name="cache", graph=CountingGraph([]))
+
+        with patch("ag_ui_langgraph.agent.inspect.signature", wraps=__import__("inspect").signature) as signature:
+            for i in range(5):
+                kwargs = agent.get_stream_kwargs(input={}, config=_config(str(i)))
+
+        self.assertEqual(signature.call_count, 1)
+        self.assertNotIn("context", kwargs)
+
+    def test_warm_up_populates_cache(self):
+        graph = CountingGraph(["document"])
+        agent = LangGraphAgent(name="cache", graph=graph)
+
+        agent.warm_up()
+        agent.get_schema_keys(_config("thread"))
+
+        self.assertEqual(graph.schema_calls, 1)
+        self.assertIsNotNone(agent._stream_supports_context)
+
+
+if __name__ == "__main__":
+    unittest.main()
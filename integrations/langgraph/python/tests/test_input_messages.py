@@ -0,0 +1,88 @@
+"""
+Tests for merging the client's message history into the thread on each run.
+"""
+
+import unittest
+from unittest import mock
+
+from langchain_core.messages import AIMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from ag_ui.core import AssistantMessage, SystemMessage, UserMessage
+
+from ag_ui_langgraph import LangGraphAgent
+from ag_ui_langgraph import agent as agent_module
+from .fake_graph import make_input
+
+
+def _chat(state):
+    return {"messages": [AIMessage(content="ok", id="ai-" + state["messages"][-1].id)]}
+
+
+def _build_graph():
+    builder = StateGraph(MessagesState)
+    builder.add_node("chat", _chat)
+    builder.add_edge(START, "chat")
+    builder.add_edge("chat", END)
+    return builder.compile(checkpointer=InMemorySaver())
+
+
+class TestInputMessages(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.graph = _build_graph()
+        self.agent = LangGraphAgent(name="input", graph=self.graph)
+        self.converted = []
+        convert = agent_module.agui_messages_to_langchain
+
+        def counting_convert(messages):
+            self.converted.append([message.id for message in messages])
+            return convert(messages)
+
+        patcher = mock.patch.object(agent_module, "agui_messages_to_langchain", counting_convert)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _run(self, messages):
+        async for _ in self.agent.run(make_input("t1", messages=messages)):
+            pass
+        state = await self.graph.aget_state({"configurable": {"thread_id": "t1"}})
+        return [message.id for message in state.values["messages"]]
+
+    async def test_hot_thread_converts_only_new_messages(self):
+        history = [
+            SystemMessage(id="sys", role="system", content="be brief"),
+            UserMessage(id="u1", role="user", content="one"),
+        ]
+        self.assertEqual(await self._run(history), ["u1", "ai-u1"])
+
+        history += [
+            AssistantMessage(id="ai-u1", role="assistant", content="ok"),
+            UserMessage(id="u2", role="user", content="two"),
+        ]
+        self.assertEqual(await self._run(history), ["u1", "ai-u1", "u2", "ai-u2"])
+
+        # The leading system message is always handed to the merge, which strips it
+        self.assertEqual(self.converted, [["sys", "u1"], ["sys", "u2"]])
+
+    async def test_shorter_history_still_regenerates_from_the_last_user_message(self):
+        await self._run([UserMessage(id="u1", role="user", content="one")])
+        await self._run([
+            UserMessage(id="u1", role="user", content="one"),
+            AssistantMessage(id="ai-u1", role="assistant", content="ok"),
+            UserMessage(id="u2", role="user", content="two"),
+        ])
+        regenerate = mock.AsyncMock(side_effect=RuntimeError("regenerate"))
+
+        # The client dropped the last exchange and edited u1
+        with mock.patch.object(self.agent, "prepare_regenerate_stream", regenerate), \
+                self.assertRaisesRegex(RuntimeError, "regenerate"):
+            await self._run([UserMessage(id="u1", role="user", content="one, edited")])
+
+        message = regenerate.call_args.kwargs["message_checkpoint"]
+        self.assertEqual((message.id, message.content), ("u1", "one, edited"))
+
+
+if __name__ == "__main__":
+    unittest.main()
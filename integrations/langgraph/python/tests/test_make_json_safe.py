@@ -0,0 +1,163 @@
+"""
+Tests and benchmark for make_json_safe.
+"""
+
+import json
+import timeit
+import unittest
+from dataclasses import dataclass
+from enum import Enum
+
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
+
+from ag_ui_langgraph.utils import make_json_safe
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Flight:
+    number: str
+    stops: list
+
+
+class Plain:
+    def __init__(self):
+        self.name = "plain"
+        self.color = Color.RED
+
+
+class Unconvertible:
+    __slots__ = ()
+
+    def __repr__(self):
+        return "<unconvertible>"
+
+
+def _chunk_event(i):
+    return {
+        "event": "on_chat_model_stream",
+        "run_id": "run-1",
+        "name": "ChatOpenAI",
+        "tags": ["seq:step:1"],
+        "metadata": {"langgraph_node": "chat", "langgraph_step": 1, "ls_provider": "openai"},
+        "data": {"chunk": AIMessageChunk(
+            content=f"token {i} ",
+            id="msg-1",
+            tool_call_chunks=[{"name": None, "args": '{"a"', "id": None, "index": 0}],
+        )},
+    }
+
+
+def _chain_end_event():
+    messages = [
+        HumanMessage(content="question " * 20, id=f"u{i}") if i % 2 == 0
+        else AIMessage(content="answer " * 40, id=f"a{i}")
+        for i in range(50)
+    ]
+    state = {"messages": messages, "document": "text " * 200}
+    return {"event": "on_chain_end", "data": {"input": state, "output": {"messages": messages[-2:]}}}
+
+
+class TestMakeJsonSafe(unittest.TestCase):
+
+    def test_conversion_rules(self):
+        value = {
+            "enum": Color.RED,
+            "tuple": (1, 2.5, None, True),
+            "set": {"only"},
+            "dataclass": Flight("LH1", [1, 2]),
+            "model": HumanMessage(content="hi", id="u1"),
+            "object": Plain(),
+            "other": Unconvertible(),
+            ("tuple", "key"): 1,
+        }
+
+        safe = make_json_safe(value)
+
+        self.assertEqual(safe["enum"], "red")
+        self.assertEqual(safe["tuple"], [1, 2.5, None, True])
+        self.assertEqual(safe["set"], ["only"])
+        self.assertEqual(safe["dataclass"], {"number": "LH1", "stops": [1, 2]})
+        self.assertEqual(safe["model"]["content"], "hi")
+        self.assertEqual(safe["object"], {"name": "plain", "color": "red"})
+        self.assertEqual(safe["other"], "<unconvertible>")
+        self.assertEqual(safe["['tuple', 'key']"], 1)
+        json.dumps(safe)
+
+    def test_shared_substructure_is_not_recursive(self):
+        shared = {"a": [1, 2]}
+        message = HumanMessage(content="hi", id="u1")
+
+        safe = make_json_safe({"first": shared, "second": shared, "messages": [message, message]})
+
+        self.assertEqual(safe["first"], {"a": [1, 2]})
+        self.assertEqual(safe["second"], {"a": [1, 2]})
+        self.assertEqual(safe["messages"][0], safe["messages"][1])
+
+    def test_cycles_are_replaced(self):
+        cyclic = {"name": "root"}
+        cyclic["self"] = cyclic
+        items = [1]
+        items.append(items)
+        node = Plain()
+        node.child = node
+
+        self.assertEqual(make_json_safe(cyclic), {"name": "root", "self": "<recursive>"})
+        self.assertEqual(make_json_safe(items), [1, "<recursive>"])
+        self.assertEqual(make_json_safe(node)["child"], "<recursive>")
+
+    def test_deep_nesting_does_not_recurse(self):
+        value = current = {}
+        for _ in range(10000):
+            current["next"] = current = {}
+
+        safe = make_json_safe(value)
+
+        depth = 0
+        while safe:
+            safe = safe["next"]
+            depth += 1
+        self.assertEqual(depth, 10000)
+
+    def test_large_values_are_kept_whole_by_default(self):
+        value = {"items": [{"n": i} for i in range(200_000)], "after": "x"}
+
+        with self.assertNoLogs("ag_ui_langgraph.utils"):
+            safe = make_json_safe(value)
+
+        self.assertEqual(safe, value)
+
+    def test_depth_limit(self):
+        with self.assertLogs("ag_ui_langgraph.utils", "WARNING"):
+            safe = make_json_safe({"a": {"b": {"c": {"d": 1}}}}, max_depth=1)
+
+        self.assertEqual(safe, {"a": {"b": "<max depth>"}})
+
+    def test_size_limit(self):
+        with self.assertLogs("ag_ui_langgraph.utils", "WARNING") as logs:
+            safe = make_json_safe({"items": list(range(100)), "after": "x"}, max_size=10)
+
+        self.assertEqual(safe["items"][-1], "<truncated>")
+        self.assertLess(len(safe["items"]), 10)
+        self.assertEqual(safe["after"], "<truncated>")
+        self.assertIn("max_size=10", logs.output[0])
+
+
+class TestMakeJsonSafeBenchmark(unittest.TestCase):
+    """Timings on typical LangGraph events; run with -s to see the numbers."""
+
+    def test_typical_events(self):
+        for name, event, number in [
+            ("chat model chunk", _chunk_event(1), 2000),
+            ("chain end, 50 messages", _chain_end_event(), 100),
+        ]:
+            seconds = min(timeit.repeat(lambda: make_json_safe(event), number=number, repeat=5))
+            print(f"\nmake_json_safe {name}: {seconds / number * 1e6:.1f} us/event")
+            json.dumps(make_json_safe(event))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+Tests for the run-end MESSAGES_SNAPSHOT and the message conversion cache.
+"""
+
+import unittest
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START, MessagesState, StateGraph
+
+from ag_ui.core import AssistantMessage, EventType, UserMessage
+
+from ag_ui_langgraph import LangGraphAgent
+from ag_ui_langgraph.utils import (
+    MessageConversionCache,
+    langchain_messages_to_agui,
+)
+from .fake_graph import make_input
+
+
+def _chat(state):
+    return {"messages": [AIMessage(content="reply", id="ai-" + state["messages"][-1].id)]}
+
+
+def _build_graph():
+    builder = StateGraph(MessagesState)
+    builder.add_node("chat", _chat)
+    builder.add_edge(START, "chat")
+    builder.add_edge("chat", END)
+    return builder.compile(checkpointer=InMemorySaver())
+
+
+def _history(turns):
+    messages = []
+    for i in range(turns):
+        messages.append(HumanMessage(content=f"question {i}", id=f"u{i}"))
+        messages.append(AIMessage(
+            content="",
+            id=f"a{i}",
+            tool_calls=[{"id": f"call{i}", "name": "search", "args": {"q": i}}],
+        ))
+        messages.append(ToolMessage(content=f"result {i}", id=f"t{i}", tool_call_id=f"call{i}"))
+    return messages
+
+
+class TestMessagesSnapshot(unittest.IsolatedAsyncioTestCase):
+
+    async def _snapshot(self, agent, thread_id, messages):
+        events = [event async for event in agent.run(make_input(thread_id, messages=messages))]
+        return next(event for event in events if event.type == EventType.MESSAGES_SNAPSHOT)
+
+    async def test_full_mode_sends_whole_conversation(self):
+        agent = LangGraphAgent(name="full", graph=_build_graph())
+        first = [UserMessage(id="u1", role="user", content="hi")]
+        await self._snapshot(agent, "t1", first)
+
+        second = first + [
+            AssistantMessage(id="ai-u1", role="assistant", content="reply"),
+            UserMessage(id="u2", role="user", content="again"),
+        ]
+        snapshot = await self._snapshot(agent, "t1", second)
+
+        self.assertEqual([m.id for m in snapshot.messages], ["u1", "ai-u1", "u2", "ai-u2"])
+
+
+class TestMessageConversionCache(unittest.TestCase):
+
+    def test_unchanged_messages_convert_once(self):
+        cache = MessageConversionCache()
+
+        first = langchain_messages_to_agui(_history(10), cache=cache)
+        second = langchain_messages_to_agui(_history(10), cache=cache)
+
+        self.assertEqual(cache.misses, 30)
+        self.assertEqual(cache.hits, 30)
+        self.assertEqual(first, second)
+        self.assertEqual(first, langchain_messages_to_agui(_history(10)))
+
+    def test_edited_message_with_same_id_is_reconverted(self):
+        cache = MessageConversionCache()
+        langchain_messages_to_agui([HumanMessage(content="before", id="u1")], cache=cache)
+
+        converted = langchain_messages_to_agui([HumanMessage(content="after", id="u1")], cache=cache)
+
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(converted[0].content, "after")
+
+    def test_cache_is_bounded(self):
+        cache = MessageConversionCache(max_size=5)
+
+        langchain_messages_to_agui(_history(10), cache=cache)
+
+        self.assertEqual(len(cache), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""
+Tests for RAW event emission policies and raw_event attachment.
+"""
+
+import unittest
+from unittest.mock import patch
+
+from ag_ui.core import EventType
+
+from ag_ui_langgraph import LangGraphAgent, RawEventPolicy
+from .fake_graph import FakeGraph, make_input
+
+
+class TestRawEventPolicy(unittest.IsolatedAsyncioTestCase):
+
+    async def _run(self, **agent_kwargs):
+        graph = FakeGraph(tokens_per_reply=25)
+        agent = LangGraphAgent(name="raw", graph=graph, **agent_kwargs)
+        return [event async for event in agent.run(make_input("t1"))]
+
+    @staticmethod
+    def _raw_source_events(events):
+        return [event.event["event"] for event in events if event.type == EventType.RAW]
+
+    async def test_full_policy_forwards_every_event(self):
+        events = await self._run(raw_event_policy="full")
+        raw = self._raw_source_events(events)
+        self.assertEqual(len(raw), 27)
+        self.assertEqual(raw.count("on_chat_model_stream"), 25)
+
+    async def test_off_policy_forwards_nothing(self):
+        events = await self._run(raw_event_policy=RawEventPolicy.Off)
+        self.assertEqual(self._raw_source_events(events), [])
+        self.assertTrue(any(event.type == EventType.TEXT_MESSAGE_CONTENT for event in events))
+
+    async def test_lifecycle_policy_skips_stream_events(self):
+        events = await self._run(raw_event_policy="lifecycle")
+        self.assertEqual(self._raw_source_events(events), ["on_chain_start", "on_chat_model_end"])
+
+    async def test_sampled_policy_keeps_every_nth_stream_event(self):
+        events = await self._run(raw_event_policy="sampled", raw_event_sample_every=10)
+        raw = self._raw_source_events(events)
+        self.assertEqual(raw.count("on_chat_model_stream"), 3)
+        self.assertIn("on_chain_start", raw)
+        self.assertIn("on_chat_model_end", raw)
+
+    async def test_raw_event_not_attached_by_default(self):
+        with patch("ag_ui_langgraph.agent.make_json_safe", wraps=lambda value: value) as safe:
+            events = await self._run(raw_event_policy="off")
+
+        derived = [event for event in events if event.type != EventType.RAW]
+        self.assertTrue(all(getattr(event, "raw_event", None) is None for event in derived))
+        safe.assert_not_called()
+
+    async def test_raw_event_attached_when_enabled(self):
+        events = await self._run(raw_event_policy="off", attach_raw_events=True)
+        content = [event for event in events if event.type == EventType.TEXT_MESSAGE_CONTENT]
+        self.assertTrue(all(event.raw_event["event"] == "on_chat_model_stream" for event in content))
+
+    def test_invalid_policy_rejected(self):
+        with self.assertRaises(ValueError):
+            LangGraphAgent(name="raw", graph=FakeGraph(), raw_event_policy="sometimes")
+        with self.assertRaises(ValueError):
+            LangGraphAgent(name="raw", graph=FakeGraph(), raw_event_sample_every=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Tests that per-run state is released when streams complete, fail or are cancelled.
+"""
+
+import gc
+import os
+import unittest
+
+from ag_ui_langgraph import LangGraphAgent
+from .fake_graph import FakeGraph, make_input
+
+
+def _rss_bytes():
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+class FailingGraph(FakeGraph):
+
+    async def astream_events(self, input, config=None, subgraphs=False, version="v2"):
+        async for event in super().astream_events(input, config, subgraphs, version):
+            yield event
+            raise RuntimeError("graph failed")
+
+
+class TestRunCleanup(unittest.IsolatedAsyncioTestCase):
+
+    async def test_completed_run_is_released(self):
+        agent = LangGraphAgent(name="cleanup", graph=FakeGraph(tokens_per_reply=3))
+
+        stream = agent.run(make_input("t1"))
+        await stream.__anext__()
+        self.assertEqual(agent.active_run_count, 1)
+        async for _ in stream:
+            pass
+
+        self.assertEqual(agent.active_run_count, 0)
+
+    async def test_failed_run_is_released(self):
+        agent = LangGraphAgent(name="cleanup", graph=FailingGraph(tokens_per_reply=3))
+
+        with self.assertRaises(RuntimeError):
+            async for _ in agent.run(make_input("t1")):
+                pass
+
+        self.assertEqual(agent.active_run_count, 0)
+
+    async def test_cancelled_run_is_released(self):
+        agent = LangGraphAgent(name="cleanup", graph=FakeGraph(tokens_per_reply=50))
+
+        stream = agent.run(make_input("t1"))
+        for _ in range(10):
+            await stream.__anext__()
+        run = next(iter(agent._active_runs))
+        self.assertTrue(run.messages_in_process)
+        await stream.aclose()
+
+        self.assertEqual(agent.active_run_count, 0)
+        self.assertEqual(run.messages_in_process, {})
+
+
+@unittest.skipUnless(os.path.exists("/proc/self/statm"), "RSS is read from /proc")
+class TestRunMemoryRegression(unittest.IsolatedAsyncioTestCase):
+
+    async def _run_many(self, agent, count, offset=0):
+        for i in range(count):
+            thread_id = f"t{i % 10}"
+            async for _ in agent.run(make_input(thread_id, run_id=f"run-{offset + i}")):
+                pass
+
+    async def test_10k_runs_keep_rss_flat(self):
+        agent = LangGraphAgent(name="memory", graph=FakeGraph(tokens_per_reply=2))
+
+        await self._run_many(agent, 1000)
+        gc.collect()
+        baseline = _rss_bytes()
+
+        await self._run_many(agent, 10000, offset=1000)
+        gc.collect()
+        growth = _rss_bytes() - baseline
+
+        self.assertEqual(agent.active_run_count, 0)
+        self.assertLess(growth, 8 * 1024 * 1024, f"RSS grew by {growth} bytes over 10k runs")
+
+
+if __name__ == "__main__":
+    unittest.main()
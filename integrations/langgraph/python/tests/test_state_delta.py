@@ -0,0 +1,97 @@
+"""
+Tests for STATE_DELTA emission in delta state update mode.
+"""
+
+import unittest
+
+from ag_ui.core import EventType
+
+from ag_ui_langgraph import LangGraphAgent, RunContext, StateUpdateMode
+from .fake_graph import ScriptedGraph, make_input
+
+DOCUMENT = "lorem ipsum " * 500
+
+
+def _state_events(events):
+    return [
+        event for event in events
+        if event.type in (EventType.STATE_SNAPSHOT, EventType.STATE_DELTA)
+    ]
+
+
+class TestStateDelta(unittest.IsolatedAsyncioTestCase):
+
+    async def _run(self, steps, mode):
+        graph = ScriptedGraph(["document", "counter"], steps)
+        agent = LangGraphAgent(name="delta", graph=graph, state_update_mode=mode)
+        run_input = make_input("t1", state={"document": DOCUMENT, "counter": 0})
+        return [event async for event in agent.run(run_input)]
+
+    async def test_small_changes_are_sent_as_patches(self):
+        steps = [("plan", {"counter": 1}), ("write", {"counter": 2}), ("review", {"counter": 3})]
+
+        events = _state_events(await self._run(steps, StateUpdateMode.Delta))
+
+        self.assertEqual([event.type for event in events], [
+            EventType.STATE_SNAPSHOT,
+            EventType.STATE_DELTA,
+            EventType.STATE_DELTA,
+            EventType.STATE_SNAPSHOT,
+        ])
+        self.assertEqual(events[0].snapshot["counter"], 1)
+        self.assertEqual(events[1].delta, [{"op": "replace", "path": "/counter", "value": 2}])
+        self.assertEqual(events[2].delta, [{"op": "replace", "path": "/counter", "value": 3}])
+        # Run end always carries the full state
+        self.assertEqual(events[-1].snapshot["document"], DOCUMENT)
+
+    def test_falls_back_to_snapshot_when_patch_is_larger(self):
+        agent = LangGraphAgent(name="delta", graph=ScriptedGraph([], []), state_update_mode="delta")
+        run = RunContext({"id": "run", "schema_keys": {"output": ["a", "b"]}})
+        state = {"a": 1, "b": DOCUMENT}
+
+        first = agent.get_state_update_event(run, state)
+        state["a"] = 2
+        run.bump_state_versions(["a"])
+        small_change = agent.get_state_update_event(run, state)
+        state["b"] = DOCUMENT.upper()
+        state["a"] = 3
+        run.bump_state_versions(["a", "b"])
+        full_change = agent.get_state_update_event(run, state)
+
+        self.assertEqual(first.type, EventType.STATE_SNAPSHOT)
+        self.assertEqual(small_change.type, EventType.STATE_DELTA)
+        self.assertEqual(full_change.type, EventType.STATE_SNAPSHOT)
+        self.assertEqual(full_change.snapshot, {"a": 3, "b": DOCUMENT.upper()})
+
+    async def test_unchanged_state_emits_nothing(self):
+        steps = [("plan", {"counter": 1}), ("noop", {})]
+
+        events = _state_events(await self._run(steps, "delta"))
+
+        # Initial snapshot for "plan", nothing for "noop", final snapshot
+        self.assertEqual([event.type for event in events], [
+            EventType.STATE_SNAPSHOT, EventType.STATE_SNAPSHOT,
+        ])
+
+    async def test_snapshot_mode_is_unchanged(self):
+        steps = [("plan", {"counter": 1}), ("write", {"counter": 2})]
+
+        events = _state_events(await self._run(steps, "snapshot"))
+
+        self.assertTrue(all(event.type == EventType.STATE_SNAPSHOT for event in events))
+        self.assertEqual(len(events), 3)
+
+    async def test_json_pointer_escaping(self):
+        steps = [("plan", {"counter": 1}), ("write", {"a/b~c": True})]
+        graph = ScriptedGraph(["document", "counter", "a/b~c"], steps)
+        agent = LangGraphAgent(name="delta", graph=graph, state_update_mode="delta")
+
+        events = _state_events([
+            event async for event in agent.run(make_input("t1", state={"document": DOCUMENT, "counter": 0}))
+        ])
+
+        self.assertEqual(events[1].delta, [{"op": "add", "path": "/a~1b~0c", "value": True}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Tests for event dispatch and subgraph namespace filtering.
+"""
+
+import unittest
+
+from langchain_core.messages import AIMessageChunk
+
+from ag_ui.core import EventType
+
+from ag_ui_langgraph import LangGraphAgent, RawEventPolicy
+from .fake_graph import FakeGraph, make_input
+
+NAMESPACES = {
+    "root": "chat:1",
+    "research": "research:2|search:3",
+    "nested": "research:2|search:3|deep:4",
+    "writer": "writer:5|draft:6",
+}
+
+
+class NestedGraph(FakeGraph):
+    """Streams one chat reply from the root graph and from each subgraph."""
+
+    async def astream_events(self, input, config=None, subgraphs=False, version="v2"):
+        for name, checkpoint_ns in NAMESPACES.items():
+            metadata = {"langgraph_node": name, "langgraph_checkpoint_ns": checkpoint_ns}
+            run_id = f"lg-{name}"
+            yield {
+                "event": "on_chat_model_stream",
+                "run_id": run_id,
+                "metadata": metadata,
+                "data": {"chunk": AIMessageChunk(content=f"from {name}", id=f"msg-{name}")},
+            }
+            yield {"event": "on_chat_model_end", "run_id": run_id, "metadata": metadata, "data": {}}
+
+
+class TestSubgraphRouting(unittest.IsolatedAsyncioTestCase):
+
+    async def _streamed_messages(self, agent, **input_overrides):
+        events = [event async for event in agent.run(make_input("t1", **input_overrides))]
+        return [event.message_id for event in events if event.type == EventType.TEXT_MESSAGE_START]
+
+    def _agent(self, **kwargs):
+        return LangGraphAgent(name="nested", graph=NestedGraph(), raw_event_policy=RawEventPolicy.Off, **kwargs)
+
+    async def test_all_events_are_translated_by_default(self):
+        messages = await self._streamed_messages(self._agent())
+
+        self.assertEqual(messages, ["msg-root", "msg-research", "msg-nested", "msg-writer"])
+
+    async def test_selected_namespaces_include_nested_subgraphs(self):
+        messages = await self._streamed_messages(self._agent(subgraph_namespaces=["research"]))
+
+        self.assertEqual(messages, ["msg-root", "msg-research", "msg-nested"])
+
+    async def test_nested_namespace_path(self):
+        messages = await self._streamed_messages(self._agent(subgraph_namespaces=["research|search"]))
+
+        self.assertEqual(messages, ["msg-root", "msg-nested"])
+
+    async def test_forwarded_props_override_agent_default(self):
+        agent = self._agent(subgraph_namespaces=["research"])
+
+        messages = await self._streamed_messages(agent, forwarded_props={"stream_subgraphs": ["writer"]})
+
+        self.assertEqual(messages, ["msg-root", "msg-writer"])
+
+    async def test_boolean_stream_subgraphs_keeps_everything(self):
+        messages = await self._streamed_messages(self._agent(), forwarded_props={"stream_subgraphs": True})
+
+        self.assertEqual(len(messages), 4)
+
+    async def test_unhandled_event_types_are_ignored(self):
+        agent = self._agent()
+        run_events = []
+        async for event in agent._handle_single_event(None, {"event": "on_chain_stream"}, {}):
+            run_events.append(event)
+
+        self.assertEqual(run_events, [])
+        self.assertEqual(set(agent._event_handlers), {
+            "on_chat_model_stream", "on_chat_model_end", "on_custom_event", "on_tool_end",
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
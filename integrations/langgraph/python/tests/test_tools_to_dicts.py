@@ -0,0 +1,43 @@
+"""
+Tests for the dict form of the request's tools merged into graph state.
+"""
+
+import unittest
+
+from ag_ui.core import Tool
+
+from ag_ui_langgraph.utils import tools_to_dicts
+
+PARAMETERS = {
+    "type": "object",
+    "properties": {f"p{i}": {"type": "string", "description": "parameter " * 5} for i in range(8)},
+    "required": ["p0"],
+}
+
+
+def _tools(count):
+    return [Tool(name=f"tool_{i}", description="does things " * 10, parameters=PARAMETERS) for i in range(count)]
+
+
+class TestToolsToDicts(unittest.TestCase):
+
+    def test_matches_model_dump(self):
+        tools = _tools(5)
+
+        self.assertEqual(tools_to_dicts(tools), [tool.model_dump() for tool in tools])
+
+    def test_dicts_are_not_shared_with_the_tools(self):
+        tools = _tools(1)
+
+        tools_to_dicts(tools)[0]["parameters"]["properties"]["p0"]["description"] = "mutated"
+
+        self.assertEqual(tools[0].parameters, PARAMETERS)
+
+    def test_non_model_tools_are_passed_through(self):
+        tools = [{"name": "plain", "description": "", "parameters": {}}]
+
+        self.assertEqual(tools_to_dicts(tools), tools)
+
+
+if __name__ == "__main__":
+    unittest.main()